@@ -86,6 +86,16 @@ class DataSourceConnectionConfiguration:
     protocol: Optional[str] = None  # IBM DB2 specific configuration
     server: Optional[str] = None
 
+    pool_size: Optional[int] = None  # Connection pool configuration
+    pool_pre_ping: Optional[bool] = None  # Connection pool configuration
+    pool_recycle: Optional[int] = None  # Connection pool configuration
+    pool_timeout: Optional[int] = None  # Connection pool configuration
+    query_timeout: Optional[float] = None
+    fetch_size: Optional[int] = None  # SQL specific configuration
+    mapping_cache_ttl: Optional[int] = None  # Search index specific configuration
+    metadata_cache_ttl: Optional[int] = None  # SQL specific configuration
+    metadata_cache_path: Optional[str] = None  # SQL specific configuration
+
 
 @dataclass
 class DataSourceConfiguration:
@@ -109,6 +119,12 @@ class ValidationConfig:
     regex: Optional[str] = None
     values: Optional[List] = None
     ref: Optional[str] = None
+    sample: Optional[float] = None
+    approximate: bool = False
+    estimate: bool = False
+    cache_ttl: Optional[int] = None
+    timeout: Optional[float] = None
+    false_positive_rate: Optional[float] = None
 
     def _ref_field_validation(self):
         if self.ref is not None:
@@ -133,6 +149,10 @@ class ValidationConfig:
             ValidationFunction.COUNT_DOCUMENTS,
             ValidationFunction.CUSTOM_SQL,
             ValidationFunction.DELTA_COUNT_ROWS,
+            # Without a column, freshness is read from the catalog
+            ValidationFunction.FRESHNESS,
+            # Without a column, every foreign key of the table is checked
+            ValidationFunction.ORPHAN_COUNT,
         ]
 
         if self.on.strip().startswith("delta"):
@@ -153,12 +173,24 @@ class ValidationConfig:
                     r"^(\w+)\(([ \w-]+)\)$", on_statement
                 ).group(1)
 
-                if column_validation_function not in [v for v in ValidationFunction]:
+                function_name = (
+                    column_validation_function
+                    if not self._is_delta_validation
+                    else f"delta_{column_validation_function}"
+                )
+                if function_name not in [v for v in ValidationFunction]:
                     raise ValueError(
                         f"{column_validation_function} is not a valid validation function"
                     )
 
-                if column_validation_function in dataset_validation_functions:
+                if (
+                    column_validation_function in dataset_validation_functions
+                    and column_validation_function
+                    not in [
+                        ValidationFunction.FRESHNESS,
+                        ValidationFunction.ORPHAN_COUNT,
+                    ]
+                ):
                     raise ValueError(
                         f"{column_validation_function} is a table function, should not have column name"
                     )
@@ -180,9 +212,95 @@ class ValidationConfig:
             )
             self._validation_field_name = None
 
+    def _diff_validation(self):
+        if self.get_validation_function == ValidationFunction.DELTA_DIFF:
+            if self.ref is None:
+                raise ValueError(
+                    "ref is required to compare a dataset with a reference dataset"
+                )
+            if self.sample is not None:
+                raise ValueError("delta diff compares every row, it can not be sampled")
+
+    def _orphan_validation(self):
+        if self.get_validation_function == ValidationFunction.ORPHAN_COUNT:
+            if self.get_validation_field_name is not None and self.ref is None:
+                raise ValueError(
+                    "ref is required to check a column against its referenced dataset"
+                )
+            if self.get_validation_field_name is None and self.ref is not None:
+                raise ValueError(
+                    "orphan_count without a column checks the foreign keys of the"
+                    " dataset, it can not have a ref"
+                )
+            if self.sample is not None:
+                raise ValueError(
+                    "orphan_count looks up every row in its parent, it can not be"
+                    " sampled"
+                )
+        if self.false_positive_rate is not None:
+            if self.get_validation_function != ValidationFunction.ORPHAN_COUNT:
+                raise ValueError(
+                    "false_positive_rate is only supported by orphan_count"
+                )
+            if (
+                not isinstance(self.false_positive_rate, float)
+                or not 0 < self.false_positive_rate < 1
+            ):
+                raise ValueError("false_positive_rate should be between 0 and 1")
+
+    def _sample_validation(self):
+        if self.sample is not None:
+            if not isinstance(self.sample, (int, float)) or not 0 < self.sample <= 100:
+                raise ValueError("sample should be a percentage between 0 and 100")
+
+    def _approximate_validation(self):
+        if self.approximate and self.get_validation_function not in [
+            ValidationFunction.COUNT_DISTINCT,
+            ValidationFunction.COUNT_DUPLICATE,
+        ]:
+            raise ValueError(
+                "approximate is only supported by count_distinct and count_duplicate"
+            )
+
+    def _estimate_validation(self):
+        if not self.estimate:
+            return
+        if self.get_validation_function not in [
+            ValidationFunction.COUNT_ROWS,
+            ValidationFunction.COUNT_NULL,
+            ValidationFunction.PERCENT_NULL,
+            ValidationFunction.COUNT_DISTINCT,
+        ]:
+            raise ValueError(
+                "estimate is only supported by count_rows, count_null, percent_null"
+                " and count_distinct"
+            )
+        if self.where is not None or self.sample is not None or self.approximate:
+            raise ValueError(
+                "estimate reads the statistics of the whole table, it can not be"
+                " combined with where, sample or approximate"
+            )
+
+    def _cache_ttl_validation(self):
+        if self.cache_ttl is not None:
+            if not isinstance(self.cache_ttl, int) or self.cache_ttl < 0:
+                raise ValueError("cache_ttl should be a number of seconds")
+
+    def _timeout_validation(self):
+        if self.timeout is not None:
+            if not isinstance(self.timeout, (int, float)) or self.timeout <= 0:
+                raise ValueError("timeout should be a positive number of seconds")
+
     def __post_init__(self):
         self._on_field_validation()
         self._ref_field_validation()
+        self._diff_validation()
+        self._orphan_validation()
+        self._sample_validation()
+        self._approximate_validation()
+        self._estimate_validation()
+        self._cache_ttl_validation()
+        self._timeout_validation()
 
     @property
     def get_validation_function(self) -> ValidationFunction:
@@ -212,6 +330,20 @@ class ValidationConfig:
     def get_validation_field_name(self) -> str:
         return self._validation_field_name if self._validation_field_name else None
 
+    @property
+    def is_percentage(self) -> bool:
+        return self.get_validation_function.value.startswith("percent_")
+
+    @property
+    def can_be_sampled(self) -> bool:
+        # orphan_count looks up every row of the dataset in its parent, delta diff
+        # compares every row with the reference dataset and an estimate reads the
+        # statistics of the whole table
+        return not self.estimate and self.get_validation_function not in [
+            ValidationFunction.ORPHAN_COUNT,
+            ValidationFunction.DELTA_DIFF,
+        ]
+
 
 @dataclass
 class ValidationConfigByDataset:
@@ -281,6 +413,50 @@ class MetricStorageConfiguration:
     params: Union[LocalFileStorageParameters]
 
 
+@dataclass
+class IncrementalConfiguration:
+    """
+    Incremental configuration of a dataset. Validations only aggregate the rows with
+    a watermark greater than the high-water mark of the previous run.
+    """
+
+    data_source: str
+    dataset: str
+    watermark: str
+
+
+@dataclass
+class PartitionConfiguration:
+    """
+    Partition configuration of a dataset. The aggregates of the dataset are computed
+    on ranges of the partition column in parallel and merged.
+    """
+
+    data_source: str
+    dataset: str
+    column: Optional[str] = None
+    partitions: int = 8
+    max_retries: int = 2
+
+
+@dataclass
+class ExecutionConfiguration:
+    """
+    Execution configuration of the validations
+    """
+
+    fused_scan: bool = True
+    fused_scan_max_aggregates: int = 50
+    query_cache: bool = True
+    max_workers: int = 1
+    max_workers_per_data_source: Optional[int] = None
+    data_source_max_workers: Dict[str, int] = field(default_factory=dict)
+    incremental_storage_path: str = "dcs_storage"
+    result_cache: bool = False
+    result_cache_ttl: Optional[int] = None
+    result_cache_storage_path: str = "dcs_storage"
+
+
 @dataclass
 class Configuration:
     """
@@ -295,6 +471,9 @@ class Configuration:
     )
     metrics: Optional[Dict[str, MetricConfiguration]] = None
     storage: Optional[MetricStorageConfiguration] = None
+    execution: ExecutionConfiguration = field(default_factory=ExecutionConfiguration)
+    incremental: Dict[str, IncrementalConfiguration] = field(default_factory=dict)
+    partitioned: Dict[str, PartitionConfiguration] = field(default_factory=dict)
 
     def add_spark_session(self, data_source_name: str, spark_session):
         self.data_sources[data_source_name] = DataSourceConfiguration(
@@ -12,8 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from dataclasses import dataclass
-from typing import Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Union
 
 
 @dataclass
@@ -68,6 +69,39 @@ class RawColumnInfo:
     character_maximum_length: Optional[int] = None
 
 
+@dataclass
+class ColumnStatistics:
+    """
+    Optimizer statistics of a column, None when the database keeps no estimate
+    """
+
+    null_fraction: Optional[float] = None
+    distinct_count: Optional[int] = None
+
+
+@dataclass
+class TableStatistics:
+    """
+    Optimizer statistics of a table and its columns, with the time they were gathered
+    """
+
+    row_count: Optional[int] = None
+    updated_at: Optional[datetime] = None
+    columns: Dict[str, ColumnStatistics] = field(default_factory=dict)
+
+
+@dataclass
+class ForeignKey:
+    """
+    Foreign key of a table, the referencing columns paired with the referenced columns
+    """
+
+    name: str
+    columns: List[str]
+    referenced_table: str
+    referenced_columns: List[str]
+
+
 @dataclass
 class SybaseDriverTypes:
     is_ase: bool = False
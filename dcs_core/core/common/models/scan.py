@@ -0,0 +1,74 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class AggregateType(str, Enum):
+    """
+    AggregateType is an enum of the aggregates that can be computed for several
+    validations in a single scan of a dataset.
+    """
+
+    ROW_COUNT = "row_count"
+    MIN = "min"
+    MAX = "max"
+    AVG = "avg"
+    SUM = "sum"
+    VARIANCE = "variance"
+    STDDEV = "stddev"
+    NULL_COUNT = "null_count"
+    VALUE_COUNT = "value_count"
+    EMPTY_STRING_COUNT = "empty_string_count"
+    ZERO_COUNT = "zero_count"
+    NEGATIVE_COUNT = "negative_count"
+    DISTINCT_COUNT = "distinct_count"
+    APPROX_DISTINCT_COUNT = "approx_distinct_count"
+    VALUES_MATCH_COUNT = "values_match_count"
+    REGEX_MATCH_COUNT = "regex_match_count"
+    PREDEFINED_REGEX_MATCH_COUNT = "predefined_regex_match_count"
+    STRING_LENGTH_MAX = "string_length_max"
+    STRING_LENGTH_MIN = "string_length_min"
+    STRING_LENGTH_AVG = "string_length_avg"
+    PERCENTILE = "percentile"
+
+
+@dataclass(frozen=True)
+class ScanAggregate:
+    """
+    ScanAggregate is a single aggregate expression of a fused dataset scan.
+    Identical aggregates requested by different validations are computed once.
+
+    argument holds the regex pattern, the predefined regex pattern name, the
+    tuple of values or the percentile, depending on the aggregate type.
+    """
+
+    type: AggregateType
+    field: Optional[str] = None
+    argument: Optional[Union[str, Tuple, float]] = None
+
+
+@dataclass
+class IncrementalState:
+    """
+    IncrementalState is the persisted state of an incremental scan: the high-water
+    mark of the watermark column and the running value of every aggregate, keyed by
+    the aggregate key. Timestamp and date watermarks are stored as ISO text, tagged
+    with their type in watermark_type.
+    """
+
+    watermark: Optional[Union[int, float, str]]
+    aggregates: Dict[str, Any] = field(default_factory=dict)
+    watermark_type: Optional[str] = None
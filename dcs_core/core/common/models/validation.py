@@ -16,7 +16,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 class ConditionType(str, Enum):
@@ -94,6 +94,9 @@ class ValidationFunction(str, Enum):
     COUNT_DISTINCT = "count_distinct"
     COUNT_DUPLICATE = "count_duplicate"
 
+    # Referential integrity validations 1
+    ORPHAN_COUNT = "orphan_count"
+
     # Completeness validations 8
     COUNT_NULL = "count_null"
     COUNT_NOT_NULL = "count_not_null"  # todo not implemented
@@ -183,6 +186,11 @@ class ValidationFunction(str, Enum):
 
     # CROSS Validation
     DELTA_COUNT_ROWS = "delta_count_rows"
+    DELTA_SUM = "delta_sum"
+    DELTA_AVG = "delta_avg"
+    DELTA_COUNT_NULL = "delta_count_null"
+    DELTA_COUNT_DISTINCT = "delta_count_distinct"
+    DELTA_DIFF = "delta_diff"
 
     # Failed rows
     FAILED_ROWS = "failed_rows"
@@ -201,6 +209,24 @@ class ValidationInfo:
     is_valid: Optional[bool] = None
     reason: Optional[str] = None
     tags: Dict[str, str] = None
+    sample_percent: Optional[float] = None
+    confidence_interval: Optional[Tuple[float, float]] = None
+    estimated_error: Optional[float] = None
+    statistics_updated_at: Optional[datetime] = None
+    cached_at: Optional[datetime] = None
+    timed_out: bool = False
+
+
+@dataclass
+class CachedValidationInfo:
+    """
+    CachedValidationInfo is a validation info persisted by the result cache, with the
+    fingerprint of the dataset at the time it was computed.
+    """
+
+    fingerprint: str
+    cached_at: datetime
+    validation_info: ValidationInfo
 
 
 @dataclass
@@ -214,3 +240,7 @@ class DeltaValidationInfo(ValidationInfo):
     reference_datasource_name: str = None
     reference_dataset: str = None
     reference_field: Optional[str] = None
+    missing_count: Optional[int] = None
+    extra_count: Optional[int] = None
+    mismatched_count: Optional[int] = None
+    diff_sample: Optional[List[Dict[str, Any]]] = None
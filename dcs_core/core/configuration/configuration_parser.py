@@ -28,12 +28,20 @@ from dcs_core.core.common.models.configuration import (
     DataSourceConnectionConfiguration,
     DataSourceLanguageSupport,
     DataSourceType,
+    ExecutionConfiguration,
+    IncrementalConfiguration,
+    PartitionConfiguration,
     ValidationConfig,
     ValidationConfigByDataset,
 )
 from dcs_core.core.common.models.data_source_resource import Field, Index, Table
 from dcs_core.core.common.models.metric import MetricsType
-from dcs_core.core.common.models.validation import ConditionType, Threshold, Validation
+from dcs_core.core.common.models.validation import (
+    ConditionType,
+    Threshold,
+    Validation,
+    ValidationFunction,
+)
 from dcs_core.core.configuration.config_loader import parse_config
 
 CONDITION_TYPE_MAPPING = {
@@ -81,7 +89,51 @@ class DataSourceConfigParser(ConfigParser):
             protocol=config["connection"].get("protocol"),
             driver=config["connection"].get("driver"),
             server=config["connection"].get("server"),
+            pool_size=config["connection"].get("pool_size"),
+            pool_pre_ping=config["connection"].get("pool_pre_ping"),
+            pool_recycle=config["connection"].get("pool_recycle"),
+            pool_timeout=config["connection"].get("pool_timeout"),
+            query_timeout=config["connection"].get("query_timeout"),
+            fetch_size=config["connection"].get("fetch_size"),
+            mapping_cache_ttl=config["connection"].get("mapping_cache_ttl"),
+            metadata_cache_ttl=config["connection"].get("metadata_cache_ttl"),
+            metadata_cache_path=config["connection"].get("metadata_cache_path"),
         )
+        if connection_config.pool_size is not None and (
+            not isinstance(connection_config.pool_size, int)
+            or connection_config.pool_size < 1
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Connection pool_size must be an integer greater than 0"
+            )
+        if connection_config.query_timeout is not None and (
+            not isinstance(connection_config.query_timeout, (int, float))
+            or connection_config.query_timeout <= 0
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Connection query_timeout must be a positive number of seconds"
+            )
+        if connection_config.fetch_size is not None and (
+            not isinstance(connection_config.fetch_size, int)
+            or connection_config.fetch_size < 1
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Connection fetch_size must be an integer greater than 0"
+            )
+        if connection_config.mapping_cache_ttl is not None and (
+            not isinstance(connection_config.mapping_cache_ttl, int)
+            or connection_config.mapping_cache_ttl < 0
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Connection mapping_cache_ttl must be a non negative number of seconds"
+            )
+        if connection_config.metadata_cache_ttl is not None and (
+            not isinstance(connection_config.metadata_cache_ttl, int)
+            or connection_config.metadata_cache_ttl < 0
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Connection metadata_cache_ttl must be a non negative number of seconds"
+            )
         return connection_config
 
     @staticmethod
@@ -122,7 +174,11 @@ class DataSourceConfigParser(ConfigParser):
 
 
 class ValidationConfigParser(ConfigParser):
-    def parse(self, config: Dict) -> Dict[str, ValidationConfigByDataset]:
+    def parse(
+        self,
+        config: Dict,
+        data_sources: Optional[Dict[str, DataSourceConfiguration]] = None,
+    ) -> Dict[str, ValidationConfigByDataset]:
         validation_group: Dict[str, ValidationConfigByDataset] = {}
         for key, validations in config.items():
             match = re.search(r"^(validations for)\s([ \w-]+)\.([ \w-]+)$", key)
@@ -153,6 +209,15 @@ class ValidationConfigParser(ConfigParser):
                         regex=value.get("regex"),
                         values=value.get("values"),
                         ref=value.get("ref"),
+                        sample=value.get("sample"),
+                        approximate=value.get("approximate", False),
+                        estimate=value.get("estimate", False),
+                        cache_ttl=value.get("cache_ttl"),
+                        timeout=value.get("timeout"),
+                        false_positive_rate=value.get("false_positive_rate"),
+                    )
+                    self._check_search_freshness(
+                        validation_config, (data_sources or {}).get(data_source)
                     )
                     validation_dict[validation_name] = validation_config
 
@@ -165,6 +230,25 @@ class ValidationConfigParser(ConfigParser):
                 )
         return validation_group
 
+    @staticmethod
+    def _check_search_freshness(
+        validation_config: ValidationConfig,
+        data_source: Optional[DataSourceConfiguration],
+    ):
+        # Search indexes have no catalog of modification times
+        if (
+            data_source is not None
+            and data_source.language_support == DataSourceLanguageSupport.DSL_ES
+            and validation_config.get_validation_function
+            == ValidationFunction.FRESHNESS
+            and validation_config.get_validation_field_name is None
+        ):
+            raise DataChecksConfigurationError(
+                message=f"Freshness validation {validation_config.name} on search "
+                f"data source {data_source.name} needs a timestamp field, "
+                f"e.g. freshness(updated_at)"
+            )
+
     @staticmethod
     def _parse_threshold_str(threshold: str) -> Threshold:
         try:
@@ -191,6 +275,158 @@ class ValidationConfigParser(ConfigParser):
             )
 
 
+class SampleConfigParser(ConfigParser):
+    def parse(
+        self, config: Dict, validations: Dict[str, ValidationConfigByDataset] = None
+    ) -> Dict[str, float]:
+        """
+        Parse the dataset sample percentages and apply them to the validations of
+        the dataset which do not set their own sample and can be sampled
+        """
+        samples: Dict[str, float] = {}
+        for key, value in config.items():
+            match = re.search(r"^(sample for)\s([ \w-]+)\.([ \w-]+)$", key)
+            if match:
+                dataset_key = f"{match.group(2)}.{match.group(3)}"
+                percent = value.get("percent") if isinstance(value, dict) else None
+                if not isinstance(percent, (int, float)) or not 0 < percent <= 100:
+                    raise DataChecksConfigurationError(
+                        message=f"Sample of {dataset_key} must have a percent between 0 and 100"
+                    )
+                samples[dataset_key] = percent
+        for dataset_key, percent in samples.items():
+            if validations and dataset_key in validations:
+                for validation in validations[dataset_key].validations.values():
+                    if validation.sample is None and validation.can_be_sampled:
+                        validation.sample = percent
+        return samples
+
+
+class IncrementalConfigParser(ConfigParser):
+    def parse(self, config: Dict) -> Dict[str, IncrementalConfiguration]:
+        incremental_configurations: Dict[str, IncrementalConfiguration] = {}
+        for key, value in config.items():
+            match = re.search(r"^(incremental for)\s([ \w-]+)\.([ \w-]+)$", key)
+            if match:
+                data_source, dataset = match.group(2), match.group(3)
+                if not isinstance(value, dict) or not value.get("watermark"):
+                    raise DataChecksConfigurationError(
+                        message=f"Incremental configuration of {data_source}.{dataset} must have a watermark column"
+                    )
+                incremental_configurations[
+                    f"{data_source}.{dataset}"
+                ] = IncrementalConfiguration(
+                    data_source=data_source,
+                    dataset=dataset,
+                    watermark=value["watermark"],
+                )
+        return incremental_configurations
+
+
+class PartitionConfigParser(ConfigParser):
+    def parse(self, config: Dict) -> Dict[str, PartitionConfiguration]:
+        partition_configurations: Dict[str, PartitionConfiguration] = {}
+        for key, value in config.items():
+            match = re.search(r"^(partition for)\s([ \w-]+)\.([ \w-]+)$", key)
+            if match:
+                data_source, dataset = match.group(2), match.group(3)
+                value = value or {}
+                if not isinstance(value, dict):
+                    raise DataChecksConfigurationError(
+                        message=f"Partition configuration of {data_source}.{dataset} must be a dictionary"
+                    )
+                default = PartitionConfiguration(
+                    data_source=data_source, dataset=dataset
+                )
+                partition_configuration = PartitionConfiguration(
+                    data_source=data_source,
+                    dataset=dataset,
+                    column=value.get("column"),
+                    partitions=value.get("partitions", default.partitions),
+                    max_retries=value.get("max_retries", default.max_retries),
+                )
+                if (
+                    not isinstance(partition_configuration.partitions, int)
+                    or partition_configuration.partitions < 2
+                ):
+                    raise DataChecksConfigurationError(
+                        message=f"Partition configuration of {data_source}.{dataset} must have at least 2 partitions"
+                    )
+                if (
+                    not isinstance(partition_configuration.max_retries, int)
+                    or partition_configuration.max_retries < 0
+                ):
+                    raise DataChecksConfigurationError(
+                        message=f"Partition max_retries of {data_source}.{dataset} must be a positive integer"
+                    )
+                partition_configurations[
+                    f"{data_source}.{dataset}"
+                ] = partition_configuration
+        return partition_configurations
+
+
+class ExecutionConfigParser(ConfigParser):
+    def parse(self, config: Dict) -> ExecutionConfiguration:
+        if not isinstance(config, dict):
+            raise DataChecksConfigurationError(
+                message=f"Execution configuration must be a dictionary"
+            )
+        default = ExecutionConfiguration()
+        execution_configuration = ExecutionConfiguration(
+            fused_scan=config.get("fused_scan", default.fused_scan),
+            incremental_storage_path=config.get(
+                "incremental_storage_path", default.incremental_storage_path
+            ),
+            fused_scan_max_aggregates=config.get(
+                "fused_scan_max_aggregates", default.fused_scan_max_aggregates
+            ),
+            query_cache=config.get("query_cache", default.query_cache),
+            max_workers=config.get("max_workers", default.max_workers),
+            max_workers_per_data_source=config.get(
+                "max_workers_per_data_source", default.max_workers_per_data_source
+            ),
+            data_source_max_workers=config.get("data_sources", {}) or {},
+            result_cache=config.get("result_cache", default.result_cache),
+            result_cache_ttl=config.get("result_cache_ttl", default.result_cache_ttl),
+            result_cache_storage_path=config.get(
+                "result_cache_storage_path", default.result_cache_storage_path
+            ),
+        )
+        if execution_configuration.fused_scan_max_aggregates < 1:
+            raise DataChecksConfigurationError(
+                message=f"fused_scan_max_aggregates must be greater than 0"
+            )
+        if execution_configuration.result_cache_ttl is not None and (
+            not isinstance(execution_configuration.result_cache_ttl, int)
+            or execution_configuration.result_cache_ttl < 0
+        ):
+            raise DataChecksConfigurationError(
+                message=f"result_cache_ttl must be a number of seconds"
+            )
+        if not isinstance(execution_configuration.data_source_max_workers, dict):
+            raise DataChecksConfigurationError(
+                message=f"Execution data_sources must be a dictionary of data source name and max workers"
+            )
+        limits = [("max_workers", execution_configuration.max_workers)]
+        if execution_configuration.max_workers_per_data_source is not None:
+            limits.append(
+                (
+                    "max_workers_per_data_source",
+                    execution_configuration.max_workers_per_data_source,
+                )
+            )
+        limits += [
+            (f"data_sources.{name}", max_workers)
+            for name, max_workers in execution_configuration.data_source_max_workers.items()
+        ]
+        for key, value in limits:
+            if not isinstance(value, int) or value < 1:
+                raise DataChecksConfigurationError(
+                    message=f"Execution {key} must be an integer greater than 0"
+                )
+        return execution_configuration
+
+
 def _parse_configuration_from_dict(config_dict: Dict) -> Configuration:
     try:
         data_source_configurations = {}
@@ -198,11 +434,20 @@ def _parse_configuration_from_dict(config_dict: Dict) -> Configuration:
             data_source_configurations = DataSourceConfigParser().parse(
                 config_list=config_dict["data_sources"]
             )
-        validate_configurations = ValidationConfigParser().parse(config_dict)
+        validate_configurations = ValidationConfigParser().parse(
+            config_dict, data_source_configurations
+        )
 
         configuration = Configuration(
             data_sources=data_source_configurations, validations=validate_configurations
         )
+        if config_dict.get("execution") is not None:
+            configuration.execution = ExecutionConfigParser().parse(
+                config_dict["execution"]
+            )
+        configuration.incremental = IncrementalConfigParser().parse(config_dict)
+        configuration.partitioned = PartitionConfigParser().parse(config_dict)
+        SampleConfigParser().parse(config_dict, validate_configurations)
 
         return configuration
     except Exception as ex:
@@ -229,6 +474,12 @@ def load_configuration_from_yaml_str(
             configuration.data_sources[k] = v
         for k, v in from_dict.validations.items():
             configuration.validations[k] = v
+        for k, v in from_dict.incremental.items():
+            configuration.incremental[k] = v
+        for k, v in from_dict.partitioned.items():
+            configuration.partitioned[k] = v
+        if "execution" in config_dict:
+            configuration.execution = from_dict.execution
     return from_dict
 
 
@@ -296,5 +547,11 @@ def load_configuration(
                     configuration.data_sources[k] = v
                 for k, v in from_dict.validations.items():
                     configuration.validations[k] = v
+                for k, v in from_dict.incremental.items():
+                    configuration.incremental[k] = v
+                for k, v in from_dict.partitioned.items():
+                    configuration.partitioned[k] = v
+                if "execution" in final_config_dict:
+                    configuration.execution = from_dict.execution
 
             return from_dict
@@ -13,9 +13,10 @@
 #  limitations under the License.
 
 from abc import ABC
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from dcs_core.core.common.models.configuration import DataSourceLanguageSupport
+from dcs_core.core.datasource.query_cache import QueryCacheStats, QueryResultCache
 
 
 class DataSource(ABC):
@@ -37,6 +38,7 @@ class DataSource(ABC):
         self._data_source_name: str = data_source_name
         self.data_connection: Dict = data_connection
         self.language_support = language_support
+        self.query_cache: Optional[QueryResultCache] = None
 
     @property
     def data_source_name(self) -> str:
@@ -62,3 +64,36 @@ class DataSource(ABC):
         Close the connection
         """
         raise NotImplementedError("close_connection method is not implemented")
+
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        """
+        Get a cheap fingerprint of a table which changes whenever the table is
+        modified, used to serve the results of a previous run for unchanged tables
+        :param table: name of the table or index
+        :return: fingerprint, None if the data source can not tell
+        """
+        return None
+
+    def enable_query_cache(self):
+        """
+        Start memoizing the results of the read queries, identical queries are
+        executed once until the cache is disabled
+        """
+        self.query_cache = QueryResultCache()
+
+    def disable_query_cache(self) -> Optional[QueryCacheStats]:
+        """
+        Stop memoizing query results and drop the cached results
+        :return: hit and miss counters of the cache
+        """
+        if self.query_cache is None:
+            return None
+        stats = self.query_cache.stats
+        self.query_cache.clear()
+        self.query_cache = None
+        return stats
+
+    def _memoize(self, key: Tuple, execute: Callable[[], Any]) -> Any:
+        if self.query_cache is None:
+            return execute()
+        return self.query_cache.get_or_execute(key, execute)
@@ -0,0 +1,209 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from loguru import logger
+
+from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
+
+
+class ConnectionPool:
+    """
+    ConnectionPool keeps up to pool_size open connections of a data source and hands
+    each one out to a single caller at a time. Connections are opened lazily, so a pool
+    that is used by one thread only ever holds one connection.
+
+    The pool does not depend on the driver: creator opens a connection, ping raises if
+    a connection is no longer usable and reset restores a connection after a failed
+    query. It works the same for SQLAlchemy connections and raw DBAPI connections.
+    """
+
+    def __init__(
+        self,
+        creator: Callable[[], Any],
+        pool_size: int = 5,
+        pre_ping: bool = False,
+        recycle: Optional[float] = None,
+        timeout: float = 30.0,
+        ping: Optional[Callable[[Any], None]] = None,
+        reset: Optional[Callable[[Any], None]] = None,
+        on_replace: Optional[Callable[[Any, Any], None]] = None,
+    ):
+        """
+        :param creator: function that opens a new connection
+        :param pool_size: maximum number of open connections
+        :param pre_ping: check that an idle connection is alive before handing it out
+        :param recycle: seconds after which a connection is closed and opened again
+        :param timeout: seconds to wait for a connection when all of them are in use
+        :param ping: function that raises if a connection is not usable
+        :param reset: function called on a connection after a failed query
+        :param on_replace: function called with the old and the new connection when
+            a connection is recycled or fails the pre-ping
+        """
+        self.creator = creator
+        self.pool_size = pool_size
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+        self.timeout = timeout
+        self.ping = ping
+        self.reset = reset
+        self.on_replace = on_replace
+
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._opened_at: Dict[int, float] = {}
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of open connections of the pool
+        """
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """
+        Number of connections that can be checked out right now, idle or not yet open
+        """
+        with self._lock:
+            return self._idle.qsize() + max(0, self.pool_size - self._size)
+
+    def add(self, connection: Any):
+        """
+        Add an already open connection to the idle connections of the pool
+        :param connection: open connection
+        """
+        with self._lock:
+            self._size += 1
+            self._opened_at[id(connection)] = time.monotonic()
+        self._idle.put(connection)
+
+    def _open(self) -> Any:
+        connection = self.creator()
+        self._opened_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _close(self, connection: Any):
+        self._opened_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Failed to close pooled connection: {str(e)}")
+
+    def _acquire(self, wait: bool = True) -> Optional[Any]:
+        try:
+            return self._prepare(self._idle.get_nowait())
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._size < self.pool_size
+            if can_open:
+                self._size += 1
+        if can_open:
+            try:
+                return self._open()
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                raise
+        if not wait:
+            return None
+
+        try:
+            return self._prepare(self._idle.get(timeout=self.timeout))
+        except queue.Empty:
+            raise DataChecksDataSourcesConnectionError(
+                message=f"Timed out after {self.timeout} seconds waiting for one of "
+                f"{self.pool_size} pooled connections"
+            )
+
+    def _prepare(self, connection: Any) -> Any:
+        opened_at = self._opened_at.get(id(connection), time.monotonic())
+        if self.recycle is not None and time.monotonic() - opened_at > self.recycle:
+            logger.debug("Recycling pooled connection")
+            return self._replace(connection)
+        if self.pre_ping and self.ping is not None:
+            try:
+                self.ping(connection)
+            except Exception as e:
+                logger.warning(f"Pooled connection failed pre-ping: {str(e)}")
+                return self._replace(connection)
+        return connection
+
+    def _replace(self, connection: Any) -> Any:
+        self._close(connection)
+        try:
+            new_connection = self._open()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+        if self.on_replace is not None:
+            self.on_replace(connection, new_connection)
+        return new_connection
+
+    def _release(self, connection: Any, failed: bool = False):
+        if failed and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception as e:
+                logger.debug(f"Failed to reset pooled connection: {str(e)}")
+        if self._closed:
+            self._close(connection)
+            return
+        self._idle.put(connection)
+
+    @contextmanager
+    def checkout(self, wait: bool = True) -> Iterator[Optional[Any]]:
+        """
+        Check out a connection of the pool and return it once the block exits
+        :param wait: wait up to timeout seconds when all the connections are in use,
+            else yield None right away
+        """
+        connection = self._acquire(wait)
+        if connection is None:
+            yield None
+            return
+        failed = False
+        try:
+            yield connection
+        except GeneratorExit:
+            # A caller closed a generator streaming from the connection early
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._release(connection, failed=failed)
+
+    def close(self):
+        """
+        Close the idle connections. Checked out connections are closed when released.
+        """
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close(connection)
+        with self._lock:
+            self._size = 0
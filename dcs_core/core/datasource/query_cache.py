@@ -0,0 +1,96 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+@dataclass
+class QueryCacheStats:
+    """
+    Hit and miss counters of a query result cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class QueryResultCache:
+    """
+    QueryResultCache memoizes the results of the read queries of a data source for
+    the duration of an inspection run, so identical queries are executed once.
+    Concurrent callers of the same query wait for the first one instead of running
+    it again.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = QueryCacheStats()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalize a SQL query, queries that only differ in leading or trailing
+        whitespace share a key. Inner whitespace is kept, it can be part of a string
+        literal.
+        :param query: query text
+        :return: normalized query text
+        """
+        return str(query).strip()
+
+    @staticmethod
+    def normalize_body(body: Any) -> str:
+        """
+        Normalize a search request body, bodies that only differ in key order share a key
+        :param body: request body
+        :return: normalized request body
+        """
+        return json.dumps(body, sort_keys=True, default=str)
+
+    def get_or_execute(self, key: Tuple, execute: Callable[[], Any]) -> Any:
+        """
+        Get the cached result of a query, or execute it and cache the result
+        :param key: cache key of the query
+        :param execute: function that executes the query
+        :return: query result
+        """
+        with self._lock:
+            if key in self._results:
+                self.stats.hits += 1
+                return self._results[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._results:
+                    self.stats.hits += 1
+                    return self._results[key]
+            result = execute()
+            with self._lock:
+                self._results[key] = result
+                self.stats.misses += 1
+                self._key_locks.pop(key, None)
+            return result
+
+    def clear(self):
+        """
+        Remove the cached results and reset the counters
+        """
+        with self._lock:
+            self._results.clear()
+            self._key_locks.clear()
+            self.stats = QueryCacheStats()
@@ -12,12 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import fnmatch
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from dateutil import parser
 
+from dcs_core.core.common.errors import DataChecksRuntimeError
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.query_cache import QueryResultCache
+from dcs_core.core.utils.utils import estimate_duplicate_count
 
 
 class SearchIndexDataSource(DataSource):
@@ -41,10 +48,385 @@ class SearchIndexDataSource(DataSource):
         "nested": dict,
     }
 
+    DEFAULT_MAPPING_CACHE_TTL = 300
+    # Buckets per page of the composite aggregations streaming the values of a field
+    COMPOSITE_PAGE_SIZE = 1000
+    # Highest precision_threshold of the cardinality aggregation
+    CARDINALITY_PRECISION_THRESHOLD = 40000
+    # Relative error of the cardinality aggregation above the precision threshold
+    APPROXIMATE_DISTINCT_ERROR = 0.01
+    # Distinct values read to estimate the share of duplicated values
+    APPROXIMATE_SAMPLE_VALUES = 10000
+
+    # Values of the extended_stats aggregation of a field, by aggregate type
+    EXTENDED_STATS_VALUES = {
+        AggregateType.MIN: "min",
+        AggregateType.MAX: "max",
+        AggregateType.AVG: "avg",
+        AggregateType.SUM: "sum",
+        AggregateType.VARIANCE: "variance_sampling",
+        AggregateType.STDDEV: "std_deviation_sampling",
+    }
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
         self.client = None
+        mapping_cache_ttl = data_connection.get("mapping_cache_ttl")
+        self.mapping_cache_ttl: int = (
+            mapping_cache_ttl
+            if mapping_cache_ttl is not None
+            else self.DEFAULT_MAPPING_CACHE_TTL
+        )
+        # Properties and flattened fields of the index mappings, by index name
+        self._mappings: Dict[str, Tuple[float, Dict, Dict[str, Dict]]] = {}
+        self._mappings_lock = threading.Lock()
+
+    def search(self, index_name: str, body: Dict) -> Dict:
+        """
+        Run a search request, memoized while the query cache is enabled
+        :param index_name: name of the index
+        :param body: search request body
+        :return: search response
+        """
+        return self._memoize(
+            ("search", index_name, QueryResultCache.normalize_body(body)),
+            lambda: self.client.search(index=index_name, body=body),
+        )
+
+    def count(self, index_name: str, body: Dict) -> Dict:
+        """
+        Run a count request, memoized while the query cache is enabled
+        :param index_name: name of the index
+        :param body: count request body
+        :return: count response
+        """
+        return self._memoize(
+            ("count", index_name, QueryResultCache.normalize_body(body)),
+            lambda: self.client.count(index=index_name, body=body),
+        )
+
+    def msearch(self, index_name: str, bodies: List[Dict]) -> List[Dict]:
+        """
+        Run several search requests on an index with a single multi search round
+        trip, memoized while the query cache is enabled
+        :param index_name: name of the index
+        :param bodies: search request bodies
+        :return: search responses, in the order of the bodies
+        """
+        request: List[Dict] = []
+        for body in bodies:
+            request.extend([{}, body])
+        response = self._memoize(
+            (
+                "msearch",
+                index_name,
+                tuple(QueryResultCache.normalize_body(body) for body in bodies),
+            ),
+            lambda: self.client.msearch(index=index_name, body=request),
+        )
+        return response["responses"]
+
+    def search_aggregation(
+        self, aggregate: ScanAggregate
+    ) -> Optional[Tuple[str, Dict, str]]:
+        """
+        Get the aggregation of a search request computing an aggregate. The numeric
+        aggregates of a field share a single extended_stats aggregation.
+        :param aggregate: aggregate to compute
+        :return: aggregation name, aggregation body and key of the value in the
+        aggregation response, None if the aggregate is not supported
+        """
+        field = aggregate.field
+        aggregate_type = aggregate.type
+        if aggregate_type in self.EXTENDED_STATS_VALUES:
+            return (
+                f"stats_{field}",
+                {"extended_stats": {"field": field}},
+                self.EXTENDED_STATS_VALUES[aggregate_type],
+            )
+        elif aggregate_type == AggregateType.NULL_COUNT:
+            return f"missing_{field}", {"missing": {"field": field}}, "doc_count"
+        elif aggregate_type == AggregateType.VALUE_COUNT:
+            return f"value_count_{field}", {"value_count": {"field": field}}, "value"
+        elif aggregate_type == AggregateType.EMPTY_STRING_COUNT:
+            return (
+                f"empty_string_{field}",
+                {"filter": {"match": {f"{field}.keyword": ""}}},
+                "doc_count",
+            )
+        return None
+
+    def is_aggregate_supported(self, aggregate: ScanAggregate) -> bool:
+        return (
+            aggregate.type == AggregateType.ROW_COUNT
+            or self.search_aggregation(aggregate) is not None
+        )
+
+    def _aggregates_body(
+        self, aggregates: List[ScanAggregate], filters: Dict = None
+    ) -> Dict:
+        aggregations: Dict[str, Dict] = {}
+        for aggregate in aggregates:
+            if aggregate.type == AggregateType.ROW_COUNT:
+                continue
+            name, aggregation, _ = self.search_aggregation(aggregate)
+            aggregations[name] = aggregation
+        body = {"size": 0, "track_total_hits": True, "aggs": aggregations}
+        if filters:
+            body["query"] = filters
+        return body
+
+    def _aggregate_values(
+        self, aggregates: List[ScanAggregate], response: Dict
+    ) -> List[Any]:
+        if "error" in response:
+            raise DataChecksRuntimeError(
+                message=f"Search aggregation request failed: {response['error']}"
+            )
+        values = []
+        for aggregate in aggregates:
+            if aggregate.type == AggregateType.ROW_COUNT:
+                values.append(response["hits"]["total"]["value"])
+                continue
+            name, _, key = self.search_aggregation(aggregate)
+            values.append(response["aggregations"][name][key])
+        return values
+
+    def query_get_aggregates(
+        self, index_name: str, aggregates: List[ScanAggregate], filters: Dict = None
+    ) -> List[Any]:
+        """
+        Compute several aggregates of an index with a single search request
+        :param index_name: name of the index
+        :param aggregates: aggregates to compute
+        :param filters: optional filter
+        :return: aggregate values, in the order of the aggregates
+        """
+        return self.query_get_aggregates_batch(
+            index_name=index_name, requests=[(aggregates, filters)]
+        )[0]
+
+    def query_get_aggregates_batch(
+        self,
+        index_name: str,
+        requests: List[Tuple[List[ScanAggregate], Optional[Dict]]],
+    ) -> List[List[Any]]:
+        """
+        Compute the aggregates of several filters of an index. Each filter is one
+        search request, all of them sent in a single multi search round trip.
+        :param index_name: name of the index
+        :param requests: aggregates to compute and their filter
+        :return: aggregate values of every request, in the order of the requests
+        """
+        bodies = [
+            self._aggregates_body(aggregates, filters)
+            for aggregates, filters in requests
+        ]
+        if len(bodies) == 1:
+            responses = [self.search(index_name=index_name, body=bodies[0])]
+        else:
+            responses = self.msearch(index_name=index_name, bodies=bodies)
+        return [
+            self._aggregate_values(aggregates, response)
+            for (aggregates, _), response in zip(requests, responses)
+        ]
+
+    @staticmethod
+    def _flatten_properties(properties: Dict, prefix: str = "") -> Dict[str, Dict]:
+        fields: Dict[str, Dict] = {}
+        for name, mapping in properties.items():
+            path = f"{prefix}{name}"
+            fields[path] = mapping
+            if "properties" in mapping:
+                fields.update(
+                    SearchIndexDataSource._flatten_properties(
+                        mapping["properties"], f"{path}."
+                    )
+                )
+            for sub_field, sub_mapping in mapping.get("fields", {}).items():
+                fields[f"{path}.{sub_field}"] = sub_mapping
+        return fields
+
+    def _cache_mapping(self, index_name: str, properties: Dict, fetched_at: float):
+        self._mappings[index_name] = (
+            fetched_at,
+            properties,
+            self._flatten_properties(properties),
+        )
+
+    def load_mappings(self, index_names: List[str]):
+        """
+        Fetch the mappings of several indexes with a single get_mapping call and
+        keep them in the mapping cache, under the requested names, aliases included,
+        and the concrete index names. Missing indexes are skipped.
+        :param index_names: names of the indexes
+        """
+        if not index_names:
+            return
+        # A missing index is left out of the response instead of failing the batch
+        response = self.client.indices.get_mapping(
+            index=",".join(index_names), ignore_unavailable=True
+        )
+        fetched_at = time.monotonic()
+        # The response is keyed by concrete index, an alias or a pattern is cached
+        # with the mappings of the indexes it resolves to
+        unresolved = [name for name in index_names if name not in response]
+        aliases: Dict[str, List[str]] = {}
+        if unresolved and response:
+            aliases = {
+                index_name: list(alias_info.get("aliases", {}).keys())
+                for index_name, alias_info in self.client.indices.get_alias(
+                    index=",".join(response.keys()), ignore_unavailable=True
+                ).items()
+            }
+        with self._mappings_lock:
+            for index_name, mapping in response.items():
+                self._cache_mapping(
+                    index_name, mapping["mappings"].get("properties", {}), fetched_at
+                )
+            for name in unresolved:
+                resolved = [
+                    index_name
+                    for index_name in response
+                    if any(
+                        fnmatch.fnmatchcase(candidate, name)
+                        for candidate in [index_name] + aliases.get(index_name, [])
+                    )
+                ]
+                if not resolved:
+                    # Missing index, it fails when it is queried
+                    continue
+                properties: Dict = {}
+                for index_name in resolved:
+                    properties.update(
+                        response[index_name]["mappings"].get("properties", {})
+                    )
+                self._cache_mapping(name, properties, fetched_at)
+
+    def invalidate_mappings(self, index_name: Optional[str] = None):
+        """
+        Drop the cached mapping of an index, or of every index
+        :param index_name: name of the index, None for all of them
+        """
+        with self._mappings_lock:
+            if index_name is None:
+                self._mappings.clear()
+            else:
+                self._mappings.pop(index_name, None)
+
+    def _get_mapping(self, index_name: str) -> Tuple[Dict, Dict[str, Dict]]:
+        with self._mappings_lock:
+            cached = self._mappings.get(index_name)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.mapping_cache_ttl
+            ):
+                return cached[1], cached[2]
+
+        response = self.client.indices.get_mapping(index=index_name)
+        # An alias or a pattern resolves to the mappings of several indexes
+        properties: Dict = {}
+        for mapping in response.values():
+            properties.update(mapping["mappings"].get("properties", {}))
+        with self._mappings_lock:
+            self._cache_mapping(index_name, properties, time.monotonic())
+            return self._mappings[index_name][1], self._mappings[index_name][2]
+
+    def index_properties(self, index_name: str) -> Dict:
+        """
+        Get the top level properties of the mapping of an index, from the mapping
+        cache when it has not expired
+        :param index_name: name of the index
+        """
+        return self._get_mapping(index_name)[0]
+
+    def index_fields(self, index_name: str) -> Dict[str, Dict]:
+        """
+        Get the mapping of every field of an index by its full path, including the
+        fields of objects ("address.city") and multi-fields ("name.keyword")
+        :param index_name: name of the index
+        """
+        return self._get_mapping(index_name)[1]
+
+    def _aggregatable_field(self, index_name: str, field: str) -> str:
+        """
+        Get the field to aggregate on, the keyword sub-field of a text field
+        :param index_name: name of the index
+        :param field: field name
+        """
+        mapping = self.index_fields(index_name).get(field, {})
+        if mapping.get("type") != "text":
+            return field
+        for sub_field, sub_mapping in mapping.get("fields", {}).items():
+            if sub_mapping.get("type") == "keyword":
+                return f"{field}.{sub_field}"
+        return f"{field}.keyword"
+
+    def iterate_value_counts(
+        self,
+        index_name: str,
+        field: str,
+        filters: Dict = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[int]:
+        """
+        Iterate over the document count of every distinct value of a field with a
+        composite aggregation, paged by after_key so that neither the cluster nor the
+        client hold more than one page of buckets. Pages are not memoized.
+        :param index_name: name of the index
+        :param field: field name
+        :param filters: optional filter
+        :param limit: maximum number of values, all of them if None
+        :return: document count of each distinct value, in the order of the values
+        """
+        composite = {
+            "size": self.COMPOSITE_PAGE_SIZE,
+            "sources": [
+                {
+                    "value": {
+                        "terms": {"field": self._aggregatable_field(index_name, field)}
+                    }
+                }
+            ],
+        }
+        query = {"size": 0, "aggs": {"values": {"composite": composite}}}
+        if filters:
+            query["query"] = filters
+
+        returned = 0
+        while True:
+            response = self.client.search(index=index_name, body=query)
+            values = response["aggregations"]["values"]
+            for bucket in values["buckets"]:
+                if limit is not None and returned >= limit:
+                    return
+                returned += 1
+                yield bucket["doc_count"]
+            after_key = values.get("after_key")
+            if not values["buckets"] or after_key is None:
+                return
+            composite["after"] = after_key
+
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        """
+        Get the fingerprint of an index from its highest sequence number, which grows
+        with every indexed document, and its document count, which catches deletions
+        :param table: name of the index
+        :return: fingerprint, None if the index is empty
+        """
+        response = self.client.search(
+            index=table,
+            body={
+                "size": 0,
+                "track_total_hits": True,
+                "aggs": {"max_seq_no": {"max": {"field": "_seq_no"}}},
+            },
+        )
+        max_seq_no = response["aggregations"]["max_seq_no"]["value"]
+        if max_seq_no is None:
+            return None
+        return f"{int(max_seq_no)}:{response['hits']['total']['value']}"
 
     def query_get_index_metadata(self) -> List[str]:
         """
@@ -60,8 +442,7 @@ class SearchIndexDataSource(DataSource):
         :return: query for field metadata
         """
         results_: Dict[str, str] = {}
-        mappings = self.client.indices.get_mapping(index=index_name)
-        properties = mappings[index_name]["mappings"]["properties"]
+        properties = self.index_properties(index_name)
 
         for field, value in properties.items():
             if "type" in value:
@@ -78,8 +459,10 @@ class SearchIndexDataSource(DataSource):
         :param field: field name
         :return: field type
         """
-        types = self.query_get_field_metadata(index_name=index_name)
-        return types[field]
+        mapping = self.index_fields(index_name)[field]
+        if "type" in mapping:
+            return self.FIELD_TYPE_MAPPING[mapping["type"]]
+        return self.FIELD_TYPE_MAPPING["nested"]
 
     def query_get_document_count(self, index_name: str, filters: Dict = None) -> int:
         """
@@ -89,7 +472,7 @@ class SearchIndexDataSource(DataSource):
         :return: count of documents
         """
         body = {"query": filters} if filters else {}
-        response = self.client.count(index=index_name, body=body)
+        response = self.count(index_name=index_name, body=body)
         return response["count"]
 
     def query_get_max(self, index_name: str, field: str, filters: Dict = None) -> int:
@@ -100,11 +483,11 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: max value
         """
-        query = {"aggs": {"max_value": {"max": {"field": field}}}}
+        query = {"size": 0, "aggs": {"max_value": {"max": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return response["aggregations"]["max_value"]["value"]
 
     def query_get_min(self, index_name: str, field: str, filters: Dict = None) -> int:
@@ -115,11 +498,11 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"min_value": {"min": {"field": field}}}}
+        query = {"size": 0, "aggs": {"min_value": {"min": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return response["aggregations"]["min_value"]["value"]
 
     def query_get_avg(self, index_name: str, field: str, filters: Dict = None) -> int:
@@ -130,11 +513,11 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"avg_value": {"avg": {"field": field}}}}
+        query = {"size": 0, "aggs": {"avg_value": {"avg": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return round(response["aggregations"]["avg_value"]["value"], 2)
 
     def query_get_sum(self, index_name: str, field: str, filters: Dict = None) -> int:
@@ -145,11 +528,11 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"sum_value": {"sum": {"field": field}}}}
+        query = {"size": 0, "aggs": {"sum_value": {"sum": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return round(response["aggregations"]["sum_value"]["value"], 2)
 
     def query_get_variance(
@@ -162,11 +545,11 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"stats": {"extended_stats": {"field": field}}}}
+        query = {"size": 0, "aggs": {"stats": {"extended_stats": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self.search(index_name=index_name, body=query)["aggregations"]
         return round(response["stats"]["variance_sampling"], 2)
 
     def query_get_stddev(
@@ -179,29 +562,54 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"stats": {"extended_stats": {"field": field}}}}
+        query = {"size": 0, "aggs": {"stats": {"extended_stats": {"field": field}}}}
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self.search(index_name=index_name, body=query)["aggregations"]
         return round(response["stats"]["std_deviation_sampling"], 2)
 
     def query_get_distinct_count(
         self, index_name: str, field: str, filters: Dict = None
     ) -> int:
         """
-        Get the distinct count value of a field
-        :param index_name:
-        :param field:
-        :param filters:
-        :return:
+        Get the exact distinct count of a field, streamed page by page
+        :param index_name: name of the index
+        :param field: field name
+        :param filters: optional filter
+        :return: distinct count
+        """
+        return sum(
+            1 for _ in self.iterate_value_counts(index_name, field, filters=filters)
+        )
+
+    def query_get_approximate_distinct_count(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> Tuple[int, Optional[float]]:
         """
-        query = {"aggs": {"distinct_count": {"cardinality": {"field": field}}}}
+        Get the approximate distinct count of a field with the cardinality
+        aggregation, in flat memory whatever the number of distinct values
+        :param index_name: name of the index
+        :param field: field name
+        :param filters: optional filter
+        :return: approximate distinct count and its estimated relative error
+        """
+        query = {
+            "size": 0,
+            "aggs": {
+                "distinct_count": {
+                    "cardinality": {
+                        "field": self._aggregatable_field(index_name, field),
+                        "precision_threshold": self.CARDINALITY_PRECISION_THRESHOLD,
+                    }
+                }
+            },
+        }
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        return response["distinct_count"]["value"]
+        response = self.search(index_name=index_name, body=query)["aggregations"]
+        return response["distinct_count"]["value"], self.APPROXIMATE_DISTINCT_ERROR
 
     def query_get_time_diff(self, index_name: str, field: str) -> int:
         """
@@ -213,7 +621,7 @@ class SearchIndexDataSource(DataSource):
         """
         query = {"query": {"match_all": {}}, "sort": [{f"{field}": {"order": "desc"}}]}
 
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
 
         if response["hits"]["hits"]:
             last_updated = response["hits"]["hits"][0]["_source"][field]
@@ -234,10 +642,14 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: null count
         """
-        query = {"query": {"bool": {"must_not": {"exists": {"field": field}}}}}
+        query = {
+            "size": 0,
+            "track_total_hits": True,
+            "query": {"bool": {"must_not": {"exists": {"field": field}}}},
+        }
         if filters:
             query["query"]["bool"]["filter"] = filters
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return response["hits"]["total"]["value"]
 
     def query_get_null_percentage(
@@ -260,7 +672,7 @@ class SearchIndexDataSource(DataSource):
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self.search(index_name=index_name, body=query)["aggregations"]
         return round(
             (response["null_count"]["doc_count"] / response["total_count"]["value"])
             * 100,
@@ -278,10 +690,14 @@ class SearchIndexDataSource(DataSource):
         :return: count of empty strings
         """
 
-        query = {"query": {"bool": {"must": {"match": {f"{field}.keyword": ""}}}}}
+        query = {
+            "size": 0,
+            "track_total_hits": True,
+            "query": {"bool": {"must": {"match": {f"{field}.keyword": ""}}}},
+        }
         if filters:
             query["query"]["bool"]["filter"] = filters
-        response = self.client.search(index=index_name, body=query)
+        response = self.search(index_name=index_name, body=query)
         return response["hits"]["total"]["value"]
 
     def query_get_empty_string_percentage(
@@ -306,7 +722,7 @@ class SearchIndexDataSource(DataSource):
         if filters:
             query["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self.search(index_name=index_name, body=query)["aggregations"]
         total_count = response["total_count"]["value"]
         empty_string_count = response["empty_string_count"]["doc_count"]
 
@@ -315,6 +731,55 @@ class SearchIndexDataSource(DataSource):
 
         return round((empty_string_count / total_count) * 100, 2)
 
+    @staticmethod
+    def _numeric_profile_aggregations(field: str, prefix: str = "") -> Dict:
+        return {
+            f"{prefix}stats": {"extended_stats": {"field": field}},
+            f"{prefix}distinct_count": {"cardinality": {"field": field}},
+            f"{prefix}missing_count": {"missing": {"field": field}},
+        }
+
+    @staticmethod
+    def _numeric_profile(aggregations: Dict, prefix: str = "") -> Dict:
+        stats = aggregations[f"{prefix}stats"]
+        return {
+            "avg": stats["avg"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "sum": stats["sum"],
+            "stddev": stats["std_deviation"],
+            "variance": stats["variance_sampling"],
+            "distinct_count": aggregations[f"{prefix}distinct_count"]["value"],
+            "missing_count": aggregations[f"{prefix}missing_count"]["doc_count"],
+        }
+
+    @staticmethod
+    def _string_profile_aggregations(
+        field: str, keyword_field: str, prefix: str = ""
+    ) -> Dict:
+        script = {
+            "script": {
+                "source": f"params._source.containsKey('{field}')? params._source.{field}.length(): 0"
+            }
+        }
+        return {
+            f"{prefix}max_length": {"max": script},
+            f"{prefix}min_length": {"min": script},
+            f"{prefix}avg_length": {"avg": script},
+            f"{prefix}distinct_count": {"cardinality": {"field": keyword_field}},
+            f"{prefix}missing_count": {"missing": {"field": keyword_field}},
+        }
+
+    @staticmethod
+    def _string_profile(aggregations: Dict, prefix: str = "") -> Dict:
+        return {
+            "distinct_count": aggregations[f"{prefix}distinct_count"]["value"],
+            "missing_count": aggregations[f"{prefix}missing_count"]["doc_count"],
+            "max_length": aggregations[f"{prefix}max_length"]["value"],
+            "min_length": aggregations[f"{prefix}min_length"]["value"],
+            "avg_length": aggregations[f"{prefix}avg_length"]["value"],
+        }
+
     def profiling_search_aggregates_numeric(self, index_name: str, field: str) -> Dict:
         """
         Get the aggregates for a numeric field
@@ -322,26 +787,9 @@ class SearchIndexDataSource(DataSource):
         :param field: field name
         :return: aggregates
         """
-
-        query = {
-            "aggs": {
-                "stats": {"extended_stats": {"field": field}},
-                "distinct_count": {"cardinality": {"field": field}},
-                "missing_count": {"missing": {"field": field}},
-            }
-        }
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-
-        return {
-            "avg": response["stats"]["avg"],
-            "min": response["stats"]["min"],
-            "max": response["stats"]["max"],
-            "sum": response["stats"]["sum"],
-            "stddev": response["stats"]["std_deviation"],
-            "variance": response["stats"]["variance_sampling"],
-            "distinct_count": response["distinct_count"]["value"],
-            "missing_count": response["missing_count"]["doc_count"],
-        }
+        query = {"size": 0, "aggs": self._numeric_profile_aggregations(field)}
+        response = self.search(index_name=index_name, body=query)["aggregations"]
+        return self._numeric_profile(response)
 
     def profiling_search_aggregates_string(self, index_name: str, field: str) -> Dict:
         """
@@ -350,57 +798,113 @@ class SearchIndexDataSource(DataSource):
         :param field: field name
         :return: aggregates
         """
-        script = {
-            "script": {
-                "source": f"params._source.containsKey('{field}')? params._source.{field}.length(): 0"
-            }
-        }
         query = {
-            "aggs": {
-                "max_length": {"max": script},
-                "min_length": {"min": script},
-                "avg_length": {"avg": script},
-                "distinct_count": {"cardinality": {"field": f"{field}.keyword"}},
-                "missing_count": {"missing": {"field": f"{field}.keyword"}},
-            }
+            "size": 0,
+            "aggs": self._string_profile_aggregations(field, f"{field}.keyword"),
         }
+        response = self.search(index_name=index_name, body=query)["aggregations"]
+        return self._string_profile(response)
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-
-        return {
-            "distinct_count": response["distinct_count"]["value"],
-            "missing_count": response["missing_count"]["doc_count"],
-            "max_length": response["max_length"]["value"],
-            "min_length": response["min_length"]["value"],
-            "avg_length": response["avg_length"]["value"],
-        }
+    def profiling_search_index(
+        self, index_name: str, max_aggregations: int = 100
+    ) -> Tuple[int, Dict[str, Tuple[str, Dict]]]:
+        """
+        Profile every numeric and text field of an index. The fields are read from
+        the cached mapping and all their aggregations are sent in one multi search,
+        split into several searches of at most max_aggregations aggregations.
+        :param index_name: name of the index
+        :param max_aggregations: maximum number of aggregations in one search
+        :return: document count, and the data type and aggregates of every
+        profiled field
+        """
+        fields: List[Tuple[str, str, str, Dict]] = []
+        for position, (field, field_type) in enumerate(
+            self.query_get_field_metadata(index_name).items()
+        ):
+            prefix = f"{position}_"
+            if field_type.__name__ in self.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
+                aggregations = self._numeric_profile_aggregations(field, prefix)
+            elif field_type.__name__ in self.TEXT_PYTHON_TYPES_FOR_PROFILING:
+                aggregations = self._string_profile_aggregations(
+                    field, self._aggregatable_field(index_name, field), prefix
+                )
+            else:
+                continue
+            fields.append((field, field_type.__name__, prefix, aggregations))
+
+        bodies: List[Dict] = []
+        for _, _, _, aggregations in fields:
+            if (
+                not bodies
+                or len(bodies[-1]["aggs"]) + len(aggregations) > max_aggregations
+            ):
+                bodies.append({"size": 0, "track_total_hits": True, "aggs": {}})
+            bodies[-1]["aggs"].update(aggregations)
+        if not bodies:
+            bodies.append({"size": 0, "track_total_hits": True, "aggs": {}})
+
+        if len(bodies) == 1:
+            responses = [self.search(index_name=index_name, body=bodies[0])]
+        else:
+            responses = self.msearch(index_name=index_name, bodies=bodies)
+        aggregations: Dict = {}
+        for response in responses:
+            if "error" in response:
+                raise DataChecksRuntimeError(
+                    message=f"Profiling search of {index_name} failed: {response['error']}"
+                )
+            aggregations.update(response.get("aggregations", {}))
+
+        profiles: Dict[str, Tuple[str, Dict]] = {}
+        for field, data_type, prefix, _ in fields:
+            profile = (
+                self._numeric_profile(aggregations, prefix)
+                if data_type in self.NUMERIC_PYTHON_TYPES_FOR_PROFILING
+                else self._string_profile(aggregations, prefix)
+            )
+            profiles[field] = (data_type, profile)
+        return responses[0]["hits"]["total"]["value"], profiles
 
     def query_get_duplicate_count(
         self, index_name: str, field: str, filters: Dict = None
     ) -> int:
         """
-        Get the duplicate count
+        Get the exact number of values of a field appearing more than once,
+        streamed page by page
         :param index_name: name of the index
         :param field: field name
+        :param filters: optional filter
         :return: duplicate count
         """
-        field_type = self.query_get_field_type(index_name=index_name, field=field)
-        query = {
-            "aggs": {
-                "duplicate_count": {
-                    "terms": {
-                        "field": field if field_type != "str" else f"{field}.keyword",
-                        "size": 10000,
-                        "min_doc_count": 2,
-                    },
-                }
-            }
-        }
-        if filters:
-            query["query"] = filters
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        return sum(
+            1
+            for doc_count in self.iterate_value_counts(
+                index_name, field, filters=filters
+            )
+            if doc_count > 1
+        )
 
-        return len(response["duplicate_count"]["buckets"])
+    def query_get_approximate_duplicate_count(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> Tuple[int, Optional[float]]:
+        """
+        Get the approximate number of duplicated values. The share of duplicated
+        values among the first APPROXIMATE_SAMPLE_VALUES values of the field is
+        applied to the approximate distinct count.
+        :param index_name: name of the index
+        :param field: field name
+        :param filters: optional filter
+        :return: approximate duplicate count and its estimated relative error
+        """
+        distinct_count, distinct_error = self.query_get_approximate_distinct_count(
+            index_name, field, filters=filters
+        )
+        frequencies: Dict[int, int] = {}
+        for doc_count in self.iterate_value_counts(
+            index_name, field, filters=filters, limit=self.APPROXIMATE_SAMPLE_VALUES
+        ):
+            frequencies[doc_count] = frequencies.get(doc_count, 0) + 1
+        return estimate_duplicate_count(frequencies, distinct_count, distinct_error)
 
     def query_string_pattern_validity(
         self,
@@ -434,6 +938,7 @@ class SearchIndexDataSource(DataSource):
             regex_string = regex_pattern
 
         query = {
+            "size": 0,
             "track_total_hits": True,
             "query": {"regexp": {f"{field}.keyword": regex_string}},
         }
@@ -441,8 +946,8 @@ class SearchIndexDataSource(DataSource):
         if filters:
             query["query"]["bool"]["filter"] = filters
 
-        response = self.client.search(index=index_name, body=query)
-        total_count = self.client.count(
-            index=index_name, body={"query": {"match_all": {}}}
+        response = self.search(index_name=index_name, body=query)
+        total_count = self.count(
+            index_name=index_name, body={"query": {"match_all": {}}}
         )
         return response["hits"]["total"]["value"], total_count["count"]
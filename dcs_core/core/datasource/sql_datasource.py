@@ -12,17 +12,36 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+import math
+import os
+import re
 import secrets
 import string
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from contextlib import ExitStack, closing, contextmanager
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 from sqlalchemy import inspect, text
 from sqlalchemy.engine import Connection, Engine
 
+from dcs_core.core.common.errors import (
+    DataChecksDataSourcesConnectionError,
+    DataChecksRuntimeError,
+)
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    ForeignKey,
+    TableStatistics,
+)
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.pool import ConnectionPool
+from dcs_core.core.datasource.query_cache import QueryResultCache
+from dcs_core.core.utils.utils import estimate_distinct_count, estimate_duplicate_count
 
 
 class SQLDataSource(DataSource):
@@ -30,9 +49,110 @@ class SQLDataSource(DataSource):
     Abstract class for SQL data sources
     """
 
+    DEFAULT_POOL_SIZE = 5
+    DEFAULT_POOL_TIMEOUT = 30
+    DEFAULT_APPROXIMATE_SAMPLE_PERCENT = 10
+    # Relative error of the native approximate distinct count of the dialect
+    APPROXIMATE_DISTINCT_ERROR: Optional[float] = None
+    # Markers of the errors raised by the dialect when a query exceeds its timeout
+    QUERY_TIMEOUT_ERRORS: Tuple[str, ...] = ()
+    # Whether the dialect supports correlated subqueries in the select list
+    BATCHED_ORPHAN_COUNTS = True
+    DEFAULT_METADATA_CACHE_TTL = 300
+    DEFAULT_FETCH_SIZE = 10000
+    # Python type names of the catalog data types, without length or precision
+    CATALOG_PYTHON_TYPES: Dict[str, str] = {
+        "int": "int",
+        "integer": "int",
+        "smallint": "int",
+        "tinyint": "int",
+        "mediumint": "int",
+        "bigint": "int",
+        "int2": "int",
+        "int4": "int",
+        "int8": "int",
+        "int64": "int",
+        "serial": "int",
+        "bigserial": "int",
+        "float": "float",
+        "float4": "float",
+        "float8": "float",
+        "float64": "float",
+        "real": "float",
+        "double": "float",
+        "double precision": "float",
+        "binary_float": "float",
+        "binary_double": "float",
+        "numeric": "Decimal",
+        "decimal": "Decimal",
+        "number": "Decimal",
+        "bignumeric": "Decimal",
+        "money": "Decimal",
+        "smallmoney": "Decimal",
+        "char": "str",
+        "character": "str",
+        "nchar": "str",
+        "varchar": "str",
+        "varchar2": "str",
+        "nvarchar": "str",
+        "nvarchar2": "str",
+        "character varying": "str",
+        "text": "str",
+        "ntext": "str",
+        "tinytext": "str",
+        "mediumtext": "str",
+        "longtext": "str",
+        "string": "str",
+        "clob": "str",
+        "nclob": "str",
+        "enum": "str",
+        "bool": "bool",
+        "boolean": "bool",
+        "bit": "bool",
+        "date": "date",
+        "bytea": "bytes",
+        "blob": "bytes",
+        "binary": "bytes",
+        "varbinary": "bytes",
+        "bytes": "bytes",
+    }
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
+        self._checked_out = threading.local()
+        self._sampling = threading.local()
+        self._timeouts = threading.local()
+        self._connection_pool: Optional[ConnectionPool] = None
+        self._connection_pool_lock = threading.Lock()
+        self.pool_size: int = data_connection.get("pool_size") or self.DEFAULT_POOL_SIZE
+        self.pool_pre_ping: bool = bool(data_connection.get("pool_pre_ping"))
+        self.pool_recycle: Optional[int] = data_connection.get("pool_recycle")
+        self.pool_timeout: int = (
+            data_connection.get("pool_timeout") or self.DEFAULT_POOL_TIMEOUT
+        )
+        self.query_timeout: Optional[float] = data_connection.get("query_timeout")
+        self.fetch_size: int = (
+            data_connection.get("fetch_size") or self.DEFAULT_FETCH_SIZE
+        )
+        self._query_timeout_warned = False
+        metadata_cache_ttl = data_connection.get("metadata_cache_ttl")
+        self.metadata_cache_ttl: int = (
+            metadata_cache_ttl
+            if metadata_cache_ttl is not None
+            else self.DEFAULT_METADATA_CACHE_TTL
+        )
+        self.metadata_cache_path: Optional[str] = data_connection.get(
+            "metadata_cache_path"
+        )
+        # Columns of every table by schema, with the time they were loaded at
+        self._schema_columns: Dict[str, Tuple[float, Dict[str, Dict[str, str]]]] = {}
+        self._schema_columns_lock = threading.Lock()
+        self._table_statistics: Dict[str, Tuple[float, Optional[TableStatistics]]] = {}
+        self._table_statistics_lock = threading.Lock()
+        self._last_modified_times: Optional[Tuple[float, Dict[str, datetime]]] = None
+        self._last_modified_times_lock = threading.Lock()
+
         self.connection: Union[Connection, None] = None
         self.database: str = data_connection.get("database")
         self.use_sa_text_query = True
@@ -104,6 +224,22 @@ class SQLDataSource(DataSource):
             "WY",
         ]
 
+    @property
+    def connection(self) -> Any:
+        """
+        Connection checked out by the current thread, or the primary connection
+        of the data source outside a checkout
+        """
+        checked_out = getattr(self._checked_out, "connection", None)
+        return checked_out if checked_out is not None else self._connection
+
+    @connection.setter
+    def connection(self, connection: Any):
+        if self._connection_pool is not None:
+            self._connection_pool.close()
+            self._connection_pool = None
+        self._connection = connection
+
     def is_connected(self) -> bool:
         """
         Check if the data source is connected
@@ -111,21 +247,232 @@ class SQLDataSource(DataSource):
         return self.connection is not None
 
     def close(self):
-        self.connection.close()
+        if self._connection_pool is not None:
+            self._connection_pool.close()
+            self._connection_pool = None
+        else:
+            self._connection.close()
         try:
-            self.connection.engine.dispose()
+            self._connection.engine.dispose()
         except Exception as e:
             logger.error(f"Failed to close the connection: {str(e)}")
 
+    def sqlalchemy_pool_options(self) -> Dict[str, Any]:
+        """
+        Get the SQLAlchemy engine pool options matching the connection pool configuration
+        """
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": 0,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle if self.pool_recycle is not None else -1,
+            "pool_timeout": self.pool_timeout,
+        }
+
+    def _create_connection(self) -> Any:
+        """
+        Open a new connection for the connection pool
+        """
+        if isinstance(self._connection, Connection):
+            return self._connection.engine.connect()
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support pooled connections"
+        )
+
+    def _ping_connection(self, connection: Any):
+        """
+        Check that a pooled connection is alive, raise if it is not
+        """
+        if isinstance(connection, Connection):
+            connection.engine.dialect.do_ping(connection.connection.dbapi_connection)
+        else:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+
+    def _reset_connection(self, connection: Any):
+        """
+        Roll back the open transaction of a pooled connection after a failed query
+        """
+        connection.rollback()
+
+    def _replace_primary_connection(self, connection: Any, new_connection: Any):
+        if self._connection is connection:
+            self._connection = new_connection
+
+    def _get_connection_pool(self) -> ConnectionPool:
+        with self._connection_pool_lock:
+            if self._connection_pool is None:
+                if self._connection is None:
+                    raise DataChecksDataSourcesConnectionError(
+                        message=f"Data source {self.data_source_name} is not connected"
+                    )
+                self._connection_pool = ConnectionPool(
+                    creator=self._create_connection,
+                    pool_size=self.pool_size,
+                    pre_ping=self.pool_pre_ping,
+                    recycle=self.pool_recycle,
+                    timeout=self.pool_timeout,
+                    ping=self._ping_connection,
+                    reset=self._reset_connection,
+                    on_replace=self._replace_primary_connection,
+                )
+                self._connection_pool.add(self._connection)
+            return self._connection_pool
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """
+        Check out a pooled connection for the current thread. Nested checkouts of a
+        thread reuse the same connection, and self.connection points to it until the
+        outermost checkout exits.
+        """
+        checked_out = getattr(self._checked_out, "connection", None)
+        if checked_out is not None:
+            yield checked_out
+            return
+        with self._get_connection_pool().checkout() as connection:
+            self._checked_out.connection = connection
+            try:
+                yield connection
+            finally:
+                self._checked_out.connection = None
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection. The server cancels
+        a query running longer than the timeout.
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        return False
+
+    def is_timeout_error(self, error: Exception) -> bool:
+        """
+        Check whether an error was raised by a query cancelled by its timeout
+        """
+        message = str(error)
+        return any(marker in message for marker in self.QUERY_TIMEOUT_ERRORS)
+
+    @contextmanager
+    def timeout(self, timeout: float) -> Iterator[None]:
+        """
+        Run the queries of the current thread with a server side timeout. The thread
+        holds the same pooled connection until the context exits.
+        :param timeout: timeout in seconds
+        """
+        previous = getattr(self._timeouts, "timeout", None)
+        self._timeouts.timeout = timeout
+        try:
+            with self._query_timeout(timeout):
+                yield
+        finally:
+            self._timeouts.timeout = previous
+
+    @contextmanager
+    def _query_timeout(self, timeout: float) -> Iterator[None]:
+        with self.checkout() as connection:
+            if not self.set_query_timeout(connection, timeout):
+                if not self._query_timeout_warned:
+                    self._query_timeout_warned = True
+                    logger.warning(
+                        f"Query timeouts are not supported by data source "
+                        f"{self.data_source_name}, ignoring"
+                    )
+                yield
+                return
+            try:
+                yield
+            except Exception:
+                # A cancelled query may leave the transaction aborted
+                try:
+                    self._reset_connection(connection)
+                except Exception as e:
+                    logger.warning(f"Failed to reset the connection: {str(e)}")
+                raise
+            finally:
+                try:
+                    self.set_query_timeout(connection, None)
+                except Exception as e:
+                    logger.warning(f"Failed to reset the query timeout: {str(e)}")
+
     def fetchall(self, query):
-        if self.use_sa_text_query:
-            return self.connection.execute(text(query)).fetchall()
-        return self.connection.execute(query).fetchall()
+        query = self.apply_sampling(query)
+        return self._memoize(
+            ("fetchall", QueryResultCache.normalize_query(query)),
+            lambda: self._fetchall(query),
+        )
 
     def fetchone(self, query):
-        if self.use_sa_text_query:
-            return self.connection.execute(text(query)).fetchone()
-        return self.connection.execute(query).fetchone()
+        query = self.apply_sampling(query)
+        return self._memoize(
+            ("fetchone", QueryResultCache.normalize_query(query)),
+            lambda: self._fetchone(query),
+        )
+
+    def _fetchall(self, query):
+        with self.checkout() as connection:
+            if self.use_sa_text_query:
+                return connection.execute(text(query)).fetchall()
+            return connection.execute(query).fetchall()
+
+    def _fetchone(self, query):
+        with self.checkout() as connection:
+            if self.use_sa_text_query:
+                return connection.execute(text(query)).fetchone()
+            return connection.execute(query).fetchone()
+
+    def configure_cursor(self, cursor: Any, batch_size: int):
+        """
+        Set the number of rows a DBAPI cursor fetches per round trip
+        :param cursor: cursor of a checked out connection
+        :param batch_size: number of rows fetched per round trip
+        """
+        if hasattr(cursor, "arraysize"):
+            cursor.arraysize = batch_size
+
+    def _execute_stream(self, connection: Any, query: str, batch_size: int) -> Any:
+        """
+        Execute a query with a server-side cursor
+        :return: result or cursor to fetch the rows from with fetchmany
+        """
+        if isinstance(connection, Connection):
+            # Options of the statement only, Connection.execution_options() would
+            # change the pooled connection for every later query
+            return connection.execute(
+                text(query),
+                execution_options={"stream_results": True, "yield_per": batch_size},
+            )
+        cursor = connection.cursor()
+        self.configure_cursor(cursor, batch_size)
+        cursor.execute(query)
+        return cursor
+
+    def iter_rows(
+        self, query: str, batch_size: Optional[int] = None
+    ) -> Iterator[Tuple]:
+        """
+        Iterate over the rows of a query with a server-side cursor, fetching
+        batch_size rows at a time instead of loading the whole result in memory.
+        The connection is checked out until the iteration ends or the iterator is
+        closed. Results are not memoized.
+        :param query: query to run
+        :param batch_size: number of rows fetched per round trip, the fetch_size of
+            the data source if not provided
+        """
+        batch_size = batch_size or self.fetch_size
+        query = self.apply_sampling(query)
+        with self.checkout() as connection:
+            result = self._execute_stream(connection, query, batch_size)
+            try:
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                result.close()
 
     def safe_get(self, lst, idx, default=None):
         return lst[idx] if 0 <= idx < len(lst) else default
@@ -156,6 +503,343 @@ class SQLDataSource(DataSource):
         """
         return f"[{column}]"
 
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        text = value.isoformat(sep=" ", timespec="microseconds")
+        if value.tzinfo is not None:
+            return f"TIMESTAMP WITH TIME ZONE '{text}'"
+        return f"TIMESTAMP '{text}'"
+
+    def date_literal(self, value: date) -> str:
+        """
+        Get the SQL literal of a date
+        :param value: date
+        :return: SQL literal
+        """
+        return f"DATE '{value.isoformat()}'"
+
+    def random_expression(self) -> str:
+        """
+        Get the expression of a random number between 0 and 1, evaluated per row
+        """
+        return "RANDOM()"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table. Dialects with native
+        sampling override it, the default filters the rows with a random number.
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return (
+            f"(SELECT * FROM {qualified_table_name} "
+            f"WHERE {self.random_expression()} < {percent / 100}) AS dcs_sample"
+        )
+
+    @property
+    def available_connections(self) -> int:
+        """
+        Number of pooled connections that can be checked out without waiting
+        """
+        try:
+            return self._get_connection_pool().available
+        except DataChecksDataSourcesConnectionError:
+            return 0
+
+    def thread_state(self) -> Tuple[Any, Optional[Tuple[str, float]], Optional[float]]:
+        """
+        Get the checked out connection, the sampling and the query timeout of the
+        current thread, to run queries of the thread on a worker thread
+        :return: connection, sampling table and percent, timeout in seconds
+        """
+        return (
+            getattr(self._checked_out, "connection", None),
+            getattr(self._sampling, "state", None),
+            getattr(self._timeouts, "timeout", None),
+        )
+
+    @contextmanager
+    def worker_connection(
+        self,
+        state: Tuple[Any, Optional[Tuple[str, float]], Optional[float]],
+        lend: bool = False,
+    ) -> Iterator[bool]:
+        """
+        Run the queries of a worker thread with the sampling and the query timeout of
+        the thread the state was taken from. With lend, the worker uses the connection
+        of that thread, which must not query the data source until the worker is done.
+        Otherwise the worker checks out an idle pooled connection, without waiting.
+        :param state: thread state returned by thread_state
+        :param lend: use the checked out connection of the state
+        :return: whether the worker got a connection
+        """
+        connection, sampling, timeout = state
+        with ExitStack() as stack:
+            if not lend:
+                try:
+                    connection = stack.enter_context(
+                        self._get_connection_pool().checkout(wait=False)
+                    )
+                except Exception as e:
+                    logger.debug(
+                        f"No worker connection of data source "
+                        f"{self.data_source_name}: {str(e)}"
+                    )
+                    connection = None
+            if connection is None:
+                yield False
+                return
+            self._checked_out.connection = connection
+            stack.callback(setattr, self._checked_out, "connection", None)
+            if sampling is not None:
+                stack.enter_context(self.sampling(*sampling))
+            if timeout is not None:
+                if lend:
+                    # The lent connection already has the timeout
+                    self._timeouts.timeout = timeout
+                    stack.callback(setattr, self._timeouts, "timeout", None)
+                else:
+                    stack.enter_context(self.timeout(timeout))
+            yield True
+
+    @contextmanager
+    def sampling(self, table: str, percent: float) -> Iterator[None]:
+        """
+        Run the queries of the current thread on a sample of a table. Every query
+        reading from the table is rewritten to read from its sample instead.
+        :param table: name of the table
+        :param percent: percentage of the rows to sample
+        """
+        previous = getattr(self._sampling, "state", None)
+        self._sampling.state = (table, percent)
+        try:
+            yield
+        finally:
+            self._sampling.state = previous
+
+    def apply_sampling(self, query: str) -> str:
+        """
+        Rewrite a query to read from the sample of the table of the sampling context
+        :param query: query text
+        :return: rewritten query text
+        """
+        state = getattr(self._sampling, "state", None)
+        if state is None:
+            return query
+        table, percent = state
+        qualified_table_name = self.qualified_table_name(table)
+        return re.sub(
+            rf"(\bFROM\s+){re.escape(qualified_table_name)}(?=\s|\)|;|$)",
+            lambda match: match.group(1)
+            + self.sampled_table(qualified_table_name, percent),
+            query,
+            flags=re.IGNORECASE,
+        )
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return None
+
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Get the condition matching a quoted column against a regex pattern
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: SQL condition, None if the dialect can not express the pattern
+        """
+        return f"{field} ~ '{regex_pattern}'"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS VARCHAR)"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. A timestamp without time zone is taken as UTC.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        # The epoch of a timestamp without time zone is its UTC epoch
+        return (
+            f"TO_CHAR(TO_TIMESTAMP(EXTRACT(EPOCH FROM {field})) AT TIME ZONE 'UTC', "
+            f"'YYYY-MM-DD HH24:MI:SS.US')"
+        )
+
+    def numeric_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted numeric column with 10 decimal digits
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return self.text_expression(f"CAST({field} AS DECIMAL(38, 10))")
+
+    def boolean_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted boolean column as 1 or 0
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CASE WHEN {field} THEN '1' WHEN NOT {field} THEN '0' END"
+
+    def normalized_text_expression(
+        self, field: str, data_type: Optional[str] = None
+    ) -> str:
+        """
+        Get the expression casting a quoted column to the text hashed by a data diff.
+        Every dialect renders the same value as the same text: timestamps in UTC with
+        6 fractional digits, numbers with 10 decimal digits and booleans as 1 or 0.
+        :param field: quoted column name
+        :param data_type: python type name of the column, see query_get_column_metadata
+        :return: SQL expression
+        """
+        if data_type in ("datetime", "date"):
+            return self.timestamp_text_expression(field)
+        if data_type in ("int", "float", "Decimal"):
+            return self.numeric_text_expression(field)
+        if data_type == "bool":
+            return self.boolean_text_expression(field)
+        return self.text_expression(field)
+
+    def concat_expression(self, expressions: List[str]) -> str:
+        """
+        Get the expression concatenating text expressions
+        :param expressions: text expressions
+        :return: SQL expression
+        """
+        return " || ".join(expressions)
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest. Every dialect has to produce the
+        same hash of the same text to compare tables across data sources.
+        :param expression: text expression
+        :return: SQL expression, None if the dialect can not hash rows
+        """
+        return None
+
+    def row_hash_expression(
+        self, fields: List[str], data_types: Optional[List[Optional[str]]] = None
+    ) -> Optional[str]:
+        """
+        Get the expression hashing the normalized text of quoted columns of a row
+        :param fields: quoted column names
+        :param data_types: python type names of the columns, text casts if not provided
+        :return: SQL expression, None if the dialect can not hash rows
+        """
+        data_types = data_types or [None] * len(fields)
+        values = []
+        for i, (field, data_type) in enumerate(zip(fields, data_types)):
+            if i > 0:
+                values.append("'|'")
+            text = self.normalized_text_expression(field, data_type)
+            values.append(f"COALESCE({text}, '<null>')")
+        return self.hash_expression(self.concat_expression(values))
+
+    def modulo_expression(self, expression: str, modulus: int) -> str:
+        """
+        Get the expression of the remainder of an integer expression by a modulus
+        :param expression: integer expression
+        :param modulus: modulus
+        :return: SQL expression
+        """
+        return f"MOD({expression}, {modulus})"
+
+    def aggregate_expression(self, aggregate: ScanAggregate) -> Optional[str]:
+        """
+        Get the SQL expression computing an aggregate of a fused scan
+        :param aggregate: aggregate to compute
+        :return: SQL expression, None if the aggregate is not supported by the dialect
+        """
+        field = self.quote_column(aggregate.field) if aggregate.field else None
+        aggregate_type = aggregate.type
+
+        if aggregate_type == AggregateType.ROW_COUNT:
+            return "COUNT(*)"
+        elif aggregate_type == AggregateType.MIN:
+            return f"MIN({field})"
+        elif aggregate_type == AggregateType.MAX:
+            return f"MAX({field})"
+        elif aggregate_type == AggregateType.AVG:
+            return f"AVG({field})"
+        elif aggregate_type == AggregateType.SUM:
+            return f"SUM({field})"
+        elif aggregate_type == AggregateType.VARIANCE:
+            return f"VAR_SAMP({field})"
+        elif aggregate_type == AggregateType.STDDEV:
+            return f"STDDEV_SAMP({field})"
+        elif aggregate_type == AggregateType.VALUE_COUNT:
+            return f"COUNT({field})"
+        elif aggregate_type == AggregateType.DISTINCT_COUNT:
+            return f"COUNT(DISTINCT {field})"
+        elif aggregate_type == AggregateType.APPROX_DISTINCT_COUNT:
+            return self.approximate_distinct_expression(field)
+        elif aggregate_type == AggregateType.STRING_LENGTH_MAX:
+            return f"MAX(LENGTH({field}))"
+        elif aggregate_type == AggregateType.STRING_LENGTH_MIN:
+            return f"MIN(LENGTH({field}))"
+        elif aggregate_type == AggregateType.STRING_LENGTH_AVG:
+            return f"AVG(LENGTH({field}))"
+
+        if aggregate_type == AggregateType.NULL_COUNT:
+            condition = f"{field} IS NULL"
+        elif aggregate_type == AggregateType.EMPTY_STRING_COUNT:
+            condition = f"{field} = ''"
+        elif aggregate_type == AggregateType.ZERO_COUNT:
+            condition = f"{field} = 0"
+        elif aggregate_type == AggregateType.NEGATIVE_COUNT:
+            condition = f"{field} < 0"
+        elif aggregate_type == AggregateType.VALUES_MATCH_COUNT:
+            values_str = ", ".join([f"'{value}'" for value in aggregate.argument])
+            condition = f"{field} IN ({values_str})"
+        elif aggregate_type == AggregateType.REGEX_MATCH_COUNT:
+            condition = self.regex_match_condition(field, aggregate.argument)
+        elif aggregate_type == AggregateType.PREDEFINED_REGEX_MATCH_COUNT:
+            condition = self.regex_match_condition(
+                field, self.regex_patterns[aggregate.argument]
+            )
+        else:
+            return None
+
+        if condition is None:
+            return None
+        return f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)"
+
+    def query_get_aggregates(
+        self, table: str, aggregates: List[ScanAggregate], filters: str = None
+    ) -> List[Any]:
+        """
+        Compute several aggregates of a table with a single scan
+        :param table: table name
+        :param aggregates: aggregates to compute
+        :param filters: filter condition
+        :return: aggregate values, in the order of the aggregates
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        expressions = ", ".join(
+            [self.aggregate_expression(aggregate) for aggregate in aggregates]
+        )
+        query = f"SELECT {expressions} FROM {qualified_table_name}"
+        if filters:
+            query += f" WHERE {filters}"
+
+        return list(self.fetchone(query))
+
     def query_get_database_version(
         self, database_version_query: Optional[str] = None
     ) -> str:
@@ -173,6 +857,10 @@ class SQLDataSource(DataSource):
         :param table_name: name of the table
         :return: query for column metadata
         """
+        columns = self.get_schema_columns().get(table_name)
+        if columns is not None:
+            return columns
+
         results_: Dict[str, str] = {}
 
         columns = inspect(self.connection.engine).get_columns(table_name)
@@ -181,6 +869,163 @@ class SQLDataSource(DataSource):
 
         return results_
 
+    def catalog_python_type(self, data_type: str) -> str:
+        """
+        Get the python type name of a data type of the system catalog
+        :param data_type: data type of the catalog, e.g. character varying(255)
+        :return: python type name, object for an unknown data type
+        """
+        name = data_type.lower().split("(")[0].strip()
+        if name in self.CATALOG_PYTHON_TYPES:
+            return self.CATALOG_PYTHON_TYPES[name]
+        if name.startswith("timestamp") or name.startswith("datetime"):
+            return "datetime"
+        if name.startswith("time"):
+            return "time"
+        if name.startswith("interval"):
+            return "timedelta"
+        return "object"
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        """
+        Get the catalog query of the columns of every table of a schema. The query
+        returns the table name, the column name and the data type of every column.
+        :param schema: schema name
+        """
+        return (
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            f"WHERE table_schema = '{schema}' "
+            "ORDER BY table_name, ordinal_position"
+        )
+
+    def query_get_schema_columns(self, schema: str) -> Dict[str, Dict[str, str]]:
+        """
+        Get the columns of every table of a schema with a single catalog query,
+        falling back to the bulk reflection of SQLAlchemy when the dialect has no
+        usable catalog query
+        :param schema: schema name
+        :return: python type name by column name, by table name
+        """
+        tables: Dict[str, Dict[str, str]] = {}
+        dialect = self.connection.engine.dialect
+        # Case insensitive names are upper case in the catalog of some dialects
+        normalize_name = (
+            dialect.normalize_name if dialect.requires_name_normalize else str
+        )
+        try:
+            rows = self.fetchall(
+                self.query_get_schema_columns_query(
+                    dialect.denormalize_name(schema)
+                    if dialect.requires_name_normalize
+                    else schema
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"Catalog query of the columns of schema {schema} failed, "
+                f"reflecting the tables instead [{str(e)}]"
+            )
+            multi_columns = inspect(self.connection.engine).get_multi_columns(
+                schema=schema
+            )
+            for (_, table_name), columns in multi_columns.items():
+                tables[table_name] = {
+                    column["name"]: column["type"].python_type.__name__
+                    for column in columns
+                }
+            return tables
+
+        for table_name, column_name, data_type in rows:
+            columns = tables.setdefault(normalize_name(table_name), {})
+            columns[normalize_name(column_name)] = self.catalog_python_type(
+                str(data_type)
+            )
+        return tables
+
+    def _default_schema(self) -> str:
+        return self.schema_name or inspect(self.connection.engine).default_schema_name
+
+    def get_schema_columns(
+        self, schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get the columns of every table of a schema from the metadata cache. The
+        catalog is queried again once the cached columns are older than
+        metadata_cache_ttl seconds. With metadata_cache_path, the cache is kept on
+        disk so a new run starts without catalog queries.
+        :param schema: schema name, the configured or default schema if not provided
+        :return: python type name by column name, by table name
+        """
+        schema = schema or self._default_schema()
+        with self._schema_columns_lock:
+            if not self._schema_columns and self.metadata_cache_path:
+                self._schema_columns = self._read_metadata_cache()
+            cached = self._schema_columns.get(schema)
+            # Wall clock time, the loaded time outlives the process on disk
+            if cached is not None and time.time() - cached[0] < self.metadata_cache_ttl:
+                return cached[1]
+
+        tables = self.query_get_schema_columns(schema)
+        with self._schema_columns_lock:
+            self._schema_columns[schema] = (time.time(), tables)
+            if self.metadata_cache_path:
+                self._write_metadata_cache()
+        return tables
+
+    def invalidate_schema_columns(self, schema: Optional[str] = None):
+        """
+        Drop the cached columns of a schema, or of every schema
+        :param schema: schema name, None for all of them
+        """
+        with self._schema_columns_lock:
+            if schema is None:
+                self._schema_columns.clear()
+            else:
+                self._schema_columns.pop(schema, None)
+            if self.metadata_cache_path:
+                self._write_metadata_cache()
+
+    def _read_metadata_cache(
+        self,
+    ) -> Dict[str, Tuple[float, Dict[str, Dict[str, str]]]]:
+        try:
+            with open(self.metadata_cache_path) as cache_file:
+                content = json.load(cache_file)
+            return {
+                schema: (cached["loaded_at"], cached["tables"])
+                for schema, cached in content.get(self.data_source_name, {}).items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(
+                f"Ignoring unreadable metadata cache {self.metadata_cache_path} [{str(e)}]"
+            )
+            return {}
+
+    def _write_metadata_cache(self):
+        # The file is shared by the data sources, keep the entries of the others
+        content: Dict = {}
+        try:
+            with open(self.metadata_cache_path) as cache_file:
+                content = json.load(cache_file)
+        except (OSError, ValueError):
+            pass
+        content[self.data_source_name] = {
+            schema: {"loaded_at": loaded_at, "tables": tables}
+            for schema, (loaded_at, tables) in self._schema_columns.items()
+        }
+        temporary_path = f"{self.metadata_cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w") as cache_file:
+                json.dump(content, cache_file)
+            os.replace(temporary_path, self.metadata_cache_path)
+        except OSError as e:
+            logger.warning(
+                f"Failed to write metadata cache {self.metadata_cache_path} [{str(e)}]"
+            )
+
     def query_get_table_metadata(self) -> List[str]:
         """
         Get the table metadata
@@ -388,6 +1233,413 @@ class SQLDataSource(DataSource):
 
         return self.fetchone(query)[0]
 
+    def query_get_value_frequencies(
+        self, table: str, field: str, filters: str = None
+    ) -> Dict[int, int]:
+        """
+        Get the number of distinct non null values by their frequency
+        :param table: table name
+        :param field: column name
+        :param filters: filter condition
+        :return: number of distinct values by frequency
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        field = self.quote_column(field)
+        condition = f"{field} IS NOT NULL"
+        if filters:
+            condition += f" AND ({filters})"
+        query = (
+            f"SELECT dcs_frequency, COUNT(*) FROM ("
+            f"SELECT COUNT(*) AS dcs_frequency FROM {qualified_table_name} "
+            f"WHERE {condition} GROUP BY {field}) dcs_groups GROUP BY dcs_frequency"
+        )
+        return {int(frequency): int(count) for frequency, count in self.fetchall(query)}
+
+    def _row_hash_expression(self, table: str, fields: List[str]) -> str:
+        columns = {
+            name.lower(): data_type
+            for name, data_type in self.query_get_column_metadata(table).items()
+        }
+        expression = self.row_hash_expression(
+            [self.quote_column(field) for field in fields],
+            [columns.get(field.lower()) for field in fields],
+        )
+        if expression is None:
+            raise DataChecksRuntimeError(
+                message=f"Data source {self.data_source_name} does not support row hashes"
+            )
+        return expression
+
+    def key_bucket_condition(
+        self, table: str, key: str, modulus: int, remainder: int
+    ) -> str:
+        """
+        Get the condition selecting the rows whose key hash has a remainder by a
+        modulus. The same key falls in the same bucket on every dialect.
+        :param table: table name
+        :param key: key column
+        :param modulus: number of buckets
+        :param remainder: bucket of the rows
+        :return: SQL condition
+        """
+        key_hash = self._row_hash_expression(table, [key])
+        return f"{self.modulo_expression(key_hash, modulus)} = {remainder}"
+
+    def query_get_checksum(
+        self, table: str, fields: List[str], filters: str = None
+    ) -> Tuple[int, int]:
+        """
+        Get the row count and an order independent checksum of the rows of a table,
+        the sum of the hashes of the rows
+        :param table: table name
+        :param fields: columns hashed
+        :param filters: filter condition
+        :return: row count and checksum
+        """
+        row_hash = self._row_hash_expression(table, fields)
+        query = (
+            f"SELECT COUNT(*), SUM(CAST({row_hash} AS DECIMAL(38, 0))) "
+            f"FROM {self.qualified_table_name(table)}"
+        )
+        if filters:
+            query += f" WHERE {filters}"
+        count, checksum = self.fetchone(query)
+        return int(count or 0), int(checksum or 0)
+
+    def query_get_row_hashes(
+        self, table: str, key: str, fields: List[str], filters: str = None
+    ) -> Dict[Any, int]:
+        """
+        Get the hash of every row of a table by key
+        :param table: table name
+        :param key: key column
+        :param fields: columns hashed
+        :param filters: filter condition
+        :return: row hash by key
+        """
+        row_hash = self._row_hash_expression(table, fields)
+        query = (
+            f"SELECT {self.quote_column(key)}, {row_hash} "
+            f"FROM {self.qualified_table_name(table)}"
+        )
+        if filters:
+            query += f" WHERE {filters}"
+        return {row[0]: int(row[1]) for row in self.fetchall(query)}
+
+    def get_table_foreign_key_info(
+        self, table_name: str, schema: str | None = None
+    ) -> List[Dict[str, str]]:
+        """
+        Get the foreign key columns of a table, one row per referencing column,
+        reflected from the database
+        :param table_name: table name
+        :param schema: schema name, the configured schema if not provided
+        :return: constraint_name, table_name, fk_column, referenced_table and
+            referenced_column of every foreign key column
+        """
+        try:
+            foreign_keys = inspect(self.connection.engine).get_foreign_keys(
+                table_name, schema=schema or self.schema_name
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch fk info for dataset {table_name}: {str(e)}")
+            return []
+        rows = []
+        for i, foreign_key in enumerate(foreign_keys):
+            for column, referenced_column in zip(
+                foreign_key["constrained_columns"], foreign_key["referred_columns"]
+            ):
+                rows.append(
+                    {
+                        "constraint_name": foreign_key.get("name") or f"fk_{i}",
+                        "table_name": table_name,
+                        "fk_column": column,
+                        "referenced_table": foreign_key["referred_table"],
+                        "referenced_column": referenced_column,
+                    }
+                )
+        return rows
+
+    def get_table_foreign_keys(self, table: str) -> List[ForeignKey]:
+        """
+        Get the foreign keys of a table, the columns of a composite key grouped by
+        constraint
+        :param table: table name
+        :return: foreign keys of the table
+        """
+        foreign_keys: Dict[Tuple[str, str], ForeignKey] = {}
+        for row in self.get_table_foreign_key_info(table):
+            key = (row["constraint_name"], row["referenced_table"])
+            foreign_key = foreign_keys.setdefault(
+                key,
+                ForeignKey(
+                    name=row["constraint_name"],
+                    columns=[],
+                    referenced_table=row["referenced_table"],
+                    referenced_columns=[],
+                ),
+            )
+            if row["fk_column"] not in foreign_key.columns:
+                foreign_key.columns.append(row["fk_column"])
+                foreign_key.referenced_columns.append(row["referenced_column"])
+        return list(foreign_keys.values())
+
+    def orphan_condition(self, foreign_key: ForeignKey) -> str:
+        """
+        Condition of the rows of the child table, aliased dcs_child, referencing no
+        row of the parent table. As with MATCH SIMPLE, a key with a null column is
+        not checked.
+        :param foreign_key: foreign key of the child table
+        :return: NOT EXISTS anti-join condition
+        """
+        not_null = " AND ".join(
+            f"dcs_child.{self.quote_column(column)} IS NOT NULL"
+            for column in foreign_key.columns
+        )
+        join = " AND ".join(
+            f"dcs_parent.{self.quote_column(referenced)} = "
+            f"dcs_child.{self.quote_column(column)}"
+            for column, referenced in zip(
+                foreign_key.columns, foreign_key.referenced_columns
+            )
+        )
+        return (
+            f"{not_null} AND NOT EXISTS (SELECT 1 FROM "
+            f"{self.qualified_table_name(foreign_key.referenced_table)} dcs_parent "
+            f"WHERE {join})"
+        )
+
+    def query_get_orphan_counts(
+        self, table: str, foreign_keys: List[ForeignKey], filters: str = None
+    ) -> List[int]:
+        """
+        Get the number of rows of a table referencing no row of the parent table of
+        each foreign key. Every foreign key is checked by an anti-join on the parent
+        table, all of them in a single scan of the table if the dialect supports
+        correlated subqueries in the select list, else one query per foreign key.
+        :param table: table name
+        :param foreign_keys: foreign keys of the table
+        :param filters: filter condition on the rows of the table
+        :return: number of orphan rows of every foreign key
+        """
+        if not foreign_keys:
+            return []
+        qualified_table_name = self.qualified_table_name(table)
+        where = f" WHERE {filters}" if filters else ""
+        if not self.BATCHED_ORPHAN_COUNTS:
+            return [
+                int(
+                    self.fetchone(
+                        f"SELECT COUNT(*) FROM {qualified_table_name} dcs_child WHERE "
+                        f"{self.orphan_condition(foreign_key)}"
+                        + (f" AND ({filters})" if filters else "")
+                    )[0]
+                    or 0
+                )
+                for foreign_key in foreign_keys
+            ]
+        counts = ", ".join(
+            f"SUM(CASE WHEN {self.orphan_condition(foreign_key)} THEN 1 ELSE 0 END)"
+            for foreign_key in foreign_keys
+        )
+        row = self.fetchone(
+            f"SELECT {counts} FROM {qualified_table_name} dcs_child{where}"
+        )
+        return [int(value or 0) for value in row]
+
+    def query_stream_key_counts(
+        self,
+        table: str,
+        key: str,
+        filters: str = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Tuple[Any, int]]:
+        """
+        Stream the distinct non null values of a key column with their row count,
+        batch_size rows at a time through a server-side cursor
+        :param table: table name
+        :param key: key column
+        :param filters: filter condition
+        :param batch_size: number of keys fetched per round trip, the fetch_size of
+            the data source if not provided
+        :return: iterator of key and number of rows with the key
+        """
+        key = self.quote_column(key)
+        condition = f"{key} IS NOT NULL"
+        if filters:
+            condition += f" AND ({filters})"
+        query = (
+            f"SELECT {key}, COUNT(*) FROM {self.qualified_table_name(table)} "
+            f"WHERE {condition} GROUP BY {key}"
+        )
+        for row in self.iter_rows(query, batch_size=batch_size):
+            yield row[0], int(row[1])
+
+    def _query_fingerprint(self, query: str) -> Optional[str]:
+        """
+        Get a fingerprint from the first row of a query on the table metadata
+        :param query: metadata query
+        :return: fingerprint, None if the table or one of the values is missing
+        """
+        row = self.fetchone(query)
+        if row is None or any(value is None for value in row):
+            return None
+        return ":".join(str(value) for value in row)
+
+    def query_get_approximate_distinct_count(
+        self, table: str, field: str, filters: str = None, sample_percent: float = None
+    ) -> Tuple[int, Optional[float]]:
+        """
+        Get the approximate distinct count, with the native sketch of the dialect or
+        estimated on a sample of the table when the dialect has none
+        :param table: table name
+        :param field: column name
+        :param filters: filter condition
+        :param sample_percent: percentage of the rows sampled when there is no sketch
+        :return: approximate distinct count and its estimated relative error
+        """
+        expression = self.approximate_distinct_expression(self.quote_column(field))
+        if expression is not None:
+            query = f"SELECT {expression} FROM {self.qualified_table_name(table)}"
+            if filters:
+                query += f" WHERE {filters}"
+            value = self.fetchone(query)[0]
+            return round(value or 0), self.APPROXIMATE_DISTINCT_ERROR
+
+        percent = sample_percent or self.DEFAULT_APPROXIMATE_SAMPLE_PERCENT
+        with self.sampling(table, percent):
+            frequencies = self.query_get_value_frequencies(table, field, filters)
+        return estimate_distinct_count(frequencies, percent)
+
+    def query_get_approximate_duplicate_count(
+        self, table: str, field: str, filters: str = None, sample_percent: float = None
+    ) -> Tuple[int, Optional[float]]:
+        """
+        Get the approximate number of duplicated values. A sketch can not tell which
+        values repeat, the share of duplicated values of a sample of the table is
+        applied to the approximate distinct count
+        :param table: table name
+        :param field: column name
+        :param filters: filter condition
+        :param sample_percent: percentage of the rows sampled
+        :return: approximate duplicate count and its estimated relative error
+        """
+        distinct_count, distinct_error = self.query_get_approximate_distinct_count(
+            table, field, filters, sample_percent
+        )
+        percent = sample_percent or self.DEFAULT_APPROXIMATE_SAMPLE_PERCENT
+        with self.sampling(table, percent):
+            frequencies = self.query_get_value_frequencies(table, field, filters)
+        return estimate_duplicate_count(frequencies, distinct_count, distinct_error)
+
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the optimizer statistics of a table and its columns from the system
+        catalog, without scanning the table
+        :param table: table name
+        :return: table statistics, None if the dialect keeps no usable statistics
+        """
+        return None
+
+    def get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the statistics of a table, cached for metadata_cache_ttl seconds
+        :param table: table name
+        """
+        with self._table_statistics_lock:
+            cached = self._table_statistics.get(table)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.metadata_cache_ttl
+            ):
+                return cached[1]
+        statistics = self.query_get_table_statistics(table)
+        with self._table_statistics_lock:
+            self._table_statistics[table] = (time.monotonic(), statistics)
+        return statistics
+
+    def _column_statistics(
+        self, table: str, field: str
+    ) -> Tuple[Optional[TableStatistics], Optional[ColumnStatistics]]:
+        statistics = self.get_table_statistics(table)
+        if statistics is None:
+            return None, None
+        column = statistics.columns.get(field)
+        if column is None:
+            # Case insensitive names are stored upper or lower case by the catalog
+            column = next(
+                (
+                    column_statistics
+                    for name, column_statistics in statistics.columns.items()
+                    if name.lower() == field.lower()
+                ),
+                None,
+            )
+        return statistics, column
+
+    def query_get_estimated_row_count(
+        self, table: str
+    ) -> Tuple[Optional[int], Optional[datetime]]:
+        """
+        Get the row count estimated by the optimizer statistics
+        :param table: table name
+        :return: estimated row count, None without statistics, and the time the
+        statistics were gathered
+        """
+        statistics = self.get_table_statistics(table)
+        if statistics is None or statistics.row_count is None:
+            return None, None
+        return statistics.row_count, statistics.updated_at
+
+    def query_get_estimated_null_count(
+        self, table: str, field: str
+    ) -> Tuple[Optional[int], Optional[datetime]]:
+        """
+        Get the null count estimated by the optimizer statistics
+        :param table: table name
+        :param field: column name
+        :return: estimated null count, None without statistics, and the time the
+        statistics were gathered
+        """
+        statistics, column = self._column_statistics(table, field)
+        if (
+            column is None
+            or column.null_fraction is None
+            or statistics.row_count is None
+        ):
+            return None, None
+        return round(column.null_fraction * statistics.row_count), statistics.updated_at
+
+    def query_get_estimated_null_percentage(
+        self, table: str, field: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        """
+        Get the null percentage estimated by the optimizer statistics
+        :param table: table name
+        :param field: column name
+        :return: estimated null percentage, None without statistics, and the time the
+        statistics were gathered
+        """
+        statistics, column = self._column_statistics(table, field)
+        if column is None or column.null_fraction is None:
+            return None, None
+        return round(column.null_fraction * 100, 2), statistics.updated_at
+
+    def query_get_estimated_distinct_count(
+        self, table: str, field: str
+    ) -> Tuple[Optional[int], Optional[datetime]]:
+        """
+        Get the distinct count estimated by the optimizer statistics
+        :param table: table name
+        :param field: column name
+        :return: estimated distinct count, None without statistics, and the time the
+        statistics were gathered
+        """
+        statistics, column = self._column_statistics(table, field)
+        if column is None or column.distinct_count is None:
+            return None, None
+        return column.distinct_count, statistics.updated_at
+
     def query_get_null_percentage(
         self, table: str, field: str, filters: str = None
     ) -> int:
@@ -422,66 +1674,199 @@ class SQLDataSource(DataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT {field} from {qualified_table_name} ORDER BY {field} DESC LIMIT 1;
+            SELECT MAX({field}) FROM {qualified_table_name};
         """
         result = self.fetchone(query)
-        if result:
-            return int((datetime.utcnow() - result[0]).total_seconds())
+        if result and result[0] is not None:
+            updated_time = result[0]
+            if isinstance(updated_time, str):
+                updated_time = datetime.fromisoformat(updated_time)
+            return self._seconds_since(updated_time)
         return 0
 
-    def profiling_sql_aggregates_numeric(
-        self, table_name: str, column_name: str
+    @staticmethod
+    def _seconds_since(timestamp: datetime) -> int:
+        now = (
+            datetime.now(timezone.utc)
+            if timestamp.tzinfo is not None
+            else datetime.utcnow()
+        )
+        return int((now - timestamp).total_seconds())
+
+    def query_get_last_modified_query(self) -> Optional[str]:
+        """
+        Get the catalog query of the last modification time of every table of the
+        schema. The query returns the table name and its last modification time.
+        :return: query, None if the catalog does not track modification times
+        """
+        return None
+
+    def get_last_modified_times(self) -> Dict[str, datetime]:
+        """
+        Get the last modification time of every table of the schema with a single
+        catalog query, cached for metadata_cache_ttl seconds
+        :return: last modification time by table name
+        """
+        with self._last_modified_times_lock:
+            cached = self._last_modified_times
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.metadata_cache_ttl
+            ):
+                return cached[1]
+        query = self.query_get_last_modified_query()
+        if query is None:
+            raise DataChecksRuntimeError(
+                message=f"Data source {self.data_source_name} does not track the "
+                f"modification time of its tables, freshness needs a column"
+            )
+        last_modified_times = {
+            table_name: last_modified
+            for table_name, last_modified in self.fetchall(query) or []
+            if last_modified is not None
+        }
+        with self._last_modified_times_lock:
+            self._last_modified_times = (time.monotonic(), last_modified_times)
+        return last_modified_times
+
+    def query_get_table_freshness(self, table: str) -> int:
+        """
+        Get the time since the last modification of a table from the catalog, without
+        reading the table
+        :param table: name of the table
+        :return: time difference in seconds
+        """
+        last_modified_times = self.get_last_modified_times()
+        last_modified = last_modified_times.get(table)
+        if last_modified is None:
+            # Case insensitive names are stored upper or lower case by the catalog
+            last_modified = next(
+                (
+                    value
+                    for name, value in last_modified_times.items()
+                    if name.lower() == table.lower()
+                ),
+                None,
+            )
+        if last_modified is None:
+            raise DataChecksRuntimeError(
+                message=f"No modification time of table {table} in the catalog of "
+                f"data source {self.data_source_name}"
+            )
+        return self._seconds_since(last_modified)
+
+    @staticmethod
+    def profiling_numeric_expressions(column_name: str) -> List[Tuple[str, str]]:
+        """
+        Get the profile metrics of a numeric column and their SQL expression
+        :param column_name: quoted column name
+        """
+        return [
+            ("avg", f"avg({column_name})"),
+            ("min", f"min({column_name})"),
+            ("max", f"max({column_name})"),
+            ("sum", f"sum({column_name})"),
+            ("stddev", f"stddev_samp({column_name})"),
+            ("variance", f"var_samp({column_name})"),
+            ("distinct_count", f"count(distinct({column_name}))"),
+            (
+                "missing_count",
+                f"sum(case when {column_name} is null then 1 else 0 end)",
+            ),
+        ]
+
+    @staticmethod
+    def profiling_string_expressions(column_name: str) -> List[Tuple[str, str]]:
+        """
+        Get the profile metrics of a text column and their SQL expression
+        :param column_name: quoted column name
+        """
+        return [
+            ("distinct_count", f"count(distinct({column_name}))"),
+            (
+                "missing_count",
+                f"sum(case when {column_name} is null then 1 else 0 end)",
+            ),
+            ("max_length", f"max(length({column_name}))"),
+            ("min_length", f"min(length({column_name}))"),
+            ("avg_length", f"avg(length({column_name}))"),
+        ]
+
+    def _profiling_query(
+        self, table_name: str, expressions: List[Tuple[str, str]]
     ) -> Dict:
-        column_name = f'"{column_name}"'
         qualified_table_name = self.qualified_table_name(table_name)
+        select = ",\n                ".join(
+            [f"{expression} as {key}" for key, expression in expressions]
+        )
         query = f"""
             SELECT
-                avg({column_name}) as avg,
-                min({column_name}) as min,
-                max({column_name}) as max,
-                sum({column_name}) as sum,
-                stddev_samp({column_name}) as stddev,
-                var_samp({column_name}) as variance,
-                count(distinct({column_name})) as distinct_count,
-                sum(case when {column_name} is null then 1 else 0 end) as missing_count
+                {select}
             FROM {qualified_table_name}
             """
-
         result = self.fetchone(query)
-        return {
-            "avg": result[0],
-            "min": result[1],
-            "max": result[2],
-            "sum": result[3],
-            "stddev": result[4],
-            "variance": result[5],
-            "distinct_count": result[6],
-            "missing_count": result[7],
-        }
+        return {key: result[i] for i, (key, _) in enumerate(expressions)}
+
+    def profiling_sql_aggregates_numeric(
+        self, table_name: str, column_name: str
+    ) -> Dict:
+        return self._profiling_query(
+            table_name, self.profiling_numeric_expressions(f'"{column_name}"')
+        )
 
     def profiling_sql_aggregates_string(
         self, table_name: str, column_name: str
     ) -> Dict:
-        column_name = f'"{column_name}"'
-        qualified_table_name = self.qualified_table_name(table_name)
-        query = f"""
-            SELECT
-                count(distinct({column_name})) as distinct_count,
-                sum(case when {column_name} is null then 1 else 0 end) as missing_count,
-                max(length({column_name})) as max_length,
-                min(length({column_name})) as min_length,
-                avg(length({column_name})) as avg_length
-            FROM {qualified_table_name}
-            """
+        return self._profiling_query(
+            table_name, self.profiling_string_expressions(f'"{column_name}"')
+        )
 
-        result = self.fetchone(query)
-        return {
-            "distinct_count": result[0],
-            "missing_count": result[1],
-            "max_length": result[2],
-            "min_length": result[3],
-            "avg_length": result[4],
-        }
+    def profiling_sql_aggregates_table(
+        self,
+        table_name: str,
+        columns: Dict[str, str],
+        max_aggregates: int = 100,
+    ) -> Tuple[int, Dict[str, Dict]]:
+        """
+        Profile the numeric and text columns of a table with a single aggregate query,
+        split into several queries of at most max_aggregates aggregates for wide
+        tables. The aggregates of one column are never split.
+        :param table_name: table name
+        :param columns: python data type by column name
+        :param max_aggregates: maximum number of aggregates in one query
+        :return: row count of the table and the aggregates of every profiled column
+        """
+        batches: List[List[Tuple[str, str]]] = [[("row_count", "count(*)")]]
+        for position, (column, data_type) in enumerate(columns.items()):
+            if data_type in self.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
+                expressions = self.profiling_numeric_expressions(f'"{column}"')
+            elif data_type in self.TEXT_PYTHON_TYPES_FOR_PROFILING:
+                expressions = self.profiling_string_expressions(f'"{column}"')
+            else:
+                continue
+            # Column names are not valid aliases, the position identifies the column
+            expressions = [
+                (f"c{position}_{key}", expression) for key, expression in expressions
+            ]
+            if len(batches[-1]) + len(expressions) > max_aggregates:
+                batches.append([])
+            batches[-1].extend(expressions)
+
+        values: Dict = {}
+        for batch in batches:
+            values.update(self._profiling_query(table_name, batch))
+
+        profiles: Dict[str, Dict] = {}
+        for position, column in enumerate(columns):
+            prefix = f"c{position}_"
+            profile = {
+                key[len(prefix) :]: value
+                for key, value in values.items()
+                if key.startswith(prefix)
+            }
+            if profile:
+                profiles[column] = profile
+        return values["row_count"], profiles
 
     def query_get_duplicate_count(
         self, table: str, field: str, filters: str = None
@@ -490,16 +1875,17 @@ class SQLDataSource(DataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT
-            count(*) as duplicate_count
-            FROM {qualified_table_name}
-            {filters}
-            GROUP BY {field}
-            HAVING COUNT(*) > 1
+            SELECT COUNT(*) FROM (
+                SELECT {field}
+                FROM {qualified_table_name}
+                {filters}
+                GROUP BY {field}
+                HAVING COUNT(*) > 1
+            ) dcs_duplicates
             """
 
-        result = self.fetchall(query)
-        return len(result) if result else 0
+        result = self.fetchone(query)
+        return result[0] if result else 0
 
     def query_string_pattern_validity(
         self,
@@ -677,12 +2063,78 @@ class SQLDataSource(DataSource):
         :param filters: filter condition
         :return: the value at the specified percentile
         """
+        return self.query_get_percentiles(
+            table=table, field=field, percentiles=[percentile], filters=filters
+        )[0]
+
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column with a single query.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
-        query = f"SELECT PERCENTILE_DISC({percentile}) WITHIN GROUP (ORDER BY {field}) FROM {qualified_table_name}"
+        expressions = ", ".join(
+            [
+                f"PERCENTILE_DISC({percentile}) WITHIN GROUP (ORDER BY {field})"
+                for percentile in percentiles
+            ]
+        )
+        query = f"SELECT {expressions} FROM {qualified_table_name}"
         if filters:
             query += f" WHERE {filters}"
-        return round(self.fetchone(query)[0], 2)
+        return [
+            round(value, 2) if value is not None else None
+            for value in self.fetchone(query)
+        ]
+
+    def query_get_percentiles_streaming(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column for dialects without an
+        ordered-set aggregate. The ordered values are streamed through a server-side
+        cursor and the discrete percentiles picked by rank, so the client memory does
+        not grow with the table.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        field = self.quote_column(field)
+        condition = f"{field} IS NOT NULL"
+        if filters:
+            condition += f" AND ({filters})"
+
+        count = self.fetchone(
+            f"SELECT COUNT(*) FROM {qualified_table_name} WHERE {condition}"
+        )[0]
+        if not count:
+            return [None for _ in percentiles]
+
+        # Rank of PERCENTILE_DISC: first value whose cumulative distribution >= p
+        ranks = [max(1, math.ceil(round(p * count, 9))) for p in percentiles]
+        values: Dict[int, Any] = {}
+        last_value = None
+        query = f"SELECT {field} FROM {qualified_table_name} WHERE {condition} ORDER BY {field}"
+        with closing(self.iter_rows(query)) as rows:
+            for position, row in enumerate(rows, start=1):
+                last_value = row[0]
+                if position in ranks:
+                    values[position] = last_value
+                if position >= max(ranks):
+                    break
+        # A sampled stream may be shorter than the sampled count
+        results = [values.get(rank, last_value) for rank in ranks]
+        return [round(value, 2) if value is not None else None for value in results]
 
     def query_zero_metric(
         self, table: str, field: str, operation: str, filters: str = None
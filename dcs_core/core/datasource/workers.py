@@ -0,0 +1,117 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+
+Call = Tuple[DataSource, Callable[[], Any]]
+
+
+def map_on_connections(
+    calls: Sequence[Call], thread_name_prefix: str = "dcs-worker"
+) -> List[Any]:
+    """
+    Run calls, each querying one data source, in parallel on the connections that
+    are available right now, never waiting for a connection held by another task.
+    The current thread runs the calls of the data source of the first call on its
+    own connection. The connection it holds of any other SQL data source is lent to
+    a worker thread, and a worker thread is started for every idle pooled connection
+    of a data source. Calls left without a connection run on the current thread.
+    Worker threads keep the sampling and the query timeout of the current thread.
+    A failing call cancels the calls that have not started yet.
+    :param calls: data source and function of every call
+    :param thread_name_prefix: name prefix of the worker threads
+    :return: result of every call, in the order of the calls
+    """
+    if len(calls) <= 1:
+        return [function() for _, function in calls]
+
+    queues: Dict[int, queue.SimpleQueue] = {}
+    data_sources: Dict[int, DataSource] = {}
+    for index, (data_source, _) in enumerate(calls):
+        data_sources[id(data_source)] = data_source
+        queues.setdefault(id(data_source), queue.SimpleQueue()).put(index)
+    home = id(calls[0][0])
+
+    results: List[Any] = [None] * len(calls)
+    failed = threading.Event()
+
+    def drain(key: int):
+        while not failed.is_set():
+            try:
+                index = queues[key].get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[index] = calls[index][1]()
+            except BaseException:
+                failed.set()
+                raise
+
+    def work(data_source: SQLDataSource, state: Tuple, lend: bool):
+        with data_source.worker_connection(state, lend=lend) as connected:
+            if connected:
+                drain(id(data_source))
+
+    with ExitStack() as stack:
+        caller_keys = [home]
+        workers: List[Tuple[SQLDataSource, Tuple, bool]] = []
+        for key, data_source in data_sources.items():
+            if not isinstance(data_source, SQLDataSource):
+                if key != home:
+                    caller_keys.append(key)
+                continue
+            call_count = queues[key].qsize()
+            if key == home:
+                # Hold the connection of the current thread before counting the
+                # idle ones, so that the workers can not leave it waiting
+                stack.enter_context(data_source.checkout())
+                call_count -= 1
+            state = data_source.thread_state()
+            if key != home and state[0] is not None:
+                workers.append((data_source, state, True))
+                call_count -= 1
+            idle_count = min(call_count, data_source.available_connections)
+            workers.extend((data_source, state, False) for _ in range(idle_count))
+            if key != home and state[0] is None and idle_count <= 0:
+                caller_keys.append(key)
+
+        if not workers:
+            for key in caller_keys:
+                drain(key)
+            return results
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(workers), thread_name_prefix=thread_name_prefix
+        )
+        try:
+            futures = [executor.submit(work, *worker) for worker in workers]
+            try:
+                for key in caller_keys:
+                    drain(key)
+            finally:
+                wait(futures)
+            for future in futures:
+                future.result()
+        finally:
+            executor.shutdown(wait=True)
+        # Calls of the workers that found no idle connection after all
+        for key in queues:
+            drain(key)
+        return results
@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import sys
 import traceback
 from dataclasses import dataclass
@@ -32,12 +33,16 @@ from dcs_core.core.configuration.configuration_parser import (
     load_configuration_from_yaml_str,
 )
 from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.datasource.query_cache import QueryCacheStats
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.utils.tracking import (
     create_inspect_event_json,
     is_tracking_enabled,
     send_event_json,
 )
 from dcs_core.core.utils.utils import truncate_error
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.executor import ValidationExecutor
 from dcs_core.core.validation.manager import ValidationManager
 
 requests.packages.urllib3.disable_warnings(
@@ -112,6 +117,7 @@ class Inspect:
 
         self.execution_time_taken = 0
         self.is_storage_enabled = False
+        self.query_cache_stats: Dict[str, QueryCacheStats] = {}
 
     def add_configuration_yaml_file(self, file_path: str):
         load_configuration(
@@ -126,6 +132,71 @@ class Inspect:
     def add_spark_session(self, spark_session, data_source_name: str = "spark_df"):
         self.configuration.add_spark_session(data_source_name, spark_session)
 
+    def _get_validations(self) -> List[Validation]:
+        return [
+            validation
+            for datasets in self.validation_manager.get_validations.values()
+            for dataset_validations in datasets.values()
+            for validation in dataset_validations.values()
+        ]
+
+    def _run_validations(self) -> Dict[str, ValidationInfo]:
+        """
+        Run the validations with the configured execution mode.
+        Validation infos are returned in the configuration order.
+        """
+        return ValidationExecutor(
+            self.configuration.execution,
+            incremental=self.configuration.incremental,
+            partitioned=self.configuration.partitioned,
+        ).run(self._get_validations())
+
+    def _load_search_mappings(self):
+        """
+        Warm the mapping cache of every search data source with a single get_mapping
+        call covering the indexes of its validations
+        """
+        for name, datasets in self.validation_manager.get_validations.items():
+            data_source = self.data_source_manager.get_data_source(name)
+            if not isinstance(data_source, SearchIndexDataSource):
+                continue
+            try:
+                data_source.load_mappings(list(datasets.keys()))
+            except Exception as e:
+                logger.warning(f"Failed to load the index mappings of {name}: {str(e)}")
+
+    def _enable_query_caches(self):
+        if not self.configuration.execution.query_cache:
+            return
+        for data_source in self.data_source_manager.get_data_sources().values():
+            data_source.enable_query_cache()
+
+    def _disable_query_caches(self):
+        self.query_cache_stats = {}
+        for name, data_source in self.data_source_manager.get_data_sources().items():
+            stats = data_source.disable_query_cache()
+            if stats is not None:
+                self.query_cache_stats[name] = stats
+                logger.info(
+                    f"Query cache of {name}: {stats.hits} hits, {stats.misses} misses"
+                )
+
+    def _finish_run(self, start: datetime, inspect_info: Optional[Dict], error):
+        self._disable_query_caches()
+        end = datetime.now()
+        self.execution_time_taken = round((end - start).total_seconds(), 3)
+        logger.info(f"Inspection took {self.execution_time_taken} seconds")
+        err_message = truncate_error(repr(error))
+        if is_tracking_enabled():
+            event_json = create_inspect_event_json(
+                runtime_seconds=self.execution_time_taken,
+                inspect_info=inspect_info,
+                error=err_message,
+            )
+            send_event_json(event_json)
+        if error:
+            logger.error(error)
+
     def run(self) -> InspectOutput:
         """
         This method starts the inspection process.
@@ -135,21 +206,43 @@ class Inspect:
         inspect_info = None
         try:
             self.data_source_manager.connect()
+            self._enable_query_caches()
             self.validation_manager.build_validations()
+            self._load_search_mappings()
 
-            validation_infos: Dict[str, ValidationInfo] = {}
+            validation_infos = self._run_validations()
 
-            for datasource, _ in self.validation_manager.get_validations.items():
-                for dataset, _ in self.validation_manager.get_validations[
-                    datasource
-                ].items():
-                    for _, validation in self.validation_manager.get_validations[
-                        datasource
-                    ][dataset].items():
-                        validation_info = validation.get_validation_info()
-                        validation_infos[
-                            validation.get_validation_identity()
-                        ] = validation_info
+            output = InspectOutput(validations=validation_infos)
+            inspect_info = output.get_inspect_info()
+
+            return output
+        except Exception as ex:
+            logger.error(f"Error while running inspection: {ex}")
+            traceback.print_exc(file=sys.stdout)
+            error = ex
+        finally:
+            self._finish_run(start, inspect_info, error)
+
+    async def run_async(self) -> InspectOutput:
+        """
+        This coroutine starts the inspection process without blocking the event loop.
+        Connecting to the data sources and the queries of the validations run on
+        worker threads, bounded by the execution configuration.
+        """
+        start = datetime.now()
+        error = None
+        inspect_info = None
+        try:
+            await asyncio.to_thread(self.data_source_manager.connect)
+            self._enable_query_caches()
+            await asyncio.to_thread(self.validation_manager.build_validations)
+            await asyncio.to_thread(self._load_search_mappings)
+
+            validation_infos = await ValidationExecutor(
+                self.configuration.execution,
+                incremental=self.configuration.incremental,
+                partitioned=self.configuration.partitioned,
+            ).run_async(self._get_validations())
 
             output = InspectOutput(validations=validation_infos)
             inspect_info = output.get_inspect_info()
@@ -160,16 +253,4 @@ class Inspect:
             traceback.print_exc(file=sys.stdout)
             error = ex
         finally:
-            end = datetime.now()
-            self.execution_time_taken = round((end - start).total_seconds(), 3)
-            logger.info(f"Inspection took {self.execution_time_taken} seconds")
-            err_message = truncate_error(repr(error))
-            if is_tracking_enabled():
-                event_json = create_inspect_event_json(
-                    runtime_seconds=self.execution_time_taken,
-                    inspect_info=inspect_info,
-                    error=err_message,
-                )
-                send_event_json(event_json)
-            if error:
-                logger.error(error)
+            await asyncio.to_thread(self._finish_run, start, inspect_info, error)
@@ -11,8 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Union
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Union
 
 from dcs_core.core.common.models.metric import (
     IndexMetrics,
@@ -21,6 +23,7 @@ from dcs_core.core.common.models.metric import (
     TableMetrics,
 )
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.metric.base import MetricIdentity
 from dcs_core.core.profiling.numeric_field_profiling import NumericSQLFieldProfiler
@@ -33,74 +36,103 @@ class DataSourceProfiling:
 
     """
 
-    def __init__(self, data_source: DataSource):
+    # Number of index names in one get_mapping call
+    MAPPING_BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        data_source: DataSource,
+        max_workers: int = 8,
+        max_aggregations_per_request: int = 100,
+    ):
         """
         :param data_source: The data source for which field profiles are to be generated.
+        :param max_workers: number of tables or indexes profiled concurrently, limited
+        to the connection pool size of a SQL data source
+        :param max_aggregations_per_request: maximum number of aggregates in one
+        profiling query of a table or search request of an index
         """
         self._datasource = data_source
+        self._max_workers = max_workers
+        self._max_aggregations_per_request = max_aggregations_per_request
         if isinstance(data_source, SQLDataSource):
             self._tables: List[str] = data_source.query_get_table_metadata()
-            self._field_meta_data: Dict[str, Dict[str, str]] = {}
-            for table in self._tables:
-                self._field_meta_data[table] = data_source.query_get_column_metadata(
-                    table_name=table
+            self._max_workers = min(max_workers, data_source.pool_size)
+        elif isinstance(data_source, SearchIndexDataSource):
+            self._indexes: List[str] = [
+                index
+                for index in data_source.query_get_index_metadata()
+                if not index.startswith(".")
+            ]
+            for i in range(0, len(self._indexes), self.MAPPING_BATCH_SIZE):
+                data_source.load_mappings(
+                    self._indexes[i : i + self.MAPPING_BATCH_SIZE]
                 )
 
-    def _generate_sql_data_source_profiles(self) -> List[TableMetrics]:
+    def _generate_sql_table_profile(self, table: str) -> TableMetrics:
         """
-        This method generates field profiles for a SQL data source.
+        This method generates the field profiles and the row count of a table from a
+        single aggregate query, split by columns for wide tables.
         """
-        list_of_metric = []
-        for table, fields in self._field_meta_data.items():
-            table_metrics: List[MetricValue] = []
-
-            for field, data_type in fields.items():
-                # profile for numeric fields if the data type is numeric
-                if data_type in DataSource.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
-                    metrics = self._generate_numeric_field_profile(
-                        table=table, field=field, data_type=data_type
-                    )
-                    table_metrics.extend(metrics)
+        fields: Dict[str, str] = self._datasource.query_get_column_metadata(
+            table_name=table
+        )
+        row_count, field_aggregates = self._datasource.profiling_sql_aggregates_table(
+            table_name=table,
+            columns=fields,
+            max_aggregates=self._max_aggregations_per_request,
+        )
+        table_metrics: List[MetricValue] = []
+        for field, data in field_aggregates.items():
+            data_type = fields[field]
+            # profile for numeric fields if the data type is numeric
+            if data_type in DataSource.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
+                metrics = self._generate_numeric_field_profile(
+                    table=table, field=field, data_type=data_type, data=data
+                )
+                table_metrics.extend(metrics)
 
-                # profile for numeric fields if the data type is text
-                elif data_type in DataSource.TEXT_PYTHON_TYPES_FOR_PROFILING:
-                    metrics = self._generate_text_field_profile(
-                        table=table, field=field, data_type=data_type
-                    )
-                    table_metrics.extend(metrics)
-
-            # add row count metrics
-            table_metrics.append(self._generate_sql_table_row_count(table=table))
-            # create a table metric list for a table
-            list_of_metric.append(
-                TableMetrics(
-                    table_name=table,
-                    metrics={metric.identity: metric for metric in table_metrics},
-                    data_source=self._datasource.data_source_name,
+            # profile for numeric fields if the data type is text
+            elif data_type in DataSource.TEXT_PYTHON_TYPES_FOR_PROFILING:
+                metrics = self._generate_text_field_profile(
+                    table=table, field=field, data_type=data_type, data=data
                 )
-            )
+                table_metrics.extend(metrics)
 
-        return list_of_metric
+        # add row count metrics
+        table_metrics.append(
+            self._generate_sql_table_row_count(table=table, row_count=row_count)
+        )
+        return TableMetrics(
+            table_name=table,
+            metrics={metric.identity: metric for metric in table_metrics},
+            data_source=self._datasource.data_source_name,
+        )
 
-    def _generate_sql_table_row_count(self, table: str) -> MetricValue:
-        if isinstance(self._datasource, SQLDataSource):
-            table_row_count = self._datasource.query_get_row_count(table=table)
-            return MetricValue(
-                identity=MetricIdentity.generate_identity(
-                    metric_name="",
-                    metric_type=MetricsType.ROW_COUNT,
-                    data_source=self._datasource,
-                    table_name=table,
-                ),
-                value=table_row_count,
-                data_source=self._datasource.data_source_name,
+    def _generate_sql_data_source_profiles(self) -> Iterator[TableMetrics]:
+        """
+        This method generates field profiles for a SQL data source, profiling the
+        tables concurrently.
+        """
+        return self._stream(self._generate_sql_table_profile, self._tables)
+
+    def _generate_sql_table_row_count(self, table: str, row_count: int) -> MetricValue:
+        return MetricValue(
+            identity=MetricIdentity.generate_identity(
+                metric_name="",
                 metric_type=MetricsType.ROW_COUNT,
+                data_source=self._datasource,
                 table_name=table,
-                timestamp=datetime.now(timezone.utc),
-            )
+            ),
+            value=row_count,
+            data_source=self._datasource.data_source_name,
+            metric_type=MetricsType.ROW_COUNT,
+            table_name=table,
+            timestamp=datetime.now(timezone.utc),
+        )
 
     def _generate_numeric_field_profile(
-        self, table: str, field: str, data_type: str
+        self, table: str, field: str, data_type: str, data: Optional[Dict] = None
     ) -> List[MetricValue]:
         """
         This method generates a numeric field profile for a given field.
@@ -113,12 +145,12 @@ class DataSourceProfiling:
                 field_name=field,
                 data_type=data_type,
             )
-            generate = profiler.generate()
+            generate = profiler.generate(data)
             profiles = generate.get_metric_values
         return profiles
 
     def _generate_text_field_profile(
-        self, table: str, field: str, data_type: str
+        self, table: str, field: str, data_type: str, data: Optional[Dict] = None
     ) -> List[MetricValue]:
         """
         This method generates a text field profile for a given field.
@@ -132,17 +164,102 @@ class DataSourceProfiling:
                 field_name=field,
                 data_type=data_type,
             )
-            generate = profiler.generate()
+            generate = profiler.generate(data)
             profiles = generate.get_metric_values
         return profiles
 
-    def generate(self) -> List[Union[TableMetrics, IndexMetrics]]:
+    def _generate_search_index_profile(self, index: str) -> IndexMetrics:
         """
-        This method generates field profiles for a given data source.
+        This method generates the field profiles of an index from a single profiling
+        request of the search data source.
+        """
+        document_count, field_profiles = self._datasource.profiling_search_index(
+            index_name=index, max_aggregations=self._max_aggregations_per_request
+        )
+        timestamp = datetime.now(timezone.utc)
+        index_metrics: List[MetricValue] = [
+            self._search_metric_value(
+                index, None, MetricsType.DOCUMENT_COUNT, document_count, timestamp
+            )
+        ]
+        for field, (_, profile) in field_profiles.items():
+            for key, value in profile.items():
+                index_metrics.append(
+                    self._search_metric_value(
+                        index, field, MetricsType(key), value, timestamp
+                    )
+                )
+        return IndexMetrics(
+            index_name=index,
+            metrics={metric.identity: metric for metric in index_metrics},
+            data_source=self._datasource.data_source_name,
+        )
+
+    def _search_metric_value(
+        self,
+        index: str,
+        field: Optional[str],
+        metric_type: MetricsType,
+        value: Union[int, float],
+        timestamp: datetime,
+    ) -> MetricValue:
+        return MetricValue(
+            identity=MetricIdentity.generate_identity(
+                metric_name="",
+                metric_type=metric_type,
+                data_source=self._datasource,
+                index_name=index,
+                field_name=field,
+            ),
+            value=value,
+            data_source=self._datasource.data_source_name,
+            metric_type=metric_type,
+            index_name=index,
+            field_name=field,
+            timestamp=timestamp,
+        )
+
+    def _generate_search_data_source_profiles(self) -> Iterator[IndexMetrics]:
+        """
+        This method generates field profiles for a search data source, profiling
+        the indexes concurrently.
+        """
+        return self._stream(self._generate_search_index_profile, self._indexes)
+
+    def _stream(self, profile: Callable[[str], Any], names: List[str]) -> Iterator:
+        """
+        Profile the tables or indexes on a worker pool and yield the profiles in order.
+        At most two profiles per worker are in flight, so the memory held does not
+        grow with the number of tables.
+        """
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending: Deque[Future] = deque()
+        try:
+            for name in names:
+                pending.append(executor.submit(profile, name))
+                if len(pending) >= 2 * self._max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stream(self) -> Iterator[Union[TableMetrics, IndexMetrics]]:
+        """
+        This method generates field profiles for a given data source, yielding the
+        profile of every table or index as soon as it is available.
         """
         if isinstance(self._datasource, SQLDataSource):
             return self._generate_sql_data_source_profiles()
+        elif isinstance(self._datasource, SearchIndexDataSource):
+            return self._generate_search_data_source_profiles()
         else:
             raise NotImplementedError(
                 f"Profiling for {self._datasource.data_source_name} is not implemented."
             )
+
+    def generate(self) -> List[Union[TableMetrics, IndexMetrics]]:
+        """
+        This method generates field profiles for a given data source.
+        """
+        return list(self.stream())
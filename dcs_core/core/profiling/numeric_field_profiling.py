@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Optional
 
 from dcs_core.core.common.models.metric import MetricsType, MetricValue
 from dcs_core.core.common.models.profile import NumericFieldProfile
@@ -38,13 +38,16 @@ class NumericSQLFieldProfiler:
         self._field_name = field_name
         self._data_type = data_type
 
-    def generate(self) -> NumericFieldProfile:
+    def generate(self, data: Optional[Dict] = None) -> NumericFieldProfile:
         """
         Generate a numeric field profile.
+        :param data: aggregates of the field already queried with the other fields of
+        the table, queried from the data source if not provided
         """
-        data: Dict = self._data_source.profiling_sql_aggregates_numeric(
-            self._table_name, self._field_name
-        )
+        if data is None:
+            data = self._data_source.profiling_sql_aggregates_numeric(
+                self._table_name, self._field_name
+            )
         return self._generate_field_profile(data)
 
     def _generate_field_profile(self, data: Dict) -> NumericFieldProfile:
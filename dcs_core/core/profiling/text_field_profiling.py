@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Optional
 
 from dcs_core.core.common.models.metric import MetricsType, MetricValue
 from dcs_core.core.common.models.profile import TextFieldProfile
@@ -34,10 +34,16 @@ class TextSQLFieldProfiler:
         self._field_name = field_name
         self._data_type = data_type
 
-    def generate(self) -> TextFieldProfile:
-        data: Dict = self._data_source.profiling_sql_aggregates_string(
-            self._table_name, self._field_name
-        )
+    def generate(self, data: Optional[Dict] = None) -> TextFieldProfile:
+        """
+        Generate a text field profile.
+        :param data: aggregates of the field already queried with the other fields of
+        the table, queried from the data source if not provided
+        """
+        if data is None:
+            data = self._data_source.profiling_sql_aggregates_string(
+                self._table_name, self._field_name
+            )
         return self._generate_field_profile(data)
 
     def _generate_field_profile(self, data: Dict) -> TextFieldProfile:
@@ -0,0 +1,35 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import abc
+from typing import Optional
+
+from dcs_core.core.common.models.validation import CachedValidationInfo
+
+
+class ValidationResultRepository(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get_result(self, cache_id: str) -> Optional[CachedValidationInfo]:
+        """
+        This method will return the validation info cached for the given cache_id, or None if the validation has
+        not been cached yet.
+        """
+        pass
+
+    @abc.abstractmethod
+    def save_result(self, cache_id: str, result: CachedValidationInfo) -> int:
+        """
+        This method will save the validation info for the given cache_id, replacing the previous one, together with
+        the fingerprint of the dataset it was computed on.
+        """
+        pass
@@ -0,0 +1,35 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import abc
+from typing import Optional
+
+from dcs_core.core.common.models.scan import IncrementalState
+
+
+class WatermarkRepository(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get_state(self, state_id: str) -> Optional[IncrementalState]:
+        """
+        This method will return the incremental state stored for the given state_id, or None if the dataset has not
+        been scanned yet.
+        """
+        pass
+
+    @abc.abstractmethod
+    def save_state(self, state_id: str, state: IncrementalState) -> int:
+        """
+        This method will save the incremental state for the given state_id, replacing the previous state. The state
+        holds the high-water mark of the watermark column and the running aggregates of the dataset.
+        """
+        pass
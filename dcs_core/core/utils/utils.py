@@ -12,9 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import math
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 
 def truncate_error(error: str):
@@ -22,6 +24,78 @@ def truncate_error(error: str):
     return re.sub("'(.*?)'", "'***'", first_line)
 
 
+def wilson_interval(
+    percentage: float, sample_size: int, z: float = 1.96
+) -> Tuple[float, float]:
+    """
+    Wilson score interval of a percentage estimated on a sample
+    :param percentage: estimated percentage, between 0 and 100
+    :param sample_size: number of sampled rows
+    :param z: z-score of the confidence level, 1.96 for 95%
+    :return: lower and upper bound of the interval, in percent
+    """
+    p = min(max(percentage / 100, 0.0), 1.0)
+    denominator = 1 + z**2 / sample_size
+    center = (p + z**2 / (2 * sample_size)) / denominator
+    margin = (
+        z
+        * math.sqrt(p * (1 - p) / sample_size + z**2 / (4 * sample_size**2))
+        / denominator
+    )
+    return (
+        round(max(center - margin, 0.0) * 100, 2),
+        round(min(center + margin, 1.0) * 100, 2),
+    )
+
+
+def estimate_distinct_count(
+    frequencies: Dict[int, int], percent: float
+) -> Tuple[int, float]:
+    """
+    Estimate the distinct count of a column from the value frequencies of a sample,
+    with the Guaranteed-Error Estimator (Charikar et al.): values seen more than once
+    are counted once, values seen once are scaled by the square root of the inverse
+    sampling fraction
+    :param frequencies: number of distinct values of the sample by their frequency
+    :param percent: percentage of the rows sampled
+    :return: estimated distinct count and its estimated relative error
+    """
+    fraction = min(max(percent / 100, 0.0), 1.0)
+    singletons = frequencies.get(1, 0)
+    repeated = sum(count for frequency, count in frequencies.items() if frequency > 1)
+    estimate = singletons / math.sqrt(fraction) + repeated
+    if estimate == 0:
+        return 0, 0.0
+    lower = singletons + repeated
+    upper = singletons / fraction + repeated
+    error = max(estimate - lower, upper - estimate) / estimate
+    return round(estimate), round(error, 4)
+
+
+def estimate_duplicate_count(
+    frequencies: Dict[int, int],
+    distinct_count: int,
+    distinct_error: Optional[float] = None,
+) -> Tuple[int, Optional[float]]:
+    """
+    Estimate the number of duplicated values of a column by applying the share of
+    duplicated values of a sample to the estimated distinct count
+    :param frequencies: number of distinct values of the sample by their frequency
+    :param distinct_count: estimated distinct count of the column
+    :param distinct_error: relative error of the distinct count
+    :return: estimated duplicate count and its estimated relative error
+    """
+    sampled = sum(frequencies.values())
+    repeated = sum(count for frequency, count in frequencies.items() if frequency > 1)
+    if sampled == 0 or distinct_count == 0 or repeated == 0:
+        return 0, distinct_error
+    ratio = repeated / sampled
+    correction = max(1 - sampled / distinct_count, 0.0)
+    ratio_error = math.sqrt((1 - ratio) / (ratio * sampled) * correction)
+    error = math.sqrt(ratio_error**2 + (distinct_error or 0.0) ** 2)
+    return round(ratio * distinct_count), round(error, 4)
+
+
 def ensure_directory_exists(dir_path: str, create_if_not_exists=True):
     dir_path = Path(dir_path)
     if dir_path.exists() and dir_path.is_dir():
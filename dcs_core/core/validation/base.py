@@ -13,11 +13,15 @@
 #  limitations under the License.
 
 import datetime
+import functools
 import json
+import re
 import sys
 import traceback
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from contextlib import nullcontext
+from decimal import Decimal
+from typing import Any, ContextManager, Optional, Tuple, Union
 
 from loguru import logger
 
@@ -32,6 +36,10 @@ from dcs_core.core.common.models.validation import (
     ValidationInfo,
 )
 from dcs_core.core.datasource.manager import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.datasource.workers import map_on_connections
+from dcs_core.core.utils.utils import wilson_interval
+from dcs_core.integrations.databases.oracle import OracleDataSource
 
 
 class ValidationIdentity:
@@ -88,6 +96,16 @@ class Validation(ABC):
         self.where_filter = None
         self.values = None
         self.regex_pattern = validation_config.regex
+        self.sample = (
+            validation_config.sample if isinstance(data_source, SQLDataSource) else None
+        )
+        self.estimated_error: Optional[float] = None
+        self.statistics_updated_at: Optional[datetime.datetime] = None
+        self.timeout = (
+            validation_config.timeout or data_source.query_timeout
+            if isinstance(data_source, SQLDataSource)
+            else None
+        )
 
         if validation_config.where:
             if data_source.language_support == DataSourceLanguageSupport.DSL_ES:
@@ -146,29 +164,122 @@ class Validation(ABC):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         pass
 
+    def sampling(self) -> ContextManager:
+        """
+        Context in which the queries of the validation read a sample of the dataset
+        """
+        if self.sample is None:
+            return nullcontext()
+        return self.data_source.sampling(self.dataset_name, self.sample)
+
+    def _sample_size(self) -> Optional[int]:
+        if self.sample is None or not self.validation_config.is_percentage:
+            return None
+        return self.data_source.query_get_row_count(
+            table=self.dataset_name, filters=self.where_filter
+        )
+
+    def _estimated_metric_value(
+        self, estimate: Tuple[Optional[Union[float, int]], Optional[datetime.datetime]]
+    ) -> Optional[Union[float, int]]:
+        """
+        Keep the time the statistics of an estimated metric value were gathered at
+        :param estimate: estimated value, None without statistics, and statistics time
+        :return: estimated value, None when the metric has to be computed by a scan
+        """
+        value, updated_at = estimate
+        if value is None:
+            logger.warning(
+                f"No statistics of {self.dataset_name} for validation {self.name},"
+                f" computing it with a scan"
+            )
+            return None
+        self.statistics_updated_at = updated_at
+        return value
+
+    def create_validation_info(
+        self,
+        metric_value: Union[float, int],
+        sample_size: Optional[int] = None,
+        estimated_error: Optional[float] = None,
+        statistics_updated_at: Optional[datetime.datetime] = None,
+    ) -> ValidationInfo:
+        """
+        Create the validation info of an already computed metric value
+        :param metric_value: metric value of the validation
+        :param sample_size: number of sampled rows of a sampled percentage validation
+        :param estimated_error: relative error of an approximate metric value
+        :param statistics_updated_at: time the statistics of an estimated metric value
+        were gathered at
+        :return: validation info with the threshold applied
+        """
+        tags = {
+            "name": self.name,
+        }
+
+        value = ValidationInfo(
+            name=self.name,
+            identity=self.get_validation_identity(),
+            data_source_name=self.data_source.data_source_name,
+            dataset=self.dataset_name,
+            validation_function=self.validation_config.get_validation_function,
+            field=self.field_name,
+            value=metric_value,
+            timestamp=datetime.datetime.utcnow(),
+            tags=tags,
+            estimated_error=estimated_error,
+            statistics_updated_at=statistics_updated_at,
+        )
+        if self.sample is not None:
+            value.sample_percent = self.sample
+            if sample_size and metric_value is not None:
+                value.confidence_interval = wilson_interval(metric_value, sample_size)
+        if self.threshold is not None:
+            value.is_valid, value.reason = self._validate_threshold(metric_value)
+
+        return value
+
+    def create_timed_out_validation_info(self) -> ValidationInfo:
+        """
+        Create the validation info of a validation whose query exceeded its timeout
+        """
+        return ValidationInfo(
+            name=self.name,
+            identity=self.get_validation_identity(),
+            data_source_name=self.data_source.data_source_name,
+            dataset=self.dataset_name,
+            validation_function=self.validation_config.get_validation_function,
+            field=self.field_name,
+            value=None,
+            timestamp=datetime.datetime.utcnow(),
+            tags={"name": self.name},
+            is_valid=False,
+            reason=f"Query timed out after {self.timeout} seconds",
+            timed_out=True,
+        )
+
+    def _timeout(self) -> ContextManager:
+        if self.timeout is None:
+            return nullcontext()
+        return self.data_source.timeout(self.timeout)
+
     def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
         try:
-            metric_value = self._generate_metric_value(**kwargs)
-            tags = {
-                "name": self.name,
-            }
-
-            value = ValidationInfo(
-                name=self.name,
-                identity=self.get_validation_identity(),
-                data_source_name=self.data_source.data_source_name,
-                dataset=self.dataset_name,
-                validation_function=self.validation_config.get_validation_function,
-                field=self.field_name,
-                value=metric_value,
-                timestamp=datetime.datetime.utcnow(),
-                tags=tags,
+            with self._timeout(), self.sampling():
+                metric_value = self._generate_metric_value(**kwargs)
+                sample_size = self._sample_size()
+            return self.create_validation_info(
+                metric_value,
+                sample_size=sample_size,
+                estimated_error=self.estimated_error,
+                statistics_updated_at=self.statistics_updated_at,
             )
-            if self.threshold is not None:
-                value.is_valid, value.reason = self._validate_threshold(metric_value)
-
-            return value
         except Exception as e:
+            if self.timeout is not None and self.data_source.is_timeout_error(e):
+                logger.error(
+                    f"Validation {self.name} timed out after {self.timeout} seconds"
+                )
+                return self.create_timed_out_validation_info()
             traceback.print_exc(file=sys.stdout)
             logger.error(f"Failed to generate metric {self.name}: {str(e)}")
             return None
@@ -195,36 +306,134 @@ class DeltaValidation(Validation, ABC):
     def _generate_reference_metric_value(self, **kwargs) -> Union[float, int]:
         pass
 
+    def create_delta_validation_info(
+        self,
+        delta_value: Union[int, float],
+        metric_value: Union[int, float],
+        reference_metric_value: Union[int, float],
+        **kwargs,
+    ) -> DeltaValidationInfo:
+        """
+        Create the validation info of a delta validation and check its threshold
+        :param delta_value: difference between the dataset and the reference dataset
+        :param metric_value: metric value of the dataset
+        :param reference_metric_value: metric value of the reference dataset
+        :param kwargs: additional fields of the validation info
+        """
+        tags = {
+            "name": self.name,
+        }
+
+        value = DeltaValidationInfo(
+            name=self.name,
+            identity=self.get_validation_identity(),
+            data_source_name=self.data_source.data_source_name,
+            dataset=self.dataset_name,
+            validation_function=self.validation_config.get_validation_function,
+            field=self.field_name,
+            value=delta_value,
+            source_value=metric_value,
+            reference_value=reference_metric_value,
+            reference_datasource_name=self.reference_data_source.data_source_name,
+            reference_dataset=self.reference_dataset_name,
+            reference_field=self.reference_field_name,
+            timestamp=datetime.datetime.utcnow(),
+            tags=tags,
+            **kwargs,
+        )
+        if self.threshold is not None:
+            value.is_valid, value.reason = self._validate_threshold(delta_value)
+
+        return value
+
+    def _generate_metric_values(self, **kwargs) -> Tuple[Any, Any]:
+        """
+        Compute the metric of the dataset and of the reference dataset at the same
+        time, so that a comparison across data sources takes the time of the slower
+        side. The reference runs on the connection the task holds of the reference
+        data source, or on an idle pooled connection, and after the dataset if none
+        is available.
+        :return: metric value and reference metric value
+        """
+        metric_value, reference_metric_value = map_on_connections(
+            [
+                (
+                    self.data_source,
+                    functools.partial(self._generate_metric_value, **kwargs),
+                ),
+                (
+                    self.reference_data_source,
+                    functools.partial(self._generate_reference_metric_value, **kwargs),
+                ),
+            ],
+            thread_name_prefix="dcs-delta",
+        )
+        return metric_value, reference_metric_value
+
+    @staticmethod
+    def _delta(metric_value, reference_metric_value) -> Union[int, float]:
+        if metric_value is None or reference_metric_value is None:
+            raise ValueError("Metric value of the dataset or of the reference is None")
+        if isinstance(metric_value, Decimal) != isinstance(
+            reference_metric_value, Decimal
+        ):
+            metric_value, reference_metric_value = float(metric_value), float(
+                reference_metric_value
+            )
+        return abs(metric_value - reference_metric_value)
+
     def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
         try:
-            metric_value = self._generate_metric_value(**kwargs)
-            reference_metric_value = self._generate_reference_metric_value(**kwargs)
-            delta_value = abs(metric_value - reference_metric_value)
-
-            tags = {
-                "name": self.name,
-            }
-
-            value = DeltaValidationInfo(
-                name=self.name,
-                identity=self.get_validation_identity(),
-                data_source_name=self.data_source.data_source_name,
-                dataset=self.dataset_name,
-                validation_function=self.validation_config.get_validation_function,
-                field=self.field_name,
-                value=delta_value,
-                source_value=metric_value,
-                reference_value=reference_metric_value,
-                reference_datasource_name=self.reference_data_source.data_source_name,
-                reference_dataset=self.reference_dataset_name,
-                timestamp=datetime.datetime.utcnow(),
-                tags=tags,
+            metric_value, reference_metric_value = self._generate_metric_values(
+                **kwargs
+            )
+            delta_value = self._delta(metric_value, reference_metric_value)
+            return self.create_delta_validation_info(
+                delta_value, metric_value, reference_metric_value
             )
-            if self.threshold is not None:
-                value.is_valid, value.reason = self._validate_threshold(delta_value)
-
-            return value
         except Exception as e:
             traceback.print_exc(file=sys.stdout)
             logger.error(f"Failed to generate metric {self.name}: {str(e)}")
             return None
+
+
+class DeltaAggregateValidation(DeltaValidation, ABC):
+    """
+    DeltaAggregateValidation compares an aggregate of a column of a dataset with the
+    same aggregate of the reference dataset. The reference column defaults to the
+    column of the dataset.
+    """
+
+    @abstractmethod
+    def _query_metric_value(
+        self, data_source: SQLDataSource, table: str, field: str, filters: str
+    ) -> Union[float, int]:
+        pass
+
+    def _side_metric_value(
+        self, data_source: DataSource, table: str, field: str
+    ) -> Union[float, int]:
+        if not isinstance(data_source, SQLDataSource):
+            raise ValueError("Invalid data source type")
+        where_filter = self.where_filter
+        if isinstance(data_source, OracleDataSource):
+            if where_filter:
+                where_filter = re.sub(
+                    r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', where_filter
+                )
+            field = f'"{field}"'
+        return self._query_metric_value(
+            data_source, table, field, where_filter if where_filter else None
+        )
+
+    def _generate_metric_value(self, **kwargs) -> Union[float, int]:
+        return self._side_metric_value(
+            self.data_source, self.dataset_name, self.field_name
+        )
+
+    def _generate_reference_metric_value(self, **kwargs) -> Union[float, int]:
+        return self._side_metric_value(
+            self.reference_data_source,
+            self.reference_dataset_name,
+            self.reference_field_name or self.field_name,
+        )
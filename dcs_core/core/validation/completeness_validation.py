@@ -17,7 +17,7 @@ from typing import Union
 
 from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
-from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.base import DeltaAggregateValidation, Validation
 from dcs_core.integrations.databases.oracle import OracleDataSource
 
 
@@ -28,6 +28,14 @@ class CountNullValidation(Validation):
                 self.where_filter = re.sub(
                     r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
                 )
+            if self.validation_config.estimate:
+                value = self._estimated_metric_value(
+                    self.data_source.query_get_estimated_null_count(
+                        table=self.dataset_name, field=self.field_name
+                    )
+                )
+                if value is not None:
+                    return value
             return self.data_source.query_get_null_count(
                 table=self.dataset_name,
                 field=f'"{self.field_name}"'
@@ -45,6 +53,19 @@ class CountNullValidation(Validation):
             raise ValueError("Invalid data source type")
 
 
+class DeltaCountNullValidation(DeltaAggregateValidation):
+    """
+    Difference between the null count of a column and of the reference column
+    """
+
+    def _query_metric_value(
+        self, data_source: SQLDataSource, table: str, field: str, filters: str
+    ) -> Union[float, int]:
+        return data_source.query_get_null_count(
+            table=table, field=field, filters=filters
+        )
+
+
 class PercentageNullValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
@@ -52,6 +73,14 @@ class PercentageNullValidation(Validation):
                 self.where_filter = re.sub(
                     r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
                 )
+            if self.validation_config.estimate:
+                value = self._estimated_metric_value(
+                    self.data_source.query_get_estimated_null_percentage(
+                        table=self.dataset_name, field=self.field_name
+                    )
+                )
+                if value is not None:
+                    return value
             return self.data_source.query_get_null_percentage(
                 table=self.dataset_name,
                 field=f'"{self.field_name}"'
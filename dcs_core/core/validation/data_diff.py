@@ -0,0 +1,281 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import functools
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.errors import DataChecksRuntimeError
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.datasource.workers import map_on_connections
+from dcs_core.core.validation.partitioned import range_boundaries, range_literal
+
+# Row hashes have 60 bits, far more than the buckets of a bisection
+MAX_BUCKET_MODULUS = 2**32
+
+
+def _normalize_key(value: Any) -> Any:
+    if isinstance(value, Decimal) and value == value.to_integral_value():
+        return int(value)
+    return value
+
+
+@dataclass(frozen=True)
+class KeyRange:
+    """
+    Range of keys, from lower included to upper, included only for the last range,
+    every non null key without bounds. With a modulus, only the keys whose hash has
+    the remainder by the modulus.
+    """
+
+    lower: Any
+    upper: Any
+    upper_inclusive: bool = True
+    modulus: int = 1
+    remainder: int = 0
+
+    def split(self, segments: int) -> Optional[List["KeyRange"]]:
+        boundaries = range_boundaries(self.lower, self.upper, segments)
+        if boundaries and not self.upper_inclusive:
+            boundaries = [boundary for boundary in boundaries if boundary < self.upper]
+        if not boundaries:
+            return None
+        lowers = [self.lower] + boundaries
+        uppers = boundaries + [self.upper]
+        return [
+            replace(self, lower=lower, upper=upper, upper_inclusive=False)
+            for lower, upper in zip(lowers[:-1], uppers[:-1])
+        ] + [replace(self, lower=lowers[-1], upper=uppers[-1])]
+
+    def split_buckets(self, segments: int) -> Optional[List["KeyRange"]]:
+        """
+        Split the keys of the range by their hash, for keys whose range can not be
+        split like strings or UUIDs
+        :return: ranges of the buckets, None if the range holds a single key
+        """
+        modulus = self.modulus * segments
+        single_key = self.lower is not None and self.lower == self.upper
+        if single_key or modulus > MAX_BUCKET_MODULUS:
+            return None
+        return [
+            replace(self, modulus=modulus, remainder=self.remainder + i * self.modulus)
+            for i in range(segments)
+        ]
+
+
+@dataclass
+class DiffSide:
+    """
+    One of the two datasets compared by a data diff
+    """
+
+    data_source: SQLDataSource
+    dataset: str
+    key: str
+    fields: List[str]
+    where_filter: Optional[str] = None
+
+    def condition(self, key_range: KeyRange) -> str:
+        key = self.data_source.quote_column(self.key)
+        operator = "<=" if key_range.upper_inclusive else "<"
+        if key_range.lower is None:
+            condition = f"{key} IS NOT NULL"
+        else:
+            condition = (
+                f"{key} >= {range_literal(key_range.lower)} AND "
+                f"{key} {operator} {range_literal(key_range.upper)}"
+            )
+        if key_range.modulus > 1:
+            bucket = self.data_source.key_bucket_condition(
+                table=self.dataset,
+                key=self.key,
+                modulus=key_range.modulus,
+                remainder=key_range.remainder,
+            )
+            condition = f"{condition} AND {bucket}"
+        if self.where_filter:
+            condition = f"({self.where_filter}) AND {condition}"
+        return condition
+
+    def key_range(self) -> Tuple[Any, Any]:
+        minimum = ScanAggregate(type=AggregateType.MIN, field=self.key)
+        maximum = ScanAggregate(type=AggregateType.MAX, field=self.key)
+        low, high = self.data_source.query_get_aggregates(
+            table=self.dataset, aggregates=[minimum, maximum], filters=self.where_filter
+        )
+        return _normalize_key(low), _normalize_key(high)
+
+    def checksum(self, key_range: KeyRange) -> Tuple[int, int]:
+        return self.data_source.query_get_checksum(
+            table=self.dataset, fields=self.fields, filters=self.condition(key_range)
+        )
+
+    def row_hashes(self, key_range: KeyRange) -> Dict[Any, int]:
+        hashes = self.data_source.query_get_row_hashes(
+            table=self.dataset,
+            key=self.key,
+            fields=self.fields,
+            filters=self.condition(key_range),
+        )
+        return {_normalize_key(key): value for key, value in hashes.items()}
+
+
+@dataclass
+class DataDiffResult:
+    """
+    Keys of the source dataset missing from, extra to or different from the
+    reference dataset, with a bounded sample of the differing keys
+    """
+
+    source_count: int = 0
+    reference_count: int = 0
+    missing_count: int = 0
+    extra_count: int = 0
+    mismatched_count: int = 0
+    sample: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def difference_count(self) -> int:
+        return self.missing_count + self.extra_count + self.mismatched_count
+
+
+@dataclass
+class HashDiff:
+    """
+    HashDiff compares two datasets, possibly on different data sources, without
+    reading their rows. The key range is split in segments and the row count and
+    the order independent checksum of the rows of every segment are computed on
+    both sides in parallel. Only the segments whose checksums differ are split
+    again, until they hold at most leaf_rows rows, then the row hashes of the keys
+    of the segment are compared. Segments of keys whose range can not be split, like
+    strings or UUIDs, are split by the hash of their keys. A segment that can not be
+    split any more, like the rows of a single key, is refused above max_leaf_rows
+    rows rather than read.
+    Rows with a null key are not compared.
+    """
+
+    source: DiffSide
+    reference: DiffSide
+    segments: int = 8
+    leaf_rows: int = 1000
+    max_leaf_rows: int = 100000
+    max_sample: int = 10
+
+    def _on_both_sides(
+        self, method: str, arguments: List[Tuple]
+    ) -> Tuple[List[Any], List[Any]]:
+        """
+        Call a method of both sides once per arguments in parallel, on the
+        connections of the task and the idle pooled connections of the data sources
+        :param method: name of the DiffSide method
+        :param arguments: arguments of every call
+        :return: results of the source side and of the reference side
+        """
+        calls = [
+            (side.data_source, functools.partial(getattr(side, method), *args))
+            for side in (self.source, self.reference)
+            for args in arguments
+        ]
+        results = map_on_connections(calls, thread_name_prefix="dcs-diff")
+        return results[: len(arguments)], results[len(arguments) :]
+
+    def _add_sample(self, result: DataDiffResult, key: Any, status: str):
+        if len(result.sample) < self.max_sample:
+            result.sample.append({"key": key, "status": status})
+
+    def _compare_rows(
+        self,
+        result: DataDiffResult,
+        source_hashes: Dict[Any, int],
+        reference_hashes: Dict[Any, int],
+    ):
+        keys = source_hashes.keys() | reference_hashes.keys()
+        try:
+            keys = sorted(keys)
+        except TypeError:
+            keys = sorted(keys, key=str)
+        for key in keys:
+            if key not in reference_hashes:
+                result.extra_count += 1
+                self._add_sample(result, key, "extra")
+            elif key not in source_hashes:
+                result.missing_count += 1
+                self._add_sample(result, key, "missing")
+            elif source_hashes[key] != reference_hashes[key]:
+                result.mismatched_count += 1
+                self._add_sample(result, key, "mismatched")
+
+    def diff(self) -> DataDiffResult:
+        """
+        Compare the source dataset with the reference dataset
+        :return: counts of missing, extra and mismatched keys
+        """
+        result = DataDiffResult()
+        source_bounds, reference_bounds = self._on_both_sides("key_range", [()])
+        bounds = source_bounds + reference_bounds
+        lows = [low for low, _ in bounds if low is not None]
+        highs = [high for _, high in bounds if high is not None]
+        if not lows:
+            return result
+
+        pending = [KeyRange(min(lows), max(highs))]
+        if range_boundaries(min(lows), max(highs), self.segments) is None:
+            # Dialects order strings differently, keys without a range are not bounded
+            pending = [KeyRange(None, None)]
+        depth = 0
+        while pending:
+            source_checksums, reference_checksums = self._on_both_sides(
+                "checksum", [(key_range,) for key_range in pending]
+            )
+            checksums = list(zip(pending, source_checksums, reference_checksums))
+            pending, leaves = [], []
+            for key_range, source_checksum, reference_checksum in checksums:
+                if depth == 0:
+                    result.source_count = source_checksum[0]
+                    result.reference_count = reference_checksum[0]
+                if source_checksum == reference_checksum:
+                    continue
+                rows = max(source_checksum[0], reference_checksum[0])
+                segments = None
+                if rows > self.leaf_rows:
+                    segments = key_range.split(self.segments)
+                    if segments is None:
+                        segments = key_range.split_buckets(self.segments)
+                if segments is not None:
+                    pending.extend(segments)
+                elif rows > self.max_leaf_rows:
+                    raise DataChecksRuntimeError(
+                        message=f"Data diff of {self.source.dataset} can not split "
+                        f"the {rows} rows of keys {key_range.lower} to "
+                        f"{key_range.upper}, more than {self.max_leaf_rows}"
+                    )
+                else:
+                    leaves.append(key_range)
+
+            source_hashes, reference_hashes = self._on_both_sides(
+                "row_hashes", [(key_range,) for key_range in leaves]
+            )
+            for source_row_hashes, reference_row_hashes in zip(
+                source_hashes, reference_hashes
+            ):
+                self._compare_rows(result, source_row_hashes, reference_row_hashes)
+            depth += 1
+        logger.debug(
+            f"Data diff of {self.source.dataset} and {self.reference.dataset}"
+            f" bisected {depth} levels"
+        )
+        return result
@@ -0,0 +1,335 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from dcs_core.core.common.models.configuration import (
+    ExecutionConfiguration,
+    IncrementalConfiguration,
+    PartitionConfiguration,
+)
+from dcs_core.core.common.models.validation import ValidationInfo
+from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation.base import DeltaValidation, Validation
+from dcs_core.core.validation.fused_scan import (
+    FusedScanGroup,
+    FusedScanPlanner,
+    SearchScanGroup,
+)
+from dcs_core.core.validation.incremental import IncrementalScan
+from dcs_core.core.validation.partitioned import PartitionedScan
+from dcs_core.core.validation.result_cache import ValidationResultCache
+
+
+@dataclass
+class ValidationTask:
+    """
+    ValidationTask is a unit of work of the executor. It is either a fused scan
+    group or a single validation, and holds the data sources it queries.
+    """
+
+    data_sources: Tuple[DataSource, ...]
+    run_validations: Callable[[], Dict[str, Optional[ValidationInfo]]]
+
+    @property
+    def data_source_names(self) -> Tuple[str, ...]:
+        return tuple(data_source.data_source_name for data_source in self.data_sources)
+
+    @classmethod
+    def from_group(
+        cls, group: Union[FusedScanGroup, SearchScanGroup]
+    ) -> "ValidationTask":
+        return cls(data_sources=(group.data_source,), run_validations=group.execute)
+
+    @classmethod
+    def from_validation(cls, validation: Validation) -> "ValidationTask":
+        data_sources = {validation.data_source.data_source_name: validation.data_source}
+        if isinstance(validation, DeltaValidation):
+            data_sources[
+                validation.reference_data_source.data_source_name
+            ] = validation.reference_data_source
+        return cls(
+            data_sources=tuple(data_sources[name] for name in sorted(data_sources)),
+            run_validations=lambda: {
+                validation.get_validation_identity(): validation.get_validation_info()
+            },
+        )
+
+    def run(self) -> Dict[str, Optional[ValidationInfo]]:
+        """
+        Run the validations of the task, holding one pooled connection of each
+        SQL data source for the whole task
+        """
+        with ExitStack() as stack:
+            for data_source in self.data_sources:
+                if isinstance(data_source, SQLDataSource):
+                    stack.enter_context(data_source.checkout())
+            return self.run_validations()
+
+
+class ValidationExecutor:
+    """
+    ValidationExecutor runs the validations of an inspection. Fused scan groups and
+    the remaining validations are scheduled on a worker pool bounded by max_workers,
+    and a task is only started when every data source it queries is below its own
+    concurrency limit. Validation infos are returned in the order of the validations.
+    With the result cache enabled, validations of unchanged datasets are served from
+    the results of a previous run instead of being planned.
+    """
+
+    def __init__(
+        self,
+        execution_configuration: ExecutionConfiguration = None,
+        incremental: Optional[Dict[str, IncrementalConfiguration]] = None,
+        partitioned: Optional[Dict[str, PartitionConfiguration]] = None,
+    ):
+        self.execution_configuration = (
+            execution_configuration
+            if execution_configuration is not None
+            else ExecutionConfiguration()
+        )
+        self.incremental = incremental or {}
+        self.partitioned = partitioned or {}
+
+    def _incremental_scans(self) -> Dict[str, IncrementalScan]:
+        if not self.incremental:
+            return {}
+        from dcs_core.integrations.storage.local_file import (
+            LocalFileWatermarkRepository,
+        )
+
+        repository = LocalFileWatermarkRepository(
+            self.execution_configuration.incremental_storage_path
+        )
+        return {
+            key: IncrementalScan(watermark=config.watermark, repository=repository)
+            for key, config in self.incremental.items()
+        }
+
+    def _partitioned_scans(self) -> Dict[str, PartitionedScan]:
+        return {
+            key: PartitionedScan(
+                column=config.column,
+                partitions=config.partitions,
+                max_retries=config.max_retries,
+            )
+            for key, config in self.partitioned.items()
+        }
+
+    def result_cache(self) -> Optional[ValidationResultCache]:
+        """
+        Create the cross run result cache of the validations, None if it is disabled
+        """
+        if not self.execution_configuration.result_cache:
+            return None
+        from dcs_core.integrations.storage.local_file import (
+            LocalFileValidationResultRepository,
+        )
+
+        return ValidationResultCache(
+            LocalFileValidationResultRepository(
+                self.execution_configuration.result_cache_storage_path
+            ),
+            default_ttl=self.execution_configuration.result_cache_ttl,
+        )
+
+    def data_source_max_workers(self, data_source: DataSource) -> int:
+        """
+        Get the number of tasks that can query a data source at the same time.
+        Without a configured limit, it is the connection pool size of the data source.
+        :param data_source: data source
+        :return: concurrency limit of the data source
+        """
+        max_workers = self.execution_configuration.data_source_max_workers.get(
+            data_source.data_source_name,
+            self.execution_configuration.max_workers_per_data_source,
+        )
+        if max_workers is None:
+            max_workers = (
+                data_source.pool_size if isinstance(data_source, SQLDataSource) else 1
+            )
+        return max_workers
+
+    def plan(self, validations: List[Validation]) -> List[ValidationTask]:
+        remaining = validations
+        tasks: List[ValidationTask] = []
+        if self.execution_configuration.fused_scan:
+            planner = FusedScanPlanner(
+                max_aggregates_per_query=self.execution_configuration.fused_scan_max_aggregates,
+                incremental=self._incremental_scans(),
+                partitioned=self._partitioned_scans(),
+            )
+            groups, remaining = planner.plan(validations)
+            tasks.extend(ValidationTask.from_group(group) for group in groups)
+        else:
+            if self.incremental:
+                logger.warning(
+                    "Incremental validations require the fused scan, ignoring"
+                )
+            if self.partitioned:
+                logger.warning(
+                    "Partitioned validations require the fused scan, ignoring"
+                )
+        tasks.extend(ValidationTask.from_validation(v) for v in remaining)
+        return tasks
+
+    def run(self, validations: List[Validation]) -> Dict[str, ValidationInfo]:
+        """
+        Run the validations and return the validation infos by validation identity
+        :param validations: validations to run
+        :return: validation infos in the order of the validations
+        """
+        result_cache = self.result_cache()
+        cached: Dict[str, ValidationInfo] = {}
+        remaining = validations
+        if result_cache is not None:
+            cached, remaining = result_cache.split(validations)
+
+        tasks = self.plan(remaining)
+        if self.execution_configuration.max_workers == 1:
+            task_validation_infos: Dict[str, Optional[ValidationInfo]] = {}
+            for task in tasks:
+                try:
+                    task_validation_infos.update(task.run())
+                except Exception as e:
+                    logger.error(f"Failed to run validation task: {str(e)}")
+        else:
+            task_validation_infos = self._run_concurrently(tasks)
+
+        if result_cache is not None:
+            result_cache.save_all(remaining, task_validation_infos)
+        task_validation_infos.update(cached)
+        return self._ordered(validations, task_validation_infos)
+
+    async def run_async(
+        self, validations: List[Validation]
+    ) -> Dict[str, ValidationInfo]:
+        """
+        Run the validations from an event loop. The blocking queries of the tasks
+        run on a pool of max_workers threads, and asyncio semaphores apply the same
+        global and per data source limits as run.
+        :param validations: validations to run
+        :return: validation infos in the order of the validations
+        """
+        result_cache = self.result_cache()
+        cached: Dict[str, ValidationInfo] = {}
+        remaining = validations
+        if result_cache is not None:
+            cached, remaining = await asyncio.to_thread(result_cache.split, validations)
+
+        tasks = self.plan(remaining)
+        loop = asyncio.get_running_loop()
+        workers = asyncio.Semaphore(self.execution_configuration.max_workers)
+        data_source_semaphores: Dict[str, asyncio.Semaphore] = {}
+        for task in tasks:
+            for data_source in task.data_sources:
+                if data_source.data_source_name not in data_source_semaphores:
+                    data_source_semaphores[
+                        data_source.data_source_name
+                    ] = asyncio.Semaphore(self.data_source_max_workers(data_source))
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.execution_configuration.max_workers,
+            thread_name_prefix="dcs-validation",
+        )
+
+        async def run_task(task: ValidationTask) -> Dict[str, Optional[ValidationInfo]]:
+            async with AsyncExitStack() as stack:
+                for name in task.data_source_names:
+                    await stack.enter_async_context(data_source_semaphores[name])
+                await stack.enter_async_context(workers)
+                try:
+                    return await loop.run_in_executor(pool, task.run)
+                except Exception as e:
+                    logger.error(f"Failed to run validation task: {str(e)}")
+                    return {}
+
+        try:
+            results = await asyncio.gather(*(run_task(task) for task in tasks))
+        finally:
+            pool.shutdown(wait=False)
+
+        task_validation_infos: Dict[str, Optional[ValidationInfo]] = {}
+        for result in results:
+            task_validation_infos.update(result)
+
+        if result_cache is not None:
+            await asyncio.to_thread(
+                result_cache.save_all, remaining, task_validation_infos
+            )
+        task_validation_infos.update(cached)
+        return self._ordered(validations, task_validation_infos)
+
+    @staticmethod
+    def _ordered(
+        validations: List[Validation],
+        validation_infos: Dict[str, Optional[ValidationInfo]],
+    ) -> Dict[str, ValidationInfo]:
+        return {
+            validation.get_validation_identity(): validation_infos.get(
+                validation.get_validation_identity()
+            )
+            for validation in validations
+        }
+
+    def _can_start(self, task: ValidationTask, running: Dict[str, int]) -> bool:
+        return all(
+            running.get(data_source.data_source_name, 0)
+            < self.data_source_max_workers(data_source)
+            for data_source in task.data_sources
+        )
+
+    def _run_concurrently(
+        self, tasks: List[ValidationTask]
+    ) -> Dict[str, Optional[ValidationInfo]]:
+        validation_infos: Dict[str, Optional[ValidationInfo]] = {}
+        pending = list(tasks)
+        running: Dict[str, int] = {}
+        futures: Dict[Future, ValidationTask] = {}
+
+        logger.info(
+            f"Running {len(tasks)} validation tasks with "
+            f"{self.execution_configuration.max_workers} workers"
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.execution_configuration.max_workers,
+            thread_name_prefix="dcs-validation",
+        ) as pool:
+            while pending or futures:
+                for task in list(pending):
+                    if len(futures) >= self.execution_configuration.max_workers:
+                        break
+                    if not self._can_start(task, running):
+                        continue
+                    pending.remove(task)
+                    for name in task.data_source_names:
+                        running[name] = running.get(name, 0) + 1
+                    futures[pool.submit(task.run)] = task
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = futures.pop(future)
+                    for name in task.data_source_names:
+                        running[name] -= 1
+                    try:
+                        validation_infos.update(future.result())
+                    except Exception as e:
+                        logger.error(f"Failed to run validation task: {str(e)}")
+        return validation_infos
@@ -0,0 +1,669 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import re
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.common.models.validation import ValidationFunction, ValidationInfo
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation.base import DeltaValidation, Validation
+from dcs_core.core.validation.incremental import IncrementalScan
+from dcs_core.core.validation.partitioned import PartitionedScan
+from dcs_core.integrations.databases.oracle import OracleDataSource
+
+Finalizer = Callable[[List[Any]], Union[int, float]]
+
+
+def _percent(count, total) -> float:
+    return round((count or 0) / total * 100, 2) if total else 0.0
+
+
+def _field_metric(
+    aggregate_type: AggregateType,
+    finalize: Callable[[Any], Union[int, float]] = lambda value: value,
+):
+    def plan(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+        return [ScanAggregate(type=aggregate_type, field=validation.field_name)], (
+            lambda values: finalize(values[0])
+        )
+
+    return plan
+
+
+def _field_count(aggregate_type: AggregateType, argument: Callable = None):
+    def plan(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+        aggregate = ScanAggregate(
+            type=aggregate_type,
+            field=validation.field_name,
+            argument=argument(validation) if argument else None,
+        )
+        return [aggregate], lambda values: values[0] or 0
+
+    return plan
+
+
+def _field_percent(aggregate_type: AggregateType, argument: Callable = None):
+    def plan(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+        aggregate = ScanAggregate(
+            type=aggregate_type,
+            field=validation.field_name,
+            argument=argument(validation) if argument else None,
+        )
+        return [aggregate, ScanAggregate(type=AggregateType.ROW_COUNT)], (
+            lambda values: _percent(values[0], values[1])
+        )
+
+    return plan
+
+
+def _field_ratio(
+    aggregate_type: AggregateType, total_field: Callable[[str], str] = lambda f: f
+):
+    def plan(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+        return [
+            ScanAggregate(type=aggregate_type, field=validation.field_name),
+            ScanAggregate(
+                type=AggregateType.VALUE_COUNT, field=total_field(validation.field_name)
+            ),
+        ], lambda values: _percent(values[0], values[1])
+
+    return plan
+
+
+def _distinct_count(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+    if validation.validation_config.approximate:
+        return _field_metric(
+            AggregateType.APPROX_DISTINCT_COUNT, lambda value: round(value or 0)
+        )(validation)
+    return _field_metric(AggregateType.DISTINCT_COUNT)(validation)
+
+
+def _percentile(percentile: float):
+    def plan(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+        aggregate = ScanAggregate(
+            type=AggregateType.PERCENTILE,
+            field=validation.field_name,
+            argument=percentile,
+        )
+        return [aggregate], lambda values: values[0]
+
+    return plan
+
+
+def _row_count(validation: Validation) -> Tuple[List[ScanAggregate], Finalizer]:
+    return [ScanAggregate(type=AggregateType.ROW_COUNT)], lambda values: values[0]
+
+
+def _values(validation: Validation) -> Tuple:
+    if validation.values is None:
+        raise ValueError("Values are required for valid/invalid values validation")
+    return tuple(validation.values)
+
+
+def _regex(validation: Validation) -> str:
+    if validation.regex_pattern is None:
+        raise ValueError("Regex pattern is required for regex validation")
+    return validation.regex_pattern
+
+
+def _predefined(name: str) -> Callable:
+    return lambda validation: name
+
+
+PREDEFINED_REGEX_PATTERNS: Dict[Tuple[ValidationFunction, ValidationFunction], str] = {
+    (ValidationFunction.COUNT_UUID, ValidationFunction.PERCENT_UUID): "uuid",
+    (
+        ValidationFunction.COUNT_USA_PHONE,
+        ValidationFunction.PERCENT_USA_PHONE,
+    ): "usa_phone",
+    (ValidationFunction.COUNT_EMAIL, ValidationFunction.PERCENT_EMAIL): "email",
+    (
+        ValidationFunction.COUNT_USA_ZIP_CODE,
+        ValidationFunction.PERCENT_USA_ZIP_CODE,
+    ): "usa_zip_code",
+    (ValidationFunction.COUNT_SSN, ValidationFunction.PERCENT_SSN): "ssn",
+    (ValidationFunction.COUNT_SEDOL, ValidationFunction.PERCENT_SEDOL): "sedol",
+    (ValidationFunction.COUNT_CUSIP, ValidationFunction.PERCENT_CUSIP): "cusip",
+    (ValidationFunction.COUNT_LEI, ValidationFunction.PERCENT_LEI): "lei",
+    (ValidationFunction.COUNT_FIGI, ValidationFunction.PERCENT_FIGI): "figi",
+    (ValidationFunction.COUNT_ISIN, ValidationFunction.PERCENT_ISIN): "isin",
+    (ValidationFunction.COUNT_PERM_ID, ValidationFunction.PERCENT_PERM_ID): "perm_id",
+}
+
+
+class FusedScanPlanner:
+    """
+    FusedScanPlanner groups the SQL validations of a run by data source, dataset and
+    where filter, and computes every group with a single aggregate query instead of
+    one query per validation.
+    Percentiles of a column are computed together by one percentile query per column.
+    Validations which can not be expressed as an aggregate of the dataset (custom sql,
+    duplicates, delta validations, search data sources, ...) are left to the regular
+    per validation execution.
+    """
+
+    FUSED_VALIDATION_MAPPING: Dict[ValidationFunction, Callable] = {
+        ValidationFunction.COUNT_ROWS: _row_count,
+        ValidationFunction.MIN: _field_metric(AggregateType.MIN),
+        ValidationFunction.MAX: _field_metric(AggregateType.MAX),
+        ValidationFunction.AVG: _field_metric(
+            AggregateType.AVG, lambda value: round(value, 2)
+        ),
+        ValidationFunction.SUM: _field_metric(
+            AggregateType.SUM, lambda value: round(value, 2)
+        ),
+        ValidationFunction.VARIANCE: _field_metric(
+            AggregateType.VARIANCE, lambda value: round(value, 2)
+        ),
+        ValidationFunction.STDDEV: _field_metric(
+            AggregateType.STDDEV, lambda value: round(value, 2)
+        ),
+        ValidationFunction.COUNT_DISTINCT: _distinct_count,
+        ValidationFunction.COUNT_NULL: _field_count(AggregateType.NULL_COUNT),
+        ValidationFunction.PERCENT_NULL: _field_percent(AggregateType.NULL_COUNT),
+        ValidationFunction.COUNT_EMPTY_STRING: _field_count(
+            AggregateType.EMPTY_STRING_COUNT
+        ),
+        ValidationFunction.PERCENT_EMPTY_STRING: _field_percent(
+            AggregateType.EMPTY_STRING_COUNT
+        ),
+        ValidationFunction.COUNT_ZERO: _field_count(AggregateType.ZERO_COUNT),
+        ValidationFunction.PERCENT_ZERO: _field_percent(AggregateType.ZERO_COUNT),
+        ValidationFunction.COUNT_NEGATIVE: _field_count(AggregateType.NEGATIVE_COUNT),
+        ValidationFunction.PERCENT_NEGATIVE: _field_percent(
+            AggregateType.NEGATIVE_COUNT
+        ),
+        ValidationFunction.COUNT_VALID_VALUES: _field_count(
+            AggregateType.VALUES_MATCH_COUNT, _values
+        ),
+        ValidationFunction.PERCENT_VALID_VALUES: _field_percent(
+            AggregateType.VALUES_MATCH_COUNT, _values
+        ),
+        ValidationFunction.COUNT_INVALID_VALUES: _field_count(
+            AggregateType.VALUES_MATCH_COUNT, _values
+        ),
+        ValidationFunction.PERCENT_INVALID_VALUES: _field_percent(
+            AggregateType.VALUES_MATCH_COUNT, _values
+        ),
+        ValidationFunction.COUNT_VALID_REGEX: _field_count(
+            AggregateType.REGEX_MATCH_COUNT, _regex
+        ),
+        ValidationFunction.PERCENT_VALID_REGEX: _field_percent(
+            AggregateType.REGEX_MATCH_COUNT, _regex
+        ),
+        ValidationFunction.COUNT_INVALID_REGEX: _field_count(
+            AggregateType.REGEX_MATCH_COUNT, _regex
+        ),
+        ValidationFunction.PERCENT_INVALID_REGEX: _field_percent(
+            AggregateType.REGEX_MATCH_COUNT, _regex
+        ),
+        ValidationFunction.STRING_LENGTH_MAX: _field_metric(
+            AggregateType.STRING_LENGTH_MAX
+        ),
+        ValidationFunction.STRING_LENGTH_MIN: _field_metric(
+            AggregateType.STRING_LENGTH_MIN
+        ),
+        ValidationFunction.STRING_LENGTH_AVERAGE: _field_metric(
+            AggregateType.STRING_LENGTH_AVG, lambda value: round(value, 2)
+        ),
+        ValidationFunction.PERCENTILE_20: _percentile(0.2),
+        ValidationFunction.PERCENTILE_40: _percentile(0.4),
+        ValidationFunction.PERCENTILE_60: _percentile(0.6),
+        ValidationFunction.PERCENTILE_80: _percentile(0.8),
+        ValidationFunction.PERCENTILE_90: _percentile(0.9),
+        **{
+            count_function: _field_count(
+                AggregateType.PREDEFINED_REGEX_MATCH_COUNT, _predefined(pattern)
+            )
+            for (count_function, _), pattern in PREDEFINED_REGEX_PATTERNS.items()
+        },
+        **{
+            percent_function: _field_percent(
+                AggregateType.PREDEFINED_REGEX_MATCH_COUNT, _predefined(pattern)
+            )
+            for (_, percent_function), pattern in PREDEFINED_REGEX_PATTERNS.items()
+        },
+    }
+
+    # Search index validations, all of them answered by one multi search per index
+    SEARCH_VALIDATION_MAPPING: Dict[ValidationFunction, Callable] = {
+        ValidationFunction.COUNT_ROWS: _row_count,
+        ValidationFunction.MIN: _field_metric(AggregateType.MIN),
+        ValidationFunction.MAX: _field_metric(AggregateType.MAX),
+        ValidationFunction.AVG: _field_metric(
+            AggregateType.AVG, lambda value: round(value, 2)
+        ),
+        ValidationFunction.SUM: _field_metric(
+            AggregateType.SUM, lambda value: round(value, 2)
+        ),
+        ValidationFunction.VARIANCE: _field_metric(
+            AggregateType.VARIANCE, lambda value: round(value, 2)
+        ),
+        ValidationFunction.STDDEV: _field_metric(
+            AggregateType.STDDEV, lambda value: round(value, 2)
+        ),
+        ValidationFunction.COUNT_NULL: _field_count(AggregateType.NULL_COUNT),
+        ValidationFunction.PERCENT_NULL: _field_ratio(AggregateType.NULL_COUNT),
+        ValidationFunction.COUNT_EMPTY_STRING: _field_count(
+            AggregateType.EMPTY_STRING_COUNT
+        ),
+        ValidationFunction.PERCENT_EMPTY_STRING: _field_ratio(
+            AggregateType.EMPTY_STRING_COUNT, lambda field: f"{field}.keyword"
+        ),
+    }
+
+    def __init__(
+        self,
+        max_aggregates_per_query: int = 50,
+        incremental: Optional[Dict[str, IncrementalScan]] = None,
+        partitioned: Optional[Dict[str, PartitionedScan]] = None,
+    ):
+        """
+        :param max_aggregates_per_query: maximum number of aggregates in one query
+        :param incremental: incremental scan by "data_source.dataset"
+        :param partitioned: partitioned scan by "data_source.dataset"
+        """
+        if max_aggregates_per_query < 1:
+            raise ValueError("max_aggregates_per_query should be greater than 0")
+        self.max_aggregates_per_query = max_aggregates_per_query
+        self.incremental = incremental or {}
+        self.partitioned = partitioned or {}
+
+    @staticmethod
+    def _sql_where_filter(validation: Validation) -> Optional[str]:
+        where_filter = validation.where_filter
+        if isinstance(validation.data_source, OracleDataSource) and where_filter:
+            where_filter = re.sub(
+                r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', where_filter
+            )
+        return where_filter
+
+    def _plan_validation(
+        self, validation: Validation
+    ) -> Optional[Tuple[List[ScanAggregate], Finalizer]]:
+        if isinstance(validation, DeltaValidation):
+            return None
+        if validation.validation_config.estimate:
+            # Answered by the statistics of the table, without a scan
+            return None
+        if isinstance(validation.data_source, SearchIndexDataSource):
+            return self._plan_search_validation(validation)
+        if not isinstance(validation.data_source, SQLDataSource):
+            return None
+        planner = self.FUSED_VALIDATION_MAPPING.get(
+            validation.validation_config.get_validation_function
+        )
+        if planner is None:
+            return None
+        try:
+            aggregates, finalize = planner(validation)
+        except ValueError:
+            # Invalid configuration, reported by the per validation execution
+            return None
+        for aggregate in aggregates:
+            if aggregate.type == AggregateType.PERCENTILE:
+                continue
+            if validation.data_source.aggregate_expression(aggregate) is None:
+                return None
+        return aggregates, finalize
+
+    def _plan_search_validation(
+        self, validation: Validation
+    ) -> Optional[Tuple[List[ScanAggregate], Finalizer]]:
+        planner = self.SEARCH_VALIDATION_MAPPING.get(
+            validation.validation_config.get_validation_function
+        )
+        if planner is None:
+            return None
+        aggregates, finalize = planner(validation)
+        for aggregate in aggregates:
+            if not validation.data_source.is_aggregate_supported(aggregate):
+                return None
+        return aggregates, finalize
+
+    def plan(
+        self, validations: List[Validation]
+    ) -> Tuple[List[Union["FusedScanGroup", "SearchScanGroup"]], List[Validation]]:
+        """
+        Split the validations into fused scan groups, search scan groups and the
+        validations which have to be executed one by one
+        :param validations: validations of the run
+        :return: fused scan groups, remaining validations
+        """
+        groups: Dict[Tuple, Union[FusedScanGroup, SearchScanGroup]] = {}
+        remaining: List[Validation] = []
+
+        for validation in validations:
+            fused_plan = self._plan_validation(validation)
+            if fused_plan is None:
+                remaining.append(validation)
+                continue
+            aggregates, finalize = fused_plan
+            if isinstance(validation.data_source, SearchIndexDataSource):
+                key = (validation.data_source.data_source_name, validation.dataset_name)
+                if key not in groups:
+                    groups[key] = SearchScanGroup(
+                        data_source=validation.data_source,
+                        dataset=validation.dataset_name,
+                    )
+                groups[key].add(validation, aggregates, finalize)
+                continue
+            where_filter = self._sql_where_filter(validation)
+            dataset_key = (
+                f"{validation.data_source.data_source_name}.{validation.dataset_name}"
+            )
+            incremental = self.incremental.get(dataset_key)
+            if validation.sample is not None or (
+                incremental is not None and not incremental.is_supported(aggregates)
+            ):
+                incremental = None
+            partitioned = self.partitioned.get(dataset_key)
+            if validation.sample is not None or (
+                partitioned is not None and not partitioned.is_supported(aggregates)
+            ):
+                partitioned = None
+            key = (
+                validation.data_source.data_source_name,
+                validation.dataset_name,
+                where_filter,
+                validation.sample,
+                validation.timeout,
+                incremental is not None,
+                partitioned is not None,
+            )
+            if key not in groups:
+                groups[key] = FusedScanGroup(
+                    data_source=validation.data_source,
+                    dataset=validation.dataset_name,
+                    where_filter=where_filter,
+                    max_aggregates_per_query=self.max_aggregates_per_query,
+                    sample=validation.sample,
+                    timeout=validation.timeout,
+                    incremental=incremental,
+                    partitioned=partitioned,
+                )
+            groups[key].add(validation, aggregates, finalize)
+
+        return list(groups.values()), remaining
+
+
+@dataclass
+class FusedScanGroup:
+    """
+    Validations of one dataset sharing a where filter, computed by a single scan.
+    The scan is split in several queries when the number of aggregates exceeds
+    max_aggregates_per_query.
+    """
+
+    data_source: SQLDataSource
+    dataset: str
+    where_filter: Optional[str] = None
+    max_aggregates_per_query: int = 50
+    validations: List[Tuple[Validation, List[ScanAggregate], Finalizer]] = field(
+        default_factory=list
+    )
+    sample: Optional[float] = None
+    timeout: Optional[float] = None
+    incremental: Optional[IncrementalScan] = None
+    partitioned: Optional[PartitionedScan] = None
+
+    def add(
+        self,
+        validation: Validation,
+        aggregates: List[ScanAggregate],
+        finalize: Finalizer,
+    ):
+        self.validations.append((validation, aggregates, finalize))
+
+    @property
+    def aggregates(self) -> List[ScanAggregate]:
+        """
+        Unique aggregates of the group, in the order they were requested
+        """
+        aggregates: Dict[ScanAggregate, None] = {}
+        for _, validation_aggregates, _ in self.validations:
+            for aggregate in validation_aggregates:
+                aggregates[aggregate] = None
+        return list(aggregates.keys())
+
+    def _batches(self, aggregates: List[ScanAggregate]) -> List[List[ScanAggregate]]:
+        return [
+            aggregates[i : i + self.max_aggregates_per_query]
+            for i in range(0, len(aggregates), self.max_aggregates_per_query)
+        ]
+
+    @property
+    def aggregate_batches(self) -> List[List[ScanAggregate]]:
+        return self._batches(
+            [
+                aggregate
+                for aggregate in self.aggregates
+                if aggregate.type != AggregateType.PERCENTILE
+            ]
+        )
+
+    def _scan(
+        self, aggregates: List[ScanAggregate], filters: Optional[str]
+    ) -> Dict[ScanAggregate, Any]:
+        values: Dict[ScanAggregate, Any] = {}
+        percentiles: Dict[str, List[ScanAggregate]] = {}
+        for aggregate in aggregates:
+            if aggregate.type == AggregateType.PERCENTILE:
+                percentiles.setdefault(aggregate.field, []).append(aggregate)
+        scan_aggregates = [
+            aggregate
+            for aggregate in aggregates
+            if aggregate.type != AggregateType.PERCENTILE
+        ]
+        with self._timeout(), self._sampling():
+            for batch in self._batches(scan_aggregates):
+                results = self.data_source.query_get_aggregates(
+                    table=self.dataset, aggregates=batch, filters=filters
+                )
+                values.update(dict(zip(batch, results)))
+            for column, column_aggregates in percentiles.items():
+                results = self.data_source.query_get_percentiles(
+                    table=self.dataset,
+                    field=column,
+                    percentiles=[aggregate.argument for aggregate in column_aggregates],
+                    filters=filters,
+                )
+                values.update(dict(zip(column_aggregates, results)))
+        return values
+
+    def _timeout(self) -> ContextManager:
+        if self.timeout is None:
+            return nullcontext()
+        return self.data_source.timeout(self.timeout)
+
+    def _sampling(self) -> ContextManager:
+        if self.sample is None:
+            return nullcontext()
+        return self.data_source.sampling(self.dataset, self.sample)
+
+    def _scan_dataset(
+        self, aggregates: List[ScanAggregate], filters: Optional[str]
+    ) -> Dict[ScanAggregate, Any]:
+        if self.partitioned is not None:
+            return self.partitioned.compute(
+                data_source=self.data_source,
+                dataset=self.dataset,
+                where_filter=filters,
+                aggregates=aggregates,
+                compute_aggregates=self._scan,
+            )
+        return self._scan(aggregates, filters)
+
+    def _compute_aggregates(self) -> Dict[ScanAggregate, Any]:
+        if self.incremental is not None:
+            return self.incremental.compute(
+                data_source=self.data_source,
+                dataset=self.dataset,
+                where_filter=self.where_filter,
+                aggregates=self.aggregates,
+                compute_aggregates=self._scan_dataset,
+            )
+        return self._scan_dataset(self.aggregates, self.where_filter)
+
+    def execute(self) -> Dict[str, Optional[ValidationInfo]]:
+        """
+        Run the fused scan and build the validation info of every validation of the
+        group. Falls back to the per validation execution if the scan fails, except
+        when it timed out, in which case every validation is reported as timed out.
+        :return: validation info by validation identity
+        """
+        try:
+            values = self._compute_aggregates()
+        except Exception as e:
+            if self.timeout is not None and self.data_source.is_timeout_error(e):
+                logger.error(
+                    f"Fused scan of {self.data_source.data_source_name}.{self.dataset}"
+                    f" timed out after {self.timeout} seconds"
+                )
+                return {
+                    validation.get_validation_identity(): validation.create_timed_out_validation_info()
+                    for validation, _, _ in self.validations
+                }
+            logger.warning(
+                f"Fused scan of {self.data_source.data_source_name}.{self.dataset} failed,"
+                f" running validations one by one: {str(e)}"
+            )
+            return {
+                validation.get_validation_identity(): validation.get_validation_info()
+                for validation, _, _ in self.validations
+            }
+
+        sample_size = None
+        if self.sample is not None:
+            sample_size = values.get(ScanAggregate(type=AggregateType.ROW_COUNT))
+
+        validation_infos: Dict[str, Optional[ValidationInfo]] = {}
+        for validation, aggregates, finalize in self.validations:
+            validation_infos[validation.get_validation_identity()] = self._finalize(
+                validation,
+                [values[aggregate] for aggregate in aggregates],
+                finalize,
+                sample_size if validation.validation_config.is_percentage else None,
+                self.data_source.APPROXIMATE_DISTINCT_ERROR
+                if validation.validation_config.approximate
+                else None,
+            )
+        return validation_infos
+
+    @staticmethod
+    def _finalize(
+        validation: Validation,
+        values: List[Any],
+        finalize: Finalizer,
+        sample_size: Optional[int] = None,
+        estimated_error: Optional[float] = None,
+    ) -> Optional[ValidationInfo]:
+        try:
+            return validation.create_validation_info(
+                finalize(values),
+                sample_size=sample_size,
+                estimated_error=estimated_error,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate metric {validation.name}: {str(e)}")
+            return None
+
+
+@dataclass
+class SearchScanGroup:
+    """
+    Validations of one search index, computed by a single multi search request
+    holding one aggregation-only search per where filter.
+    """
+
+    data_source: SearchIndexDataSource
+    dataset: str
+    validations: List[Tuple[Validation, List[ScanAggregate], Finalizer]] = field(
+        default_factory=list
+    )
+
+    def add(
+        self,
+        validation: Validation,
+        aggregates: List[ScanAggregate],
+        finalize: Finalizer,
+    ):
+        self.validations.append((validation, aggregates, finalize))
+
+    @staticmethod
+    def _filter_key(where_filter: Optional[Dict]) -> str:
+        return json.dumps(where_filter or None, sort_keys=True)
+
+    @property
+    def requests(self) -> List[Tuple[List[ScanAggregate], Optional[Dict]]]:
+        """
+        Unique aggregates of the group by where filter, in the order they were
+        requested
+        """
+        requests: Dict[str, Tuple[Dict[ScanAggregate, None], Optional[Dict]]] = {}
+        for validation, aggregates, _ in self.validations:
+            key = self._filter_key(validation.where_filter)
+            if key not in requests:
+                requests[key] = ({}, validation.where_filter or None)
+            for aggregate in aggregates:
+                requests[key][0][aggregate] = None
+        return [
+            (list(aggregates.keys()), where_filter)
+            for aggregates, where_filter in requests.values()
+        ]
+
+    def execute(self) -> Dict[str, Optional[ValidationInfo]]:
+        """
+        Run the multi search and build the validation info of every validation of
+        the group. Falls back to the per validation execution if the request fails.
+        :return: validation info by validation identity
+        """
+        requests = self.requests
+        try:
+            results = self.data_source.query_get_aggregates_batch(
+                index_name=self.dataset, requests=requests
+            )
+        except Exception as e:
+            logger.warning(
+                f"Search scan of {self.data_source.data_source_name}.{self.dataset}"
+                f" failed, running validations one by one: {str(e)}"
+            )
+            return {
+                validation.get_validation_identity(): validation.get_validation_info()
+                for validation, _, _ in self.validations
+            }
+
+        values: Dict[Tuple[str, ScanAggregate], Any] = {}
+        for (aggregates, where_filter), result in zip(requests, results):
+            key = self._filter_key(where_filter)
+            for aggregate, value in zip(aggregates, result):
+                values[(key, aggregate)] = value
+
+        validation_infos: Dict[str, Optional[ValidationInfo]] = {}
+        for validation, aggregates, finalize in self.validations:
+            key = self._filter_key(validation.where_filter)
+            validation_infos[
+                validation.get_validation_identity()
+            ] = FusedScanGroup._finalize(
+                validation,
+                [values[(key, aggregate)] for aggregate in aggregates],
+                finalize,
+            )
+        return validation_infos
@@ -0,0 +1,202 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import datetime
+import hashlib
+import json
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.models.scan import (
+    AggregateType,
+    IncrementalState,
+    ScanAggregate,
+)
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.repository.watermark_repository import WatermarkRepository
+
+
+def _add(previous, current):
+    if previous is None:
+        return current
+    if current is None:
+        return previous
+    return previous + current
+
+
+def _min(previous, current):
+    if previous is None or current is None:
+        return current if previous is None else previous
+    return min(previous, current)
+
+
+def _max(previous, current):
+    if previous is None or current is None:
+        return current if previous is None else previous
+    return max(previous, current)
+
+
+COMBINABLE_AGGREGATES: Dict[AggregateType, Callable[[Any, Any], Any]] = {
+    AggregateType.ROW_COUNT: _add,
+    AggregateType.SUM: _add,
+    AggregateType.NULL_COUNT: _add,
+    AggregateType.EMPTY_STRING_COUNT: _add,
+    AggregateType.ZERO_COUNT: _add,
+    AggregateType.NEGATIVE_COUNT: _add,
+    AggregateType.VALUES_MATCH_COUNT: _add,
+    AggregateType.REGEX_MATCH_COUNT: _add,
+    AggregateType.PREDEFINED_REGEX_MATCH_COUNT: _add,
+    AggregateType.MIN: _min,
+    AggregateType.MAX: _max,
+    AggregateType.STRING_LENGTH_MIN: _min,
+    AggregateType.STRING_LENGTH_MAX: _max,
+}
+
+
+def aggregate_key(aggregate: ScanAggregate) -> str:
+    """
+    Stable key of an aggregate, used to persist its running value
+    """
+    return json.dumps(
+        [aggregate.type.value, aggregate.field, aggregate.argument], default=str
+    )
+
+
+def _to_state_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return str(value)
+    return value
+
+
+def _to_watermark(value: Any) -> Tuple[Any, Optional[str]]:
+    """
+    Persisted value and type tag of a watermark. Timestamps and dates are kept as ISO
+    text so that they can be read back with their type.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(), "datetime"
+    if isinstance(value, datetime.date):
+        return value.isoformat(), "date"
+    return _to_state_value(value), None
+
+
+@dataclass
+class IncrementalScan:
+    """
+    IncrementalScan computes the aggregates of a fused scan group on the rows newer
+    than the high-water mark of the previous run, and combines them with the running
+    aggregates persisted in the watermark repository. Only aggregates that can be
+    combined (counts, sums, minimums and maximums) are computed incrementally.
+    """
+
+    watermark: str
+    repository: WatermarkRepository
+
+    @staticmethod
+    def is_supported(aggregates: List[ScanAggregate]) -> bool:
+        return all(aggregate.type in COMBINABLE_AGGREGATES for aggregate in aggregates)
+
+    @staticmethod
+    def state_id(data_source_name: str, dataset: str, where_filter: Optional[str]):
+        state_id = f"{data_source_name}.{dataset}"
+        if where_filter:
+            digest = hashlib.sha1(where_filter.encode("utf-8")).hexdigest()[:12]
+            state_id = f"{state_id}.{digest}"
+        return state_id
+
+    @staticmethod
+    def _watermark_literal(data_source: SQLDataSource, state: IncrementalState) -> str:
+        value = state.watermark
+        if state.watermark_type == "datetime":
+            return data_source.timestamp_literal(datetime.datetime.fromisoformat(value))
+        if state.watermark_type == "date":
+            return data_source.date_literal(datetime.date.fromisoformat(value))
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        escaped = str(value).replace("'", "''")
+        return f"'{escaped}'"
+
+    def compute(
+        self,
+        data_source: SQLDataSource,
+        dataset: str,
+        where_filter: Optional[str],
+        aggregates: List[ScanAggregate],
+        compute_aggregates: Callable[
+            [List[ScanAggregate], Optional[str]], Dict[ScanAggregate, Any]
+        ],
+    ) -> Dict[ScanAggregate, Any]:
+        """
+        Compute the aggregates of the new rows and combine them with the persisted state
+        :param data_source: data source of the dataset
+        :param dataset: name of the dataset
+        :param where_filter: where filter of the fused scan group
+        :param aggregates: aggregates of the fused scan group
+        :param compute_aggregates: function that runs the scan of the given aggregates
+            with the given where filter
+        :return: combined value of every aggregate
+        """
+        state_id = self.state_id(data_source.data_source_name, dataset, where_filter)
+        state = self.repository.get_state(state_id)
+        keys = {aggregate: aggregate_key(aggregate) for aggregate in aggregates}
+
+        filters = where_filter
+        previous: Dict[str, Any] = {}
+        if (
+            state is not None
+            and state.watermark is not None
+            and all(key in state.aggregates for key in keys.values())
+        ):
+            previous = state.aggregates
+            watermark_filter = (
+                f"{data_source.quote_column(self.watermark)} > "
+                f"{self._watermark_literal(data_source, state)}"
+            )
+            filters = (
+                f"({where_filter}) AND {watermark_filter}"
+                if where_filter
+                else watermark_filter
+            )
+        else:
+            logger.info(f"Running a full scan of {state_id} to build its watermark")
+
+        watermark_aggregate = ScanAggregate(
+            type=AggregateType.MAX, field=self.watermark
+        )
+        values = compute_aggregates(
+            list(dict.fromkeys(aggregates + [watermark_aggregate])), filters
+        )
+
+        combined: Dict[ScanAggregate, Any] = {}
+        for aggregate, key in keys.items():
+            combined[aggregate] = COMBINABLE_AGGREGATES[aggregate.type](
+                previous.get(key), _to_state_value(values[aggregate])
+            )
+
+        new_watermark, watermark_type = _to_watermark(values[watermark_aggregate])
+        if new_watermark is None and state is not None:
+            new_watermark, watermark_type = state.watermark, state.watermark_type
+        self.repository.save_state(
+            state_id,
+            IncrementalState(
+                watermark=new_watermark,
+                aggregates={keys[a]: value for a, value in combined.items()},
+                watermark_type=watermark_type,
+            ),
+        )
+        return combined
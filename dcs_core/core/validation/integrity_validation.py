@@ -0,0 +1,139 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import re
+from typing import List, Optional
+
+from loguru import logger
+
+from dcs_core.core.common.models.configuration import ValidationConfig
+from dcs_core.core.common.models.data_source_resource import ForeignKey
+from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.key_existence import KeyExistenceCheck
+from dcs_core.integrations.databases.oracle import OracleDataSource
+
+
+class OrphanCountValidation(Validation):
+    """
+    OrphanCountValidation counts the rows of a table whose foreign key references no
+    row of the parent table. With a column, the column is checked against the
+    referenced column of the ref dataset. Without a column, every foreign key of the
+    table is discovered from the database and all of them are checked in one query.
+    When the ref dataset is on another data source, the keys are checked with a
+    KeyExistenceCheck instead of an anti-join.
+    """
+
+    DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+    def __init__(
+        self,
+        name: str,
+        validation_config: ValidationConfig,
+        data_source: DataSource,
+        dataset_name: str,
+        field_name: str = None,
+        reference_data_source: Optional[DataSource] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            name=name,
+            validation_config=validation_config,
+            data_source=data_source,
+            dataset_name=dataset_name,
+            field_name=field_name,
+            **kwargs,
+        )
+        self.reference_data_source = reference_data_source
+
+    @property
+    def is_cross_data_source(self) -> bool:
+        return (
+            self.field_name is not None
+            and self.reference_data_source is not None
+            and self.reference_data_source is not self.data_source
+        )
+
+    def foreign_keys(self) -> List[ForeignKey]:
+        """
+        Foreign keys checked by the validation
+        """
+        if self.field_name is None:
+            foreign_keys = self.data_source.get_table_foreign_keys(self.dataset_name)
+            if not foreign_keys:
+                raise ValueError(f"No foreign key found on {self.dataset_name}")
+            return foreign_keys
+        config = self.validation_config
+        if config.get_ref_data_source_name != self.data_source.data_source_name:
+            raise ValueError(
+                "orphan_count references a dataset of the same data source, "
+                f"was {config.get_ref_data_source_name}"
+            )
+        return [
+            ForeignKey(
+                name=self.name,
+                columns=[self.field_name],
+                referenced_table=config.get_ref_dataset_name,
+                referenced_columns=[config.get_ref_field_name or self.field_name],
+            )
+        ]
+
+    def key_existence_check(self) -> KeyExistenceCheck:
+        """
+        Check of the keys of the column against the ref dataset of another data source
+        """
+        if not isinstance(self.reference_data_source, SQLDataSource):
+            raise ValueError("Invalid reference data source type")
+        config = self.validation_config
+        return KeyExistenceCheck(
+            source=self.data_source,
+            dataset=self.dataset_name,
+            key=self.field_name,
+            reference=self.reference_data_source,
+            reference_dataset=config.get_ref_dataset_name,
+            reference_key=config.get_ref_field_name or self.field_name,
+            where_filter=self.where_filter,
+            false_positive_rate=(
+                config.false_positive_rate or self.DEFAULT_FALSE_POSITIVE_RATE
+            ),
+        )
+
+    def _generate_metric_value(self, **kwargs) -> int:
+        if isinstance(self.data_source, SQLDataSource):
+            if isinstance(self.data_source, OracleDataSource) and self.where_filter:
+                self.where_filter = re.sub(
+                    r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
+                )
+            if self.is_cross_data_source:
+                result = self.key_existence_check().check()
+                logger.debug(
+                    f"{result.orphan_key_count} of {result.key_count} keys of "
+                    f"{self.dataset_name}.{self.field_name} missing from the reference"
+                )
+                self.estimated_error = result.false_positive_rate or None
+                return result.orphan_count
+            foreign_keys = self.foreign_keys()
+            counts = self.data_source.query_get_orphan_counts(
+                table=self.dataset_name,
+                foreign_keys=foreign_keys,
+                filters=self.where_filter if self.where_filter else None,
+            )
+            for foreign_key, count in zip(foreign_keys, counts):
+                logger.debug(
+                    f"{count} orphan rows of {self.dataset_name} for foreign key "
+                    f"{foreign_key.name} on {foreign_key.referenced_table}"
+                )
+            return sum(counts)
+        else:
+            raise ValueError("Invalid data source type")
@@ -0,0 +1,191 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import hashlib
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional, Union
+
+from loguru import logger
+
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+
+
+def _normalize_key(value: Any) -> Any:
+    # The same key is read as an int, a float or a Decimal depending on the database
+    if isinstance(value, (float, Decimal)) and math.isfinite(value):
+        if value == int(value):
+            return int(value)
+    return value
+
+
+class BloomFilter:
+    """
+    BloomFilter is a set of keys answering membership with no false negative and a
+    false positive rate of at most false_positive_rate once capacity keys are added.
+    Its size is about 1.44 * log2(1 / false_positive_rate) bits per key.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.false_positive_rate = false_positive_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: Any):
+        digest = hashlib.blake2b(
+            str(_normalize_key(key)).encode("utf-8"), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, key: Any):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: Any) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class KeyBitmap:
+    """
+    KeyBitmap is an exact set of the integer keys between low and high, one bit per
+    value of the range
+    """
+
+    false_positive_rate = 0.0
+
+    def __init__(self, low: int, high: int):
+        self.low = low
+        self.size = high - low + 1
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _position(self, key: Any) -> Optional[int]:
+        key = _normalize_key(key)
+        if not isinstance(key, int) or isinstance(key, bool):
+            return None
+        position = key - self.low
+        return position if 0 <= position < self.size else None
+
+    def add(self, key: Any):
+        position = self._position(key)
+        if position is not None:
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: Any) -> bool:
+        position = self._position(key)
+        return position is not None and bool(
+            self.bits[position >> 3] & (1 << (position & 7))
+        )
+
+
+@dataclass
+class KeyExistenceResult:
+    """
+    Rows of the checked dataset whose key is missing from the reference dataset. With
+    a Bloom filter the counts are estimates, lower than the exact counts by at most
+    false_positive_rate.
+    """
+
+    orphan_count: int = 0
+    key_count: int = 0
+    orphan_key_count: int = 0
+    false_positive_rate: float = 0.0
+
+
+@dataclass
+class KeyExistenceCheck:
+    """
+    KeyExistenceCheck counts the rows of a dataset whose key is missing from a
+    reference dataset of another data source, where the two can not be joined.
+    The distinct keys of the reference dataset are streamed, chunk_size keys per
+    round trip or the fetch_size of the data source, into a bitmap of the key range
+    for dense integer keys, else into a Bloom filter sized for the configured false
+    positive rate. The keys of the checked dataset are then streamed with their row
+    count, and the rows of the keys absent from the filter are counted as orphans.
+    The count is exact with a bitmap. A Bloom filter has no false negative but can
+    take an orphan key for a reference key, the orphan count is then an estimate,
+    lower than the exact count by at most false_positive_rate.
+    """
+
+    source: SQLDataSource
+    dataset: str
+    key: str
+    reference: SQLDataSource
+    reference_dataset: str
+    reference_key: str
+    where_filter: Optional[str] = None
+    false_positive_rate: float = 0.01
+    chunk_size: Optional[int] = None
+
+    def key_filter(self) -> Union[BloomFilter, KeyBitmap]:
+        """
+        Build the filter of the distinct keys of the reference dataset
+        """
+        aggregates = [
+            ScanAggregate(type=AggregateType.MIN, field=self.reference_key),
+            ScanAggregate(type=AggregateType.MAX, field=self.reference_key),
+            ScanAggregate(type=AggregateType.DISTINCT_COUNT, field=self.reference_key),
+        ]
+        low, high, count = self.reference.query_get_aggregates(
+            table=self.reference_dataset, aggregates=aggregates
+        )
+        low, high = _normalize_key(low), _normalize_key(high)
+        key_filter = BloomFilter(int(count or 0), self.false_positive_rate)
+        if (
+            isinstance(low, int)
+            and isinstance(high, int)
+            and not isinstance(low, bool)
+            and high - low + 1 <= key_filter.size
+        ):
+            key_filter = KeyBitmap(low, high)
+        for key, _ in self.reference.query_stream_key_counts(
+            table=self.reference_dataset,
+            key=self.reference_key,
+            batch_size=self.chunk_size,
+        ):
+            key_filter.add(key)
+        logger.debug(
+            f"{type(key_filter).__name__} of {int(count or 0)} keys of "
+            f"{self.reference.data_source_name}.{self.reference_dataset} uses "
+            f"{len(key_filter.bits)} bytes"
+        )
+        return key_filter
+
+    def check(self) -> KeyExistenceResult:
+        """
+        Count the rows of the dataset whose key is missing from the reference dataset
+        :return: orphan row and key counts, with the false positive rate of the filter
+        """
+        key_filter = self.key_filter()
+        result = KeyExistenceResult(false_positive_rate=key_filter.false_positive_rate)
+        for key, count in self.source.query_stream_key_counts(
+            table=self.dataset,
+            key=self.key,
+            filters=self.where_filter,
+            batch_size=self.chunk_size,
+        ):
+            result.key_count += 1
+            if key not in key_filter:
+                result.orphan_key_count += 1
+                result.orphan_count += count
+        return result
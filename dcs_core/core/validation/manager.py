@@ -26,6 +26,7 @@ from dcs_core.core.validation.completeness_validation import (  # noqa F401 this
     CountEmptyStringValidation,
     CountNullKeywordValidation,
     CountNullValidation,
+    DeltaCountNullValidation,
     PercentageAllSpaceValidation,
     PercentageEmptyStringValidation,
     PercentageNullKeywordValidation,
@@ -34,10 +35,15 @@ from dcs_core.core.validation.completeness_validation import (  # noqa F401 this
 from dcs_core.core.validation.custom_query_validation import (  # noqa F401 this is used in globals
     CustomSqlValidation,
 )
+from dcs_core.core.validation.integrity_validation import (  # noqa F401 this is used in globals
+    OrphanCountValidation,
+)
 from dcs_core.core.validation.numeric_validation import (  # noqa F401 this is used in globals
     AvgValidation,
     CountNegativeValidation,
     CountZeroValidation,
+    DeltaAvgValidation,
+    DeltaSumValidation,
     MaxValidation,
     MinValidation,
     Percentile20Validation,
@@ -55,11 +61,13 @@ from dcs_core.core.validation.reliability_validation import (  # noqa F401 this
     CountDocumentsValidation,
     CountRowValidation,
     DeltaCountRowValidation,
+    DeltaDiffValidation,
     FreshnessValueMetric,
 )
 from dcs_core.core.validation.uniqueness_validation import (  # noqa F401 this is used in globals
     CountDistinctValidation,
     CountDuplicateValidation,
+    DeltaCountDistinctValidation,
 )
 from dcs_core.core.validation.validity_validation import (  # noqa F401 this is used in globals
     CountCUSIPValidation,
@@ -120,6 +128,7 @@ class ValidationManager:
         ValidationFunction.STDDEV.value: "StdDevValidation",
         ValidationFunction.COUNT_DUPLICATE.value: "CountDuplicateValidation",
         ValidationFunction.COUNT_DISTINCT.value: "CountDistinctValidation",
+        ValidationFunction.ORPHAN_COUNT.value: "OrphanCountValidation",
         ValidationFunction.COUNT_NULL.value: "CountNullValidation",
         ValidationFunction.PERCENT_NULL.value: "PercentageNullValidation",
         ValidationFunction.COUNT_EMPTY_STRING.value: "CountEmptyStringValidation",
@@ -128,6 +137,11 @@ class ValidationManager:
         ValidationFunction.COUNT_DOCUMENTS.value: "CountDocumentsValidation",
         ValidationFunction.COUNT_ROWS.value: "CountRowValidation",
         ValidationFunction.DELTA_COUNT_ROWS.value: "DeltaCountRowValidation",
+        ValidationFunction.DELTA_SUM.value: "DeltaSumValidation",
+        ValidationFunction.DELTA_AVG.value: "DeltaAvgValidation",
+        ValidationFunction.DELTA_COUNT_NULL.value: "DeltaCountNullValidation",
+        ValidationFunction.DELTA_COUNT_DISTINCT.value: "DeltaCountDistinctValidation",
+        ValidationFunction.DELTA_DIFF.value: "DeltaDiffValidation",
         ValidationFunction.FRESHNESS.value: "FreshnessValueMetric",
         ValidationFunction.COUNT_UUID.value: "CountUUIDValidation",
         ValidationFunction.PERCENT_UUID.value: "PercentUUIDValidation",
@@ -255,6 +269,12 @@ class ValidationManager:
                         validation_name
                     ] = validation
                 else:
+                    if validation_config.ref is not None:
+                        params[
+                            "reference_data_source"
+                        ] = self.data_source_manager.get_data_source(
+                            validation_config.get_ref_data_source_name
+                        )
                     validation: Validation = globals()[
                         self.VALIDATION_CLASS_MAPPING[
                             validation_config.get_validation_function
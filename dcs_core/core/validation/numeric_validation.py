@@ -17,7 +17,7 @@ from typing import Union
 
 from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
-from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.base import DeltaAggregateValidation, Validation
 from dcs_core.integrations.databases.oracle import OracleDataSource
 
 
@@ -117,6 +117,28 @@ class SumValidation(Validation):
             raise ValueError("Invalid data source type")
 
 
+class DeltaAvgValidation(DeltaAggregateValidation):
+    """
+    Difference between the average of a column and of the reference column
+    """
+
+    def _query_metric_value(
+        self, data_source: SQLDataSource, table: str, field: str, filters: str
+    ) -> Union[float, int]:
+        return data_source.query_get_avg(table=table, field=field, filters=filters)
+
+
+class DeltaSumValidation(DeltaAggregateValidation):
+    """
+    Difference between the sum of a column and of the reference column
+    """
+
+    def _query_metric_value(
+        self, data_source: SQLDataSource, table: str, field: str, filters: str
+    ) -> Union[float, int]:
+        return data_source.query_get_sum(table=table, field=field, filters=filters)
+
+
 class VarianceValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
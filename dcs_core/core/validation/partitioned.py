@@ -0,0 +1,369 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import datetime
+import functools
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.datasource.workers import map_on_connections
+from dcs_core.core.validation.incremental import COMBINABLE_AGGREGATES
+
+# Aggregates merged from the count, mean and variance of every partition
+MOMENT_AGGREGATES = [
+    AggregateType.AVG,
+    AggregateType.VARIANCE,
+    AggregateType.STDDEV,
+    AggregateType.STRING_LENGTH_AVG,
+]
+
+ComputeAggregates = Callable[
+    [List[ScanAggregate], Optional[str]], Dict[ScanAggregate, Any]
+]
+
+
+@dataclass
+class Moments:
+    """
+    Count, mean and sum of squared differences from the mean of the values of a
+    partition, merged with the parallel algorithm of Chan et al.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_partition(cls, count, mean, variance=None) -> "Moments":
+        count = int(count or 0)
+        if count == 0 or mean is None:
+            return cls()
+        m2 = float(variance) * (count - 1) if variance is not None else 0.0
+        return cls(count=count, mean=float(mean), m2=m2)
+
+    def merge(self, other: "Moments") -> "Moments":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return Moments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def variance(self) -> Optional[float]:
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+
+def _merge_value(previous, current):
+    if previous is None:
+        return current
+    return previous + current
+
+
+def range_literal(value: Any) -> str:
+    """
+    SQL literal of a bound of a key range
+    """
+    if isinstance(value, datetime.datetime):
+        return f"'{value.isoformat(sep=' ')}'"
+    if isinstance(value, datetime.date):
+        return f"'{value.isoformat()}'"
+    return str(value)
+
+
+def range_boundaries(low: Any, high: Any, partitions: int) -> Optional[List[Any]]:
+    """
+    Split the range between low and high into equal width ranges
+    :return: inner boundaries of the ranges, None if the values can not be split
+    """
+    if isinstance(low, bool) or isinstance(high, bool):
+        return None
+    if isinstance(low, int) and isinstance(high, int):
+        span = high - low + 1
+        boundaries = [low + span * i // partitions for i in range(1, partitions)]
+    elif isinstance(low, (int, float, Decimal)) and isinstance(
+        high, (int, float, Decimal)
+    ):
+        step = (high - low) / partitions
+        boundaries = [low + step * i for i in range(1, partitions)]
+    elif isinstance(low, datetime.date) and isinstance(high, datetime.date):
+        if type(low) is not type(high):
+            return None
+        step = (high - low) / partitions
+        if isinstance(low, datetime.datetime):
+            boundaries = [low + step * i for i in range(1, partitions)]
+        else:
+            boundaries = [
+                low + datetime.timedelta(days=(step * i).days)
+                for i in range(1, partitions)
+            ]
+    else:
+        return None
+    return [
+        boundary for boundary in dict.fromkeys(boundaries) if low < boundary <= high
+    ]
+
+
+@dataclass
+class PartitionedScan:
+    """
+    PartitionedScan splits the scan of a fused scan group into ranges of a partition
+    column, computes the aggregates of every range in parallel and merges the partial
+    results. A failed partition is retried on its own, up to max_retries times.
+    Counts, sums, minimums and maximums are merged directly, averages, variances and
+    standard deviations are merged from the count, mean and variance of every range.
+    """
+
+    column: Optional[str] = None
+    partitions: int = 8
+    max_retries: int = 2
+
+    @staticmethod
+    def is_supported(aggregates: List[ScanAggregate]) -> bool:
+        return all(
+            aggregate.type in COMBINABLE_AGGREGATES
+            or aggregate.type in MOMENT_AGGREGATES
+            or aggregate.type == AggregateType.VALUE_COUNT
+            for aggregate in aggregates
+        )
+
+    def partition_column(
+        self, data_source: SQLDataSource, dataset: str
+    ) -> Optional[str]:
+        """
+        Get the partition column of a dataset, the configured column or else the
+        leading column of the primary key or of the first index of the table
+        """
+        if self.column:
+            return self.column
+        if not hasattr(data_source, "query_get_table_indexes"):
+            return None
+        try:
+            indexes = data_source.query_get_table_indexes(dataset)
+        except Exception as e:
+            logger.warning(f"Failed to get the indexes of {dataset}: {str(e)}")
+            return None
+        ordered = sorted(
+            indexes.values(), key=lambda index: not index.get("is_primary_key")
+        )
+        for index in ordered:
+            columns = sorted(
+                index.get("columns", []), key=lambda column: column["column_order"]
+            )
+            if columns:
+                return columns[0]["column_name"].strip()
+        return None
+
+    def ranges(
+        self,
+        data_source: SQLDataSource,
+        column: str,
+        where_filter: Optional[str],
+        compute_aggregates: ComputeAggregates,
+    ) -> Optional[List[str]]:
+        """
+        Split the rows into equal width ranges of the partition column, between its
+        minimum and maximum, and the rows where it is null
+        :return: filter condition of every range, None if the column can not be split
+        """
+        minimum = ScanAggregate(type=AggregateType.MIN, field=column)
+        maximum = ScanAggregate(type=AggregateType.MAX, field=column)
+        values = compute_aggregates([minimum, maximum], where_filter)
+        low, high = values[minimum], values[maximum]
+        if low is None or high is None:
+            return None
+        boundaries = range_boundaries(low, high, self.partitions)
+        if boundaries is None:
+            return None
+
+        quoted = data_source.quote_column(column)
+        lower = [low] + boundaries
+        conditions = []
+        for i, start in enumerate(lower):
+            if i + 1 < len(lower):
+                conditions.append(
+                    f"{quoted} >= {range_literal(start)} AND "
+                    f"{quoted} < {range_literal(lower[i + 1])}"
+                )
+            else:
+                conditions.append(
+                    f"{quoted} >= {range_literal(start)} AND "
+                    f"{quoted} <= {range_literal(high)}"
+                )
+        conditions.append(f"{quoted} IS NULL")
+        if where_filter:
+            conditions = [f"({where_filter}) AND {c}" for c in conditions]
+        return conditions
+
+    @staticmethod
+    def partial_aggregates(aggregates: List[ScanAggregate]) -> List[ScanAggregate]:
+        """
+        Aggregates computed on every partition to merge the given aggregates
+        """
+        partial: Dict[ScanAggregate, None] = {}
+        for aggregate in aggregates:
+            if aggregate.type == AggregateType.STRING_LENGTH_AVG:
+                partial[
+                    ScanAggregate(type=AggregateType.VALUE_COUNT, field=aggregate.field)
+                ] = None
+                partial[aggregate] = None
+            elif aggregate.type in MOMENT_AGGREGATES:
+                partial[
+                    ScanAggregate(type=AggregateType.VALUE_COUNT, field=aggregate.field)
+                ] = None
+                partial[
+                    ScanAggregate(type=AggregateType.AVG, field=aggregate.field)
+                ] = None
+                if aggregate.type != AggregateType.AVG:
+                    partial[
+                        ScanAggregate(
+                            type=AggregateType.VARIANCE, field=aggregate.field
+                        )
+                    ] = None
+            else:
+                partial[aggregate] = None
+        return list(partial.keys())
+
+    @staticmethod
+    def merge(
+        aggregates: List[ScanAggregate], partitions: List[Dict[ScanAggregate, Any]]
+    ) -> Dict[ScanAggregate, Any]:
+        """
+        Merge the partial aggregates of every partition into the given aggregates
+        """
+        merged: Dict[ScanAggregate, Any] = {}
+        for aggregate in aggregates:
+            if aggregate.type in MOMENT_AGGREGATES:
+                count = ScanAggregate(
+                    type=AggregateType.VALUE_COUNT, field=aggregate.field
+                )
+                if aggregate.type == AggregateType.STRING_LENGTH_AVG:
+                    mean, variance = aggregate, None
+                else:
+                    mean = ScanAggregate(type=AggregateType.AVG, field=aggregate.field)
+                    variance = ScanAggregate(
+                        type=AggregateType.VARIANCE, field=aggregate.field
+                    )
+                moments = Moments()
+                for values in partitions:
+                    moments = moments.merge(
+                        Moments.from_partition(
+                            values[count],
+                            values[mean],
+                            values.get(variance) if variance else None,
+                        )
+                    )
+                if moments.count == 0:
+                    merged[aggregate] = None
+                elif aggregate.type == AggregateType.VARIANCE:
+                    merged[aggregate] = moments.variance
+                elif aggregate.type == AggregateType.STDDEV:
+                    variance_value = moments.variance
+                    merged[aggregate] = (
+                        math.sqrt(variance_value)
+                        if variance_value is not None
+                        else None
+                    )
+                else:
+                    merged[aggregate] = moments.mean
+                continue
+            combine = COMBINABLE_AGGREGATES.get(aggregate.type, _merge_value)
+            value = None
+            for values in partitions:
+                value = combine(value, values[aggregate])
+            merged[aggregate] = value
+        return merged
+
+    def _compute_partition(
+        self,
+        data_source: SQLDataSource,
+        aggregates: List[ScanAggregate],
+        condition: str,
+        compute_aggregates: ComputeAggregates,
+    ) -> Dict[ScanAggregate, Any]:
+        attempt = 0
+        while True:
+            try:
+                return compute_aggregates(aggregates, condition)
+            except Exception as e:
+                if attempt >= self.max_retries or data_source.is_timeout_error(e):
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"Partition {condition} failed, retrying ({attempt}/"
+                    f"{self.max_retries}): {str(e)}"
+                )
+
+    def compute(
+        self,
+        data_source: SQLDataSource,
+        dataset: str,
+        where_filter: Optional[str],
+        aggregates: List[ScanAggregate],
+        compute_aggregates: ComputeAggregates,
+    ) -> Dict[ScanAggregate, Any]:
+        """
+        Compute the aggregates of every partition of the dataset in parallel and merge
+        them. Falls back to a single scan if the dataset can not be partitioned.
+        :param data_source: data source of the dataset
+        :param dataset: name of the dataset
+        :param where_filter: where filter of the fused scan group
+        :param aggregates: aggregates of the fused scan group
+        :param compute_aggregates: function that runs the scan of the given aggregates
+            with the given where filter
+        :return: merged value of every aggregate
+        """
+        column = self.partition_column(data_source, dataset)
+        conditions = None
+        if column is not None:
+            conditions = self.ranges(
+                data_source, column, where_filter, compute_aggregates
+            )
+        if not conditions:
+            logger.info(
+                f"Dataset {data_source.data_source_name}.{dataset} can not be "
+                f"partitioned, running a single scan"
+            )
+            return compute_aggregates(aggregates, where_filter)
+
+        partial = self.partial_aggregates(aggregates)
+        # The partitions run on the connection of the current thread and on the idle
+        # connections of the pool, never waiting for a connection of another task
+        partitions = map_on_connections(
+            [
+                (
+                    data_source,
+                    functools.partial(
+                        self._compute_partition,
+                        data_source,
+                        partial,
+                        condition,
+                        compute_aggregates,
+                    ),
+                )
+                for condition in conditions
+            ],
+            thread_name_prefix="dcs-partition",
+        )
+        return self.merge(aggregates, partitions)
@@ -12,11 +12,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import re
-from typing import Union
+import sys
+import traceback
+from typing import List, Tuple, Union
 
+from loguru import logger
+
+from dcs_core.core.common.models.validation import ValidationInfo
 from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import DeltaValidation, Validation
+from dcs_core.core.validation.data_diff import DataDiffResult, DiffSide, HashDiff
 from dcs_core.integrations.databases.oracle import OracleDataSource
 
 
@@ -47,6 +53,14 @@ class CountRowValidation(Validation):
                 self.where_filter = re.sub(
                     r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
                 )
+            if self.validation_config.estimate:
+                value = self._estimated_metric_value(
+                    self.data_source.query_get_estimated_row_count(
+                        table=self.dataset_name
+                    )
+                )
+                if value is not None:
+                    return value
 
             return self.data_source.query_get_row_count(
                 table=self.dataset_name,
@@ -80,6 +94,91 @@ class DeltaCountRowValidation(DeltaValidation):
             raise ValueError("Invalid data source type")
 
 
+class DeltaDiffValidation(DeltaValidation):
+    """
+    DeltaDiffValidation reconciles the rows of a dataset with a reference dataset by
+    key, and counts the keys missing from, extra to and different from the reference.
+    """
+
+    def _generate_reference_metric_value(self, **kwargs) -> Union[float, int]:
+        if isinstance(self.reference_data_source, SQLDataSource):
+            return self.reference_data_source.query_get_row_count(
+                table=self.reference_dataset_name,
+                filters=self.where_filter if self.where_filter else None,
+            )
+        else:
+            raise ValueError("Invalid data source type")
+
+    def _generate_metric_value(self):
+        if isinstance(self.data_source, SQLDataSource):
+            return self.data_source.query_get_row_count(
+                table=self.dataset_name,
+                filters=self.where_filter if self.where_filter else None,
+            )
+        else:
+            raise ValueError("Invalid data source type")
+
+    def _compared_fields(self, reference_key: str) -> Tuple[List[str], List[str]]:
+        """
+        Columns of the dataset present in the reference dataset, matched without case
+        """
+        reference_columns = {
+            column.lower(): column
+            for column in self.reference_data_source.query_get_column_metadata(
+                self.reference_dataset_name
+            )
+        }
+        fields, reference_fields = [self.field_name], [reference_key]
+        for column in self.data_source.query_get_column_metadata(self.dataset_name):
+            if column.lower() == self.field_name.lower():
+                continue
+            if column.lower() in reference_columns:
+                fields.append(column)
+                reference_fields.append(reference_columns[column.lower()])
+        return fields, reference_fields
+
+    def diff(self) -> DataDiffResult:
+        if not isinstance(self.data_source, SQLDataSource) or not isinstance(
+            self.reference_data_source, SQLDataSource
+        ):
+            raise ValueError("Invalid data source type")
+        reference_key = self.reference_field_name or self.field_name
+        fields, reference_fields = self._compared_fields(reference_key)
+        return HashDiff(
+            source=DiffSide(
+                data_source=self.data_source,
+                dataset=self.dataset_name,
+                key=self.field_name,
+                fields=fields,
+                where_filter=self.where_filter,
+            ),
+            reference=DiffSide(
+                data_source=self.reference_data_source,
+                dataset=self.reference_dataset_name,
+                key=reference_key,
+                fields=reference_fields,
+                where_filter=self.where_filter,
+            ),
+        ).diff()
+
+    def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
+        try:
+            result = self.diff()
+            return self.create_delta_validation_info(
+                result.difference_count,
+                result.source_count,
+                result.reference_count,
+                missing_count=result.missing_count,
+                extra_count=result.extra_count,
+                mismatched_count=result.mismatched_count,
+                diff_sample=result.sample,
+            )
+        except Exception as e:
+            traceback.print_exc(file=sys.stdout)
+            logger.error(f"Failed to generate metric {self.name}: {str(e)}")
+            return None
+
+
 class FreshnessValueMetric(Validation):
     """
     FreshnessMetric is a class that represents a metric that is generated by a data source.
@@ -87,10 +186,19 @@ class FreshnessValueMetric(Validation):
 
     def _generate_metric_value(self):
         if isinstance(self.data_source, SQLDataSource):
+            if self.field_name is None:
+                return self.data_source.query_get_table_freshness(
+                    table=self.dataset_name
+                )
             return self.data_source.query_get_time_diff(
                 table=self.dataset_name, field=self.field_name
             )
         elif isinstance(self.data_source, SearchIndexDataSource):
+            if self.field_name is None:
+                raise ValueError(
+                    "Freshness of a search index needs a timestamp field, "
+                    "e.g. freshness(updated_at)"
+                )
             return self.data_source.query_get_time_diff(
                 index_name=self.dataset_name, field=self.field_name
             )
@@ -0,0 +1,207 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import datetime
+import hashlib
+import json
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.models.validation import (
+    CachedValidationInfo,
+    ValidationFunction,
+    ValidationInfo,
+)
+from dcs_core.core.repository.validation_result_repository import (
+    ValidationResultRepository,
+)
+from dcs_core.core.validation.base import DeltaValidation, Validation
+
+
+class ValidationResultCache:
+    """
+    ValidationResultCache serves the validation infos of a previous run when the
+    dataset of a validation has not changed since, according to a cheap fingerprint
+    of the table reported by the data source (table statistics, last modification
+    time, ...). Data sources without a fingerprint are always queried.
+
+    A cached validation info is refreshed once it is older than the cache ttl of the
+    validation, or the default ttl of the cache. A ttl of 0 disables the cache for
+    the validation.
+    """
+
+    def __init__(
+        self, repository: ValidationResultRepository, default_ttl: Optional[int] = None
+    ):
+        """
+        :param repository: repository of the cached validation infos
+        :param default_ttl: maximum age in seconds of a cached validation info,
+            None to keep it as long as the dataset is unchanged
+        """
+        self.repository = repository
+        self.default_ttl = default_ttl
+        self._fingerprints: Dict[Tuple[str, str], Optional[str]] = {}
+
+    # Custom sql and orphan count validations read other datasets than their own,
+    # freshness is measured against the current time, so the fingerprint of their
+    # dataset does not tell whether their result changed
+    NOT_CACHEABLE_FUNCTIONS = frozenset(
+        [
+            ValidationFunction.CUSTOM_SQL,
+            ValidationFunction.FRESHNESS,
+            ValidationFunction.ORPHAN_COUNT,
+        ]
+    )
+
+    @classmethod
+    def is_cacheable(cls, validation: Validation) -> bool:
+        """
+        Whether the result of a validation only depends on its own dataset. Delta
+        validations also read the reference dataset.
+        """
+        if isinstance(validation, DeltaValidation):
+            return False
+        return (
+            validation.validation_config.get_validation_function
+            not in cls.NOT_CACHEABLE_FUNCTIONS
+        )
+
+    def ttl(self, validation: Validation) -> Optional[int]:
+        if validation.validation_config.cache_ttl is not None:
+            return validation.validation_config.cache_ttl
+        return self.default_ttl
+
+    @staticmethod
+    def cache_id(validation: Validation) -> str:
+        """
+        Key of a validation in the repository. It changes with the configuration of
+        the validation, so that an edited validation is not served a stale result.
+        """
+        config = json.dumps(
+            asdict(validation.validation_config), sort_keys=True, default=str
+        )
+        key = f"{validation.get_validation_identity()}|{config}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def fingerprint(self, validation: Validation) -> Optional[str]:
+        """
+        Fingerprint of the dataset of a validation, read once per run
+        """
+        key = (validation.data_source.data_source_name, validation.dataset_name)
+        if key not in self._fingerprints:
+            try:
+                self._fingerprints[
+                    key
+                ] = validation.data_source.query_get_table_fingerprint(
+                    validation.dataset_name
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to read the fingerprint of {key[0]}.{key[1]}: {str(e)}"
+                )
+                self._fingerprints[key] = None
+        return self._fingerprints[key]
+
+    def get(self, validation: Validation) -> Optional[ValidationInfo]:
+        """
+        Get the cached validation info of a validation whose dataset is unchanged
+        :param validation: validation
+        :return: cached validation info, None if the validation has to be run
+        """
+        ttl = self.ttl(validation)
+        if not self.is_cacheable(validation) or ttl == 0:
+            return None
+        fingerprint = self.fingerprint(validation)
+        if fingerprint is None:
+            return None
+        try:
+            cached = self.repository.get_result(self.cache_id(validation))
+        except Exception as e:
+            logger.warning(
+                f"Failed to read the cached result of {validation.name}: {e}"
+            )
+            return None
+        if cached is None or cached.fingerprint != fingerprint:
+            return None
+        now = datetime.datetime.utcnow()
+        if ttl is not None and (now - cached.cached_at).total_seconds() > ttl:
+            return None
+
+        validation_info = cached.validation_info
+        validation_info.cached_at = cached.cached_at
+        validation_info.timestamp = now
+        return validation_info
+
+    def save(self, validation: Validation, validation_info: Optional[ValidationInfo]):
+        """
+        Cache a validation info computed by the run, with the fingerprint read before
+        the validation ran
+        :param validation: validation
+        :param validation_info: validation info computed by the run
+        """
+        if validation_info is None or validation_info.cached_at is not None:
+            return
+        if validation_info.timed_out:
+            return
+        if not self.is_cacheable(validation) or self.ttl(validation) == 0:
+            return
+        fingerprint = self._fingerprints.get(
+            (validation.data_source.data_source_name, validation.dataset_name)
+        )
+        if fingerprint is None:
+            return
+        try:
+            self.repository.save_result(
+                self.cache_id(validation),
+                CachedValidationInfo(
+                    fingerprint=fingerprint,
+                    cached_at=validation_info.timestamp,
+                    validation_info=validation_info,
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache the result of {validation.name}: {e}")
+
+    def split(
+        self, validations: List[Validation]
+    ) -> Tuple[Dict[str, ValidationInfo], List[Validation]]:
+        """
+        Split the validations into the ones served from the cache and the ones to run
+        :param validations: validations of the run
+        :return: cached validation infos by validation identity, validations to run
+        """
+        cached: Dict[str, ValidationInfo] = {}
+        remaining: List[Validation] = []
+        for validation in validations:
+            validation_info = self.get(validation)
+            if validation_info is None:
+                remaining.append(validation)
+            else:
+                cached[validation.get_validation_identity()] = validation_info
+        if cached:
+            logger.info(
+                f"Serving {len(cached)} of {len(validations)} validations from the result cache"
+            )
+        return cached, remaining
+
+    def save_all(
+        self,
+        validations: List[Validation],
+        validation_infos: Dict[str, Optional[ValidationInfo]],
+    ):
+        for validation in validations:
+            self.save(
+                validation, validation_infos.get(validation.get_validation_identity())
+            )
@@ -17,7 +17,7 @@ from typing import Union
 
 from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
-from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.base import DeltaAggregateValidation, Validation
 from dcs_core.integrations.databases.oracle import OracleDataSource
 
 
@@ -28,14 +28,34 @@ class CountDuplicateValidation(Validation):
                 self.where_filter = re.sub(
                     r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
                 )
+            field = (
+                f'"{self.field_name}"'
+                if isinstance(self.data_source, OracleDataSource)
+                else self.field_name
+            )
+            if self.validation_config.approximate:
+                value, error = self.data_source.query_get_approximate_duplicate_count(
+                    table=self.dataset_name,
+                    field=field,
+                    filters=self.where_filter,
+                    sample_percent=self.sample,
+                )
+                self.estimated_error = error
+                return value
             return self.data_source.query_get_duplicate_count(
                 table=self.dataset_name,
-                field=f'"{self.field_name}"'
-                if isinstance(self.data_source, OracleDataSource)
-                else self.field_name,
+                field=field,
                 filters=self.where_filter if self.where_filter is not None else None,
             )
         elif isinstance(self.data_source, SearchIndexDataSource):
+            if self.validation_config.approximate:
+                value, error = self.data_source.query_get_approximate_duplicate_count(
+                    index_name=self.dataset_name,
+                    field=self.field_name,
+                    filters=self.where_filter if self.where_filter else None,
+                )
+                self.estimated_error = error
+                return value
             return self.data_source.query_get_duplicate_count(
                 index_name=self.dataset_name,
                 field=self.field_name,
@@ -52,14 +72,42 @@ class CountDistinctValidation(Validation):
                 self.where_filter = re.sub(
                     r"(\b[a-zA-Z_]+\b)(?=\s*[=<>])", r'"\1"', self.where_filter
                 )
+            field = (
+                f'"{self.field_name}"'
+                if isinstance(self.data_source, OracleDataSource)
+                else self.field_name
+            )
+            if self.validation_config.estimate:
+                value = self._estimated_metric_value(
+                    self.data_source.query_get_estimated_distinct_count(
+                        table=self.dataset_name, field=self.field_name
+                    )
+                )
+                if value is not None:
+                    return value
+            if self.validation_config.approximate:
+                value, error = self.data_source.query_get_approximate_distinct_count(
+                    table=self.dataset_name,
+                    field=field,
+                    filters=self.where_filter,
+                    sample_percent=self.sample,
+                )
+                self.estimated_error = error
+                return value
             return self.data_source.query_get_distinct_count(
                 table=self.dataset_name,
-                field=f'"{self.field_name}"'
-                if isinstance(self.data_source, OracleDataSource)
-                else self.field_name,
+                field=field,
                 filters=self.where_filter if self.where_filter is not None else None,
             )
         elif isinstance(self.data_source, SearchIndexDataSource):
+            if self.validation_config.approximate:
+                value, error = self.data_source.query_get_approximate_distinct_count(
+                    index_name=self.dataset_name,
+                    field=self.field_name,
+                    filters=self.where_filter if self.where_filter else None,
+                )
+                self.estimated_error = error
+                return value
             return self.data_source.query_get_distinct_count(
                 index_name=self.dataset_name,
                 field=self.field_name,
@@ -67,3 +115,16 @@ class CountDistinctValidation(Validation):
             )
         else:
             raise ValueError("Invalid data source type")
+
+
+class DeltaCountDistinctValidation(DeltaAggregateValidation):
+    """
+    Difference between the distinct count of a column and of the reference column
+    """
+
+    def _query_metric_value(
+        self, data_source: SQLDataSource, table: str, field: str, filters: str
+    ) -> Union[float, int]:
+        return data_source.query_get_distinct_count(
+            table=table, field=field, filters=filters
+        )
@@ -15,6 +15,7 @@
 import base64
 import json
 import os
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -26,6 +27,8 @@ from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class BigQueryDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.0057
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
         self.project_id = self.data_connection.get("project")
@@ -66,7 +69,11 @@ class BigQueryDataSource(SQLDataSource):
             if not credentials:
                 raise
             url = f"bigquery://{self.project_id}/{self.dataset_id}"
-            engine = create_engine(url, credentials_base64=credentials)
+            engine = create_engine(
+                url,
+                credentials_base64=credentials,
+                **self.sqlalchemy_pool_options(),
+            )
             self.connection = engine.connect()
             return self.connection
         except Exception as e:
@@ -91,6 +98,95 @@ class BigQueryDataSource(SQLDataSource):
         """
         return f"`{column}`"
 
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp, a DATETIME without time zone
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        text = value.isoformat(sep=" ", timespec="microseconds")
+        if value.tzinfo is not None:
+            return f"TIMESTAMP '{text}'"
+        return f"DATETIME '{text}'"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE SYSTEM ({percent} PERCENT)"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS STRING)"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. A DATETIME or a DATE is taken as UTC.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"FORMAT_TIMESTAMP('%F %H:%M:%E6S', TIMESTAMP({field}), 'UTC')"
+
+    def numeric_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted numeric column with 10 decimal digits
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        # NUMERIC has at most 9 decimal digits
+        return f"FORMAT('%.10f', CAST({field} AS BIGNUMERIC))"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"CAST(CONCAT('0x', SUBSTR(TO_HEX(MD5({expression})), 1, 15)) AS INT64)"
+
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column with a single query.
+        PERCENTILE_DISC is only an analytic function in BigQuery, the percentiles are
+        read from the APPROX_QUANTILES boundaries of the column.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        field = self.quote_column(field)
+        query = f"SELECT APPROX_QUANTILES({field}, 100) FROM {qualified_table_name}"
+        if filters:
+            query += f" WHERE {filters}"
+
+        quantiles = self.fetchone(query)[0]
+        if not quantiles:
+            return [None for _ in percentiles]
+        values = [quantiles[round(percentile * 100)] for percentile in percentiles]
+        return [round(value, 2) if value is not None else None for value in values]
+
     def qualified_table_name(self, table_name: str) -> str:
         """
         Get the qualified table name
@@ -122,6 +218,27 @@ class BigQueryDataSource(SQLDataSource):
         rows = self.fetchall(query)
         return [row[0] for row in rows] if rows else []
 
+    def query_get_last_modified_query(self) -> Optional[str]:
+        """
+        Get the catalog query of the last modification time of every table of the
+        dataset
+        """
+        return (
+            "SELECT table_id, TIMESTAMP_MILLIS(last_modified_time) "
+            f"FROM `{self.project_id}.{self.schema_name}.__TABLES__`"
+        )
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        """
+        Get the catalog query of the columns of every table of a dataset.
+        :param schema: dataset name
+        """
+        return (
+            "SELECT table_name, column_name, data_type "
+            f"FROM `{self.project_id}.{schema}.INFORMATION_SCHEMA.COLUMNS` "
+            "ORDER BY table_name, ordinal_position"
+        )
+
     def query_get_table_columns(
         self,
         table: str,
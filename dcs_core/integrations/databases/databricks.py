@@ -12,9 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+import math
+from datetime import datetime
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -22,6 +24,10 @@ from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class DatabricksDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.05
+    QUERY_TIMEOUT_ERRORS = ("QUERY_EXECUTION_TIMEOUT_EXCEEDED",)
+    BATCHED_ORPHAN_COUNTS = False
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -42,10 +48,78 @@ class DatabricksDataSource(SQLDataSource):
                     "catalog": self.data_connection.get("catalog"),
                 },
             )
-            engine = create_engine(url, echo=True)
+            engine = create_engine(url, echo=True, **self.sqlalchemy_pool_options())
             self.connection = engine.connect()
             return self.connection
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Databricks data source: [{str(e)}]"
             )
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE ({percent} PERCENT)"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        return f"TIMESTAMP '{value.isoformat(sep=' ', timespec='microseconds')}'"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS STRING)"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff, converted from the time zone of the session
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return (
+            f"DATE_FORMAT(TO_UTC_TIMESTAMP({field}, CURRENT_TIMEZONE()), "
+            f"'yyyy-MM-dd HH:mm:ss.SSSSSS')"
+        )
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"CAST(CONV(SUBSTR(MD5({expression}), 1, 15), 16, 10) AS BIGINT)"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        if timeout is None:
+            connection.execute(text("RESET STATEMENT_TIMEOUT"))
+        else:
+            connection.execute(text(f"SET STATEMENT_TIMEOUT = {math.ceil(timeout)}"))
+        return True
@@ -16,13 +16,18 @@ from dcs_core.integrations.utils.utils import ibm_db2_dll_files_loader
 
 ibm_db2_dll_files_loader()
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    TableStatistics,
+)
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
@@ -36,7 +41,7 @@ class DB2DataSource(SQLDataSource):
         """
         try:
             url = self._build_connection_url()
-            engine = create_engine(url, echo=False)
+            engine = create_engine(url, echo=False, **self.sqlalchemy_pool_options())
             self.connection = engine.connect()
             return self.connection
         except SQLAlchemyError as e:
@@ -68,6 +73,50 @@ class DB2DataSource(SQLDataSource):
 
         return url
 
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the statistics of a table and its columns from SYSCAT.TABLES and
+        SYSCAT.COLUMNS, as gathered by RUNSTATS
+        :param table: name of the table
+        :return: table statistics, None if the table has no statistics
+        """
+        schema = f"'{self.schema_name}'" if self.schema_name else "CURRENT SCHEMA"
+        result = self.fetchone(
+            "SELECT CARD, STATS_TIME FROM SYSCAT.TABLES "
+            f"WHERE TABSCHEMA = {schema} AND TABNAME = '{table}'"
+        )
+        # Statistics are -1 until the first RUNSTATS
+        if result is None or result[0] is None or result[0] < 0:
+            return None
+        row_count = int(result[0])
+        columns: Dict[str, ColumnStatistics] = {}
+        rows = self.fetchall(
+            "SELECT COLNAME, NUMNULLS, COLCARD FROM SYSCAT.COLUMNS "
+            f"WHERE TABSCHEMA = {schema} AND TABNAME = '{table}'"
+        )
+        for column, num_nulls, column_cardinality in rows or []:
+            columns[column] = ColumnStatistics(
+                null_fraction=num_nulls / row_count
+                if num_nulls is not None and num_nulls >= 0 and row_count
+                else None,
+                distinct_count=int(column_cardinality)
+                if column_cardinality is not None and column_cardinality >= 0
+                else None,
+            )
+        return TableStatistics(
+            row_count=row_count, updated_at=result[1], columns=columns
+        )
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        """
+        Get the catalog query of the columns of every table of a schema.
+        :param schema: schema name
+        """
+        return (
+            "SELECT TABNAME, COLNAME, TYPENAME FROM SYSCAT.COLUMNS "
+            f"WHERE TABSCHEMA = '{schema}' ORDER BY TABNAME, COLNO"
+        )
+
     def qualified_table_name(self, table_name: str) -> str:
         """
         Get the qualified table name
@@ -86,6 +135,46 @@ class DB2DataSource(SQLDataSource):
         """
         return f'"{column}"'
 
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        return f"TIMESTAMP '{value.isoformat(sep=' ', timespec='microseconds')}'"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE SYSTEM ({percent})"
+
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Get the condition matching a quoted column against a regex pattern
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: SQL condition
+        """
+        return f"REGEXP_LIKE({field}, '{regex_pattern}')"
+
+    def aggregate_expression(self, aggregate: ScanAggregate) -> Optional[str]:
+        """
+        Get the SQL expression computing an aggregate of a fused scan
+        :param aggregate: aggregate to compute
+        :return: SQL expression, None if the aggregate is not supported by the dialect
+        """
+        field = self.quote_column(aggregate.field) if aggregate.field else None
+
+        if aggregate.type == AggregateType.DISTINCT_COUNT:
+            return f"COUNT(DISTINCT CAST({field} AS VARCHAR(255)))"
+        elif aggregate.type == AggregateType.STRING_LENGTH_AVG:
+            return f"AVG(CAST(LENGTH({field}) AS FLOAT))"
+        return super().aggregate_expression(aggregate)
+
     def query_get_distinct_count(
         self, table: str, field: str, filters: str = None
     ) -> int:
@@ -664,13 +753,11 @@ class DB2DataSource(SQLDataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT {field}
-            FROM {qualified_table_name}
-            ORDER BY {field} DESC
-            FETCH FIRST 1 ROWS ONLY;
+            SELECT MAX({field})
+            FROM {qualified_table_name};
         """
         result = self.fetchone(query)
-        if result:
+        if result and result[0] is not None:
             updated_time = result[0]
             if isinstance(updated_time, str):
                 updated_time = datetime.strptime(updated_time, "%Y-%m-%d %H:%M:%S.%f")
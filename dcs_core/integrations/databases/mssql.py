@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import datetime
+import math
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
@@ -22,13 +23,23 @@ from loguru import logger
 from sqlalchemy import text
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
-from dcs_core.core.common.models.data_source_resource import RawColumnInfo
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    RawColumnInfo,
+    TableStatistics,
+)
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class MssqlDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.02
+    QUERY_TIMEOUT_ERRORS = ("HYT00",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
+        self.connection_params: Dict = {}
+        self._server_major_version: Optional[int] = None
         self.regex_patterns = {
             "uuid": r"[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%",
             "usa_phone": r"^(\+1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}$",
@@ -95,6 +106,7 @@ class MssqlDataSource(SQLDataSource):
                     f"{server_value},{port}" if use_port and port else server_value
                 )
                 self.connection = pyodbc.connect(**conn_dict)
+                self.connection_params = dict(conn_dict)
                 logger.info(f"Connected to MSSQL database using {conn_dict['SERVER']}")
                 return self.connection
             except Exception:
@@ -104,11 +116,16 @@ class MssqlDataSource(SQLDataSource):
             message="Failed to connect to Mssql data source: [All connection attempts failed]"
         )
 
-    def fetchall(self, query):
-        return self.connection.cursor().execute(query).fetchall()
+    def _fetchall(self, query):
+        with self.checkout() as connection:
+            return connection.cursor().execute(query).fetchall()
+
+    def _fetchone(self, query):
+        with self.checkout() as connection:
+            return connection.cursor().execute(query).fetchone()
 
-    def fetchone(self, query):
-        return self.connection.cursor().execute(query).fetchone()
+    def _create_connection(self) -> Any:
+        return pyodbc.connect(**self.connection_params)
 
     def qualified_table_name(self, table_name: str) -> str:
         """
@@ -120,6 +137,54 @@ class MssqlDataSource(SQLDataSource):
             return f"[{self.schema_name}].[{table_name}]"
         return f"[{table_name}]"
 
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the row count of a table from sys.dm_db_partition_stats and the statistics
+        of its columns from the density vector and histogram of DBCC SHOW_STATISTICS
+        :param table: name of the table
+        :return: table statistics, None if the table does not exist
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        result = self.fetchone(
+            "SELECT SUM(row_count) FROM sys.dm_db_partition_stats "
+            f"WHERE object_id = OBJECT_ID('{qualified_table_name}') "
+            "AND index_id IN (0, 1)"
+        )
+        if result is None or result[0] is None:
+            return None
+        statistics = TableStatistics(row_count=int(result[0]))
+        # Most recent statistics object leading with each column
+        rows = self.fetchall(
+            "SELECT c.name, s.name, STATS_DATE(s.object_id, s.stats_id) "
+            "FROM sys.stats s "
+            "JOIN sys.stats_columns sc ON sc.object_id = s.object_id "
+            "AND sc.stats_id = s.stats_id AND sc.stats_column_id = 1 "
+            "JOIN sys.columns c ON c.object_id = sc.object_id "
+            "AND c.column_id = sc.column_id "
+            f"WHERE s.object_id = OBJECT_ID('{qualified_table_name}') "
+            "ORDER BY STATS_DATE(s.object_id, s.stats_id) DESC"
+        )
+        for column, statistics_name, updated_at in rows or []:
+            if column in statistics.columns or updated_at is None:
+                continue
+            dbcc = (
+                f"DBCC SHOW_STATISTICS ('{qualified_table_name}', [{statistics_name}])"
+            )
+            density = self.fetchone(f"{dbcc} WITH DENSITY_VECTOR")
+            histogram = self.fetchall(f"{dbcc} WITH HISTOGRAM") or []
+            # Histogram steps are RANGE_HI_KEY, RANGE_ROWS, EQ_ROWS, ...
+            histogram_rows = sum(step[1] + step[2] for step in histogram)
+            null_rows = sum(step[2] for step in histogram if step[0] is None)
+            statistics.columns[column] = ColumnStatistics(
+                null_fraction=null_rows / histogram_rows if histogram_rows else None,
+                distinct_count=round(1 / density[0])
+                if density is not None and density[0]
+                else None,
+            )
+            if statistics.updated_at is None or updated_at > statistics.updated_at:
+                statistics.updated_at = updated_at
+        return statistics
+
     def quote_column(self, column: str) -> str:
         """
         Quote the column name
@@ -128,6 +193,129 @@ class MssqlDataSource(SQLDataSource):
         """
         return f"[{column}]"
 
+    def timestamp_literal(self, value: datetime.datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        text = value.isoformat(timespec="microseconds")
+        if value.tzinfo is not None:
+            return f"CAST('{text}' AS DATETIMEOFFSET(6))"
+        return f"CAST('{text}' AS DATETIME2(6))"
+
+    def date_literal(self, value: datetime.date) -> str:
+        """
+        Get the SQL literal of a date
+        :param value: date
+        :return: SQL literal
+        """
+        return f"CAST('{value.isoformat()}' AS DATE)"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE ({percent} PERCENT)"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        if self.server_major_version() < 15:
+            # APPROX_COUNT_DISTINCT is available from SQL Server 2019
+            return None
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS VARCHAR(MAX))"
+
+    def concat_expression(self, expressions: List[str]) -> str:
+        """
+        Get the expression concatenating text expressions
+        :param expressions: text expressions
+        :return: SQL expression
+        """
+        return f"CONCAT({', '.join(expressions)})"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. A DATETIMEOFFSET is converted to UTC, the other
+        types are taken as UTC.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        # Style 1 converts a DATETIMEOFFSET to UTC, style 121 is yyyy-mm-dd hh:mi:ss.f
+        return f"CONVERT(VARCHAR(26), CONVERT(DATETIME2(6), {field}, 1), 121)"
+
+    def boolean_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted boolean column as 1 or 0
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CASE {field} WHEN 1 THEN '1' WHEN 0 THEN '0' END"
+
+    def modulo_expression(self, expression: str, modulus: int) -> str:
+        """
+        Get the expression of the remainder of an integer expression by a modulus
+        :param expression: integer expression
+        :param modulus: modulus
+        :return: SQL expression
+        """
+        return f"({expression}) % {modulus}"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        digest = f"CONVERT(VARCHAR(32), HASHBYTES('MD5', {expression}), 2)"
+        prefix = f"'0' + SUBSTRING({digest}, 1, 15)"
+        return f"CONVERT(BIGINT, CONVERT(VARBINARY(8), {prefix}, 2))"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection, the ODBC driver
+        cancels the statement when it expires
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        connection.timeout = math.ceil(timeout) if timeout is not None else 0
+        return True
+
+    def server_major_version(self) -> int:
+        """
+        Get the major version of the SQL Server instance, 0 if it can not be read
+        """
+        if self._server_major_version is None:
+            try:
+                result = self.fetchone(
+                    "SELECT CAST(SERVERPROPERTY('ProductMajorVersion') AS INT)"
+                )
+                self._server_major_version = (
+                    int(result[0]) if result and result[0] else 0
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read the SQL Server version: {str(e)}")
+                self._server_major_version = 0
+        return self._server_major_version
+
     def query_get_table_names(
         self, schema: str | None = None, with_view: bool = False
     ) -> dict:
@@ -306,15 +494,16 @@ class MssqlDataSource(SQLDataSource):
             complete_query
             or f"SELECT * FROM ({query}) AS subquery ORDER BY 1 OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
         )
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        rows = cursor.fetchmany(limit)
+        with self.checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            rows = cursor.fetchmany(limit)
 
-        if with_column_names:
-            column_names = [column[0] for column in cursor.description]
-            return rows, column_names
-        else:
-            return rows, None
+            if with_column_names:
+                column_names = [column[0] for column in cursor.description]
+                return rows, column_names
+            else:
+                return rows, None
 
     def regex_to_sql_condition(self, regex_pattern: str, field: str) -> str:
         """
@@ -341,6 +530,40 @@ class MssqlDataSource(SQLDataSource):
 
         return f"IIF({field} LIKE '{pattern}', 1, 0)"
 
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Get the condition matching a quoted column against a regex pattern
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: SQL condition
+        """
+        return f"{self.regex_to_sql_condition(regex_pattern, field)} = 1"
+
+    def aggregate_expression(self, aggregate: ScanAggregate) -> Optional[str]:
+        """
+        Get the SQL expression computing an aggregate of a fused scan
+        :param aggregate: aggregate to compute
+        :return: SQL expression, None if the aggregate is not supported by the dialect
+        """
+        field = self.quote_column(aggregate.field) if aggregate.field else None
+
+        if aggregate.type == AggregateType.VARIANCE:
+            return f"VAR({field})"
+        elif aggregate.type == AggregateType.STDDEV:
+            return f"STDEV({field})"
+        elif aggregate.type == AggregateType.STRING_LENGTH_MAX:
+            return f"MAX(LEN({field}))"
+        elif aggregate.type == AggregateType.STRING_LENGTH_MIN:
+            return f"MIN(LEN({field}))"
+        elif aggregate.type == AggregateType.STRING_LENGTH_AVG:
+            return f"AVG(CAST(LEN({field}) AS FLOAT))"
+        elif aggregate.type == AggregateType.PREDEFINED_REGEX_MATCH_COUNT and (
+            aggregate.argument in ["perm_id", "ssn", "usa_phone", "usa_zip_code"]
+        ):
+            # These patterns are matched with dedicated LIKE expressions
+            return None
+        return super().aggregate_expression(aggregate)
+
     def query_get_variance(self, table: str, field: str, filters: str = None) -> int:
         """
         Get the variance value
@@ -397,6 +620,36 @@ class MssqlDataSource(SQLDataSource):
         result = self.fetchone(query)
         return round(result[0], 2) if result and result[0] is not None else None
 
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column with a single query.
+        PERCENTILE_CONT is a window function in MSSQL, every window shares the
+        same sort of the column.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        field = self.quote_column(field)
+        expressions = ", ".join(
+            [
+                f"PERCENTILE_CONT({percentile}) WITHIN GROUP (ORDER BY {field}) OVER ()"
+                for percentile in percentiles
+            ]
+        )
+        query = f"SELECT TOP 1 {expressions} FROM {qualified_table_name}"
+        if filters:
+            query += f" WHERE {filters}"
+
+        result = self.fetchone(query)
+        if result is None:
+            return [None for _ in percentiles]
+        return [round(value, 2) if value is not None else None for value in result]
+
     def query_get_null_keyword_count(
         self, table: str, field: str, operation: str, filters: str = None
     ) -> Union[int, float]:
@@ -680,10 +933,10 @@ class MssqlDataSource(SQLDataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT TOP 1 {field} FROM {qualified_table_name} ORDER BY {field} DESC;
+            SELECT MAX({field}) FROM {qualified_table_name};
         """
         result = self.fetchone(query)
-        if result:
+        if result and result[0] is not None:
             updated_time = result[0]
             if isinstance(updated_time, str):
                 updated_time = datetime.datetime.strptime(
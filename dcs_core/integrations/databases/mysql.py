@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -20,11 +21,19 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
-from dcs_core.core.common.models.data_source_resource import RawColumnInfo
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    RawColumnInfo,
+    TableStatistics,
+)
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.integrations.databases.db2 import DB2DataSource
 
 
 class MysqlDataSource(DB2DataSource):
+    QUERY_TIMEOUT_ERRORS = ("maximum statement execution time exceeded",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
         self.regex_patterns = {
@@ -66,6 +75,7 @@ class MysqlDataSource(DB2DataSource):
                 url,
                 isolation_level="AUTOCOMMIT",
                 connect_args={"ssl": {"ssl": ssl} if ssl else None},
+                **self.sqlalchemy_pool_options(),
             )
             self.connection = engine.connect()
             return self.connection
@@ -92,6 +102,108 @@ class MysqlDataSource(DB2DataSource):
         """
         return f"`{column}`"
 
+    def random_expression(self) -> str:
+        """
+        Get the expression of a random number between 0 and 1, evaluated per row
+        """
+        return "RAND()"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        MySQL has no table sampling, rows are filtered with a random number
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return SQLDataSource.sampled_table(self, qualified_table_name, percent)
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection, it applies to
+        SELECT statements
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        if timeout is None:
+            connection.execute(text("SET SESSION MAX_EXECUTION_TIME = DEFAULT"))
+        else:
+            connection.execute(
+                text(f"SET SESSION MAX_EXECUTION_TIME = {int(timeout * 1000)}")
+            )
+        return True
+
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Get the condition matching a quoted column against a regex pattern
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: SQL condition
+        """
+        return f"{field} REGEXP '{regex_pattern}'"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS CHAR)"
+
+    def concat_expression(self, expressions: List[str]) -> str:
+        """
+        Get the expression concatenating text expressions
+        :param expressions: text expressions
+        :return: SQL expression
+        """
+        return f"CONCAT({', '.join(expressions)})"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. DATETIME is taken as UTC, TIMESTAMP is rendered in
+        the time zone of the session.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"DATE_FORMAT({field}, '%Y-%m-%d %H:%i:%s.%f')"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"CAST(CONV(SUBSTRING(MD5({expression}), 1, 15), 16, 10) AS UNSIGNED)"
+
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        """
+        Get the fingerprint of a table from its last update time. InnoDB does not
+        persist it across server restarts, the table is queried until it is updated.
+        :param table: name of the table
+        :return: fingerprint, None if the update time is unknown
+        """
+        query = (
+            "SELECT UPDATE_TIME FROM information_schema.tables "
+            f"WHERE TABLE_SCHEMA = '{self.schema_name}' AND TABLE_NAME = '{table}'"
+        )
+        return self._query_fingerprint(query)
+
+    def aggregate_expression(self, aggregate: ScanAggregate) -> Optional[str]:
+        """
+        Get the SQL expression computing an aggregate of a fused scan
+        :param aggregate: aggregate to compute
+        :return: SQL expression, None if the aggregate is not supported by the dialect
+        """
+        field = self.quote_column(aggregate.field) if aggregate.field else None
+
+        if aggregate.type == AggregateType.DISTINCT_COUNT:
+            return f"COUNT(DISTINCT {field})"
+        elif aggregate.type == AggregateType.STRING_LENGTH_AVG:
+            return f"AVG(LENGTH({field}))"
+        return super().aggregate_expression(aggregate)
+
     def query_get_table_names(
         self,
         schema: str | None = None,
@@ -130,6 +242,80 @@ class MysqlDataSource(DB2DataSource):
 
         return result
 
+    def query_get_last_modified_query(self) -> Optional[str]:
+        """
+        Get the catalog query of the last modification time of every table, in UTC
+        """
+        schema = f"'{self.database}'" if self.database else "DATABASE()"
+        return (
+            "SELECT TABLE_NAME, "
+            "CONVERT_TZ(UPDATE_TIME, @@session.time_zone, '+00:00') "
+            f"FROM information_schema.TABLES WHERE TABLE_SCHEMA = {schema}"
+        )
+
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the row estimate of a table from information_schema.TABLES, the
+        cardinality of its indexed columns from information_schema.STATISTICS and the
+        null fraction of the columns with a histogram on MySQL 8
+        :param table: name of the table
+        :return: table statistics, None if the table does not exist
+        """
+        schema = f"'{self.database}'" if self.database else "DATABASE()"
+        result = self.fetchone(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = {schema} AND TABLE_NAME = '{table}'"
+        )
+        if result is None or result[0] is None:
+            return None
+        statistics = TableStatistics(row_count=int(result[0]))
+        try:
+            # Reading the persistent InnoDB statistics needs a grant on mysql
+            updated_at = self.fetchone(
+                "SELECT last_update FROM mysql.innodb_table_stats "
+                f"WHERE database_name = {schema} AND table_name = '{table}'"
+            )
+            statistics.updated_at = updated_at[0] if updated_at else None
+        except Exception as e:
+            logger.debug(f"No InnoDB statistics time of {table} [{str(e)}]")
+        rows = self.fetchall(
+            "SELECT COLUMN_NAME, MAX(CARDINALITY) FROM information_schema.STATISTICS "
+            f"WHERE TABLE_SCHEMA = {schema} AND TABLE_NAME = '{table}' "
+            "AND SEQ_IN_INDEX = 1 GROUP BY COLUMN_NAME"
+        )
+        for column, cardinality in rows or []:
+            statistics.columns[column] = ColumnStatistics(
+                distinct_count=int(cardinality) if cardinality is not None else None
+            )
+        try:
+            rows = self.fetchall(
+                "SELECT COLUMN_NAME, HISTOGRAM FROM information_schema.COLUMN_STATISTICS "
+                f"WHERE SCHEMA_NAME = {schema} AND TABLE_NAME = '{table}'"
+            )
+        except Exception as e:
+            logger.debug(f"No column histograms of {table} [{str(e)}]")
+            rows = []
+        for column, histogram in rows or []:
+            if isinstance(histogram, str):
+                histogram = json.loads(histogram)
+            column_statistics = statistics.columns.setdefault(
+                column, ColumnStatistics()
+            )
+            column_statistics.null_fraction = histogram.get("null-values")
+        return statistics
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        """
+        Get the catalog query of the columns of every table of a database.
+        :param schema: database name
+        """
+        return (
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            f"WHERE table_schema = '{schema}' "
+            "ORDER BY table_name, ordinal_position"
+        )
+
     def query_get_table_columns(
         self, table: str, schema: str | None = None
     ) -> RawColumnInfo:
@@ -181,14 +367,15 @@ class MysqlDataSource(DB2DataSource):
         """
         query = complete_query or f"SELECT * FROM ({query}) AS subquery LIMIT {limit}"
 
-        result = self.connection.execute(text(query))
-        rows = result.fetchmany(limit)
+        with self.checkout() as connection:
+            result = connection.execute(text(query))
+            rows = result.fetchmany(limit)
 
-        if with_column_names:
-            column_names = result.keys()
-            return rows, list(column_names)
-        else:
-            return rows, None
+            if with_column_names:
+                column_names = result.keys()
+                return rows, list(column_names)
+            else:
+                return rows, None
 
     def query_get_distinct_count(
         self, table: str, field: str, filters: str = None
@@ -237,6 +424,40 @@ class MysqlDataSource(DB2DataSource):
         result = self.fetchone(query)
         return round(result[0], 2) if result and result[0] is not None else None
 
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column with a single query.
+        MySQL has no percentile aggregate, every percentile is read from the same
+        NTILE ranking of the column.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        field = self.quote_column(field)
+        ranks = [round(percentile * 100) for percentile in percentiles]
+        ranks_str = ", ".join([str(rank) for rank in sorted(set(ranks))])
+
+        query = f"""
+            SELECT percentile_rank, MIN({field}) FROM (
+                SELECT {field}, NTILE(100) OVER (ORDER BY {field}) AS percentile_rank
+                FROM {qualified_table_name}
+                {f'WHERE {filters}' if filters else ''}
+            ) AS ranked
+            WHERE percentile_rank IN ({ranks_str})
+            GROUP BY percentile_rank
+        """
+
+        values = {int(rank): value for rank, value in self.fetchall(query)}
+        return [
+            round(values[rank], 2) if values.get(rank) is not None else None
+            for rank in ranks
+        ]
+
     def query_negative_metric(
         self, table: str, field: str, operation: str, filters: str = None
     ) -> Union[int, float]:
@@ -386,13 +607,11 @@ class MysqlDataSource(DB2DataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT {field}
-            FROM {qualified_table_name}
-            ORDER BY {field} DESC
-            LIMIT 1;
+            SELECT MAX({field})
+            FROM {qualified_table_name};
         """
         result = self.fetchone(query)
-        if result:
+        if result and result[0] is not None:
             updated_time = result[0]
             if isinstance(updated_time, str):
                 updated_time = datetime.strptime(updated_time, "%Y-%m-%d %H:%M:%S.%f")
@@ -22,11 +22,20 @@ from loguru import logger
 from sqlalchemy import create_engine, text
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
-from dcs_core.core.common.models.data_source_resource import RawColumnInfo
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    RawColumnInfo,
+    TableStatistics,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class OracleDataSource(SQLDataSource):
+    # Oracle does not document the error of APPROX_COUNT_DISTINCT, in line with
+    # the HyperLogLog implementations of the other dialects
+    APPROXIMATE_DISTINCT_ERROR = 0.02
+    QUERY_TIMEOUT_ERRORS = ("DPI-1067", "ORA-03156")
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -59,6 +68,7 @@ class OracleDataSource(SQLDataSource):
                     "port": self.data_connection.get("port"),
                     "service_name": self.data_connection.get("service_name"),
                 },
+                **self.sqlalchemy_pool_options(),
             )
             self.schema_name = self.data_connection.get(
                 "schema"
@@ -88,6 +98,117 @@ class OracleDataSource(SQLDataSource):
         """
         return f'"{column}"'
 
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        text = value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        if value.tzinfo is not None:
+            offset = value.isoformat()[-6:]
+            return (
+                f"TO_TIMESTAMP_TZ('{text} {offset}', "
+                f"'YYYY-MM-DD HH24:MI:SS.FF6 TZH:TZM')"
+            )
+        return f"TO_TIMESTAMP('{text}', 'YYYY-MM-DD HH24:MI:SS.FF6')"
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} SAMPLE ({percent})"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS VARCHAR2(4000))"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. DATE and TIMESTAMP are taken as UTC, a TIMESTAMP
+        WITH TIME ZONE is rendered at its own offset.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"TO_CHAR(CAST({field} AS TIMESTAMP), 'YYYY-MM-DD HH24:MI:SS.FF6')"
+
+    def numeric_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted numeric column with 10 decimal digits
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"TO_CHAR({field}, 'FM99999999999999999999999999990.0000000000')"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        digest = f"RAWTOHEX(STANDARD_HASH({expression}, 'MD5'))"
+        return f"TO_NUMBER(SUBSTR({digest}, 1, 15), 'XXXXXXXXXXXXXXX')"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection with the call
+        timeout of the driver, which interrupts the round trip to the server
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        dbapi_connection = connection.connection.dbapi_connection
+        dbapi_connection.call_timeout = (
+            int(timeout * 1000) if timeout is not None else 0
+        )
+        return True
+
+    def configure_cursor(self, cursor: Any, batch_size: int):
+        """
+        Fetch batch_size rows per round trip, the first batch with the execution
+        :param cursor: cursor of a checked out connection
+        :param batch_size: number of rows fetched per round trip
+        """
+        cursor.arraysize = batch_size
+        cursor.prefetchrows = batch_size
+
+    def _execute_stream(self, connection: Any, query: str, batch_size: int) -> Any:
+        """
+        Execute a query on a driver cursor, whose arraysize and prefetchrows have to
+        be set before the execution
+        """
+        cursor = connection.connection.cursor()
+        self.configure_cursor(cursor, batch_size)
+        cursor.execute(query)
+        return cursor
+
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Get the condition matching a quoted column against a regex pattern
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: SQL condition
+        """
+        return f"REGEXP_LIKE({field}, '{regex_pattern}')"
+
     def query_get_database_version(
         self, database_version_query: Optional[str] = None
     ) -> str:
@@ -211,6 +332,51 @@ class OracleDataSource(SQLDataSource):
 
         return indexes
 
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the statistics of a table from ALL_TABLES and of its columns from
+        ALL_TAB_COL_STATISTICS, as gathered by DBMS_STATS
+        :param table: name of the table
+        :return: table statistics, None if the table has no statistics
+        """
+        owner = (
+            f"'{self.schema_name}'"
+            if self.schema_name
+            else "SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')"
+        )
+        result = self.fetchone(
+            "SELECT num_rows, last_analyzed FROM ALL_TABLES "
+            f"WHERE owner = {owner} AND table_name = '{table}'"
+        )
+        if result is None or result[0] is None:
+            return None
+        row_count = int(result[0])
+        columns: Dict[str, ColumnStatistics] = {}
+        rows = self.fetchall(
+            "SELECT column_name, num_nulls, num_distinct FROM ALL_TAB_COL_STATISTICS "
+            f"WHERE owner = {owner} AND table_name = '{table}'"
+        )
+        for column, num_nulls, num_distinct in rows or []:
+            columns[column] = ColumnStatistics(
+                null_fraction=num_nulls / row_count
+                if num_nulls is not None and row_count
+                else None,
+                distinct_count=int(num_distinct) if num_distinct is not None else None,
+            )
+        return TableStatistics(
+            row_count=row_count, updated_at=result[1], columns=columns
+        )
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        """
+        Get the catalog query of the columns of every table of a schema.
+        :param schema: schema name
+        """
+        return (
+            "SELECT table_name, column_name, data_type FROM ALL_TAB_COLUMNS "
+            f"WHERE owner = '{schema}' ORDER BY table_name, column_id"
+        )
+
     def query_get_table_columns(
         self,
         table: str,
@@ -267,14 +433,15 @@ class OracleDataSource(SQLDataSource):
             or f"SELECT * FROM ({query}) subquery ORDER BY 1 FETCH NEXT {limit} ROWS ONLY"
         )
 
-        result = self.connection.execute(text(query))
-        rows = result.fetchmany(limit)
+        with self.checkout() as connection:
+            result = connection.execute(text(query))
+            rows = result.fetchmany(limit)
 
-        if with_column_names:
-            column_names = result.keys()
-            return rows, list(column_names)
-        else:
-            return rows, None
+            if with_column_names:
+                column_names = result.keys()
+                return rows, list(column_names)
+            else:
+                return rows, None
 
     def query_valid_invalid_values_validity(
         self,
@@ -648,19 +815,10 @@ class OracleDataSource(SQLDataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT {field} from {qualified_table_name} ORDER BY {field} DESC LIMIT 1;
-        """
-        query = f"""
-            SELECT {field}
-            FROM (
-                SELECT {field}
-                FROM {qualified_table_name}
-                ORDER BY {field} DESC
-            )
-            WHERE ROWNUM = 1
+            SELECT MAX({field}) FROM {qualified_table_name}
         """
         result = self.fetchone(query)
-        if result:
+        if result and result[0] is not None:
             return int(abs(datetime.utcnow() - result[0]).total_seconds())
         return 0
 
@@ -21,14 +21,22 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
-from dcs_core.core.common.models.data_source_resource import RawColumnInfo
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    RawColumnInfo,
+    TableStatistics,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class PostgresDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.023
+    QUERY_TIMEOUT_ERRORS = ("statement timeout",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
         self.DEFAULT_NUMERIC_PRECISION = 16383
+        self._has_hll_extension: Optional[bool] = None
 
     def connect(self) -> Any:
         """
@@ -48,6 +56,7 @@ class PostgresDataSource(SQLDataSource):
                 url,
                 connect_args={"options": f"-csearch_path={schema}"},
                 isolation_level="AUTOCOMMIT",
+                **self.sqlalchemy_pool_options(),
             )
             self.connection = engine.connect()
             return self.connection
@@ -74,6 +83,135 @@ class PostgresDataSource(SQLDataSource):
         """
         return f'"{column}"'
 
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE SYSTEM ({percent})"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        if not self.has_hll_extension():
+            return None
+        return f"ROUND(hll_cardinality(hll_add_agg(hll_hash_any({field}))))"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"('x' || SUBSTR(MD5({expression}), 1, 15))::BIT(60)::BIGINT"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        if timeout is None:
+            connection.execute(text("RESET statement_timeout"))
+        else:
+            connection.execute(
+                text(f"SET statement_timeout = {int(timeout * 1000)}")
+            )
+        return True
+
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        """
+        Get the fingerprint of a table from its row change statistics and its file
+        node, which changes on TRUNCATE
+        :param table: name of the table
+        :return: fingerprint, None if the table has no statistics
+        """
+        schema_condition = (
+            f"schemaname = '{self.schema_name}'"
+            if self.schema_name
+            else "schemaname = current_schema()"
+        )
+        query = (
+            "SELECT n_tup_ins, n_tup_upd, n_tup_del, pg_relation_filenode(relid) "
+            f"FROM pg_stat_user_tables WHERE {schema_condition} AND relname = '{table}'"
+        )
+        return self._query_fingerprint(query)
+
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        """
+        Get the statistics of a table from pg_class and of its columns from pg_stats,
+        as gathered by the last ANALYZE
+        :param table: name of the table
+        :return: table statistics, None if the table was never analyzed
+        """
+        schema = f"'{self.schema_name}'" if self.schema_name else "current_schema()"
+        result = self.fetchone(
+            "SELECT c.reltuples, GREATEST(s.last_analyze, s.last_autoanalyze) "
+            "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid "
+            f"WHERE n.nspname = {schema} AND c.relname = '{table}'"
+        )
+        # reltuples is -1 until the first ANALYZE on PostgreSQL 14 and later
+        if result is None or result[1] is None or result[0] < 0:
+            return None
+        row_count = int(result[0])
+        columns: Dict[str, ColumnStatistics] = {}
+        rows = self.fetchall(
+            "SELECT attname, null_frac, n_distinct FROM pg_stats "
+            f"WHERE schemaname = {schema} AND tablename = '{table}' AND NOT inherited"
+        )
+        for column, null_fraction, n_distinct in rows or []:
+            # A negative n_distinct is the ratio of distinct values to rows
+            columns[column] = ColumnStatistics(
+                null_fraction=float(null_fraction),
+                distinct_count=round(
+                    n_distinct if n_distinct >= 0 else -n_distinct * row_count
+                ),
+            )
+        return TableStatistics(
+            row_count=row_count, updated_at=result[1], columns=columns
+        )
+
+    def query_get_last_modified_query(self) -> Optional[str]:
+        """
+        Get the catalog query of the last modification time of every table. Autovacuum
+        and autoanalyze run after rows change, the latest automatic maintenance of a
+        table is the time of its last change as far as the statistics collector knows.
+        Manual VACUUM and ANALYZE are left out, they can run without any change.
+        """
+        schema_condition = (
+            f"schemaname = '{self.schema_name}'"
+            if self.schema_name
+            else "schemaname = current_schema()"
+        )
+        return (
+            "SELECT relname, "
+            "GREATEST(last_autovacuum, last_autoanalyze) "
+            f"FROM pg_stat_user_tables WHERE {schema_condition}"
+        )
+
+    def has_hll_extension(self) -> bool:
+        """
+        Check whether the hll extension is installed in the database
+        """
+        if self._has_hll_extension is None:
+            try:
+                result = self.fetchone(
+                    "SELECT COUNT(*) FROM pg_extension WHERE extname = 'hll'"
+                )
+                self._has_hll_extension = bool(result and result[0])
+            except Exception:
+                self._has_hll_extension = False
+        return self._has_hll_extension
+
     def query_get_database_version(
         self, database_version_query: Optional[str] = None
     ) -> str:
@@ -279,14 +417,15 @@ class PostgresDataSource(SQLDataSource):
         """
         query = complete_query or f"SELECT * FROM ({query}) AS subquery LIMIT {limit}"
 
-        result = self.connection.execute(text(query))
-        rows = result.fetchmany(limit)
+        with self.checkout() as connection:
+            result = connection.execute(text(query))
+            rows = result.fetchmany(limit)
 
-        if with_column_names:
-            column_names = result.keys()
-            return rows, list(column_names)
-        else:
-            return rows, None
+            if with_column_names:
+                column_names = result.keys()
+                return rows, list(column_names)
+            else:
+                return rows, None
 
     def fetch_sample_values_from_database(
         self,
@@ -492,8 +631,9 @@ class PostgresDataSource(SQLDataSource):
             JOIN pg_namespace nsp_t ON nsp_t.oid = rel_t.relnamespace
             JOIN pg_class rel_p ON rel_p.oid = con.confrelid
             JOIN pg_namespace nsp_p ON nsp_p.oid = rel_p.relnamespace
-            JOIN pg_attribute att_t ON att_t.attrelid = rel_t.oid AND att_t.attnum = ANY(con.conkey)
-            JOIN pg_attribute att_p ON att_p.attrelid = rel_p.oid AND att_p.attnum = ANY(con.confkey)
+            CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS cols(conkey, confkey)
+            JOIN pg_attribute att_t ON att_t.attrelid = rel_t.oid AND att_t.attnum = cols.conkey
+            JOIN pg_attribute att_p ON att_p.attrelid = rel_p.oid AND att_p.attnum = cols.confkey
             WHERE con.contype = 'f'
             AND rel_t.relname = '{table_name}'
             AND nsp_t.nspname = '{schema}';
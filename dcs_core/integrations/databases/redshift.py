@@ -12,9 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -22,6 +22,9 @@ from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class RedShiftDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.02
+    QUERY_TIMEOUT_ERRORS = ("statement timeout",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -43,6 +46,7 @@ class RedShiftDataSource(SQLDataSource):
                 url,
                 connect_args={"options": f"-csearch_path={schema}"} if schema else None,
                 isolation_level="AUTOCOMMIT",
+                **self.sqlalchemy_pool_options(),
             )
 
             self.connection = engine.connect()
@@ -51,3 +55,51 @@ class RedShiftDataSource(SQLDataSource):
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to AWS RedShift data source: [{str(e)}]"
             )
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROXIMATE COUNT(DISTINCT {field})"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS VARCHAR(MAX))"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. A TIMESTAMP is taken as UTC.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"TO_CHAR(CONVERT_TIMEZONE('UTC', {field}), 'YYYY-MM-DD HH24:MI:SS.US')"
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"STRTOL(SUBSTRING(MD5({expression}), 1, 15), 16)"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        if timeout is None:
+            connection.execute(text("RESET statement_timeout"))
+        else:
+            connection.execute(text(f"SET statement_timeout = {int(timeout * 1000)}"))
+        return True
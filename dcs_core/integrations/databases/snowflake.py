@@ -11,17 +11,21 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import math
 import urllib.parse
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from snowflake.sqlalchemy import URL
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class SnowFlakeDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.0162
+    QUERY_TIMEOUT_ERRORS = ("000630",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -39,10 +43,101 @@ class SnowFlakeDataSource(SQLDataSource):
                 warehouse=self.data_connection.get("warehouse"),
                 role=self.data_connection.get("role"),
             )
-            engine = create_engine(url)
+            engine = create_engine(url, **self.sqlalchemy_pool_options())
             self.connection = engine.connect()
             return self.connection
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Snowflake data source: [{str(e)}]"
             )
+
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE SYSTEM ({percent})"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff. A TIMESTAMP_NTZ is taken as UTC.
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        # The epoch of a TIMESTAMP_NTZ is its UTC epoch
+        return (
+            f"TO_CHAR(TO_TIMESTAMP_NTZ(DATE_PART(EPOCH_MICROSECOND, {field}), 6), "
+            f"'YYYY-MM-DD HH24:MI:SS.FF6')"
+        )
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"TO_NUMBER(SUBSTR(MD5({expression}), 1, 15), 'xxxxxxxxxxxxxxx')"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        if timeout is None:
+            connection.execute(text("ALTER SESSION UNSET STATEMENT_TIMEOUT_IN_SECONDS"))
+        else:
+            connection.execute(
+                text(
+                    "ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = "
+                    f"{math.ceil(timeout)}"
+                )
+            )
+        return True
+
+    def query_get_last_modified_query(self) -> Optional[str]:
+        """
+        Get the catalog query of the last modification time of every table
+        """
+        schema = self.data_connection.get("schema")
+        schema_condition = (
+            f"UPPER(TABLE_SCHEMA) = UPPER('{schema}')"
+            if schema
+            else "TABLE_SCHEMA = CURRENT_SCHEMA()"
+        )
+        return (
+            "SELECT TABLE_NAME, LAST_ALTERED FROM INFORMATION_SCHEMA.TABLES "
+            f"WHERE {schema_condition}"
+        )
+
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        """
+        Get the fingerprint of a table from its last modification time
+        :param table: name of the table
+        :return: fingerprint, None if the table is not found
+        """
+        schema = self.data_connection.get("schema")
+        schema_condition = (
+            f"UPPER(TABLE_SCHEMA) = UPPER('{schema}')"
+            if schema
+            else "TABLE_SCHEMA = CURRENT_SCHEMA()"
+        )
+        query = (
+            "SELECT LAST_ALTERED, ROW_COUNT FROM INFORMATION_SCHEMA.TABLES "
+            f"WHERE {schema_condition} AND UPPER(TABLE_NAME) = UPPER('{table}')"
+        )
+        return self._query_fingerprint(query)
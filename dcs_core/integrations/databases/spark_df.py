@@ -11,7 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, List, Union
+import itertools
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Union
 
 from pyspark.sql import DataFrame
 from pyspark.sql.session import SparkSession
@@ -27,11 +29,13 @@ class SparkDfCursor:
         self.description: Union[tuple[tuple], None] = None
         self.rowcount: int = -1
         self.cursor_index: int = -1
+        self.rows_iterator: Optional[Iterator[Row]] = None
 
     def execute(self, sql: str):
         self.df = self.spark_session.sql(sqlQuery=sql)
         self.description = self.convert_spark_df_schema_to_dbapi_description(self.df)
         self.cursor_index = 0
+        self.rows_iterator = None
 
     def fetchall(self) -> tuple[List, ...]:
         rows = []
@@ -44,8 +48,10 @@ class SparkDfCursor:
 
     def fetchmany(self, size: int) -> tuple[List, ...]:
         rows = []
-        self.rowcount = self.df.count()
-        spark_rows: list[Row] = self.df.limit(size).offset(self.cursor_index).collect()
+        # Rows are pulled one partition at a time, the result is never collected
+        if self.rows_iterator is None:
+            self.rows_iterator = self.df.toLocalIterator()
+        spark_rows: list[Row] = list(itertools.islice(self.rows_iterator, size))
         self.cursor_index += len(spark_rows)
         for spark_row in spark_rows:
             row = self.convert_spark_row_to_dbapi_row(spark_row)
@@ -91,6 +97,9 @@ class SparkDfConnection:
 
 
 class SparkDFDataSource(SQLDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.05
+    BATCHED_ORPHAN_COUNTS = False
+
     def __init__(self, data_source_name: str, data_connection: dict):
         super().__init__(data_source_name, data_connection)
         self.spark_session = data_connection.get("spark_session")
@@ -99,15 +108,75 @@ class SparkDFDataSource(SQLDataSource):
     def connect(self):
         self.connection = SparkDfConnection(self.spark_session)
 
+    def sampled_table(self, qualified_table_name: str, percent: float) -> str:
+        """
+        Get the table reference of a random sample of a table
+        :param qualified_table_name: qualified table name
+        :param percent: percentage of the rows to sample
+        :return: sampled table reference
+        """
+        return f"{qualified_table_name} TABLESAMPLE ({percent} PERCENT)"
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        """
+        Get the expression estimating the distinct count of a quoted column with the
+        native HyperLogLog sketch of the dialect
+        :param field: quoted column name
+        :return: SQL expression, None if the dialect has no native sketch
+        """
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, with or without time zone
+        :return: SQL literal
+        """
+        return f"TIMESTAMP '{value.isoformat(sep=' ', timespec='microseconds')}'"
+
+    def text_expression(self, field: str) -> str:
+        """
+        Get the expression casting a quoted column to text
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return f"CAST({field} AS STRING)"
+
+    def timestamp_text_expression(self, field: str) -> str:
+        """
+        Get the expression formatting a quoted timestamp or date column in UTC as
+        YYYY-MM-DD HH:MM:SS.ffffff, converted from the time zone of the session
+        :param field: quoted column name
+        :return: SQL expression
+        """
+        return (
+            f"DATE_FORMAT(TO_UTC_TIMESTAMP({field}, CURRENT_TIMEZONE()), "
+            f"'yyyy-MM-dd HH:mm:ss.SSSSSS')"
+        )
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        """
+        Get the expression hashing a text expression to a non negative integer, the
+        first 15 hexadecimal digits of its MD5 digest
+        :param expression: text expression
+        :return: SQL expression
+        """
+        return f"CAST(CONV(SUBSTR(MD5({expression}), 1, 15), 16, 10) AS BIGINT)"
+
     def close(self):
         pass
 
-    def fetchone(self, query):
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor.fetchone()
+    def _create_connection(self) -> SparkDfConnection:
+        return SparkDfConnection(self.spark_session)
+
+    def _fetchone(self, query):
+        with self.checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            return cursor.fetchone()
 
-    def fetchall(self, query):
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor.fetchall()
+    def _fetchall(self, query):
+        with self.checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            return cursor.fetchall()
@@ -12,10 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import math
 import random
 import re
 import time
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pyodbc
@@ -26,12 +27,16 @@ from dcs_core.core.common.models.data_source_resource import (
     RawColumnInfo,
     SybaseDriverTypes,
 )
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class SybaseDataSource(SQLDataSource):
+    QUERY_TIMEOUT_ERRORS = ("HYT00",)
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
+        self.connection_params: Dict = {}
         self.regex_patterns = {
             "uuid": r"%[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%-%[0-9a-fA-F]%",
             "usa_phone": r"%[0-9][0-9][0-9] [0-9][0-9][0-9] [0-9][0-9][0-9][0-9]%",
@@ -72,6 +77,7 @@ class SybaseDataSource(SQLDataSource):
             try:
                 logger.debug("Attempting FreeTDS connection")
                 self.connection = pyodbc.connect(**conn_dict)
+                self.connection_params = dict(conn_dict)
                 logger.info("Successfully connected to Sybase using FreeTDS")
                 return self.connection
             except Exception as e:
@@ -149,6 +155,7 @@ class SybaseDataSource(SQLDataSource):
                     try:
                         logger.debug("Attempting connection ...")
                         self.connection = pyodbc.connect(**final_config)
+                        self.connection_params = dict(final_config)
                         logger.info(
                             "Successfully connected to Sybase using: "
                             f"driver={driver}"
@@ -191,11 +198,16 @@ class SybaseDataSource(SQLDataSource):
         """Ensure driver string is properly formatted with braces."""
         return f"{{{driver}}}" if not driver.startswith("{") else driver
 
-    def fetchall(self, query):
-        return self.connection.cursor().execute(query).fetchall()
+    def _fetchall(self, query):
+        with self.checkout() as connection:
+            return connection.cursor().execute(query).fetchall()
+
+    def _fetchone(self, query):
+        with self.checkout() as connection:
+            return connection.cursor().execute(query).fetchone()
 
-    def fetchone(self, query):
-        return self.connection.cursor().execute(query).fetchone()
+    def _create_connection(self) -> Any:
+        return pyodbc.connect(**self.connection_params)
 
     def qualified_table_name(self, table_name: str) -> str:
         """
@@ -215,6 +227,65 @@ class SybaseDataSource(SQLDataSource):
         """
         return f"[{column}]"
 
+    def timestamp_literal(self, value: datetime) -> str:
+        """
+        Get the SQL literal of a timestamp
+        :param value: timestamp, taken as is without its time zone
+        :return: SQL literal
+        """
+        text = value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        return f"CAST('{text}' AS BIGDATETIME)"
+
+    def date_literal(self, value: date) -> str:
+        """
+        Get the SQL literal of a date
+        :param value: date
+        :return: SQL literal
+        """
+        return f"CAST('{value.isoformat()}' AS DATE)"
+
+    def random_expression(self) -> str:
+        """
+        Get the expression of a random number between 0 and 1, evaluated per row
+        """
+        return "RAND2()"
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        """
+        Set the server side timeout of the queries of a connection, the ODBC driver
+        cancels the statement when it expires
+        :param connection: checked out connection
+        :param timeout: timeout in seconds, None to restore the default timeout
+        :return: whether the dialect supports query timeouts
+        """
+        connection.timeout = math.ceil(timeout) if timeout is not None else 0
+        return True
+
+    def regex_match_condition(self, field: str, regex_pattern: str) -> Optional[str]:
+        """
+        Sybase has no regex operator, patterns are translated per validation
+        :param field: quoted column name
+        :param regex_pattern: regex pattern
+        :return: None
+        """
+        return None
+
+    def aggregate_expression(self, aggregate: ScanAggregate) -> Optional[str]:
+        """
+        Get the SQL expression computing an aggregate of a fused scan
+        :param aggregate: aggregate to compute
+        :return: SQL expression, None if the aggregate is not supported by the dialect
+        """
+        field = self.quote_column(aggregate.field) if aggregate.field else None
+
+        if aggregate.type == AggregateType.STRING_LENGTH_MAX:
+            return f"MAX(LEN({field}))"
+        elif aggregate.type == AggregateType.STRING_LENGTH_MIN:
+            return f"MIN(LEN({field}))"
+        elif aggregate.type == AggregateType.STRING_LENGTH_AVG:
+            return f"AVG(CAST(LEN({field}) AS FLOAT))"
+        return super().aggregate_expression(aggregate)
+
     def query_get_row_count(self, table: str, filters: str = None) -> int:
         """
         Get the row count
@@ -593,15 +664,16 @@ class SybaseDataSource(SQLDataSource):
         :return: Tuple of (rows, column_names or None)
         """
         query = complete_query or f"SELECT TOP {limit} * FROM ({query}) AS subquery"
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        rows = cursor.fetchmany(limit)
-
-        if with_column_names:
-            column_names = [column[0] for column in cursor.description]
-            return rows, column_names
-        else:
-            return rows, None
+        with self.checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            rows = cursor.fetchmany(limit)
+
+            if with_column_names:
+                column_names = [column[0] for column in cursor.description]
+                return rows, column_names
+            else:
+                return rows, None
 
     def fetch_sample_values_from_database(
         self,
@@ -676,10 +748,22 @@ class SybaseDataSource(SQLDataSource):
         result = self.fetchone(query)
         return result[0], result[1]
 
-    def query_get_percentile(
-        self, table: str, field: str, percentile: float, filters: str = None
-    ) -> float:
-        raise NotImplementedError("Method not implemented for Sybase data source")
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        """
+        Get several percentile values of a numeric column. Sybase has neither a
+        percentile aggregate nor window functions, the percentiles are picked from
+        the ordered column streamed through the cursor.
+        :param table: table name
+        :param field: column name
+        :param percentiles: percentiles to calculate (e.g., [0.2, 0.4])
+        :param filters: filter condition
+        :return: the values at the percentiles, in the order of the percentiles
+        """
+        return self.query_get_percentiles_streaming(
+            table=table, field=field, percentiles=percentiles, filters=filters
+        )
 
     def query_get_all_space_count(
         self, table: str, field: str, operation: str, filters: str = None
@@ -872,12 +956,11 @@ class SybaseDataSource(SQLDataSource):
         qualified_table_name = self.qualified_table_name(table)
         field = self.quote_column(field)
         query = f"""
-            SELECT TOP 1 {field}
-            FROM {qualified_table_name}
-            ORDER BY {field} DESC;
+            SELECT MAX({field})
+            FROM {qualified_table_name};
         """
         result = self.fetchone(query)
-        if result:
+        if result and result[0] is not None:
             updated_time = result[0]
             if isinstance(updated_time, str):
                 updated_time = datetime.strptime(updated_time, "%Y-%m-%d %H:%M:%S.%f")
@@ -13,14 +13,27 @@
 #  limitations under the License.
 
 import datetime as dt
+import json
 import os
+from dataclasses import asdict
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Dict, List, Literal, Tuple, Union
 
 from dcs_core.core.common.errors import DataChecksRuntimeError
 from dcs_core.core.common.models.metric import MetricValue
+from dcs_core.core.common.models.scan import IncrementalState
+from dcs_core.core.common.models.validation import (
+    CachedValidationInfo,
+    ValidationFunction,
+    ValidationInfo,
+)
 from dcs_core.core.repository.metric_repository import MetricRepository
+from dcs_core.core.repository.validation_result_repository import (
+    ValidationResultRepository,
+)
+from dcs_core.core.repository.watermark_repository import WatermarkRepository
 from dcs_core.core.utils.utils import ensure_directory_exists, write_to_file
 
 
@@ -162,3 +175,128 @@ class LocalFileMetricRepository(MetricRepository):
             metrics[metric_id] = (daily_metrics, hourly_metrics)
 
         return metrics
+
+
+class LocalFileWatermarkRepository(WatermarkRepository):
+    """
+    Directory Structure:
+
+    Dir:watermarks
+    - file:state_identifier.json
+    """
+
+    def __init__(self, storage_path):
+        self.storage_path = f"{storage_path}/watermarks"
+        try:
+            ensure_directory_exists(self.storage_path, create_if_not_exists=True)
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to locate watermark storage directory: {self.storage_path} due to error: {e}"
+            )
+
+    def _file_name(self, state_id: str) -> str:
+        return f"{self.storage_path}/{state_id}.json"
+
+    def get_state(self, state_id: str) -> Union[IncrementalState, None]:
+        file_name = self._file_name(state_id)
+        if not os.path.exists(file_name):
+            return None
+        with open(file_name, "r") as f:
+            state = json.loads(f.read())
+        return IncrementalState(
+            watermark=state.get("watermark"),
+            aggregates=state.get("aggregates", {}),
+            watermark_type=state.get("watermark_type"),
+        )
+
+    def save_state(self, state_id: str, state: IncrementalState) -> int:
+        try:
+            write_to_file(
+                self._file_name(state_id),
+                json.dumps(
+                    {
+                        "watermark": state.watermark,
+                        "watermark_type": state.watermark_type,
+                        "aggregates": state.aggregates,
+                    }
+                ),
+            )
+            return 1
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to save watermark state {state_id} due to error: {e}"
+            )
+
+
+class LocalFileValidationResultRepository(ValidationResultRepository):
+    """
+    Directory Structure:
+
+    Dir:validation_results
+    - file:cache_identifier.json
+    """
+
+    def __init__(self, storage_path):
+        self.storage_path = f"{storage_path}/validation_results"
+        try:
+            ensure_directory_exists(self.storage_path, create_if_not_exists=True)
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to locate validation result storage directory: {self.storage_path} due to error: {e}"
+            )
+
+    def _file_name(self, cache_id: str) -> str:
+        return f"{self.storage_path}/{cache_id}.json"
+
+    @staticmethod
+    def _to_json_value(value):
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, (datetime, dt.date)):
+            return value.isoformat()
+        return str(value)
+
+    def get_result(self, cache_id: str) -> Union[CachedValidationInfo, None]:
+        file_name = self._file_name(cache_id)
+        if not os.path.exists(file_name):
+            return None
+        with open(file_name, "r") as f:
+            result = json.loads(f.read())
+        info = result["validation_info"]
+        info["validation_function"] = ValidationFunction(info["validation_function"])
+        info["timestamp"] = datetime.fromisoformat(info["timestamp"])
+        if info.get("confidence_interval") is not None:
+            info["confidence_interval"] = tuple(info["confidence_interval"])
+        if info.get("statistics_updated_at") is not None:
+            info["statistics_updated_at"] = datetime.fromisoformat(
+                info["statistics_updated_at"]
+            )
+        info["cached_at"] = None
+        return CachedValidationInfo(
+            fingerprint=result["fingerprint"],
+            cached_at=datetime.fromisoformat(result["cached_at"]),
+            validation_info=ValidationInfo(**info),
+        )
+
+    def save_result(self, cache_id: str, result: CachedValidationInfo) -> int:
+        try:
+            info = asdict(result.validation_info)
+            info[
+                "validation_function"
+            ] = result.validation_info.validation_function.value
+            write_to_file(
+                self._file_name(cache_id),
+                json.dumps(
+                    {
+                        "fingerprint": result.fingerprint,
+                        "cached_at": result.cached_at.isoformat(),
+                        "validation_info": info,
+                    },
+                    default=self._to_json_value,
+                ),
+            )
+            return 1
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to save validation result {cache_id} due to error: {e}"
+            )
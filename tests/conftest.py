@@ -12,7 +12,40 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import pytest
 from urllib3 import disable_warnings
 from urllib3.exceptions import InsecureRequestWarning
 
+from tests.utils import SqliteDataSource
+
 disable_warnings(InsecureRequestWarning)
+
+
+@pytest.fixture
+def sqlite_data_source(tmp_path):
+    """
+    Factory of the SQLite data sources of a test, closed when the test ends. With
+    file, the database is a file of the test directory, so that every pooled
+    connection sees the same tables.
+    """
+    data_sources = []
+
+    def create(
+        *statements: str,
+        name: str = "sqlite",
+        data_source_class=SqliteDataSource,
+        file: bool = False,
+        **connection,
+    ) -> SqliteDataSource:
+        if file:
+            connection["database"] = str(tmp_path / f"{name}.db")
+        data_source = data_source_class(
+            name, {"statements": list(statements), **connection}
+        )
+        data_source.connect()
+        data_sources.append(data_source)
+        return data_source
+
+    yield create
+    for data_source in data_sources:
+        data_source.close()
@@ -13,6 +13,7 @@
 #  limitations under the License.
 import pytest
 
+from dcs_core.core.common.errors import DataChecksConfigurationError
 from dcs_core.core.common.models.configuration import DataSourceType
 from dcs_core.core.common.models.validation import ValidationFunction
 from dcs_core.core.configuration.configuration_parser import (
@@ -1209,6 +1210,34 @@ def test_should_read_delta_validation_config():
     )
 
 
+def test_should_read_delta_diff_validation_config():
+    yaml_string = """
+    validations for source.table:
+      - test:
+          on: delta diff(id)
+          threshold: "= 0"
+          ref: source1.table1.key
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validation = configuration.validations["source.table"].validations["test"]
+    assert validation.get_validation_function == ValidationFunction.DELTA_DIFF
+    assert validation.get_validation_field_name == "id"
+    assert validation.get_ref_field_name == "key"
+
+
+def test_should_not_apply_dataset_sample_to_delta_diff():
+    yaml_string = """
+    sample for source.table:
+      percent: 1
+    validations for source.table:
+      - test:
+          on: delta diff(id)
+          ref: source1.table1.key
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.validations["source.table"].validations["test"].sample is None
+
+
 def test_should_throw_error_on_delta_function():
     yaml_string = """
     validations for source.table:
@@ -1219,3 +1248,278 @@ def test_should_throw_error_on_delta_function():
     """
     with pytest.raises(Exception):
         load_configuration_from_yaml_str(yaml_string)
+
+
+def test_should_read_orphan_count_validation_config():
+    yaml_string = """
+    validations for source.orders:
+      - orphans:
+          on: orphan_count
+          threshold: "= 0"
+      - customer orphans:
+          on: orphan_count(customer_id)
+          ref: source.customers.id
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validations = configuration.validations["source.orders"].validations
+    assert validations["orphans"].get_validation_function == (
+        ValidationFunction.ORPHAN_COUNT
+    )
+    assert validations["orphans"].get_validation_field_name is None
+    assert validations["customer orphans"].get_validation_field_name == "customer_id"
+    assert validations["customer orphans"].get_ref_dataset_name == "customers"
+
+
+def test_should_throw_error_on_orphan_count_of_column_without_ref():
+    yaml_string = """
+    validations for source.orders:
+      - test:
+          on: orphan_count(customer_id)
+    """
+    with pytest.raises(Exception):
+        load_configuration_from_yaml_str(yaml_string)
+
+
+def test_should_not_apply_dataset_sample_to_orphan_count():
+    yaml_string = """
+    sample for source.orders:
+      percent: 1
+    validations for source.orders:
+      - customer orphans:
+          on: orphan_count(customer_id)
+          ref: source.customers.id
+      - rows:
+          on: count_rows
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validations = configuration.validations["source.orders"].validations
+    assert validations["customer orphans"].sample is None
+    assert validations["rows"].sample == 1
+
+
+def test_should_read_false_positive_rate_of_orphan_count():
+    yaml_string = """
+    validations for source.orders:
+      - customer orphans:
+          on: orphan_count(customer_id)
+          ref: warehouse.customers.id
+          false_positive_rate: 0.001
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validation = configuration.validations["source.orders"].validations[
+        "customer orphans"
+    ]
+    assert validation.false_positive_rate == 0.001
+
+
+def test_should_throw_error_on_false_positive_rate_of_other_function():
+    yaml_string = """
+    validations for source.orders:
+      - test:
+          on: count_rows
+          false_positive_rate: 0.001
+    """
+    with pytest.raises(Exception):
+        load_configuration_from_yaml_str(yaml_string)
+
+
+def test_should_read_execution_configuration():
+    yaml_string = """
+    execution:
+      fused_scan: false
+      fused_scan_max_aggregates: 20
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.execution.fused_scan is False
+    assert configuration.execution.fused_scan_max_aggregates == 20
+
+
+def test_should_use_default_execution_configuration():
+    yaml_string = """
+    validations for source.table:
+      - test:
+          on: count_rows
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.execution.fused_scan is True
+    assert configuration.execution.fused_scan_max_aggregates == 50
+
+
+def test_should_read_execution_concurrency_configuration():
+    yaml_string = """
+    execution:
+      max_workers: 8
+      max_workers_per_data_source: 2
+      data_sources:
+        warehouse: 4
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.execution.max_workers == 8
+    assert configuration.execution.max_workers_per_data_source == 2
+    assert configuration.execution.data_source_max_workers == {"warehouse": 4}
+
+
+def test_should_fail_on_invalid_execution_max_workers():
+    yaml_string = """
+    execution:
+      max_workers: 0
+    """
+    with pytest.raises(DataChecksConfigurationError):
+        load_configuration_from_yaml_str(yaml_string)
+
+
+def test_should_read_connection_pool_configuration():
+    yaml_string = """
+    data_sources:
+      - name: "test"
+        type: "postgres"
+        connection:
+          host: "localhost"
+          pool_size: 4
+          pool_pre_ping: true
+          pool_recycle: 3600
+          pool_timeout: 10
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    connection_config = configuration.data_sources["test"].connection_config
+    assert connection_config.pool_size == 4
+    assert connection_config.pool_pre_ping is True
+    assert connection_config.pool_recycle == 3600
+    assert connection_config.pool_timeout == 10
+
+
+def test_should_read_incremental_configuration():
+    yaml_string = """
+    incremental for source.table:
+      watermark: updated_at
+    execution:
+      incremental_storage_path: /tmp/dcs
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    incremental = configuration.incremental["source.table"]
+    assert incremental.data_source == "source"
+    assert incremental.dataset == "table"
+    assert incremental.watermark == "updated_at"
+    assert configuration.execution.incremental_storage_path == "/tmp/dcs"
+
+
+def test_should_read_partition_configuration():
+    yaml_string = """
+    partition for source.events:
+      column: event_time
+      partitions: 16
+    partition for source.orders:
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    events = configuration.partitioned["source.events"]
+    assert events.column == "event_time"
+    assert events.partitions == 16
+    assert events.max_retries == 2
+    assert configuration.partitioned["source.orders"].column is None
+
+    with pytest.raises(DataChecksConfigurationError):
+        load_configuration_from_yaml_str(
+            """
+    partition for source.events:
+      partitions: 1
+    """
+        )
+
+
+def test_should_read_result_cache_configuration():
+    yaml_string = """
+    execution:
+      result_cache: true
+      result_cache_ttl: 86400
+    validations for source.table:
+      - rows:
+          on: count_rows
+          cache_ttl: 0
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.execution.result_cache is True
+    assert configuration.execution.result_cache_ttl == 86400
+    assert configuration.execution.result_cache_storage_path == "dcs_storage"
+    validation = configuration.validations["source.table"].validations["rows"]
+    assert validation.cache_ttl == 0
+
+
+def test_should_read_query_timeout_configuration():
+    yaml_string = """
+    data_sources:
+      - name: "source"
+        type: "postgres"
+        connection:
+          host: "localhost"
+          query_timeout: 300
+    validations for source.table:
+      - rows:
+          on: count_rows
+          timeout: 60
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.data_sources["source"].connection_config.query_timeout == 300
+    validation = configuration.validations["source.table"].validations["rows"]
+    assert validation.timeout == 60
+
+
+def test_should_read_fetch_size_configuration():
+    yaml_string = """
+    data_sources:
+      - name: "source"
+        type: "postgres"
+        connection:
+          host: "localhost"
+          fetch_size: 50000
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.data_sources["source"].connection_config.fetch_size == 50000
+    with pytest.raises(DataChecksConfigurationError):
+        load_configuration_from_yaml_str(yaml_string.replace("50000", "0"))
+
+
+def test_should_read_mapping_cache_ttl_configuration():
+    yaml_string = """
+    data_sources:
+      - name: "search"
+        type: "elasticsearch"
+        connection:
+          host: "localhost"
+          mapping_cache_ttl: 600
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert (
+        configuration.data_sources["search"].connection_config.mapping_cache_ttl == 600
+    )
+
+
+def test_should_read_metadata_cache_configuration():
+    yaml_string = """
+    data_sources:
+      - name: "source"
+        type: "postgres"
+        connection:
+          host: "localhost"
+          metadata_cache_ttl: 3600
+          metadata_cache_path: "/tmp/dcs_metadata.json"
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    connection_config = configuration.data_sources["source"].connection_config
+    assert connection_config.metadata_cache_ttl == 3600
+    assert connection_config.metadata_cache_path == "/tmp/dcs_metadata.json"
+
+
+def test_should_throw_error_on_freshness_without_column_of_search_index():
+    yaml_string = """
+    data_sources:
+      - name: "search"
+        type: "elasticsearch"
+        connection:
+          host: "localhost"
+          port: 9200
+    validations for search.products:
+      - test:
+          on: freshness
+    """
+    with pytest.raises(DataChecksConfigurationError, match="needs a timestamp field"):
+        load_configuration_from_yaml_str(yaml_string)
@@ -0,0 +1,83 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import sqlite3
+
+import pytest
+
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+
+QUERY = "SELECT id FROM numbers ORDER BY id"
+
+
+class SqliteDbapiDataSource(SQLDataSource):
+    """
+    Uses a driver connection, as the pyodbc data sources do
+    """
+
+    def connect(self):
+        self.connection = sqlite3.connect(
+            self.data_connection["database"], check_same_thread=False
+        )
+        return self.connection
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        "CREATE TABLE numbers (id INTEGER)", file=True, pool_size=1, fetch_size=3
+    )
+    data_source.insert("numbers", [(i,) for i in range(10)])
+    return data_source
+
+
+def test_should_stream_rows_in_batches_of_fetch_size(data_source, mocker):
+    execute_stream = mocker.spy(data_source, "_execute_stream")
+
+    rows = [row[0] for row in data_source.iter_rows(QUERY)]
+
+    assert rows == list(range(10))
+    assert execute_stream.call_args.args[2] == 3
+
+
+def test_should_release_connection_when_iteration_stops(data_source):
+    rows = data_source.iter_rows(QUERY, batch_size=2)
+    assert next(rows)[0] == 0
+    rows.close()
+
+    # The only connection of the pool is available again
+    assert data_source.fetchone("SELECT COUNT(*) FROM numbers")[0] == 10
+
+
+def test_should_not_change_execution_options_of_connection(data_source):
+    options = dict(data_source.connection.get_execution_options())
+
+    assert len(list(data_source.iter_rows(QUERY))) == 10
+
+    assert dict(data_source.connection.get_execution_options()) == options
+    assert "stream_results" not in data_source.connection.get_execution_options()
+
+
+def test_should_set_array_size_of_driver_cursor(data_source, mocker):
+    dbapi_data_source = SqliteDbapiDataSource(
+        "dbapi", {"database": data_source.data_connection["database"]}
+    )
+    dbapi_data_source.connect()
+    configure_cursor = mocker.spy(dbapi_data_source, "configure_cursor")
+
+    rows = list(dbapi_data_source.iter_rows(QUERY, batch_size=4))
+
+    assert len(rows) == 10
+    cursor, batch_size = configure_cursor.call_args.args
+    assert cursor.arraysize == batch_size == 4
+    dbapi_data_source.connection.close()
@@ -0,0 +1,107 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict
+
+import pytest
+
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+
+MAPPINGS = {
+    "products": {
+        "mappings": {
+            "properties": {
+                "name": {
+                    "type": "text",
+                    "fields": {"raw": {"type": "keyword"}},
+                },
+                "price": {"type": "double"},
+                "vendor": {"properties": {"country": {"type": "keyword"}}},
+            }
+        }
+    },
+    "orders": {"mappings": {"properties": {"amount": {"type": "long"}}}},
+}
+
+ALIASES = {"sales": ["orders"]}
+
+
+class MappingClient:
+    def __init__(self):
+        self.get_mapping_calls = 0
+        self.indices = self
+
+    def get_mapping(self, index: str, ignore_unavailable: bool = False) -> Dict:
+        self.get_mapping_calls += 1
+        mappings = {}
+        for name in index.split(","):
+            for index_name in ALIASES.get(name, [name]):
+                if index_name in MAPPINGS:
+                    mappings[index_name] = MAPPINGS[index_name]
+                elif not ignore_unavailable:
+                    raise KeyError(index_name)
+        return mappings
+
+    def get_alias(self, index: str, ignore_unavailable: bool = False) -> Dict:
+        return {
+            name: {
+                "aliases": {
+                    alias: {} for alias, indexes in ALIASES.items() if name in indexes
+                }
+            }
+            for name in index.split(",")
+        }
+
+
+@pytest.fixture
+def data_source():
+    data_source = SearchIndexDataSource("search", {})
+    data_source.client = MappingClient()
+    return data_source
+
+
+def test_should_resolve_fields_from_the_cached_mapping(data_source):
+    data_source.load_mappings(["products", "orders"])
+    assert data_source.client.get_mapping_calls == 1
+
+    assert data_source.query_get_field_type("products", "price") == float
+    assert data_source.query_get_field_type("products", "vendor") == dict
+    assert data_source.query_get_field_type("products", "vendor.country") == str
+    assert data_source._aggregatable_field("products", "name") == "name.raw"
+    assert data_source._aggregatable_field("products", "price") == "price"
+    assert data_source.query_get_field_metadata("orders") == {"amount": int}
+    assert data_source.client.get_mapping_calls == 1
+
+
+def test_should_refetch_expired_or_invalidated_mappings(data_source):
+    data_source.query_get_field_type("orders", "amount")
+    data_source.query_get_field_type("orders", "amount")
+    assert data_source.client.get_mapping_calls == 1
+
+    data_source.invalidate_mappings("orders")
+    data_source.query_get_field_type("orders", "amount")
+    assert data_source.client.get_mapping_calls == 2
+
+    data_source.mapping_cache_ttl = 0
+    data_source.query_get_field_type("orders", "amount")
+    assert data_source.client.get_mapping_calls == 3
+
+
+def test_should_cache_aliases_and_skip_missing_indexes(data_source):
+    data_source.load_mappings(["products", "sales", "missing"])
+    assert data_source.client.get_mapping_calls == 1
+
+    assert data_source.query_get_field_type("sales", "amount") == int
+    assert data_source.query_get_field_type("orders", "amount") == int
+    assert data_source.query_get_field_type("products", "price") == float
+    assert data_source.client.get_mapping_calls == 1
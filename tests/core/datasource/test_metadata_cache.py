@@ -0,0 +1,86 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from tests.utils import SqliteDataSource
+
+COLUMNS = {
+    "customers": {"id": "int", "name": "str", "created_at": "datetime"},
+    "orders": {"id": "int", "amount": "Decimal"},
+}
+
+
+class CatalogSqliteDataSource(SqliteDataSource):
+    """
+    Reads the columns of every table from the SQLite catalog
+    """
+
+    catalog_queries = 0
+
+    def query_get_schema_columns_query(self, schema: str) -> str:
+        return (
+            "SELECT m.name, p.name, p.type FROM sqlite_master m "
+            "JOIN pragma_table_info(m.name) p WHERE m.type = 'table' "
+            "ORDER BY m.name, p.cid"
+        )
+
+    def fetchall(self, query: str):
+        self.catalog_queries += 1
+        return super().fetchall(query)
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(
+        "CREATE TABLE customers (id INTEGER, name VARCHAR(20), created_at DATETIME)",
+        "CREATE TABLE orders (id INT, amount NUMERIC(10, 2))",
+        data_source_class=CatalogSqliteDataSource,
+    )
+
+
+def test_should_load_all_columns_with_one_catalog_query(data_source):
+    assert data_source.get_schema_columns() == COLUMNS
+    assert data_source.query_get_column_metadata("customers") == COLUMNS["customers"]
+    assert data_source.query_get_column_metadata("orders") == COLUMNS["orders"]
+    assert data_source.catalog_queries == 1
+
+    data_source.invalidate_schema_columns()
+    data_source.query_get_column_metadata("orders")
+    assert data_source.catalog_queries == 2
+
+    data_source.metadata_cache_ttl = 0
+    data_source.query_get_column_metadata("orders")
+    assert data_source.catalog_queries == 3
+
+
+def test_should_start_from_the_persisted_metadata_cache(
+    data_source, sqlite_data_source, tmp_path
+):
+    data_source.metadata_cache_path = str(tmp_path / "metadata.json")
+    data_source.get_schema_columns()
+    assert data_source.catalog_queries == 1
+
+    next_run = sqlite_data_source(
+        data_source_class=CatalogSqliteDataSource,
+        metadata_cache_path=data_source.metadata_cache_path,
+    )
+    assert next_run.get_schema_columns() == COLUMNS
+    assert next_run.catalog_queries == 0
+
+
+def test_should_reflect_tables_without_catalog_query(sqlite_data_source):
+    data_source = sqlite_data_source("CREATE TABLE orders (id INTEGER, note TEXT)")
+
+    # SQLite has no information_schema
+    assert data_source.get_schema_columns() == {"orders": {"id": "int", "note": "str"}}
@@ -0,0 +1,139 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
+from dcs_core.core.datasource.pool import ConnectionPool
+from dcs_core.core.datasource.workers import map_on_connections
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(file=True, pool_size=2)
+
+
+class TestConnectionPool:
+    def test_should_open_connections_lazily_up_to_pool_size(self):
+        creator = MagicMock(side_effect=lambda: MagicMock())
+        pool = ConnectionPool(creator=creator, pool_size=2, timeout=0.01)
+
+        with pool.checkout() as first:
+            with pool.checkout() as second:
+                assert first is not second
+                with pytest.raises(DataChecksDataSourcesConnectionError):
+                    with pool.checkout():
+                        pass
+        with pool.checkout() as third:
+            assert third in (first, second)
+
+        assert creator.call_count == 2
+
+    def test_should_not_wait_for_a_connection_without_wait(self):
+        pool = ConnectionPool(creator=MagicMock, pool_size=1, timeout=5)
+
+        with pool.checkout() as connection:
+            assert pool.available == 0
+            with pool.checkout(wait=False) as other:
+                assert other is None
+        assert pool.available == 1
+        with pool.checkout(wait=False) as other:
+            assert other is connection
+
+    def test_should_replace_connection_failing_pre_ping(self):
+        dead, alive = MagicMock(), MagicMock()
+        on_replace = MagicMock()
+
+        def ping(connection):
+            if connection is dead:
+                raise Exception("connection lost")
+
+        pool = ConnectionPool(
+            creator=lambda: alive, pre_ping=True, ping=ping, on_replace=on_replace
+        )
+        pool.add(dead)
+
+        with pool.checkout() as connection:
+            assert connection is alive
+        dead.close.assert_called_once()
+        on_replace.assert_called_once_with(dead, alive)
+
+    def test_should_recycle_old_connections(self):
+        old, new = MagicMock(), MagicMock()
+        pool = ConnectionPool(creator=lambda: new, recycle=0)
+        pool.add(old)
+
+        with pool.checkout() as connection:
+            assert connection is new
+        old.close.assert_called_once()
+
+    def test_should_reset_connection_after_failed_query(self):
+        connection = MagicMock()
+        pool = ConnectionPool(creator=lambda: connection, reset=lambda c: c.rollback())
+
+        with pytest.raises(ValueError):
+            with pool.checkout():
+                raise ValueError("query failed")
+        connection.rollback.assert_called_once()
+
+
+class TestSQLDataSourceCheckout:
+    def test_should_reuse_connection_in_nested_checkout(self, data_source):
+        with data_source.checkout() as connection:
+            with data_source.checkout() as nested:
+                assert nested is connection
+                assert data_source.connection is connection
+            assert data_source.fetchone("SELECT 1")[0] == 1
+
+    def test_should_check_out_a_connection_per_thread(self, data_source):
+        barrier = threading.Barrier(2)
+        connections = []
+
+        def run():
+            with data_source.checkout() as connection:
+                barrier.wait(timeout=5)
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(connections) == 2
+        assert connections[0] is not connections[1]
+        assert data_source._connection_pool.size == 2
+
+    def test_should_map_calls_on_held_and_idle_connections(self, data_source):
+        barrier = threading.Barrier(2)
+
+        def call():
+            barrier.wait(timeout=5)
+            return (
+                data_source.connection,
+                data_source.apply_sampling("SELECT * FROM [numbers]"),
+            )
+
+        with data_source.checkout() as connection:
+            with data_source.sampling("numbers", 10):
+                results = map_on_connections([(data_source, call)] * 2)
+
+        # Both calls ran at the same time, with the sampling of the current thread
+        assert results[0][0] is not results[1][0]
+        assert connection in (results[0][0], results[1][0])
+        assert all("dcs_sample" in result[1] for result in results)
@@ -0,0 +1,67 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import MagicMock
+
+import pytest
+
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source()
+
+
+class TestQueryResultCache:
+    def test_should_execute_identical_queries_once(self, data_source, mocker):
+        data_source.enable_query_cache()
+        execute = mocker.spy(data_source, "_fetchone")
+
+        assert data_source.fetchone("SELECT 1")[0] == 1
+        assert data_source.fetchone("  SELECT 1\n")[0] == 1
+        assert data_source.fetchall("SELECT 1")[0][0] == 1
+
+        assert execute.call_count == 1
+        stats = data_source.disable_query_cache()
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    def test_should_not_share_results_of_queries_differing_in_literals(
+        self, data_source
+    ):
+        data_source.enable_query_cache()
+
+        assert data_source.fetchone("SELECT 'a  b'")[0] == "a  b"
+        assert data_source.fetchone("SELECT 'a b'")[0] == "a b"
+
+    def test_should_not_memoize_without_cache(self, data_source, mocker):
+        execute = mocker.spy(data_source, "_fetchone")
+
+        data_source.fetchone("SELECT 1")
+        data_source.fetchone("SELECT 1")
+
+        assert execute.call_count == 2
+        assert data_source.disable_query_cache() is None
+
+    def test_should_memoize_search_requests_by_body(self):
+        data_source = SearchIndexDataSource("search", {})
+        data_source.client = MagicMock()
+        data_source.client.count.return_value = {"count": 10}
+        data_source.enable_query_cache()
+
+        data_source.query_get_document_count("index", filters={"term": {"a": 1}})
+        data_source.query_get_document_count("index", filters={"term": {"a": 1}})
+        data_source.query_get_document_count("other", filters={"term": {"a": 1}})
+
+        assert data_source.client.count.call_count == 2
+        assert data_source.query_cache.stats.hits == 1
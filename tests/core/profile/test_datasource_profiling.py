@@ -12,12 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from datetime import datetime, timezone
+from typing import Dict, List
 from unittest.mock import Mock
 
 from dcs_core.core.common.models.metric import MetricsType, MetricValue
 from dcs_core.core.common.models.profile import NumericFieldProfile, TextFieldProfile
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.profiling.datasource_profiling import DataSourceProfiling
+from tests.utils import SqliteDataSource
 
 
 class TestFieldProfiling:
@@ -40,6 +43,11 @@ class TestFieldProfiling:
         mock_data_source.data_source_name.return_value = "test_data_source"
         mock_data_source.query_get_table_metadata.return_value = ["test_table"]
         mock_data_source.query_get_column_metadata.return_value = {"test_field": "int"}
+        mock_data_source.profiling_sql_aggregates_table.return_value = (
+            10,
+            {"test_field": {"distinct_count": 1}},
+        )
+        mock_data_source.pool_size = 5
 
         field_profile = DataSourceProfiling(mock_data_source)
         list_metric = field_profile.generate()
@@ -68,8 +76,150 @@ class TestFieldProfiling:
         mock_data_source.data_source_name.return_value = "test_data_source"
         mock_data_source.query_get_table_metadata.return_value = ["test_table"]
         mock_data_source.query_get_column_metadata.return_value = {"test_field": "str"}
+        mock_data_source.profiling_sql_aggregates_table.return_value = (
+            10,
+            {"test_field": {"distinct_count": 1}},
+        )
+        mock_data_source.pool_size = 5
 
         field_profile = DataSourceProfiling(mock_data_source)
         list_metric = field_profile.generate()
 
         assert len(list_metric) == 1
+
+
+class ProfilingSearchClient:
+    """
+    Answers the profiling requests of indexes with a numeric and a text field
+    """
+
+    def __init__(self, indexes: List[str]):
+        self.indexes = indexes
+        self.indices = self
+        self.get_mapping_calls = 0
+        self.search_calls = 0
+
+    def get(self, index: str) -> Dict:
+        return {index: {} for index in self.indexes + [".kibana"]}
+
+    def get_mapping(self, index: str, ignore_unavailable: bool = False) -> Dict:
+        self.get_mapping_calls += 1
+        properties = {
+            "price": {"type": "double"},
+            "name": {"type": "text", "fields": {"keyword": {"type": "keyword"}}},
+            "created_at": {"type": "date"},
+        }
+        return {
+            name: {"mappings": {"properties": properties}} for name in index.split(",")
+        }
+
+    def _search(self, body: Dict) -> Dict:
+        aggregations = {}
+        for name, aggregation in body["aggs"].items():
+            if "extended_stats" in aggregation:
+                aggregations[name] = {
+                    "avg": 2.0,
+                    "min": 1.0,
+                    "max": 3.0,
+                    "sum": 6.0,
+                    "std_deviation": 1.0,
+                    "variance_sampling": 1.0,
+                }
+            elif "missing" in aggregation:
+                aggregations[name] = {"doc_count": 0}
+            else:
+                aggregations[name] = {"value": 3}
+        return {"hits": {"total": {"value": 3}}, "aggregations": aggregations}
+
+    def search(self, index: str, body: Dict) -> Dict:
+        self.search_calls += 1
+        return self._search(body)
+
+    def msearch(self, index: str, body: List[Dict]) -> Dict:
+        self.search_calls += 1
+        return {"responses": [self._search(request) for request in body[1::2]]}
+
+
+def test_should_profile_search_indexes_with_one_request_per_index():
+    data_source = SearchIndexDataSource("search", {})
+    data_source.client = ProfilingSearchClient(["products", "orders"])
+
+    profiling = DataSourceProfiling(data_source, max_aggregations_per_request=5)
+    list_metric = profiling.generate()
+
+    assert data_source.client.get_mapping_calls == 1
+    assert data_source.client.search_calls == 2
+    assert [metrics.index_name for metrics in list_metric] == ["products", "orders"]
+    metrics = list_metric[0].metrics
+    assert metrics["search.products.document_count"].value == 3
+    assert metrics["search.products.price.max"].value == 3.0
+    assert metrics["search.products.name.avg_length"].value == 3
+    assert "search.products.created_at.max" not in metrics
+
+
+class ProfilingSqliteDataSource(SqliteDataSource):
+    """
+    Profiles tables of a SQLite database file, shared by the pooled connections of
+    the profiling workers
+    """
+
+    profiling_queries = 0
+
+    def qualified_table_name(self, table_name: str) -> str:
+        return table_name
+
+    def query_get_table_metadata(self) -> List[str]:
+        return ["customers", "orders"]
+
+    def query_get_column_metadata(self, table_name: str) -> Dict[str, str]:
+        return {"id": "int", "name": "str", "amount": "float"}
+
+    def profiling_numeric_expressions(self, column_name: str):
+        # SQLite has no sample standard deviation or variance
+        return [
+            (key, expression)
+            for key, expression in super().profiling_numeric_expressions(column_name)
+            if key not in ["stddev", "variance"]
+        ]
+
+    def fetchone(self, query: str):
+        self.profiling_queries += 1
+        return super().fetchone(query)
+
+
+def test_should_profile_sql_table_with_one_query_per_column_batch(sqlite_data_source):
+    statements = []
+    for table in ["customers", "orders"]:
+        statements += [
+            f"CREATE TABLE {table} (id INTEGER, name TEXT, amount REAL)",
+            f"INSERT INTO {table} VALUES (1, 'ab', 1.0), (2, 'abcd', NULL)",
+        ]
+    data_source = sqlite_data_source(
+        *statements, data_source_class=ProfilingSqliteDataSource, file=True
+    )
+
+    row_count, profiles = data_source.profiling_sql_aggregates_table(
+        "customers", {"id": "int", "name": "str", "created": "datetime"}
+    )
+    assert data_source.profiling_queries == 1
+    assert row_count == 2
+    assert list(profiles.keys()) == ["id", "name"]
+    assert profiles["id"]["max"] == 2
+    assert profiles["name"]["max_length"] == 4
+
+    # Row count plus 6 numeric aggregates does not fit in 8, the column moves whole
+    data_source.profiling_queries = 0
+    row_count, profiles = data_source.profiling_sql_aggregates_table(
+        "customers", {"id": "int", "amount": "float"}, max_aggregates=8
+    )
+    assert data_source.profiling_queries == 2
+    assert profiles["amount"]["missing_count"] == 1
+    assert profiles["id"]["sum"] == 3
+
+    profiling = DataSourceProfiling(data_source, max_workers=2)
+    list_metric = list(profiling.stream())
+    assert data_source.profiling_queries == 4
+    assert [metrics.table_name for metrics in list_metric] == ["customers", "orders"]
+    metrics = list_metric[1].metrics
+    assert metrics["sqlite.orders.row_count"].value == 2
+    assert metrics["sqlite.orders.name.min_length"].value == 2
@@ -0,0 +1,121 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Optional
+
+import pytest
+
+from dcs_core.core.common.models.configuration import ValidationConfig
+from dcs_core.core.utils.utils import estimate_distinct_count, estimate_duplicate_count
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.uniqueness_validation import (
+    CountDistinctValidation,
+    CountDuplicateValidation,
+)
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "approximate_test_table"
+
+
+class SampledSqliteDataSource(SqliteDataSource):
+    def random_expression(self) -> str:
+        return "0"
+
+
+class SketchSqliteDataSource(SampledSqliteDataSource):
+    APPROXIMATE_DISTINCT_ERROR = 0.01
+
+    def approximate_distinct_expression(self, field: str) -> Optional[str]:
+        return f"COUNT(DISTINCT {field})"
+
+
+def _validation(validation_class, data_source, on, **kwargs):
+    return create_validation(
+        validation_class, data_source, TABLE_NAME, on, approximate=True, **kwargs
+    )
+
+
+def _create_data_source(sqlite_data_source, data_source_class):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, name TEXT)",
+        data_source_class=data_source_class,
+    )
+    # 40 distinct names, the first 10 of them appear twice
+    data_source.insert(
+        TABLE_NAME, [(row_id, f"name-{row_id % 40}") for row_id in range(50)]
+    )
+    return data_source
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return _create_data_source(sqlite_data_source, SampledSqliteDataSource)
+
+
+@pytest.fixture
+def sketch_data_source(sqlite_data_source):
+    return _create_data_source(sqlite_data_source, SketchSqliteDataSource)
+
+
+def test_should_estimate_distinct_count_from_sample_frequencies():
+    assert estimate_distinct_count({1: 30, 2: 10}, 100) == (40, 0.0)
+
+    estimate, error = estimate_distinct_count({1: 30, 2: 10}, 25)
+    assert estimate == 70
+    assert 40 < estimate * (1 + error)
+    assert estimate * (1 - error) <= 40
+
+    assert estimate_duplicate_count({1: 30, 2: 10}, 40, 0.0) == (10, 0.0)
+    assert estimate_duplicate_count({1: 10}, 40, 0.01) == (0, 0.01)
+
+
+def test_should_count_duplicates_in_the_database(data_source):
+    assert data_source.query_get_duplicate_count(TABLE_NAME, "name") == 10
+    assert data_source.query_get_value_frequencies(TABLE_NAME, "name") == {1: 30, 2: 10}
+
+
+def test_should_fall_back_to_sample_without_sketch(data_source):
+    distinct = _validation(
+        CountDistinctValidation, data_source, "count_distinct(name)", sample=100
+    )
+    duplicate = _validation(
+        CountDuplicateValidation, data_source, "count_duplicate(name)", sample=100
+    )
+    groups, remaining = FusedScanPlanner().plan([distinct])
+    assert groups == [] and remaining == [distinct]
+
+    distinct_info = distinct.get_validation_info()
+    assert distinct_info.value == 40
+    assert distinct_info.estimated_error == 0.0
+
+    duplicate_info = duplicate.get_validation_info()
+    assert duplicate_info.value == 10
+    assert duplicate_info.estimated_error == 0.0
+
+
+def test_should_use_dialect_sketch(sketch_data_source):
+    distinct = _validation(
+        CountDistinctValidation, sketch_data_source, "count_distinct(name)"
+    )
+    groups, remaining = FusedScanPlanner().plan([distinct])
+    assert remaining == []
+
+    validation_info = list(groups[0].execute().values())[0]
+    assert validation_info.value == 40
+    assert validation_info.estimated_error == 0.01
+    assert distinct.get_validation_info().estimated_error == 0.01
+
+
+def test_should_reject_approximate_on_other_validations():
+    with pytest.raises(ValueError):
+        ValidationConfig(name="rows", on="count_rows", approximate=True)
@@ -0,0 +1,275 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import functools
+import hashlib
+from typing import Optional
+
+import pytest
+
+from dcs_core.core.common.errors import DataChecksRuntimeError
+from dcs_core.core.common.models.configuration import ExecutionConfiguration
+from dcs_core.core.validation.data_diff import DiffSide, HashDiff, KeyRange
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.reliability_validation import DeltaDiffValidation
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "diff_test_table"
+REFERENCE_TABLE_NAME = "diff_reference_table"
+
+
+def _hash(value: str) -> int:
+    # SQLite has no MD5, 8 digits keep the sum of the hashes in a 64 bit integer
+    return int(hashlib.md5(value.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class DiffSqliteDataSource(SqliteDataSource):
+    functions = {"MD5_HASH": _hash}
+
+    def hash_expression(self, expression: str) -> Optional[str]:
+        return f"MD5_HASH({expression})"
+
+    def modulo_expression(self, expression: str, modulus: int) -> str:
+        return f"({expression}) % {modulus}"
+
+
+class IsoSqliteDataSource(DiffSqliteDataSource):
+    """
+    Stores timestamps as ISO text
+    """
+
+    def timestamp_text_expression(self, field: str) -> str:
+        return f"STRFTIME('%Y-%m-%d %H:%M:%f', {field}) || '000'"
+
+    def numeric_text_expression(self, field: str) -> str:
+        return f"PRINTF('%.10f', {field})"
+
+
+class EpochSqliteDataSource(IsoSqliteDataSource):
+    """
+    Stores timestamps as seconds since the epoch
+    """
+
+    def timestamp_text_expression(self, field: str) -> str:
+        return f"STRFTIME('%Y-%m-%d %H:%M:%f', {field}, 'unixepoch') || '000'"
+
+
+def _data_source(sqlite_data_source, name, **connection):
+    return sqlite_data_source(
+        *[
+            f"CREATE TABLE {table} (id INTEGER, name TEXT, amount REAL)"
+            for table in (TABLE_NAME, REFERENCE_TABLE_NAME)
+        ],
+        name=name,
+        data_source_class=DiffSqliteDataSource,
+        file=True,
+        **connection,
+    )
+
+
+def _insert_rows(source, reference, reference_dataset: str = TABLE_NAME):
+    rows = [(i, f"name{i}", i * 10.0) for i in range(1, 201)]
+    reference.insert(reference_dataset, rows)
+    changed = {17: (17, "changed", 170.0), 150: (150, "name150", None)}
+    source.insert(
+        TABLE_NAME,
+        [changed.get(row[0], row) for row in rows if row[0] not in (42, 43)]
+        + [(250, "new", 1.0)],
+    )
+
+
+@pytest.fixture
+def data_sources(sqlite_data_source):
+    source = _data_source(sqlite_data_source, "source")
+    reference = _data_source(sqlite_data_source, "reference")
+    _insert_rows(source, reference)
+    return source, reference
+
+
+def _side(data_source):
+    return DiffSide(
+        data_source=data_source,
+        dataset=TABLE_NAME,
+        key="id",
+        fields=["id", "name", "amount"],
+    )
+
+
+def test_should_split_key_range_into_segments():
+    segments = KeyRange(1, 10).split(3)
+
+    assert segments == [
+        KeyRange(1, 4, upper_inclusive=False),
+        KeyRange(4, 7, upper_inclusive=False),
+        KeyRange(7, 10, upper_inclusive=True),
+    ]
+    assert KeyRange(5, 5).split(3) is None
+
+
+def test_should_bisect_only_differing_segments(data_sources, mocker):
+    source, reference = data_sources
+    row_hashes = mocker.spy(source, "query_get_row_hashes")
+
+    result = HashDiff(
+        source=_side(source), reference=_side(reference), segments=4, leaf_rows=10
+    ).diff()
+
+    assert result.source_count == 199
+    assert result.reference_count == 200
+    assert result.missing_count == 2
+    assert result.extra_count == 1
+    assert result.mismatched_count == 2
+    assert sorted(result.sample, key=lambda sample: sample["key"]) == [
+        {"key": 17, "status": "mismatched"},
+        {"key": 42, "status": "missing"},
+        {"key": 43, "status": "missing"},
+        {"key": 150, "status": "mismatched"},
+        {"key": 250, "status": "extra"},
+    ]
+    # Keys are only compared in the few segments holding a difference
+    compared = sum(len(hashes) for hashes in row_hashes.spy_return_list)
+    assert compared < 40
+
+
+def test_should_bisect_string_keys_by_their_hash(sqlite_data_source, mocker):
+    statement = f"CREATE TABLE {TABLE_NAME} (code TEXT, amount REAL)"
+    source, reference = [
+        sqlite_data_source(
+            statement, name=name, data_source_class=DiffSqliteDataSource, file=True
+        )
+        for name in ("source", "reference")
+    ]
+    rows = [(f"code-{i:03}", i * 10.0) for i in range(300)]
+    reference.insert(TABLE_NAME, rows)
+    source.insert(
+        TABLE_NAME,
+        [
+            (code, 1.0) if code == "code-123" else (code, amount)
+            for code, amount in rows
+        ],
+    )
+    row_hashes = mocker.spy(source, "query_get_row_hashes")
+
+    side = functools.partial(
+        DiffSide, dataset=TABLE_NAME, key="code", fields=["amount"]
+    )
+    result = HashDiff(
+        source=side(source), reference=side(reference), segments=4, leaf_rows=10
+    ).diff()
+
+    assert result.sample == [{"key": "code-123", "status": "mismatched"}]
+    assert sum(len(hashes) for hashes in row_hashes.spy_return_list) <= 10
+
+
+def test_should_refuse_segments_too_large_to_compare(sqlite_data_source):
+    source, reference = [
+        _data_source(sqlite_data_source, name) for name in ("source", "reference")
+    ]
+    reference.insert(TABLE_NAME, [(1, "thor", float(i)) for i in range(30)])
+    source.insert(TABLE_NAME, [(1, "odin", float(i)) for i in range(30)])
+
+    with pytest.raises(DataChecksRuntimeError):
+        HashDiff(
+            source=_side(source),
+            reference=_side(reference),
+            leaf_rows=5,
+            max_leaf_rows=20,
+        ).diff()
+
+
+def _validation(source, reference, reference_dataset: str = TABLE_NAME):
+    return create_validation(
+        DeltaDiffValidation,
+        source,
+        TABLE_NAME,
+        "delta diff(id)",
+        ref=f"{reference.data_source_name}.{reference_dataset}",
+        reference_data_source=reference,
+        reference_dataset_name=reference_dataset,
+    )
+
+
+def test_should_report_differences_as_delta_validation(data_sources):
+    source, reference = data_sources
+
+    validation_info = _validation(*data_sources).get_validation_info()
+
+    assert validation_info.value == 5
+    assert validation_info.source_value == 199
+    assert validation_info.reference_value == 200
+    assert validation_info.missing_count == 2
+    assert len(validation_info.diff_sample) == 5
+
+
+@pytest.mark.parametrize("same_data_source", [False, True])
+def test_should_diff_in_a_task_with_a_single_pooled_connection(
+    sqlite_data_source, same_data_source
+):
+    pool = {"pool_size": 1, "pool_timeout": 1}
+    source = _data_source(sqlite_data_source, "source", **pool)
+    if same_data_source:
+        reference, reference_dataset = source, REFERENCE_TABLE_NAME
+    else:
+        reference = _data_source(sqlite_data_source, "reference", **pool)
+        reference_dataset = TABLE_NAME
+    _insert_rows(source, reference, reference_dataset)
+    validation = _validation(source, reference, reference_dataset)
+
+    validation_info = list(
+        ValidationExecutor(ExecutionConfiguration(max_workers=2))
+        .run([validation])
+        .values()
+    )[0]
+
+    assert validation_info.value == 5
+
+
+def test_should_hash_the_same_values_of_two_dialects_alike(sqlite_data_source):
+    statement = (
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, updated_at TIMESTAMP, amount REAL)"
+    )
+    source = sqlite_data_source(
+        statement, name="source", data_source_class=IsoSqliteDataSource, file=True
+    )
+    source.insert(
+        TABLE_NAME, [(1, "2024-01-01 00:00:00", 10), (2, "2024-01-01 10:30:00.5", 1.5)]
+    )
+    reference = sqlite_data_source(
+        statement,
+        name="reference",
+        data_source_class=EpochSqliteDataSource,
+        file=True,
+    )
+    reference.insert(TABLE_NAME, [(1, 1704067200, 10.0), (2, 1704105000.5, 1.25)])
+
+    texts = []
+    for data_source in (source, reference):
+        timestamp = data_source.normalized_text_expression("updated_at", "datetime")
+        amount = data_source.normalized_text_expression("amount", "float")
+        texts.append(
+            data_source.fetchall(
+                f"SELECT {timestamp}, {amount} FROM {TABLE_NAME} ORDER BY id"
+            )
+        )
+    assert texts[0] == [
+        ("2024-01-01 00:00:00.000000", "10.0000000000"),
+        ("2024-01-01 10:30:00.500000", "1.5000000000"),
+    ]
+    assert texts[1][0] == texts[0][0]
+
+    side = functools.partial(
+        DiffSide, dataset=TABLE_NAME, key="id", fields=["updated_at", "amount"]
+    )
+    result = HashDiff(source=side(source), reference=side(reference)).diff()
+
+    assert result.sample == [{"key": 2, "status": "mismatched"}]
@@ -0,0 +1,133 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import threading
+
+import pytest
+
+from dcs_core.core.common.models.configuration import ExecutionConfiguration
+from dcs_core.core.common.models.validation import ValidationFunction
+from dcs_core.core.validation.completeness_validation import DeltaCountNullValidation
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.numeric_validation import (
+    DeltaAvgValidation,
+    DeltaSumValidation,
+)
+from dcs_core.core.validation.reliability_validation import DeltaCountRowValidation
+from dcs_core.core.validation.uniqueness_validation import DeltaCountDistinctValidation
+from tests.utils import create_validation
+
+TABLE_NAME = "delta_test_table"
+
+
+def _data_sources(sqlite_data_source, **connection):
+    data_sources = []
+    for name, rows in [
+        ("source", [(1, "thor", 10.0), (2, None, 20.0), (3, "thor", 30.0)]),
+        ("reference", [(1, "thor", 10.0), (2, "odin", 25.0)]),
+    ]:
+        data_source = sqlite_data_source(
+            f"CREATE TABLE {TABLE_NAME} (id INTEGER, name TEXT, amount REAL)",
+            name=name,
+            file=True,
+            **connection,
+        )
+        data_source.insert(TABLE_NAME, rows)
+        data_sources.append(data_source)
+    return tuple(data_sources)
+
+
+@pytest.fixture
+def data_sources(sqlite_data_source):
+    return _data_sources(sqlite_data_source)
+
+
+def _validation(validation_class, data_sources, on):
+    source, reference = data_sources
+    return create_validation(
+        validation_class,
+        source,
+        TABLE_NAME,
+        on,
+        ref=f"reference.{TABLE_NAME}",
+        reference_data_source=reference,
+        reference_dataset_name=TABLE_NAME,
+    )
+
+
+@pytest.mark.parametrize(
+    "validation_class, on, function, expected",
+    [
+        (DeltaSumValidation, "delta sum(amount)", ValidationFunction.DELTA_SUM, 25),
+        (DeltaAvgValidation, "delta avg(amount)", ValidationFunction.DELTA_AVG, 2.5),
+        (
+            DeltaCountNullValidation,
+            "delta count_null(name)",
+            ValidationFunction.DELTA_COUNT_NULL,
+            1,
+        ),
+        (
+            DeltaCountDistinctValidation,
+            "delta count_distinct(name)",
+            ValidationFunction.DELTA_COUNT_DISTINCT,
+            1,
+        ),
+    ],
+)
+def test_should_compute_delta_of_aggregate(
+    data_sources, validation_class, on, function, expected
+):
+    validation = _validation(validation_class, data_sources, on)
+
+    validation_info = validation.get_validation_info()
+
+    assert validation_info.validation_function == function
+    assert validation_info.value == pytest.approx(expected)
+
+
+def test_should_query_both_sides_at_the_same_time(data_sources, mocker):
+    source, reference = data_sources
+    # Each side waits for the other one, a sequential evaluation breaks the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waiting(query_get_sum):
+        def query(**kwargs):
+            barrier.wait()
+            return query_get_sum(**kwargs)
+
+        return query
+
+    mocker.patch.object(source, "query_get_sum", waiting(source.query_get_sum))
+    mocker.patch.object(reference, "query_get_sum", waiting(reference.query_get_sum))
+    validation = _validation(DeltaSumValidation, data_sources, "delta sum(amount)")
+
+    validation_info = validation.get_validation_info()
+
+    assert validation_info.source_value == 60
+    assert validation_info.reference_value == 35
+
+
+def test_should_run_delta_tasks_with_a_single_pooled_connection(sqlite_data_source):
+    data_sources = _data_sources(sqlite_data_source, pool_size=1, pool_timeout=1)
+    validations = [
+        _validation(DeltaSumValidation, data_sources, "delta sum(amount)"),
+        _validation(DeltaCountRowValidation, data_sources, "delta count_rows"),
+    ]
+
+    validation_infos = list(
+        ValidationExecutor(ExecutionConfiguration(max_workers=2))
+        .run(validations)
+        .values()
+    )
+
+    assert [info.value for info in validation_infos] == [25, 1]
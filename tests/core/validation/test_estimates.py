@@ -0,0 +1,134 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from dcs_core.core.common.models.configuration import ValidationConfig
+from dcs_core.core.common.models.data_source_resource import (
+    ColumnStatistics,
+    TableStatistics,
+)
+from dcs_core.core.configuration.configuration_parser import (
+    load_configuration_from_yaml_str,
+)
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.reliability_validation import CountRowValidation
+from dcs_core.core.validation.uniqueness_validation import CountDistinctValidation
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "estimate_test_table"
+ANALYZED_AT = datetime(2024, 1, 1)
+
+
+class AnalyzedSqliteDataSource(SqliteDataSource):
+    """
+    Reads the row count and the distinct count of indexed columns from the
+    sqlite_stat1 table written by ANALYZE
+    """
+
+    statistics_queries = 0
+
+    def qualified_table_name(self, table_name: str) -> str:
+        return table_name
+
+    def query_get_table_statistics(self, table: str) -> Optional[TableStatistics]:
+        self.statistics_queries += 1
+        statistics = TableStatistics(updated_at=ANALYZED_AT)
+        for index_name, stat in self.fetchall(
+            f"SELECT idx, stat FROM sqlite_stat1 WHERE tbl = '{table}'"
+        ):
+            # Row count followed by the average number of rows per indexed value
+            row_count, rows_per_value = [int(value) for value in stat.split()[:2]]
+            statistics.row_count = row_count
+            if index_name == "country_index":
+                statistics.columns["country"] = ColumnStatistics(
+                    distinct_count=round(row_count / rows_per_value)
+                )
+        return statistics
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, country TEXT)",
+        f"CREATE INDEX country_index ON {TABLE_NAME} (country)",
+        f"INSERT INTO {TABLE_NAME} VALUES (0, 'IN'), (1, 'US'), (2, NULL), "
+        "(3, NULL), (4, 'IN'), (5, 'US'), (6, NULL), (7, NULL)",
+        "ANALYZE",
+        data_source_class=AnalyzedSqliteDataSource,
+    )
+
+
+def _validation(validation_class, data_source, on, **kwargs):
+    return create_validation(
+        validation_class, data_source, TABLE_NAME, on, estimate=True, **kwargs
+    )
+
+
+def test_should_answer_validations_from_statistics(data_source):
+    rows = _validation(CountRowValidation, data_source, "count_rows")
+    distinct = _validation(
+        CountDistinctValidation, data_source, "count_distinct(country)"
+    )
+    groups, remaining = FusedScanPlanner().plan([rows, distinct])
+    assert groups == [] and remaining == [rows, distinct]
+
+    rows_info = rows.get_validation_info()
+    assert rows_info.value == 8
+    assert rows_info.statistics_updated_at == ANALYZED_AT
+
+    # NULL is a distinct value of the index statistics
+    distinct_info = distinct.get_validation_info()
+    assert distinct_info.value == 3
+    assert distinct_info.statistics_updated_at == ANALYZED_AT
+    assert data_source.statistics_queries == 1
+
+
+def test_should_scan_without_column_statistics(data_source):
+    null_count = _validation(CountNullValidation, data_source, "count_null(country)")
+    null_percentage = _validation(
+        PercentageNullValidation, data_source, "percent_null(country)"
+    )
+
+    null_count_info = null_count.get_validation_info()
+    assert null_count_info.value == 4
+    assert null_count_info.statistics_updated_at is None
+    assert null_percentage.get_validation_info().value == 50
+
+
+def test_should_only_estimate_whole_table_metrics():
+    with pytest.raises(ValueError):
+        ValidationConfig(name="avg", on="avg(id)", estimate=True)
+    with pytest.raises(ValueError):
+        ValidationConfig(name="rows", on="count_rows", estimate=True, where="id > 1")
+
+
+def test_should_not_apply_dataset_sample_to_estimates():
+    yaml_string = f"""
+    sample for sqlite.{TABLE_NAME}:
+      percent: 5
+    validations for sqlite.{TABLE_NAME}:
+      - rows:
+          on: count_rows
+          estimate: true
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validation = configuration.validations[f"sqlite.{TABLE_NAME}"].validations["rows"]
+    assert validation.sample is None
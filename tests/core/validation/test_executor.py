@@ -0,0 +1,153 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+from dcs_core.core.common.models.configuration import (
+    DataSourceLanguageSupport,
+    ExecutionConfiguration,
+    ValidationConfig,
+)
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.executor import ValidationExecutor
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = defaultdict(int)
+        self.max_running = defaultdict(int)
+        self.total_running = 0
+        self.max_total_running = 0
+
+    def enter(self, name: str):
+        with self.lock:
+            self.running[name] += 1
+            self.total_running += 1
+            self.max_running[name] = max(self.max_running[name], self.running[name])
+            self.max_total_running = max(self.max_total_running, self.total_running)
+
+    def exit(self, name: str):
+        with self.lock:
+            self.running[name] -= 1
+            self.total_running -= 1
+
+
+class SleepingValidation(Validation):
+    def __init__(self, name: str, data_source_name: str, tracker: ConcurrencyTracker):
+        data_source = MagicMock()
+        data_source.data_source_name = data_source_name
+        data_source.language_support = DataSourceLanguageSupport.SQL
+        super().__init__(
+            name=name,
+            validation_config=ValidationConfig(name=name, on="count_rows"),
+            data_source=data_source,
+            dataset_name="table",
+        )
+        self.tracker = tracker
+
+    def _generate_metric_value(self, **kwargs):
+        self.tracker.enter(self.data_source.data_source_name)
+        time.sleep(0.05)
+        self.tracker.exit(self.data_source.data_source_name)
+        return int(self.name.split("_")[-1])
+
+
+def _validations(tracker, data_source_names, count):
+    return [
+        SleepingValidation(f"{name}_{i}", name, tracker)
+        for i in range(count)
+        for name in data_source_names
+    ]
+
+
+class TestValidationExecutor:
+    def test_should_run_validations_sequentially_by_default(self):
+        tracker = ConcurrencyTracker()
+        validations = _validations(tracker, ["a", "b"], 2)
+
+        validation_infos = ValidationExecutor().run(validations)
+
+        assert tracker.max_total_running == 1
+        assert len(validation_infos) == 4
+
+    def test_should_keep_validation_order(self):
+        tracker = ConcurrencyTracker()
+        validations = _validations(tracker, ["a", "b", "c"], 3)
+
+        validation_infos = ValidationExecutor(
+            ExecutionConfiguration(max_workers=4)
+        ).run(validations)
+
+        assert list(validation_infos.keys()) == [
+            v.get_validation_identity() for v in validations
+        ]
+        assert [info.value for info in validation_infos.values()] == [
+            int(v.name.split("_")[-1]) for v in validations
+        ]
+
+    def test_should_respect_global_and_data_source_limits(self):
+        tracker = ConcurrencyTracker()
+        validations = _validations(tracker, ["a", "b", "c"], 4)
+
+        ValidationExecutor(
+            ExecutionConfiguration(
+                max_workers=3,
+                max_workers_per_data_source=1,
+                data_source_max_workers={"a": 2},
+            )
+        ).run(validations)
+
+        assert tracker.max_total_running <= 3
+        assert tracker.max_running["a"] <= 2
+        assert tracker.max_running["b"] == 1
+        assert tracker.max_running["c"] == 1
+        assert tracker.max_total_running > 1
+
+    def test_should_return_none_for_failed_validation(self, mocker):
+        tracker = ConcurrencyTracker()
+        validations = _validations(tracker, ["a", "b"], 1)
+        mocker.patch.object(
+            validations[0], "_generate_metric_value", side_effect=Exception("fail")
+        )
+
+        validation_infos = ValidationExecutor(
+            ExecutionConfiguration(max_workers=2)
+        ).run(validations)
+
+        assert validation_infos[validations[0].get_validation_identity()] is None
+        assert validation_infos[validations[1].get_validation_identity()] is not None
+
+    def test_should_run_validations_from_event_loop(self):
+        tracker = ConcurrencyTracker()
+        validations = _validations(tracker, ["a", "b", "c"], 3)
+
+        validation_infos = asyncio.run(
+            ValidationExecutor(
+                ExecutionConfiguration(
+                    max_workers=2,
+                    max_workers_per_data_source=1,
+                )
+            ).run_async(validations)
+        )
+
+        assert list(validation_infos.keys()) == [
+            v.get_validation_identity() for v in validations
+        ]
+        assert tracker.max_total_running <= 2
+        assert all(count == 1 for count in tracker.max_running.values())
+        assert tracker.max_total_running > 1
@@ -0,0 +1,88 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+
+from dcs_core.core.common.errors import DataChecksRuntimeError
+from dcs_core.core.validation.reliability_validation import FreshnessValueMetric
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "freshness_test_table"
+
+
+class CatalogSqliteDataSource(SqliteDataSource):
+    """
+    Keeps the modification time of its tables in a table_changes catalog table
+    """
+
+    catalog_queries = 0
+
+    def qualified_table_name(self, table_name: str) -> str:
+        return table_name
+
+    def quote_column(self, column: str) -> str:
+        return column
+
+    def query_get_last_modified_query(self) -> Optional[str]:
+        self.catalog_queries += 1
+        return "SELECT table_name, datetime(changed_at) FROM table_changes"
+
+    def fetchall(self, query: str):
+        # SQLite returns timestamps as text
+        return [
+            (row[0], datetime.fromisoformat(row[1])) for row in super().fetchall(query)
+        ]
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, updated_at TIMESTAMP)",
+        "CREATE TABLE table_changes (table_name TEXT, changed_at TIMESTAMP)",
+        data_source_class=CatalogSqliteDataSource,
+    )
+    now = datetime.utcnow()
+    data_source.insert(
+        TABLE_NAME,
+        [
+            (row_id, now - timedelta(seconds=age) if age else None)
+            for row_id, age in enumerate([3600, 60, None])
+        ],
+    )
+    data_source.insert(
+        "table_changes", [(TABLE_NAME.upper(), now - timedelta(seconds=600))]
+    )
+    return data_source
+
+
+def test_should_read_freshness_of_tables_from_the_catalog(data_source):
+    validation = create_validation(
+        FreshnessValueMetric, data_source, TABLE_NAME, "freshness"
+    )
+    assert validation.field_name is None
+    assert 595 <= validation.get_validation_info().value <= 605
+    assert 595 <= data_source.query_get_table_freshness(TABLE_NAME) <= 605
+    assert data_source.catalog_queries == 1
+
+    with pytest.raises(DataChecksRuntimeError):
+        data_source.query_get_table_freshness("missing_table")
+
+
+def test_should_use_the_latest_non_null_timestamp(data_source):
+    validation = create_validation(
+        FreshnessValueMetric, data_source, TABLE_NAME, "freshness(updated_at)"
+    )
+    assert 55 <= validation.get_validation_info().value <= 65
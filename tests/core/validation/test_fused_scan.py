@@ -0,0 +1,175 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from dcs_core.core.validation.completeness_validation import (
+    CountEmptyStringValidation,
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.custom_query_validation import CustomSqlValidation
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.numeric_validation import (
+    AvgValidation,
+    CountZeroValidation,
+    MaxValidation,
+    MinValidation,
+    PercentZeroValidation,
+    SumValidation,
+)
+from dcs_core.core.validation.reliability_validation import CountRowValidation
+from dcs_core.core.validation.uniqueness_validation import CountDistinctValidation
+from dcs_core.core.validation.validity_validation import (
+    CountValidValues,
+    StringLengthMaxValidation,
+)
+from tests.utils import create_validation
+
+TABLE_NAME = "fused_scan_test_table"
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (name TEXT, age INTEGER, score REAL)",
+        f"INSERT INTO {TABLE_NAME} VALUES "
+        "('thor', 1500, 10.5), ('loki', 1000, 0), ('', 0, -2.25), "
+        "(NULL, 40, NULL), ('odin', 5000, 7.75)",
+    )
+
+
+@pytest.fixture
+def validations(data_source):
+    return [
+        create_validation(CountRowValidation, data_source, TABLE_NAME, "count_rows"),
+        create_validation(MinValidation, data_source, TABLE_NAME, "min(age)"),
+        create_validation(MaxValidation, data_source, TABLE_NAME, "max(age)"),
+        create_validation(AvgValidation, data_source, TABLE_NAME, "avg(score)"),
+        create_validation(SumValidation, data_source, TABLE_NAME, "sum(score)"),
+        create_validation(
+            CountNullValidation, data_source, TABLE_NAME, "count_null(name)"
+        ),
+        create_validation(
+            PercentageNullValidation, data_source, TABLE_NAME, "percent_null(name)"
+        ),
+        create_validation(
+            CountEmptyStringValidation,
+            data_source,
+            TABLE_NAME,
+            "count_empty_string(name)",
+        ),
+        create_validation(
+            CountZeroValidation, data_source, TABLE_NAME, "count_zero(age)"
+        ),
+        create_validation(
+            PercentZeroValidation, data_source, TABLE_NAME, "percent_zero(age)"
+        ),
+        create_validation(
+            CountDistinctValidation, data_source, TABLE_NAME, "count_distinct(name)"
+        ),
+        create_validation(
+            CountValidValues,
+            data_source,
+            TABLE_NAME,
+            "count_valid_values(name)",
+            values=["thor", "odin"],
+        ),
+        create_validation(
+            StringLengthMaxValidation,
+            data_source,
+            TABLE_NAME,
+            "string_length_max(name)",
+        ),
+    ]
+
+
+class TestFusedScanPlanner:
+    def test_should_fuse_validations_of_a_dataset_into_one_query(
+        self, data_source, validations, mocker
+    ):
+        groups, remaining = FusedScanPlanner().plan(validations)
+
+        assert remaining == []
+        assert len(groups) == 1
+
+        fetchone = mocker.spy(data_source, "fetchone")
+        validation_infos = groups[0].execute()
+
+        assert fetchone.call_count == 1
+        assert len(validation_infos) == len(validations)
+
+    def test_should_match_per_validation_results(self, validations):
+        expected = {
+            validation.get_validation_identity(): validation.get_validation_info().value
+            for validation in validations
+        }
+        groups, _ = FusedScanPlanner().plan(validations)
+        fused = {
+            identity: validation_info.value
+            for identity, validation_info in groups[0].execute().items()
+        }
+
+        assert fused == expected
+
+    def test_should_split_aggregates_in_batches(self, data_source, validations, mocker):
+        groups, _ = FusedScanPlanner(max_aggregates_per_query=5).plan(validations)
+
+        fetchone = mocker.spy(data_source, "fetchone")
+        groups[0].execute()
+
+        # null and zero counts are shared by the count and percent validations
+        assert len(groups[0].aggregates) == 11
+        assert fetchone.call_count == 3
+
+    def test_should_group_by_where_filter(self, data_source):
+        validations = [
+            create_validation(MinValidation, data_source, TABLE_NAME, "min(age)"),
+            create_validation(
+                MaxValidation, data_source, TABLE_NAME, "max(age)", where="score > 0"
+            ),
+            create_validation(
+                SumValidation, data_source, TABLE_NAME, "sum(score)", where="score > 0"
+            ),
+        ]
+        groups, _ = FusedScanPlanner().plan(validations)
+
+        assert len(groups) == 2
+        assert [len(group.validations) for group in groups] == [1, 2]
+
+    def test_should_leave_unsupported_validations_to_per_validation_run(
+        self, data_source
+    ):
+        custom_sql = create_validation(
+            CustomSqlValidation,
+            data_source,
+            TABLE_NAME,
+            "custom_sql",
+            query=f"SELECT COUNT(*) FROM {TABLE_NAME}",
+        )
+        groups, remaining = FusedScanPlanner().plan([custom_sql])
+
+        assert groups == []
+        assert remaining == [custom_sql]
+
+    def test_should_fall_back_when_fused_query_fails(
+        self, data_source, validations, mocker
+    ):
+        groups, _ = FusedScanPlanner().plan(validations)
+        mocker.patch.object(
+            data_source, "query_get_aggregates", side_effect=Exception("failed")
+        )
+
+        validation_infos = groups[0].execute()
+
+        assert all(info is not None for info in validation_infos.values())
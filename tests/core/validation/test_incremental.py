@@ -0,0 +1,147 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import datetime
+
+import pytest
+
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.incremental import IncrementalScan
+from dcs_core.core.validation.numeric_validation import (
+    AvgValidation,
+    MaxValidation,
+    SumValidation,
+)
+from dcs_core.core.validation.reliability_validation import CountRowValidation
+from dcs_core.integrations.databases.oracle import OracleDataSource
+from dcs_core.integrations.storage.local_file import LocalFileWatermarkRepository
+from tests.utils import create_validation
+
+TABLE_NAME = "incremental_test_table"
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, name TEXT, score REAL)"
+    )
+    data_source.insert(TABLE_NAME, [(1, "thor", 10.5), (2, None, 1.5)])
+    return data_source
+
+
+@pytest.fixture
+def validations(data_source):
+    return [
+        create_validation(CountRowValidation, data_source, TABLE_NAME, "count_rows"),
+        create_validation(SumValidation, data_source, TABLE_NAME, "sum(score)"),
+        create_validation(MaxValidation, data_source, TABLE_NAME, "max(score)"),
+        create_validation(
+            CountNullValidation, data_source, TABLE_NAME, "count_null(name)"
+        ),
+        create_validation(
+            PercentageNullValidation, data_source, TABLE_NAME, "percent_null(name)"
+        ),
+    ]
+
+
+def _run(validations, tmp_path):
+    incremental = {
+        f"sqlite.{TABLE_NAME}": IncrementalScan(
+            watermark="id", repository=LocalFileWatermarkRepository(str(tmp_path))
+        )
+    }
+    groups, _ = FusedScanPlanner(incremental=incremental).plan(validations)
+    values = {}
+    for group in groups:
+        for identity, validation_info in group.execute().items():
+            values[identity] = validation_info.value
+    return values
+
+
+class TestIncrementalScan:
+    def test_should_combine_new_rows_with_previous_state(
+        self, data_source, validations, tmp_path, mocker
+    ):
+        _run(validations, tmp_path)
+        data_source.insert(TABLE_NAME, [(3, None, 4.0), (4, "odin", 20.0)])
+
+        query_get_aggregates = mocker.spy(data_source, "query_get_aggregates")
+        incremental = _run(validations, tmp_path)
+        expected = {
+            v.get_validation_identity(): v.get_validation_info().value
+            for v in validations
+        }
+
+        assert incremental == expected
+        assert query_get_aggregates.call_args.kwargs["filters"] == "[id] > 2"
+
+    def test_should_persist_high_water_mark(self, validations, tmp_path):
+        _run(validations, tmp_path)
+
+        state = LocalFileWatermarkRepository(str(tmp_path)).get_state(
+            f"sqlite.{TABLE_NAME}"
+        )
+
+        # percent_null shares the null and row counts
+        assert state.watermark == 2
+        assert len(state.aggregates) == 4
+
+    def test_should_scan_non_combinable_aggregates_in_full(self, data_source, tmp_path):
+        avg = create_validation(AvgValidation, data_source, TABLE_NAME, "avg(score)")
+        incremental = {
+            f"sqlite.{TABLE_NAME}": IncrementalScan(
+                watermark="id", repository=LocalFileWatermarkRepository(str(tmp_path))
+            )
+        }
+
+        groups, _ = FusedScanPlanner(incremental=incremental).plan([avg])
+
+        assert groups[0].incremental is None
+
+    def test_should_render_timestamp_watermark_as_dialect_literal(self, tmp_path):
+        data_source = OracleDataSource("oracle", {})
+        incremental = IncrementalScan(
+            watermark="UPDATED_AT",
+            repository=LocalFileWatermarkRepository(str(tmp_path)),
+        )
+        row_count = ScanAggregate(type=AggregateType.ROW_COUNT)
+        filters = []
+
+        def compute_aggregates(aggregates, where_filter):
+            filters.append(where_filter)
+            return {
+                aggregate: datetime(2024, 5, 1, 10, 0, 0, 123000)
+                if aggregate.type == AggregateType.MAX
+                else 2
+                for aggregate in aggregates
+            }
+
+        incremental.compute(
+            data_source, "ORDERS", None, [row_count], compute_aggregates
+        )
+        incremental.compute(
+            data_source, "ORDERS", None, [row_count], compute_aggregates
+        )
+        state = incremental.repository.get_state("oracle.ORDERS")
+
+        assert filters[1] == (
+            "\"UPDATED_AT\" > TO_TIMESTAMP('2024-05-01 10:00:00.123000', "
+            "'YYYY-MM-DD HH24:MI:SS.FF6')"
+        )
+        assert state.watermark == "2024-05-01T10:00:00.123000"
+        assert state.watermark_type == "datetime"
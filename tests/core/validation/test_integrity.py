@@ -0,0 +1,187 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from dcs_core.core.common.models.data_source_resource import ForeignKey
+from dcs_core.core.validation.integrity_validation import OrphanCountValidation
+from dcs_core.core.validation.key_existence import (
+    BloomFilter,
+    KeyBitmap,
+    KeyExistenceCheck,
+)
+from dcs_core.core.validation.result_cache import ValidationResultCache
+from tests.utils import create_validation
+
+STATEMENTS = [
+    "CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)",
+    "CREATE TABLE products (code TEXT, region TEXT, PRIMARY KEY (code, region))",
+    "CREATE TABLE orders (id INTEGER, customer_id INTEGER REFERENCES customers (id),"
+    " product_code TEXT, product_region TEXT,"
+    " FOREIGN KEY (product_code, product_region) REFERENCES products (code, region))",
+    "INSERT INTO customers VALUES (1, 'thor'), (2, 'odin')",
+    "INSERT INTO products VALUES ('hammer', 'asgard'), ('spear', 'asgard')",
+    "INSERT INTO orders VALUES (1, 1, 'hammer', 'asgard'), (2, 3, 'spear', 'asgard'),"
+    " (3, NULL, 'hammer', 'midgard'), (4, 4, 'shield', NULL),"
+    " (5, 2, 'spear', 'midgard')",
+]
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(*STATEMENTS, file=True)
+
+
+@pytest.fixture
+def reference_data_source(sqlite_data_source):
+    return sqlite_data_source(
+        "CREATE TABLE customers (id INTEGER, code TEXT)",
+        "INSERT INTO customers VALUES (1, 'c1'), (2, 'c2'), (5, 'c5'), (6, 'c6')",
+        name="warehouse",
+        file=True,
+    )
+
+
+def test_should_group_composite_foreign_key_columns(data_source):
+    foreign_keys = sorted(
+        data_source.get_table_foreign_keys("orders"),
+        key=lambda foreign_key: foreign_key.referenced_table,
+    )
+
+    assert [
+        (fk.columns, fk.referenced_table, fk.referenced_columns) for fk in foreign_keys
+    ] == [
+        (["customer_id"], "customers", ["id"]),
+        (["product_code", "product_region"], "products", ["code", "region"]),
+    ]
+
+
+def test_should_count_orphans_of_every_foreign_key_in_one_query(data_source, mocker):
+    fetchone = mocker.spy(data_source, "fetchone")
+
+    validation_info = create_validation(
+        OrphanCountValidation, data_source, "orders", "orphan_count"
+    ).get_validation_info()
+
+    # Customers 3 and 4 do not exist, hammer and spear are not sold in midgard
+    assert validation_info.value == 4
+    assert fetchone.call_count == 1
+    assert fetchone.call_args.args[0].count("NOT EXISTS") == 2
+
+
+def test_should_count_orphans_of_a_column(data_source):
+    validation = create_validation(
+        OrphanCountValidation,
+        data_source,
+        "orders",
+        "orphan_count(customer_id)",
+        ref="sqlite.customers.id",
+        where="id < 4",
+    )
+
+    assert validation.get_validation_info().value == 1
+
+
+def test_should_not_cache_orphan_counts(data_source):
+    # The referenced tables can change while the checked table does not
+    assert not ValidationResultCache.is_cacheable(
+        create_validation(OrphanCountValidation, data_source, "orders", "orphan_count")
+    )
+
+
+def test_should_query_foreign_keys_one_by_one_without_batching(data_source, mocker):
+    mocker.patch.object(data_source, "BATCHED_ORPHAN_COUNTS", False)
+    foreign_keys = [
+        ForeignKey("fk_customer", ["customer_id"], "customers", ["id"]),
+        ForeignKey(
+            "fk_product",
+            ["product_code", "product_region"],
+            "products",
+            ["code", "region"],
+        ),
+    ]
+
+    counts = data_source.query_get_orphan_counts("orders", foreign_keys)
+
+    assert counts == [2, 2]
+
+
+def test_should_count_orphans_against_another_data_source(
+    data_source, reference_data_source, mocker
+):
+    streamed_keys = mocker.spy(reference_data_source, "query_stream_key_counts")
+    validation = create_validation(
+        OrphanCountValidation,
+        data_source,
+        "orders",
+        "orphan_count(customer_id)",
+        ref="warehouse.customers.id",
+        reference_data_source=reference_data_source,
+    )
+
+    validation_info = validation.get_validation_info()
+
+    # Customers 3 and 4 are only in the orders database, a bitmap holds keys 1 to 6
+    assert validation_info.value == 2
+    assert validation_info.estimated_error is None
+    # The reference keys are read once, into the filter
+    assert streamed_keys.call_count == 1
+
+
+def test_should_check_string_keys_with_a_bloom_filter(
+    data_source, reference_data_source, mocker
+):
+    mocker.patch.object(
+        data_source,
+        "query_stream_key_counts",
+        return_value=iter([("c1", 3), ("c3", 2), ("c6", 1), ("c9", 4)]),
+    )
+    check = KeyExistenceCheck(
+        source=data_source,
+        dataset="orders",
+        key="customer_code",
+        reference=reference_data_source,
+        reference_dataset="customers",
+        reference_key="code",
+        false_positive_rate=0.001,
+    )
+
+    assert isinstance(check.key_filter(), BloomFilter)
+    result = check.check()
+    assert result.orphan_count == 6
+    assert result.orphan_key_count == 2
+    assert result.false_positive_rate == 0.001
+
+
+def test_should_size_bloom_filter_by_false_positive_rate():
+    bloom = BloomFilter(capacity=10000, false_positive_rate=0.01)
+    for key in range(10000):
+        bloom.add(f"key{key}")
+
+    false_positives = sum(f"other{key}" in bloom for key in range(10000))
+
+    assert all(f"key{key}" in bloom for key in range(10000))
+    assert false_positives < 200
+    # About 9.6 bits per key at 1%, whatever the length of the keys
+    assert len(bloom.bits) < 10000 * 10 / 8
+
+
+def test_should_match_numeric_keys_of_any_type_in_bitmap():
+    bitmap = KeyBitmap(10, 20)
+    bitmap.add(12)
+
+    assert 12 in bitmap
+    assert 12.0 in bitmap
+    assert 13 not in bitmap
+    assert 25 not in bitmap
+    assert "12" not in bitmap
@@ -0,0 +1,198 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import statistics
+
+import pytest
+
+from dcs_core.core.common.models.configuration import (
+    ExecutionConfiguration,
+    PartitionConfiguration,
+)
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.numeric_validation import (
+    AvgValidation,
+    MaxValidation,
+    SumValidation,
+)
+from dcs_core.core.validation.partitioned import Moments, PartitionedScan
+from dcs_core.core.validation.reliability_validation import CountRowValidation
+from dcs_core.core.validation.uniqueness_validation import CountDistinctValidation
+from tests.utils import create_validation
+
+TABLE_NAME = "partitioned_test_table"
+
+
+def _create_data_source(sqlite_data_source, **connection):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, name TEXT, score REAL)",
+        file=True,
+        **connection,
+    )
+    rows = [(i, None if i % 3 == 0 else f"name{i}", i * 1.5) for i in range(1, 21)]
+    data_source.insert(TABLE_NAME, rows + [(None, "orphan", 7.0)])
+    return data_source
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return _create_data_source(sqlite_data_source, pool_size=3)
+
+
+@pytest.fixture
+def validations(data_source):
+    return [
+        create_validation(CountRowValidation, data_source, TABLE_NAME, "count_rows"),
+        create_validation(SumValidation, data_source, TABLE_NAME, "sum(score)"),
+        create_validation(MaxValidation, data_source, TABLE_NAME, "max(score)"),
+        create_validation(AvgValidation, data_source, TABLE_NAME, "avg(score)"),
+        create_validation(
+            CountNullValidation, data_source, TABLE_NAME, "count_null(name)"
+        ),
+        create_validation(
+            PercentageNullValidation, data_source, TABLE_NAME, "percent_null(name)"
+        ),
+    ]
+
+
+def _run(validations, partitioned: PartitionedScan):
+    groups, _ = FusedScanPlanner(
+        partitioned={f"sqlite.{TABLE_NAME}": partitioned}
+    ).plan(validations)
+    values = {}
+    for group in groups:
+        for identity, validation_info in group.execute().items():
+            values[identity] = validation_info.value
+    return values
+
+
+class TestPartitionedScan:
+    def test_should_merge_partitions_into_full_scan_values(
+        self, data_source, validations, mocker
+    ):
+        query_get_aggregates = mocker.spy(data_source, "query_get_aggregates")
+
+        partitioned = _run(validations, PartitionedScan(column="id", partitions=4))
+        expected = {
+            v.get_validation_identity(): v.get_validation_info().value
+            for v in validations
+        }
+
+        assert partitioned == expected
+        filters = [
+            call.kwargs["filters"] for call in query_get_aggregates.call_args_list
+        ]
+        # One range query, 4 ranges and the null partition
+        assert filters[0] is None
+        assert filters[1:] == [
+            "[id] >= 1 AND [id] < 6",
+            "[id] >= 6 AND [id] < 11",
+            "[id] >= 11 AND [id] < 16",
+            "[id] >= 16 AND [id] <= 20",
+            "[id] IS NULL",
+        ]
+
+    def test_should_retry_failed_partition_only(self, data_source, validations, mocker):
+        query_get_aggregates = data_source.query_get_aggregates
+        failures = []
+
+        def flaky(table, aggregates, filters=None):
+            if filters == "[id] IS NULL" and not failures:
+                failures.append(filters)
+                raise RuntimeError("connection reset")
+            return query_get_aggregates(table, aggregates, filters)
+
+        mocker.patch.object(data_source, "query_get_aggregates", side_effect=flaky)
+
+        values = _run(validations, PartitionedScan(column="id", partitions=2))
+
+        assert failures == ["[id] IS NULL"]
+        # 1 range query, 3 partitions and 1 retry
+        assert data_source.query_get_aggregates.call_count == 5
+        assert values[validations[0].get_validation_identity()] == 21
+
+    def test_should_scan_non_mergeable_aggregates_in_full(self, data_source):
+        distinct = create_validation(
+            CountDistinctValidation, data_source, TABLE_NAME, "count_distinct(name)"
+        )
+
+        groups, _ = FusedScanPlanner(
+            partitioned={f"sqlite.{TABLE_NAME}": PartitionedScan(column="id")}
+        ).plan([distinct])
+
+        assert groups[0].partitioned is None
+
+
+def test_should_run_partitions_of_a_task_with_a_single_pooled_connection(
+    sqlite_data_source, mocker
+):
+    data_source = _create_data_source(sqlite_data_source, pool_size=1, pool_timeout=1)
+    query_get_aggregates = data_source.query_get_aggregates
+    scanned = []
+
+    def scan(table, aggregates, filters=None):
+        values = query_get_aggregates(table, aggregates, filters)
+        scanned.append(filters)
+        return values
+
+    mocker.patch.object(data_source, "query_get_aggregates", side_effect=scan)
+    validations = [
+        create_validation(CountRowValidation, data_source, TABLE_NAME, "count_rows"),
+        create_validation(SumValidation, data_source, TABLE_NAME, "sum(score)"),
+    ]
+    executor = ValidationExecutor(
+        ExecutionConfiguration(max_workers=2),
+        partitioned={
+            f"sqlite.{TABLE_NAME}": PartitionConfiguration(
+                data_source="sqlite", dataset=TABLE_NAME, column="id", partitions=4
+            )
+        },
+    )
+
+    values = [info.value for info in executor.run(validations).values()]
+
+    assert values == [21, 322.0]
+    # The range query and the 5 partitions, none of them timed out on the pool
+    assert len(scanned) == 6
+
+
+def test_should_merge_moments_of_partitions():
+    values = [4.0, 7.0, 13.0, 16.0, 1.0, 9.5, 3.25]
+    score = "score"
+    partitions = []
+    for chunk in [values[:3], values[3:4], values[4:], []]:
+        partitions.append(
+            {
+                ScanAggregate(type=AggregateType.VALUE_COUNT, field=score): len(chunk),
+                ScanAggregate(type=AggregateType.AVG, field=score): (
+                    statistics.mean(chunk) if chunk else None
+                ),
+                ScanAggregate(type=AggregateType.VARIANCE, field=score): (
+                    statistics.variance(chunk) if len(chunk) > 1 else None
+                ),
+            }
+        )
+    variance = ScanAggregate(type=AggregateType.VARIANCE, field=score)
+    stddev = ScanAggregate(type=AggregateType.STDDEV, field=score)
+
+    merged = PartitionedScan.merge([variance, stddev], partitions)
+
+    assert merged[variance] == pytest.approx(statistics.variance(values))
+    assert merged[stddev] == pytest.approx(statistics.stdev(values))
+    assert Moments().merge(Moments()).variance is None
@@ -0,0 +1,110 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import List, Optional
+
+import pytest
+
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.numeric_validation import (
+    Percentile20Validation,
+    Percentile40Validation,
+    Percentile60Validation,
+    Percentile80Validation,
+    Percentile90Validation,
+)
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "percentile_test_table"
+
+
+class StreamingSqliteDataSource(SqliteDataSource):
+    """
+    SQLite has no ordered-set aggregate, percentiles use the streaming fallback
+    """
+
+    percentile_queries = 0
+
+    def qualified_table_name(self, table_name: str) -> str:
+        return table_name
+
+    def query_get_percentiles(
+        self, table: str, field: str, percentiles: List[float], filters: str = None
+    ) -> List[Optional[float]]:
+        self.percentile_queries += 1
+        return self.query_get_percentiles_streaming(
+            table=table, field=field, percentiles=percentiles, filters=filters
+        )
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, age INTEGER)",
+        data_source_class=StreamingSqliteDataSource,
+    )
+    # Ages 10, 20, ..., 100 in reverse order and one NULL
+    data_source.insert(
+        TABLE_NAME,
+        [(row_id, (10 - row_id) * 10) for row_id in range(10)] + [(10, None)],
+    )
+    return data_source
+
+
+def test_should_pick_discrete_percentiles_from_stream(data_source):
+    assert data_source.query_get_percentiles_streaming(
+        TABLE_NAME, "age", [0.2, 0.5, 0.9, 1.0]
+    ) == [20, 50, 90, 100]
+    assert data_source.query_get_percentiles_streaming(
+        TABLE_NAME, "age", [0.5], filters="id >= 5"
+    ) == [30]
+    assert data_source.query_get_percentiles_streaming(
+        TABLE_NAME, "age", [0.5], filters="id > 100"
+    ) == [None]
+
+
+def test_should_compute_column_percentiles_with_one_query(data_source):
+    validations = [
+        create_validation(
+            Percentile20Validation, data_source, TABLE_NAME, "percentile_20(age)"
+        ),
+        create_validation(
+            Percentile40Validation, data_source, TABLE_NAME, "percentile_40(age)"
+        ),
+        create_validation(
+            Percentile60Validation, data_source, TABLE_NAME, "percentile_60(age)"
+        ),
+        create_validation(
+            Percentile80Validation, data_source, TABLE_NAME, "percentile_80(age)"
+        ),
+        create_validation(
+            Percentile90Validation, data_source, TABLE_NAME, "percentile_90(age)"
+        ),
+    ]
+    groups, remaining = FusedScanPlanner().plan(validations)
+    assert len(groups) == 1 and remaining == []
+    assert groups[0].aggregate_batches == []
+
+    validation_infos = groups[0].execute()
+    assert data_source.percentile_queries == 1
+    assert [
+        validation_infos[validation.get_validation_identity()].value
+        for validation in validations
+    ] == [20, 40, 60, 80, 90]
+
+
+def test_should_compute_single_percentile(data_source):
+    validation = create_validation(
+        Percentile40Validation, data_source, TABLE_NAME, "percentile_40(age)"
+    )
+    assert validation.get_validation_info().value == 40
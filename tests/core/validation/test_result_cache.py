@@ -0,0 +1,137 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+
+from dcs_core.core.common.models.configuration import ExecutionConfiguration
+from dcs_core.core.common.models.validation import (
+    CachedValidationInfo,
+    ValidationFunction,
+    ValidationInfo,
+)
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.numeric_validation import SumValidation
+from dcs_core.core.validation.reliability_validation import (
+    CountRowValidation,
+    FreshnessValueMetric,
+)
+from dcs_core.core.validation.result_cache import ValidationResultCache
+from dcs_core.integrations.storage.local_file import LocalFileValidationResultRepository
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "result_cache_test_table"
+
+
+class FingerprintSqliteDataSource(SqliteDataSource):
+    def query_get_table_fingerprint(self, table: str) -> Optional[str]:
+        return self._query_fingerprint(
+            f"SELECT COUNT(*), MAX(id) FROM {self.qualified_table_name(table)}"
+        )
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER)",
+        data_source_class=FingerprintSqliteDataSource,
+    )
+    data_source.insert(TABLE_NAME, [(1,)])
+    return data_source
+
+
+def _executor(tmp_path):
+    return ValidationExecutor(
+        ExecutionConfiguration(
+            result_cache=True, result_cache_storage_path=str(tmp_path)
+        )
+    )
+
+
+def test_should_serve_unchanged_tables_from_cache(data_source, tmp_path):
+    validations = [
+        create_validation(CountRowValidation, data_source, TABLE_NAME, "count_rows"),
+        create_validation(SumValidation, data_source, TABLE_NAME, "sum(id)"),
+    ]
+
+    first = _executor(tmp_path).run(validations)
+    assert [info.value for info in first.values()] == [1, 1]
+    assert all(info.cached_at is None for info in first.values())
+
+    second = _executor(tmp_path).run(validations)
+    assert [info.value for info in second.values()] == [1, 1]
+    assert all(info.cached_at is not None for info in second.values())
+
+    data_source.insert(TABLE_NAME, [(2,)])
+    third = _executor(tmp_path).run(validations)
+    assert [info.value for info in third.values()] == [2, 3]
+    assert all(info.cached_at is None for info in third.values())
+
+
+def test_should_refresh_validations_with_zero_ttl(data_source, tmp_path):
+    validations = [
+        create_validation(
+            CountRowValidation, data_source, TABLE_NAME, "count_rows", cache_ttl=0
+        )
+    ]
+    _executor(tmp_path).run(validations)
+    validation_info = list(_executor(tmp_path).run(validations).values())[0]
+    assert validation_info.value == 1
+    assert validation_info.cached_at is None
+
+
+def test_should_not_cache_freshness(data_source, tmp_path):
+    validations = [
+        create_validation(
+            FreshnessValueMetric, data_source, TABLE_NAME, "freshness(id)"
+        ),
+        create_validation(FreshnessValueMetric, data_source, TABLE_NAME, "freshness"),
+    ]
+    assert not any(
+        ValidationResultCache.is_cacheable(validation) for validation in validations
+    )
+
+
+def test_should_persist_validation_info(tmp_path):
+    repository = LocalFileValidationResultRepository(str(tmp_path))
+    timestamp = datetime.datetime(2024, 1, 1, 12, 0)
+    repository.save_result(
+        "cache_id",
+        CachedValidationInfo(
+            fingerprint="10:20",
+            cached_at=timestamp,
+            validation_info=ValidationInfo(
+                name="null pct",
+                identity="identity",
+                data_source_name="source",
+                dataset="table",
+                validation_function=ValidationFunction.PERCENT_NULL,
+                value=Decimal("12.5"),
+                timestamp=timestamp,
+                is_valid=True,
+                sample_percent=10,
+                confidence_interval=(10.0, 15.0),
+            ),
+        ),
+    )
+
+    cached = repository.get_result("cache_id")
+    assert cached.fingerprint == "10:20"
+    assert cached.cached_at == timestamp
+    assert cached.validation_info.value == 12.5
+    assert cached.validation_info.validation_function == ValidationFunction.PERCENT_NULL
+    assert cached.validation_info.confidence_interval == (10.0, 15.0)
+    assert repository.get_result("missing") is None
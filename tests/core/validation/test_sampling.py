@@ -0,0 +1,108 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from dcs_core.core.configuration.configuration_parser import (
+    load_configuration_from_yaml_str,
+)
+from dcs_core.core.utils.utils import wilson_interval
+from dcs_core.core.validation.completeness_validation import PercentageNullValidation
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from tests.utils import SqliteDataSource, create_validation
+
+TABLE_NAME = "sampling_test_table"
+
+
+class SampledSqliteDataSource(SqliteDataSource):
+    def random_expression(self) -> str:
+        # Deterministic stand-in, samples the rows by the last digit of the id
+        return "(id % 10) / 10.0"
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER, name TEXT)",
+        data_source_class=SampledSqliteDataSource,
+    )
+    data_source.insert(
+        TABLE_NAME,
+        [(row_id, None if row_id % 5 == 0 else "thor") for row_id in range(100)],
+    )
+    return data_source
+
+
+def _percent_null_validation(data_source, sample=None):
+    return create_validation(
+        PercentageNullValidation,
+        data_source,
+        TABLE_NAME,
+        "percent_null(name)",
+        sample=sample,
+    )
+
+
+def test_should_rewrite_queries_on_sampled_table(data_source):
+    table = data_source.qualified_table_name(TABLE_NAME)
+    query = f"SELECT COUNT(*) FROM {table} WHERE id > 1"
+    assert data_source.apply_sampling(query) == query
+
+    with data_source.sampling(TABLE_NAME, 50):
+        assert data_source.apply_sampling(query) == (
+            f"SELECT COUNT(*) FROM (SELECT * FROM {table} "
+            f"WHERE (id % 10) / 10.0 < 0.5) AS dcs_sample WHERE id > 1"
+        )
+        assert data_source.query_get_row_count(TABLE_NAME) == 50
+    assert data_source.query_get_row_count(TABLE_NAME) == 100
+
+
+def test_should_report_confidence_interval_of_sampled_validation(data_source):
+    validation = _percent_null_validation(data_source, sample=50)
+    validation_info = validation.get_validation_info()
+
+    assert validation_info.value == 20
+    assert validation_info.sample_percent == 50
+    assert validation_info.confidence_interval == wilson_interval(20, 50)
+
+
+def test_should_report_confidence_interval_of_fused_sampled_validation(data_source):
+    sampled = _percent_null_validation(data_source, sample=50)
+    full = _percent_null_validation(data_source)
+    groups, _ = FusedScanPlanner().plan([sampled, full])
+    assert len(groups) == 2
+
+    validation_infos = {}
+    for group in groups:
+        validation_infos[group.sample] = list(group.execute().values())[0]
+    assert validation_infos[50].value == 20
+    assert validation_infos[50].confidence_interval == wilson_interval(20, 50)
+    assert validation_infos[None].sample_percent is None
+    assert validation_infos[None].confidence_interval is None
+
+
+def test_should_apply_dataset_sample_to_validations():
+    yaml_string = """
+    sample for source.table:
+      percent: 5
+    validations for source.table:
+      - null pct:
+          on: percent_null(name)
+      - rows:
+          on: count_rows
+          sample: 20
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validations = configuration.validations["source.table"].validations
+    assert validations["null pct"].sample == 5
+    assert validations["rows"].sample == 20
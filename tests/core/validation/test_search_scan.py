@@ -0,0 +1,241 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import statistics
+from collections import Counter
+from typing import Dict, List
+
+import pytest
+
+from dcs_core.core.common.models.configuration import DataSourceLanguageSupport
+from dcs_core.core.common.models.scan import AggregateType, ScanAggregate
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.fused_scan import FusedScanPlanner, SearchScanGroup
+from dcs_core.core.validation.numeric_validation import (
+    AvgValidation,
+    MaxValidation,
+    MinValidation,
+    StdDevValidation,
+)
+from dcs_core.core.validation.reliability_validation import CountDocumentsValidation
+from dcs_core.core.validation.uniqueness_validation import (
+    CountDistinctValidation,
+    CountDuplicateValidation,
+)
+from tests.utils import create_validation
+
+INDEX_NAME = "search_test_index"
+
+DOCUMENTS = [
+    {"price": 10, "country": "IN"},
+    {"price": 20, "country": "IN"},
+    {"price": 30, "country": "US"},
+    {"price": None, "country": "US"},
+]
+
+DUPLICATE_DOCUMENTS = [{"price": price % 7, "country": "IN"} for price in range(10)]
+
+
+class InMemorySearchClient:
+    """
+    Evaluates the aggregations used by the search scan on in-memory documents
+    """
+
+    def __init__(self, documents: List[Dict]):
+        self.documents = documents
+        self.search_requests = 0
+        self.msearch_requests = 0
+        self.indices = self
+
+    def _search(self, body: Dict) -> Dict:
+        assert body["size"] == 0
+        documents = self.documents
+        if "query" in body:
+            field, value = list(body["query"]["term"].items())[0]
+            documents = [document for document in documents if document[field] == value]
+        aggregations = {}
+        for name, aggregation in body["aggs"].items():
+            kind, params = list(aggregation.items())[0]
+            if kind == "composite":
+                aggregations[name] = self._composite(documents, params)
+                continue
+            values = [
+                document[params["field"]]
+                for document in documents
+                if document.get(params["field"]) is not None
+            ]
+            if kind == "extended_stats":
+                aggregations[name] = {
+                    "min": min(values),
+                    "max": max(values),
+                    "avg": statistics.mean(values),
+                    "sum": sum(values),
+                    "std_deviation_sampling": statistics.stdev(values),
+                    "variance_sampling": statistics.variance(values),
+                }
+            elif kind == "missing":
+                aggregations[name] = {"doc_count": len(documents) - len(values)}
+            elif kind == "value_count":
+                aggregations[name] = {"value": len(values)}
+            elif kind == "cardinality":
+                aggregations[name] = {"value": len(set(values))}
+        return {
+            "hits": {"total": {"value": len(documents)}},
+            "aggregations": aggregations,
+        }
+
+    def _composite(self, documents: List[Dict], params: Dict) -> Dict:
+        field = params["sources"][0]["value"]["terms"]["field"]
+        counts = Counter(
+            document[field] for document in documents if document[field] is not None
+        )
+        keys = sorted(counts)
+        if "after" in params:
+            keys = [key for key in keys if key > params["after"]["value"]]
+        page = keys[: params["size"]]
+        aggregation = {
+            "buckets": [
+                {"key": {"value": key}, "doc_count": counts[key]} for key in page
+            ]
+        }
+        if page:
+            aggregation["after_key"] = {"value": page[-1]}
+        return aggregation
+
+    def get_mapping(self, index: str) -> Dict:
+        return {index: {"mappings": {"properties": {"price": {"type": "long"}}}}}
+
+    def search(self, index: str, body: Dict) -> Dict:
+        self.search_requests += 1
+        return self._search(body)
+
+    def msearch(self, index: str, body: List[Dict]) -> Dict:
+        self.msearch_requests += 1
+        return {"responses": [self._search(request) for request in body[1::2]]}
+
+
+@pytest.fixture
+def data_source():
+    data_source = SearchIndexDataSource("search", {})
+    data_source.language_support = DataSourceLanguageSupport.DSL_ES
+    data_source.client = InMemorySearchClient(DOCUMENTS)
+    return data_source
+
+
+def test_should_answer_index_validations_with_one_multi_search(data_source):
+    us_filter = '{"term": {"country": "US"}}'
+    validations = [
+        create_validation(MinValidation, data_source, INDEX_NAME, "min(price)"),
+        create_validation(MaxValidation, data_source, INDEX_NAME, "max(price)"),
+        create_validation(AvgValidation, data_source, INDEX_NAME, "avg(price)"),
+        create_validation(StdDevValidation, data_source, INDEX_NAME, "stddev(price)"),
+        create_validation(
+            CountNullValidation, data_source, INDEX_NAME, "count_null(price)"
+        ),
+        create_validation(
+            PercentageNullValidation, data_source, INDEX_NAME, "percent_null(price)"
+        ),
+        create_validation(
+            CountDocumentsValidation, data_source, INDEX_NAME, "count_rows"
+        ),
+        create_validation(
+            CountDocumentsValidation,
+            data_source,
+            INDEX_NAME,
+            "count_rows",
+            name="us_documents",
+            where=us_filter,
+        ),
+    ]
+    groups, remaining = FusedScanPlanner().plan(validations)
+    assert remaining == []
+    assert len(groups) == 1 and isinstance(groups[0], SearchScanGroup)
+
+    requests = groups[0].requests
+    assert len(requests) == 2
+    # min, max, avg and stddev share one extended_stats aggregation
+    body = data_source._aggregates_body(*requests[0])
+    assert list(body["aggs"].keys()) == [
+        "stats_price",
+        "missing_price",
+        "value_count_price",
+    ]
+
+    validation_infos = groups[0].execute()
+    assert data_source.client.msearch_requests == 1
+    assert data_source.client.search_requests == 0
+    assert [
+        validation_infos[validation.get_validation_identity()].value
+        for validation in validations
+    ] == [10, 30, 20, 10.0, 1, 33.33, 4, 2]
+
+
+def test_should_run_single_filter_with_one_search(data_source):
+    values = data_source.query_get_aggregates(
+        index_name=INDEX_NAME,
+        aggregates=[
+            ScanAggregate(type=AggregateType.SUM, field="price"),
+            ScanAggregate(type=AggregateType.ROW_COUNT),
+        ],
+        filters={"term": {"country": "IN"}},
+    )
+    assert values == [30, 2]
+    assert data_source.client.search_requests == 1
+    assert data_source.client.msearch_requests == 0
+
+
+def test_should_page_through_values_for_exact_counts(data_source):
+    data_source.client = InMemorySearchClient(DUPLICATE_DOCUMENTS)
+    data_source.COMPOSITE_PAGE_SIZE = 2
+
+    # 0, 1 and 2 appear twice, 3 to 6 once
+    assert data_source.query_get_duplicate_count(INDEX_NAME, "price") == 3
+    assert data_source.client.search_requests == 5
+    assert data_source.query_get_distinct_count(INDEX_NAME, "price") == 7
+    assert list(data_source.iterate_value_counts(INDEX_NAME, "price", limit=3)) == [
+        2,
+        2,
+        2,
+    ]
+
+
+def test_should_estimate_counts_with_cardinality(data_source):
+    data_source.client = InMemorySearchClient(DUPLICATE_DOCUMENTS)
+    distinct = create_validation(
+        CountDistinctValidation,
+        data_source,
+        INDEX_NAME,
+        "count_distinct(price)",
+        approximate=True,
+    )
+    duplicate = create_validation(
+        CountDuplicateValidation,
+        data_source,
+        INDEX_NAME,
+        "count_duplicate(price)",
+        approximate=True,
+    )
+    groups, remaining = FusedScanPlanner().plan([distinct, duplicate])
+    assert groups == [] and remaining == [distinct, duplicate]
+
+    distinct_info = distinct.get_validation_info()
+    assert distinct_info.value == 7
+    assert distinct_info.estimated_error == 0.01
+
+    duplicate_info = duplicate.get_validation_info()
+    assert duplicate_info.value == 3
+    assert duplicate_info.estimated_error == 0.01
@@ -0,0 +1,106 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import time
+from typing import Any, Optional
+
+import pytest
+
+from dcs_core.core.validation.custom_query_validation import CustomSqlValidation
+from dcs_core.core.validation.fused_scan import FusedScanPlanner
+from dcs_core.core.validation.reliability_validation import CountRowValidation
+from tests.utils import SqliteDataSource, create_validation
+
+SLOW_VIEW = "slow_view"
+SLOW_QUERY = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c "
+    "WHERE x < 100000000) SELECT x AS id FROM c"
+)
+
+
+class InterruptibleSqliteDataSource(SqliteDataSource):
+    QUERY_TIMEOUT_ERRORS = ("interrupted",)
+
+    def set_query_timeout(self, connection: Any, timeout: Optional[float]) -> bool:
+        # sqlite has no statement timeout, interrupt the query from its progress handler
+        dbapi_connection = connection.connection.dbapi_connection
+        if timeout is None:
+            dbapi_connection.set_progress_handler(None, 0)
+        else:
+            deadline = time.monotonic() + timeout
+            dbapi_connection.set_progress_handler(
+                lambda: time.monotonic() > deadline, 10000
+            )
+        return True
+
+
+@pytest.fixture
+def data_source(sqlite_data_source):
+    return sqlite_data_source(
+        f"CREATE VIEW {SLOW_VIEW} AS {SLOW_QUERY}",
+        data_source_class=InterruptibleSqliteDataSource,
+    )
+
+
+def test_should_report_timed_out_validation(data_source):
+    validation = create_validation(
+        CustomSqlValidation,
+        data_source,
+        SLOW_VIEW,
+        "custom_sql",
+        query=f"SELECT COUNT(*) FROM ({SLOW_QUERY})",
+        timeout=0.2,
+    )
+
+    start = time.monotonic()
+    validation_info = validation.get_validation_info()
+    assert time.monotonic() - start < 5
+    assert validation_info.timed_out is True
+    assert validation_info.is_valid is False
+    assert validation_info.value is None
+
+    # The timeout is removed from the connection once the validation is done
+    assert data_source.fetchone("SELECT 1")[0] == 1
+    fast_validation = create_validation(
+        CustomSqlValidation,
+        data_source,
+        SLOW_VIEW,
+        "custom_sql",
+        query="SELECT 42",
+        timeout=0.2,
+    )
+    assert fast_validation.get_validation_info().value == 42
+
+
+def test_should_report_timed_out_fused_scan(data_source):
+    validation = create_validation(
+        CountRowValidation, data_source, SLOW_VIEW, "count_rows", timeout=0.2
+    )
+    groups, _ = FusedScanPlanner().plan([validation])
+    assert groups[0].timeout == 0.2
+
+    validation_info = list(groups[0].execute().values())[0]
+    assert validation_info.timed_out is True
+
+
+def test_should_use_data_source_query_timeout(sqlite_data_source):
+    data_source = sqlite_data_source(
+        f"CREATE VIEW {SLOW_VIEW} AS {SLOW_QUERY}",
+        data_source_class=InterruptibleSqliteDataSource,
+        query_timeout=0.2,
+    )
+    validation = create_validation(
+        CountRowValidation, data_source, SLOW_VIEW, "count_rows"
+    )
+    assert validation.timeout == 0.2
+    assert validation.get_validation_info().timed_out is True
@@ -12,11 +12,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import dataclasses
+from typing import Callable, Dict, Iterable, Tuple, Type
+
 from opensearchpy import OpenSearch
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Connection
 
-from dcs_core.core.common.models.configuration import DataSourceConnectionConfiguration
+from dcs_core.core.common.models.configuration import (
+    DataSourceConnectionConfiguration,
+    ValidationConfig,
+)
+from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation.base import Validation
 
 
 def is_pgsql_responsive(host, port, username, password, database):
@@ -83,3 +92,67 @@ def create_postgres_connection(
     )
     connection = engine.connect()
     return connection
+
+
+class SqliteDataSource(SQLDataSource):
+    """
+    SQLite data source of the unit tests. The database is in memory, or in the
+    database file of the connection, shared by the pooled connections. The
+    statements of the connection create the tables of the test.
+    """
+
+    # SQL functions missing from SQLite, registered on every connection
+    functions: Dict[str, Callable] = {}
+
+    def connect(self):
+        database = self.data_connection.get("database")
+        engine = create_engine(f"sqlite:///{database}" if database else "sqlite://")
+        event.listen(engine, "connect", self._create_functions)
+        self.connection = engine.connect()
+        for statement in self.data_connection.get("statements", []):
+            self.connection.execute(text(statement))
+        self.connection.commit()
+        return self.connection
+
+    def _create_functions(self, dbapi_connection, _):
+        for name, function in self.functions.items():
+            dbapi_connection.create_function(name, -1, function)
+
+    def insert(self, table: str, rows: Iterable[Tuple]):
+        for row in rows:
+            parameters = {f"value_{i}": value for i, value in enumerate(row)}
+            placeholders = ", ".join(f":{name}" for name in parameters)
+            self.connection.execute(
+                text(f"INSERT INTO {table} VALUES ({placeholders})"), parameters
+            )
+        self.connection.commit()
+
+
+def create_validation(
+    validation_class: Type[Validation],
+    data_source: DataSource,
+    dataset_name: str,
+    on: str,
+    name: str = None,
+    **kwargs,
+) -> Validation:
+    """
+    Create a validation of a dataset. Keyword arguments of ValidationConfig
+    configure the validation, the others are passed to the validation class, like
+    the reference data source of a delta validation.
+    """
+    config_fields = {field.name for field in dataclasses.fields(ValidationConfig)}
+    name = name or on
+    config = ValidationConfig(
+        name=name,
+        on=on,
+        **{key: value for key, value in kwargs.items() if key in config_fields},
+    )
+    return validation_class(
+        name=name,
+        validation_config=config,
+        data_source=data_source,
+        dataset_name=dataset_name,
+        field_name=config.get_validation_field_name,
+        **{key: value for key, value in kwargs.items() if key not in config_fields},
+    )